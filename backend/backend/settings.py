@@ -125,6 +125,40 @@ EMAIL_TIMEOUT = _env_int("DJANGO_EMAIL_TIMEOUT", 20)
 TURNSTILE_SECRET_KEY = os.getenv("TURNSTILE_SECRET_KEY", "")
 BETA_PASSWORD = os.getenv("BETA_PASSWORD", "")
 
+# Gamification recompute queue (users/gamification_queue.py).
+# When async, contribution/review saves only enqueue a per-user job and
+# `manage.py process_gamification_queue` runs it once the user has been quiet
+# for the debounce window (or after the max wait, whichever comes first).
+# Inline by default: enable GAMIFICATION_RECOMPUTE_ASYNC only after the queue
+# worker is scheduled, otherwise stats never update.
+GAMIFICATION_RECOMPUTE_ASYNC = _env_bool("GAMIFICATION_RECOMPUTE_ASYNC", False)
+GAMIFICATION_RECOMPUTE_DEBOUNCE_SECONDS = _env_int("GAMIFICATION_RECOMPUTE_DEBOUNCE_SECONDS", 30)
+GAMIFICATION_RECOMPUTE_MAX_WAIT_SECONDS = _env_int("GAMIFICATION_RECOMPUTE_MAX_WAIT_SECONDS", 300)
+
+# Approved-revision retention (users/revision_retention.py). The sweeper
+# (`manage.py sweep_revision_retention`, also part of run_lifecycle_maintenance)
+# always enforces it; set REVISION_RETENTION_INLINE=false to skip the
+# approval-time check entirely.
+REVISION_RETENTION_INLINE = _env_bool("REVISION_RETENTION_INLINE", True)
+
+# Per-process caches of rarely-changing rows (users/cache.py). Other workers
+# pick up admin edits within this many seconds.
+PROCESS_CACHE_TTL_SECONDS = _env_int("PROCESS_CACHE_TTL_SECONDS", 30)
+
+# Type-ahead index (dictionary/suggest.py). Each worker checks the dictionary
+# publish sequence at most this often and merges published changes.
+DICTIONARY_SUGGEST_REFRESH_SECONDS = _env_int("DICTIONARY_SUGGEST_REFRESH_SECONDS", 5)
+
+# PublicEntryChange ids are assigned at INSERT but become visible at COMMIT, so
+# consumers (offline bundles, the suggest index) only move their watermark past
+# log rows at least this old. Must exceed the longest write transaction.
+PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS = _env_int("PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS", 300)
+
+# run_lifecycle_maintenance prunes PublicEntryChange rows older than this (but
+# never past the latest offline bundle). Clients whose export cursor is older
+# start over with a full export.
+PUBLIC_ENTRY_CHANGE_RETENTION_DAYS = _env_int("PUBLIC_ENTRY_CHANGE_RETENTION_DAYS", 30)
+
 
 # Application definition
 
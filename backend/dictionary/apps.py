@@ -5,3 +5,7 @@ class DictionaryConfig(AppConfig):
     """Django app registration for dictionary domain."""
 
     name = "dictionary"
+
+    def ready(self):
+        # Side-effect import: keeps the public search index in sync with Entry saves.
+        from dictionary import signals  # noqa: F401
@@ -0,0 +1,25 @@
+"""
+dictionary/batching.py
+
+Slicing for `__in` lookups over caller-supplied id or key lists.
+
+SQLite caps the number of bound variables per statement, so derived-table
+maintenance (related term links, headword checks, bundle patches, the suggest
+index) filters long lists one `IN_LOOKUP_BATCH_SIZE` slice at a time.
+
+Troubleshooting:
+- "too many SQL variables" from a new `__in` filter: iterate `chunked(values)`
+  instead of passing the whole list.
+"""
+
+IN_LOOKUP_BATCH_SIZE = 500
+
+
+def chunked(values, size=IN_LOOKUP_BATCH_SIZE):
+    """
+    Yield `values` as lists of at most `size` items, in order.
+    """
+
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
@@ -0,0 +1,215 @@
+"""
+dictionary/bundles.py
+
+Versioned offline dictionary bundles with delta patches.
+
+Why:
+- Many users in Batanes have poor connectivity. Paging through
+  `api/dictionary/entries` costs hundreds of requests; a bundle is one
+  compressed download, and keeping it current costs a few KB of patch.
+
+What gets built (`manage.py build_dictionary_bundle`, run from cron):
+- `dictionary-v<N>.json.gz`: every public entry (the export fields from
+  dictionary/export.py) as compact rows: `{"fields": [...], "entries": [[...], ...]}`.
+- `dictionary-v<N-1>-to-v<N>.patch.json.gz`: the same row format for entries
+  changed since version N-1 plus a `deletes` list of entry ids.
+- Files go to default storage, so the web server serves them as static files;
+  `api/dictionary/bundle` only returns the manifest (version, URLs, hashes).
+
+How patches stay small:
+- Every PublicEntryView refresh (publish, archive, override, mother change,
+  visibility toggle, import) and every Entry delete logs the entry id to
+  PublicEntryChange. A patch holds only the ids logged since the previous
+  version; its rows are re-read from PublicEntryView at build time.
+- A version covers log rows up to `settled_change_watermark()` only. Newer rows
+  may still have a lower-id sibling in an open transaction, so they wait for
+  the next build (they are already in the full bundle).
+- `run_lifecycle_maintenance` prunes the log (`prune_public_entry_changes`),
+  never past the latest bundle watermark, so no patch misses a row.
+
+Retention:
+- Only the latest full bundle file is kept; patches are kept for the last
+  PATCH_RETENTION versions. Clients further behind download the full bundle.
+
+Troubleshooting:
+- Clients miss a change: check the entry id appears in PublicEntryChange after
+  the write. Changes reach patches `PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS` after
+  they commit, so a build right after a publish reports "up to date".
+- A manual `rebuild_public_entry_view` logs every entry, so the next patch
+  resyncs everything.
+"""
+
+import gzip
+import hashlib
+import json
+import tempfile
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from dictionary.batching import chunked
+from dictionary.export import EXPORT_FIELDS, export_queryset, export_rows
+from dictionary.models import DictionaryBundle, PublicEntryChange, PublicEntryView
+from dictionary.public_view import settled_change_watermark
+
+BUNDLE_FORMAT = 1
+PATCH_RETENTION = 60
+
+
+def _media_url(path):
+    # Storage-relative URL; clients resolve it against the site origin.
+    return default_storage.url(path) if path else ""
+
+
+def _write_bundle_file(handle, header, rows) -> int:
+    """
+    Stream `header` plus compact rows into `handle` as gzip JSON. Returns row count.
+    """
+
+    count = 0
+    # mtime=0 keeps the archive byte-identical for identical content.
+    with gzip.GzipFile(fileobj=handle, mode="wb", mtime=0) as archive:
+        head = json.dumps({**header, "fields": list(EXPORT_FIELDS)}, separators=(",", ":"))
+        archive.write(f'{head[:-1]},"entries":['.encode("utf-8"))
+        for row in rows:
+            line = json.dumps(
+                [row[field] for field in EXPORT_FIELDS],
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            archive.write(f"{',' if count else ''}{line}".encode("utf-8"))
+            count += 1
+        archive.write(b"]}")
+    return count
+
+
+def _sha256(handle) -> str:
+    handle.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+        digest.update(chunk)
+    handle.seek(0)
+    return digest.hexdigest()
+
+
+def _live_entry_ids(entry_ids) -> set:
+    live_ids = set()
+    for chunk in chunked(entry_ids):
+        live_ids.update(
+            PublicEntryView.objects.filter(entry_id__in=chunk).values_list("entry_id", flat=True)
+        )
+    return live_ids
+
+
+def _changed_rows(entry_ids):
+    for chunk in chunked(entry_ids):
+        queryset = export_queryset().filter(entry_id__in=chunk)
+        yield from export_rows(queryset, media_url=_media_url)
+
+
+def _prune(latest):
+    for bundle in DictionaryBundle.objects.exclude(id=latest.id).exclude(bundle_file=""):
+        bundle.bundle_file.delete(save=False)
+        bundle.save(update_fields=["bundle_file"])
+    for bundle in DictionaryBundle.objects.filter(version__lte=latest.version - PATCH_RETENTION):
+        if bundle.patch_file:
+            bundle.patch_file.delete(save=False)
+        bundle.delete()
+
+
+@transaction.atomic
+def build_dictionary_bundle(*, force=False):
+    """
+    Build the next bundle version (and its patch). Returns the DictionaryBundle,
+    or None when nothing changed since the latest version and `force` is off.
+    """
+
+    previous = DictionaryBundle.objects.select_for_update().order_by("-version").first()
+    previous_watermark = previous.change_watermark if previous else 0
+    # Read the watermark before the snapshot: a change landing in between is in
+    # the snapshot and also re-sent by the next patch, which is harmless.
+    watermark = max(settled_change_watermark(), previous_watermark)
+    if previous and watermark == previous_watermark and not force:
+        return None
+
+    version = previous.version + 1 if previous else 1
+    bundle = DictionaryBundle(version=version, change_watermark=watermark)
+    header = {"format": BUNDLE_FORMAT, "version": version}
+
+    with tempfile.TemporaryFile() as handle:
+        bundle.entry_count = _write_bundle_file(
+            handle, header, export_rows(export_queryset(), media_url=_media_url)
+        )
+        bundle.bundle_sha256 = _sha256(handle)
+        bundle.bundle_file.save(f"dictionary-v{version}.json.gz", File(handle), save=False)
+
+    if previous:
+        changed_ids = set(
+            PublicEntryChange.objects.filter(
+                id__gt=previous_watermark, id__lte=watermark
+            ).values_list("entry_id", flat=True)
+        )
+        live_ids = _live_entry_ids(changed_ids)
+        patch_header = {
+            **header,
+            "from_version": previous.version,
+            "deletes": sorted(str(entry_id) for entry_id in changed_ids - live_ids),
+        }
+        with tempfile.TemporaryFile() as handle:
+            _write_bundle_file(handle, patch_header, _changed_rows(sorted(live_ids)))
+            bundle.patch_sha256 = _sha256(handle)
+            bundle.patch_file.save(
+                f"dictionary-v{previous.version}-to-v{version}.patch.json.gz",
+                File(handle),
+                save=False,
+            )
+        bundle.patch_change_count = len(changed_ids)
+
+    bundle.save()
+    _prune(bundle)
+    return bundle
+
+
+def bundle_manifest(*, since_version=None, file_url):
+    """
+    Manifest of the latest bundle, or None if none was built yet.
+
+    With `since_version`, `patches` lists the patch files that bring that
+    version up to date (oldest first), or is None when the chain is
+    incomplete and the client must download the full bundle.
+    """
+
+    latest = DictionaryBundle.objects.order_by("-version").first()
+    if latest is None:
+        return None
+
+    patches = None
+    if since_version is not None and since_version <= latest.version:
+        chain = list(DictionaryBundle.objects.filter(version__gt=since_version).order_by("version"))
+        complete = len(chain) == latest.version - since_version and all(
+            bundle.patch_file for bundle in chain
+        )
+        if complete:
+            patches = [
+                {
+                    "from_version": bundle.version - 1,
+                    "to_version": bundle.version,
+                    "url": file_url(bundle.patch_file),
+                    "sha256": bundle.patch_sha256,
+                    "size": bundle.patch_file.size,
+                    "change_count": bundle.patch_change_count,
+                }
+                for bundle in chain
+            ]
+
+    return {
+        "format": BUNDLE_FORMAT,
+        "version": latest.version,
+        "created_at": latest.created_at.isoformat(),
+        "entry_count": latest.entry_count,
+        "bundle_url": file_url(latest.bundle_file),
+        "bundle_sha256": latest.bundle_sha256,
+        "bundle_size": latest.bundle_file.size,
+        "patches": patches,
+    }
@@ -0,0 +1,150 @@
+"""
+dictionary/english_lookup.py
+
+English → Ivatan reverse index.
+
+Each live Entry contributes one EnglishLookupTerm row per English key found in
+its effective meaning and English synonyms (inherited from the mother term for
+variants). The public `english-terms` endpoint reads this table instead of
+walking every entry on each request.
+
+Rows are refreshed through the same hooks as the search index:
+- `dictionary/signals.py` (Entry saves: publish, archive, overrides)
+- `variant_services._set_group_mother_flags` (mother promotion / fallback)
+
+Troubleshooting:
+- Lookup shows stale words: run `audit_english_lookup` (add `--fix` to repair)
+  or `rebuild_english_lookup`.
+"""
+
+import re
+
+from django.db import transaction
+
+from dictionary.models import EnglishLookupTerm, Entry, EntryStatus
+from dictionary.services import _semantic_source_entry
+
+LOOKUP_STATUSES = (EntryStatus.APPROVED, EntryStatus.APPROVED_UNDER_REVIEW)
+
+
+def english_lookup_key(value) -> str:
+    """
+    Normalize one English phrase into a lookup key.
+
+    Only one- or two-word phrases become keys; longer glosses are definitions,
+    not lookup words.
+    """
+
+    words = re.findall(r"[A-Za-z]+(?:'[A-Za-z]+)?", str(value or "").lower())
+    if not (1 <= len(words) <= 2):
+        return ""
+    return " ".join(words)
+
+
+def english_lookup_keys(entry: Entry) -> list[str]:
+    """
+    Ordered, de-duplicated English keys for one entry.
+    """
+
+    semantic_entry = _semantic_source_entry(entry)
+    candidates = [
+        english_lookup_key(semantic_entry.meaning),
+        *[
+            english_lookup_key(item)
+            for item in re.split(r"[,;\n]", semantic_entry.english_synonym or "")
+        ],
+    ]
+    return list(dict.fromkeys(item for item in candidates if item))
+
+
+def _lookup_rows(entry: Entry) -> list[EnglishLookupTerm]:
+    if entry.status not in LOOKUP_STATUSES:
+        return []
+    part_of_speech = _semantic_source_entry(entry).part_of_speech or ""
+    return [
+        EnglishLookupTerm(
+            english_key=key,
+            entry_id=entry.id,
+            term=entry.term,
+            part_of_speech=part_of_speech,
+        )
+        for key in english_lookup_keys(entry)
+    ]
+
+
+@transaction.atomic
+def refresh_entry_english_lookup(entries) -> None:
+    """
+    Replace the lookup rows of the given entries with their current keys.
+    """
+
+    entries = list(entries)
+    if not entries:
+        return
+    EnglishLookupTerm.objects.filter(entry_id__in=[entry.id for entry in entries]).delete()
+    rows = []
+    for entry in entries:
+        rows.extend(_lookup_rows(entry))
+    EnglishLookupTerm.objects.bulk_create(rows)
+
+
+def refresh_group_english_lookup(group) -> None:
+    """
+    Re-index every member of a variant group (variants inherit the mother's English).
+    """
+
+    if group is None:
+        return
+    refresh_entry_english_lookup(group.entries.select_related("variant_group__mother_entry"))
+
+
+def _live_entries():
+    return (
+        Entry.objects.filter(status__in=LOOKUP_STATUSES)
+        .select_related("variant_group__mother_entry")
+        .order_by("id")
+    )
+
+
+@transaction.atomic
+def rebuild_english_lookup(*, batch_size=1000) -> int:
+    """
+    Rebuild the whole reverse index. Returns the number of rows written.
+    """
+
+    EnglishLookupTerm.objects.all().delete()
+    written = 0
+    rows = []
+    for entry in _live_entries().iterator(chunk_size=batch_size):
+        rows.extend(_lookup_rows(entry))
+        if len(rows) >= batch_size:
+            EnglishLookupTerm.objects.bulk_create(rows)
+            written += len(rows)
+            rows = []
+    if rows:
+        EnglishLookupTerm.objects.bulk_create(rows)
+        written += len(rows)
+    return written
+
+
+def find_english_lookup_mismatches(*, batch_size=1000) -> dict:
+    """
+    Compare stored rows with freshly computed ones.
+
+    Returns `{"missing": [...], "stale": [...]}` as (english_key, entry_id,
+    term, part_of_speech) tuples.
+    """
+
+    expected = set()
+    for entry in _live_entries().iterator(chunk_size=batch_size):
+        expected.update(
+            (row.english_key, row.entry_id, row.term, row.part_of_speech)
+            for row in _lookup_rows(entry)
+        )
+    stored = set(
+        EnglishLookupTerm.objects.values_list("english_key", "entry_id", "term", "part_of_speech")
+    )
+    return {
+        "missing": sorted(expected - stored, key=str),
+        "stale": sorted(stored - expected, key=str),
+    }
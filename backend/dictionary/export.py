@@ -0,0 +1,200 @@
+"""
+dictionary/export.py
+
+Full public dictionary export (NDJSON / CSV) for researchers and partner archives.
+
+How it works:
+- Rows come from PublicEntryView (visible entries, mother meaning already
+  merged) joined to the entry and its mother term for the remaining fields.
+- `.iterator(chunk_size=EXPORT_CHUNK_SIZE)` streams the rows: PostgreSQL uses
+  a server-side cursor, other backends fetch chunk by chunk. The response is
+  a generator too, so memory stays flat however large the dictionary grows.
+- Every response carries an `X-Export-Cursor` header: the change-log position
+  (`settled_change_watermark()` in dictionary/public_view.py) it is complete
+  up to. `since=<cursor>` then returns only entries logged to PublicEntryChange
+  after it: the current row of each live one and a tombstone
+  (`"deleted": true`, other fields empty) for each one no longer public. A
+  mother edit logs its variants too, since they export the mother's meaning
+  and synonyms.
+- Log rows newer than the settle window stay past the cursor, so a writer that
+  commits late is still returned by the next pull.
+
+Limits:
+- The header is missing while the change log holds no settled row yet; repeat
+  the full export later to get a cursor.
+- A cursor older than the pruned change log is answered with 410: start over
+  with a full export.
+
+Troubleshooting:
+- Export fails behind pgbouncer in transaction pooling mode: server-side
+  cursors need a session, so set `DISABLE_SERVER_SIDE_CURSORS` on the database.
+"""
+
+import csv
+import json
+
+from dictionary.batching import chunked
+from dictionary.models import PublicEntryChange, PublicEntryView
+from dictionary.public_view import settled_change_watermark
+from dictionary.services import _semantic_source_entry
+
+EXPORT_CHUNK_SIZE = 2000
+
+# Lines per chunk handed to the WSGI server (avoids one write per row).
+LINES_PER_WRITE = 500
+
+EXPORT_FIELDS = (
+    "entry_id",
+    "term",
+    "is_mother",
+    "variant_group_id",
+    "mother_entry_id",
+    "status",
+    "meaning",
+    "part_of_speech",
+    "english_synonym",
+    "ivatan_synonym",
+    "english_antonym",
+    "ivatan_antonym",
+    "pronunciation_text",
+    "phonetic",
+    "variant_type",
+    "usage_notes",
+    "etymology",
+    "example_sentence",
+    "example_translation",
+    "audio_pronunciation_url",
+    "photo_url",
+    "created_at",
+    "approved_at",
+)
+
+# Downloads also say whether a row is a tombstone; bundles keep removals apart.
+EXPORT_COLUMNS = (*EXPORT_FIELDS, "deleted")
+
+
+def export_queryset():
+    return PublicEntryView.objects.select_related("entry__variant_group__mother_entry").order_by(
+        "term", "entry_id"
+    )
+
+
+def export_cursor() -> int:
+    """
+    Change-log position a full export read after this call is complete up to.
+    """
+
+    return settled_change_watermark()
+
+
+def export_changes(since):
+    """
+    `(cursor, entry ids)` logged after cursor `since`, or None when the `since`
+    row was already pruned.
+    """
+
+    if not PublicEntryChange.objects.filter(id=since).exists():
+        return None
+    # Unsettled rows stay past the cursor and come back in the next pull.
+    cursor = max(settled_change_watermark(), since)
+    entry_ids = (
+        PublicEntryChange.objects.filter(id__gt=since)
+        .order_by("entry_id")
+        .values_list("entry_id", flat=True)
+        .distinct()
+    )
+    return cursor, list(entry_ids)
+
+
+def export_rows(queryset, *, media_url):
+    """
+    Yield one export dict per PublicEntryView row.
+
+    `media_url(path)` turns a stored media path into a public URL.
+    """
+
+    for row in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        entry = row.entry
+        semantic_entry = _semantic_source_entry(entry)
+        yield {
+            "entry_id": str(row.entry_id),
+            "term": row.term,
+            "is_mother": row.is_mother,
+            "variant_group_id": str(row.variant_group_id) if row.variant_group_id else None,
+            "mother_entry_id": str(semantic_entry.id),
+            "status": row.status,
+            "meaning": row.meaning,
+            "part_of_speech": row.part_of_speech,
+            "english_synonym": semantic_entry.english_synonym,
+            "ivatan_synonym": semantic_entry.ivatan_synonym,
+            "english_antonym": semantic_entry.english_antonym,
+            "ivatan_antonym": semantic_entry.ivatan_antonym,
+            "pronunciation_text": entry.pronunciation_text,
+            "phonetic": entry.phonetic,
+            "variant_type": entry.variant_type,
+            "usage_notes": entry.usage_notes,
+            "etymology": entry.etymology,
+            "example_sentence": entry.example_sentence,
+            "example_translation": entry.example_translation,
+            "audio_pronunciation_url": media_url(row.audio_pronunciation),
+            "photo_url": media_url(row.photo),
+            "created_at": row.created_at.isoformat(),
+            "approved_at": row.last_approved_at.isoformat() if row.last_approved_at else None,
+            "deleted": False,
+        }
+
+
+def changed_export_rows(entry_ids, *, media_url):
+    """
+    Export rows of the live entries among `entry_ids`, then one tombstone per
+    entry that is no longer public.
+    """
+
+    removed = {str(entry_id) for entry_id in entry_ids}
+    for chunk in chunked(entry_ids):
+        for row in export_rows(export_queryset().filter(entry_id__in=chunk), media_url=media_url):
+            removed.discard(row["entry_id"])
+            yield row
+    for entry_id in sorted(removed):
+        yield {**dict.fromkeys(EXPORT_FIELDS), "entry_id": entry_id, "deleted": True}
+
+
+def _batched(lines):
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= LINES_PER_WRITE:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+
+def ndjson_lines(rows):
+    return _batched(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+
+class _EchoBuffer:
+    # csv.writer needs a file; this one hands each formatted line back.
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    writer = csv.writer(_EchoBuffer())
+
+    def lines():
+        yield writer.writerow(EXPORT_COLUMNS)
+        for row in rows:
+            yield writer.writerow(
+                ["" if row[field] is None else row[field] for field in EXPORT_COLUMNS]
+            )
+
+    return _batched(lines())
+
+
+# format -> (line generator, content type, file extension)
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_lines, "application/x-ndjson; charset=utf-8", "ndjson"),
+    "csv": (csv_lines, "text/csv; charset=utf-8", "csv"),
+}
@@ -0,0 +1,408 @@
+"""
+dictionary/importer.py
+
+Bulk import of legacy Ivatan wordlists (CSV or JSONL).
+
+Why:
+- Publishing through review costs one EntryRevision per term. Existing
+  wordlists are already vetted sources, so they are published directly.
+
+Input:
+- One record per CSV row / JSONL line, keyed by the Entry field names in
+  IMPORT_FIELDS plus an optional `group`.
+- Consecutive records sharing a `group` value become one VariantGroup. The
+  General Ivatan row (or the first row) is the mother; the other rows inherit
+  its semantic fields, exactly like published variants. Records without a
+  `group` become single-entry groups, like a normal publish.
+
+How it works:
+- Records are streamed, normalized with the helpers publish_revision uses and
+  validated like a submitted revision. Bad records are reported and skipped.
+- Every `batch_size` entries (cut at group boundaries) one transaction
+  bulk-creates VariantGroup, Entry, base-snapshot EntryRevision and
+  ContributionEvent rows, fills the search, English lookup, related term and
+  public listing tables and advances the WordlistImportCheckpoint.
+- bulk_create skips post_save, so no per-row signal work runs (gamification
+  jobs, counter deltas). Counters and the contributor's gamification are
+  recomputed once when the import finishes, and again by any resumed run.
+
+Troubleshooting:
+- Import stopped half way: run the same command again; it resumes after the
+  last committed batch (`--restart` ignores the checkpoint).
+- Record skipped as "already in the dictionary": a live entry has that
+  headword; change it through the normal revision flow instead.
+"""
+
+import csv
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from dictionary.english_lookup import refresh_entry_english_lookup
+from dictionary.field_groups import SEMANTIC_CORE_FIELDS
+from dictionary.models import (
+    Entry,
+    EntryRevision,
+    EntryStatus,
+    VariantGroup,
+    WordlistImportCheckpoint,
+)
+from dictionary.orthography import refresh_entry_search_keys
+from dictionary.public_view import refresh_entry_public_views
+from dictionary.related_terms import refresh_entry_related_links
+from dictionary.search import add_entry_search_documents
+from dictionary.services import find_live_headwords, snapshot_entry
+from dictionary.spelling import refresh_entry_spelling_index
+from dictionary.text import capitalize_first, headword_key, normalize_headword, normalize_sentence
+from dictionary.variant_services import is_general_ivatan_entry
+from users.contributions import bulk_award_dictionary_terms
+from users.models import PublicContentVersion
+from users.public_counters import rebuild_public_status_counters
+from users.public_versions import bump_public_content_version
+from users.recognition import recompute_gamification_for_users
+
+User = get_user_model()
+
+IMPORT_FIELDS = (
+    "term",
+    "pronunciation_text",
+    "phonetic",
+    "variant_type",
+    "usage_notes",
+    "etymology",
+    "example_sentence",
+    "example_translation",
+    "meaning",
+    "part_of_speech",
+    "english_synonym",
+    "ivatan_synonym",
+    "english_antonym",
+    "ivatan_antonym",
+    "source_text",
+    "term_source_is_self_knowledge",
+)
+BOOLEAN_IMPORT_FIELDS = {"term_source_is_self_knowledge"}
+SENTENCE_IMPORT_FIELDS = {"example_sentence", "example_translation"}
+
+# Only the first errors are kept for the report; the total is always counted.
+MAX_REPORTED_ERRORS = 100
+
+
+def _as_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _max_lengths():
+    return {
+        field: Entry._meta.get_field(field).max_length
+        for field in IMPORT_FIELDS
+        if Entry._meta.get_field(field).max_length
+    }
+
+
+# ============================================
+# READING
+# ============================================
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        reader = csv.DictReader(handle)
+        if "term" not in (reader.fieldnames or []):
+            raise ValueError("CSV header must include a 'term' column.")
+        yield from enumerate(reader, start=1)
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as handle:
+        number = 0
+        for line in handle:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                yield number, json.loads(line)
+            except ValueError:
+                yield number, None
+
+
+def read_wordlist_records(path, *, fmt=None):
+    """
+    Stream `(record_number, record)` pairs from a CSV or JSONL wordlist.
+
+    Record numbers count data rows (CSV) or non-blank lines (JSONL) from 1,
+    so they stay stable between runs and can serve as checkpoints.
+    """
+
+    fmt = (fmt or Path(path).suffix.lstrip(".")).lower()
+    if fmt == "csv":
+        return _read_csv(path)
+    if fmt in {"jsonl", "ndjson"}:
+        return _read_jsonl(path)
+    raise ValueError(f"Unsupported wordlist format '{fmt}'; use csv or jsonl.")
+
+
+def clean_wordlist_record(record, *, source_text="") -> dict:
+    """
+    Normalize one record into Entry field values. Raises ValueError if invalid.
+    """
+
+    if not isinstance(record, dict):
+        raise ValueError("record is not a JSON object.")
+
+    data = {}
+    for field in IMPORT_FIELDS:
+        value = record.get(field)
+        if field in BOOLEAN_IMPORT_FIELDS:
+            data[field] = _as_bool(value)
+        elif field == "term":
+            data[field] = normalize_headword(value)
+        elif field == "meaning":
+            data[field] = capitalize_first(value)
+        elif field in SENTENCE_IMPORT_FIELDS:
+            data[field] = normalize_sentence(value)
+        else:
+            data[field] = str(value or "").strip()
+
+    if not data["term"]:
+        raise ValueError("term is required.")
+    if data["example_sentence"] and not data["example_translation"]:
+        raise ValueError("example_translation is required when example_sentence is provided.")
+    if not data["source_text"] and not data["term_source_is_self_knowledge"]:
+        data["source_text"] = source_text
+    for field, limit in _max_lengths().items():
+        if len(data[field]) > limit:
+            raise ValueError(f"{field} is longer than {limit} characters.")
+    return data
+
+
+def _group_key(record):
+    return str(record.get("group") or "").strip() if isinstance(record, dict) else ""
+
+
+def _wordlist_groups(records, *, source_text, errors):
+    """
+    Yield `(last_record_number, rows)` per variant group.
+
+    Every record lands in exactly one yielded group; invalid records only add
+    to `errors`, so `rows` may be empty.
+    """
+
+    seen_keys = set()
+    group_key = ""
+    rows = []
+    end = 0
+    for number, record in records:
+        key = _group_key(record)
+        continues_group = bool(key) and key == group_key
+        if end and not continues_group:
+            yield end, rows
+            rows = []
+        group_key, end = key, number
+        if key and not continues_group:
+            if key in seen_keys:
+                errors.append((number, f"group '{key}' must be on consecutive records."))
+                group_key = ""
+                continue
+            seen_keys.add(key)
+        try:
+            rows.append(clean_wordlist_record(record, source_text=source_text))
+        except ValueError as exc:
+            errors.append((number, str(exc)))
+    if end:
+        yield end, rows
+
+
+# ============================================
+# WRITING
+# ============================================
+
+
+def _build_group(rows, *, contributor, now):
+    """
+    Unsaved (VariantGroup, [Entry]) for one group of cleaned rows.
+    """
+
+    entries = []
+    term_keys = set()
+    for row in rows:
+        term_key = headword_key(row["term"])
+        if term_key in term_keys:
+            raise ValueError(f"headword '{row['term']}' is repeated in its group.")
+        term_keys.add(term_key)
+        entries.append(
+            Entry(
+                # bulk_create skips Entry.save(), which normally sets these two.
+                term_key=term_key,
+                first_approved_at=now,
+                status=EntryStatus.APPROVED,
+                initial_contributor=contributor,
+                last_revised_by=contributor,
+                last_approved_at=now,
+                **row,
+            )
+        )
+
+    mother = next((entry for entry in entries if is_general_ivatan_entry(entry)), entries[0])
+    if not mother.meaning:
+        raise ValueError(f"meaning is required on the mother term '{mother.term}'.")
+    if not mother.source_text and not mother.term_source_is_self_knowledge:
+        raise ValueError(
+            f"source_text is required on '{mother.term}' unless"
+            " term_source_is_self_knowledge is set."
+        )
+
+    group = VariantGroup(mother_entry=mother)
+    for entry in entries:
+        entry.variant_group = group
+        entry.is_mother = entry is mother
+        if entry is not mother:
+            # Variants carry the mother's semantic core, as in _create_additional_variants.
+            for field in SEMANTIC_CORE_FIELDS:
+                setattr(entry, field, getattr(mother, field))
+    return group, entries
+
+
+def _write_batch(groups, *, contributor, now):
+    """
+    Insert a batch of built groups. Returns the created entries.
+    """
+
+    # FK constraints are deferred until commit, so the group <-> mother cycle
+    # can be inserted in any order.
+    VariantGroup.objects.bulk_create([group for group, _ in groups])
+    entries = [entry for _, group_entries in groups for entry in group_entries]
+    Entry.objects.bulk_create(entries)
+
+    revisions = [
+        EntryRevision(
+            entry=entry,
+            contributor=contributor,
+            proposed_data=snapshot_entry(entry),
+            status=EntryRevision.Status.APPROVED,
+            approved_at=now,
+            is_base_snapshot=True,
+        )
+        for entry in entries
+    ]
+    EntryRevision.objects.bulk_create(revisions)
+    bulk_award_dictionary_terms(
+        user=contributor,
+        entries_with_revisions=[
+            (entry, revision)
+            for entry, revision in zip(entries, revisions, strict=True)
+            if entry.is_mother
+        ],
+    )
+
+    # bulk_create skips the post_save hooks that keep these tables in sync.
+    add_entry_search_documents(entries)
+    refresh_entry_search_keys(entries)
+    refresh_entry_spelling_index(entries)
+    refresh_entry_english_lookup(entries)
+    refresh_entry_related_links(entries)
+    refresh_entry_public_views(entries)
+    bump_public_content_version(PublicContentVersion.Scope.DICTIONARY)
+    return entries
+
+
+def _flush(batch, *, contributor, checkpoint, records_done, errors):
+    """
+    Commit one batch of `(last_record_number, rows)` groups with its checkpoint.
+    """
+
+    now = timezone.now()
+    built = []
+    for end, rows in batch:
+        if not rows:
+            continue
+        try:
+            built.append((end, *_build_group(rows, contributor=contributor, now=now)))
+        except ValueError as exc:
+            errors.append((end, str(exc)))
+
+    taken = set(find_live_headwords(entry.term for _, _, entries in built for entry in entries))
+    groups = []
+    for end, group, entries in built:
+        duplicate = next((entry.term for entry in entries if entry.term_key in taken), None)
+        if duplicate:
+            errors.append((end, f"headword '{duplicate}' is already in the dictionary."))
+            continue
+        taken.update(entry.term_key for entry in entries)
+        groups.append((group, entries))
+
+    with transaction.atomic():
+        created = _write_batch(groups, contributor=contributor, now=now) if groups else []
+        checkpoint.records_done = records_done
+        checkpoint.entries_created += len(created)
+        checkpoint.save(update_fields=["records_done", "entries_created", "updated_at"])
+    return len(created)
+
+
+def import_wordlist(
+    path, *, contributor, fmt=None, batch_size=1000, source_text="", restart=False
+) -> dict:
+    """
+    Import one wordlist file, resuming from its checkpoint.
+
+    Returns `{"created", "records", "resumed_from", "error_count", "errors"}`
+    where `errors` holds the first `(record_number, message)` pairs.
+    """
+
+    records = read_wordlist_records(path, fmt=fmt)
+    source = str(Path(path).resolve())[:500]
+    checkpoint, _ = WordlistImportCheckpoint.objects.get_or_create(source=source)
+    if restart:
+        checkpoint.records_done = 0
+        checkpoint.entries_created = 0
+        checkpoint.save(update_fields=["records_done", "entries_created", "updated_at"])
+    resumed_from = checkpoint.records_done
+
+    errors = []
+    created = 0
+    batch = []
+    batch_size_so_far = 0
+    last_record = resumed_from
+    pending = ((number, record) for number, record in records if number > resumed_from)
+    for end, rows in _wordlist_groups(pending, source_text=source_text, errors=errors):
+        batch.append((end, rows))
+        batch_size_so_far += len(rows)
+        last_record = end
+        if batch_size_so_far >= batch_size:
+            created += _flush(
+                batch,
+                contributor=contributor,
+                checkpoint=checkpoint,
+                records_done=end,
+                errors=errors,
+            )
+            batch = []
+            batch_size_so_far = 0
+    if batch:
+        created += _flush(
+            batch,
+            contributor=contributor,
+            checkpoint=checkpoint,
+            records_done=last_record,
+            errors=errors,
+        )
+
+    # A crashed run commits batches without reaching this step, so rebuild
+    # whenever the checkpoint holds entries, even if this run created none.
+    if checkpoint.entries_created:
+        rebuild_public_status_counters()
+        recompute_gamification_for_users(User.objects.filter(pk=contributor.pk))
+
+    errors.sort()
+    return {
+        "created": created,
+        "records": last_record,
+        "resumed_from": resumed_from,
+        "error_count": len(errors),
+        "errors": errors[:MAX_REPORTED_ERRORS],
+    }
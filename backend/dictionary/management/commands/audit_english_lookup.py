@@ -0,0 +1,51 @@
+"""
+Management command: audit_english_lookup
+
+Compares stored EnglishLookupTerm rows with the rows the live entries should
+produce and reports drift. `--fix` repairs only the affected entries.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dictionary.english_lookup import find_english_lookup_mismatches, refresh_entry_english_lookup
+from dictionary.models import Entry
+
+
+class Command(BaseCommand):
+    help = (
+        "Audit the English → Ivatan lookup index against live dictionary entries and "
+        "report missing or stale rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Refresh lookup rows for every entry with a mismatch.",
+        )
+
+    def handle(self, *args, **options):
+        mismatches = find_english_lookup_mismatches()
+        missing = mismatches["missing"]
+        stale = mismatches["stale"]
+
+        if not missing and not stale:
+            self.stdout.write(self.style.SUCCESS("No mismatches detected."))
+            return
+
+        self.stdout.write(
+            self.style.WARNING(f"Mismatches found: missing={len(missing)}, stale={len(stale)}")
+        )
+        for english_key, entry_id, term, _ in missing:
+            self.stdout.write(f"- missing: {english_key!r} -> {term} ({entry_id})")
+        for english_key, entry_id, term, _ in stale:
+            self.stdout.write(f"- stale: {english_key!r} -> {term} ({entry_id})")
+
+        if not options["fix"]:
+            raise CommandError("English lookup index is out of sync; rerun with --fix.")
+
+        entry_ids = {row[1] for row in missing} | {row[1] for row in stale}
+        refresh_entry_english_lookup(
+            Entry.objects.filter(id__in=entry_ids).select_related("variant_group__mother_entry")
+        )
+        self.stdout.write(self.style.SUCCESS(f"Refreshed entries: {len(entry_ids)}"))
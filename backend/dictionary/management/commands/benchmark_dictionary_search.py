@@ -0,0 +1,129 @@
+"""
+Management command: benchmark_dictionary_search
+
+Measures public dictionary search latency against a synthetic corpus:
+- seeds N approved entries (default 100,000) inside a transaction
+- rebuilds the search index and times `ranked_entry_ids(...)` per query
+- rolls everything back, so the real database is left untouched
+
+To rebuild the index of the real entries, use `rebuild_search_index`.
+"""
+
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from dictionary.models import Entry, EntryStatus
+from dictionary.search import _backend, ranked_entry_ids, rebuild_search_index
+
+# Ivatan-like headwords are built from syllables; English glosses come from a
+# generated vocabulary so word frequencies resemble a real dictionary instead
+# of every entry sharing the same handful of words.
+SYLLABLES = (
+    "a ba bu da di ha hu ka ku la li ma mi na nu nga ngo pa pi ra ru sa si ta tu va vi ya yu "
+    "chi cha ri van vid ti yo du mu an ay ot ed ek in ol ap ud is uy aw"
+).split()
+VOCABULARY_SIZE = 8000
+CONSONANTS = "bcdfghjklmnprstvwy"
+VOWELS = "aeiou"
+
+
+def _english_vocabulary(rng):
+    words = set()
+    while len(words) < VOCABULARY_SIZE:
+        length = rng.randint(2, 4)
+        words.add("".join(rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(length)))
+    return sorted(words)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark the public dictionary search index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--entries", type=int, default=100_000)
+        parser.add_argument("--queries", type=int, default=200)
+        parser.add_argument("--max-p95-ms", type=float, default=10.0)
+        parser.add_argument("--limit", type=int, default=25)
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        result = {}
+        try:
+            with transaction.atomic():
+                result = self._run_benchmark(rng=rng, options=options)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+        p95_ms = result["p95_ms"]
+        summary = (
+            f"backend={result['backend']}, entries={options['entries']}, "
+            f"queries={options['queries']}, p50_ms={result['p50_ms']:.2f}, "
+            f"p95_ms={p95_ms:.2f}, max_ms={result['max_ms']:.2f}"
+        )
+        if p95_ms > options["max_p95_ms"]:
+            raise CommandError(
+                f"Search p95 {p95_ms:.2f}ms exceeds {options['max_p95_ms']:.2f}ms ({summary})"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Search benchmark passed: {summary}"))
+
+    def _run_benchmark(self, *, rng, options):
+        contributor = get_user_model().objects.create_user(
+            username="search_benchmark_user",
+            password="unused-benchmark-password",
+        )
+        vocabulary = _english_vocabulary(rng)
+        terms = []
+        batch = []
+        for _ in range(options["entries"]):
+            term = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+            terms.append(term)
+            batch.append(
+                Entry(
+                    term=term,
+                    meaning=" ".join(rng.sample(vocabulary, 3)),
+                    english_synonym=rng.choice(vocabulary),
+                    usage_notes=f"Used around {rng.choice(vocabulary)}.",
+                    example_sentence=f"{term.capitalize()} {rng.choice(vocabulary)}.",
+                    status=EntryStatus.APPROVED,
+                    initial_contributor=contributor,
+                    last_revised_by=contributor,
+                )
+            )
+            if len(batch) >= 2000:
+                Entry.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            Entry.objects.bulk_create(batch)
+
+        # bulk_create skips post_save, so index in one pass like a real import would.
+        rebuild_search_index()
+
+        queries = [
+            rng.choice(vocabulary) if index % 2 else rng.choice(terms)
+            for index in range(options["queries"])
+        ]
+        ranked_entry_ids(queries[0], limit=options["limit"])  # warm caches
+
+        timings = []
+        for query in queries:
+            started = time.perf_counter()
+            ranked_entry_ids(query, limit=options["limit"])
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        return {
+            "backend": type(_backend()).__name__.strip("_"),
+            "p50_ms": statistics.median(timings),
+            "p95_ms": timings[max(0, int(len(timings) * 0.95) - 1)],
+            "max_ms": timings[-1],
+        }
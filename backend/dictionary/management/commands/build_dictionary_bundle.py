@@ -0,0 +1,34 @@
+"""
+Management command: build_dictionary_bundle
+
+Builds the next offline dictionary bundle version and its delta patch (see
+dictionary/bundles.py). Run it from cron; it is a no-op when no public entry
+changed since the latest version (unless `--force`).
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.bundles import build_dictionary_bundle
+
+
+class Command(BaseCommand):
+    help = "Build the next offline dictionary bundle and its delta patch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Build a new version even if nothing changed.",
+        )
+
+    def handle(self, *args, **options):
+        bundle = build_dictionary_bundle(force=options["force"])
+        if bundle is None:
+            self.stdout.write(self.style.SUCCESS("Dictionary bundle is up to date."))
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Dictionary bundle v{bundle.version} built: entries={bundle.entry_count}"
+                f" patch_changes={bundle.patch_change_count}"
+            )
+        )
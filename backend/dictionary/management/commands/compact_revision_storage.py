@@ -0,0 +1,34 @@
+"""
+Management command: compact_revision_storage
+
+Re-encodes dictionary and folklore revisions as keyframes plus deltas and
+reports the storage saved. Safe to re-run. See users/revision_storage.py.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.models import EntryRevision
+from folklore.models import FolkloreRevision
+from users.revision_storage import compact_revisions
+
+
+class Command(BaseCommand):
+    help = "Store revision snapshots as deltas against keyframes and report bytes saved."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the savings without rewriting any revision.",
+        )
+
+    def handle(self, *args, **options):
+        for label, model in (("dictionary", EntryRevision), ("folklore", FolkloreRevision)):
+            report = compact_revisions(model, dry_run=options["dry_run"])
+            saved = report["bytes_before"] - report["bytes_after"]
+            summary = ", ".join(f"{key}={value}" for key, value in report.items())
+            line = f"{label}: {summary}, bytes_saved={saved}"
+            if options["dry_run"]:
+                self.stdout.write(self.style.WARNING(f"Revision storage (dry run) {line}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"Revision storage compacted {line}"))
@@ -0,0 +1,300 @@
+"""
+Management command: explain_hot_queries
+
+Runs EXPLAIN on the hottest review-queue, revision-history and public-listing
+queries and fails if any of them falls back to a sequential table scan. The
+querysets come from the helpers the views and services use (reviews/queues.py,
+dictionary/services.py, folklore/services.py, users/pagination.py), so the
+checker follows the code when a query changes.
+
+By default it seeds a synthetic dataset (~100k rows across entries,
+revisions and reviews) inside a transaction that is rolled back afterwards,
+runs ANALYZE so the planner sees realistic statistics, then explains each
+query. Use `--skip-seed` to explain against the data already in the database.
+
+Troubleshooting:
+- A query reports "sequential scan": check the matching Meta.indexes entry in
+  dictionary/folklore/reviews models and that its migration has been applied.
+"""
+
+import re
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from dictionary.models import Entry, EntryRevision, EntryStatus, PublicEntryView
+from dictionary.public_view import public_listing_queryset, rebuild_public_entry_views
+from dictionary.services import contributor_revisions, detail_revision_slices_queryset
+from folklore.models import FolkloreEntry, FolkloreRevision
+from folklore.services import (
+    approved_folklore_revisions,
+    contributor_folklore_revisions,
+    public_folklore_entries,
+)
+from reviews.models import FolkloreReview, Review
+from reviews.queues import (
+    flag_reviews,
+    folklore_flag_reviews,
+    folklore_rereview_queue,
+    folklore_reviews_by,
+    folklore_round_approvals,
+    pending_folklore_queue,
+    pending_revision_queue,
+    rereview_queue,
+    reviews_by,
+    round_approvals,
+)
+from users.pagination import keyset_queryset
+
+# First page of the public listings, as the frontend requests it.
+LISTING_PAGE_SIZE = 50
+SQLITE_FULL_SCAN = re.compile(r"\bSCAN (?!CONSTANT)(\S+)(?!.*\bUSING\b)")
+# Intermediate results (window subqueries, CTEs) that SQLite scans after building them.
+SQLITE_INTERMEDIATE = re.compile(r"\b(?:CO-ROUTINE|MATERIALIZE) (\S+)")
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _hot_queries(*, entry, folklore_entry, revision, folklore_revision, user):
+    """
+    The hot querysets, built by the same helpers the endpoints call.
+
+    Listings are sliced the way `keyset_page` slices them; queues and
+    histories are explained exactly as the views evaluate them.
+    """
+
+    page = LISTING_PAGE_SIZE + 1
+    return {
+        # dictionary.views.dictionary_entry_detail_view
+        "revision_history": detail_revision_slices_queryset(entry=entry, audience="staff"),
+        # folklore.views.folklore_entry_detail_view
+        "folklore_latest_approved": approved_folklore_revisions(folklore_entry)[:1],
+        # reviews.views.reviewer_dashboard_view
+        "pending_dictionary_queue": pending_revision_queue(user),
+        "pending_folklore_queue": pending_folklore_queue(user),
+        "rereview_queue": rereview_queue(user),
+        "folklore_rereview_queue": folklore_rereview_queue(user),
+        "my_reviews": reviews_by(user),
+        "my_folklore_reviews": folklore_reviews_by(user),
+        # reviews.views quorum progress / reviews.services flag rounds
+        "review_round_approvals": round_approvals(revision, 0),
+        "review_latest_flag": flag_reviews(revision)[:1],
+        "folklore_review_round_approvals": folklore_round_approvals(folklore_revision, 0),
+        "folklore_review_latest_flag": folklore_flag_reviews(folklore_revision)[:1],
+        # "My submissions" pages
+        "my_dictionary_revisions": contributor_revisions(user),
+        "my_folklore_revisions": contributor_folklore_revisions(user),
+        # Public listings (first keyset page)
+        "public_dictionary_recent": keyset_queryset(
+            public_listing_queryset(), field="last_approved_at", descending=True, sort="recent"
+        )[:page],
+        "public_dictionary_alpha": keyset_queryset(
+            public_listing_queryset(), field="term", descending=False, sort="alpha"
+        )[:page],
+        "public_folklore_recent": keyset_queryset(
+            public_folklore_entries(), field="created_at", descending=True, sort="recent"
+        )[:page],
+        "public_folklore_alpha": keyset_queryset(
+            public_folklore_entries(), field="title", descending=False, sort="alpha"
+        )[:page],
+    }
+
+
+def explain(queryset) -> str:
+    """
+    EXPLAIN output for a queryset, one plan line per row.
+    """
+
+    # QuerySet.explain() misplaces the EXPLAIN prefix when a window filter
+    # wraps the query in a subquery (revision history), so prefix the SQL here.
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+        return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+
+
+def find_sequential_scans(plan: str) -> list[str]:
+    """
+    Return the table names a query plan reads with a full sequential scan.
+    """
+
+    if connection.vendor == "postgresql":
+        return re.findall(r"Seq Scan on (\S+)", plan)
+    if connection.vendor == "sqlite":
+        intermediate = set(SQLITE_INTERMEDIATE.findall(plan))
+        return [
+            match.group(1)
+            for line in plan.splitlines()
+            for match in [SQLITE_FULL_SCAN.search(line)]
+            if match and match.group(1) not in intermediate
+        ]
+    return []
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN hot dictionary/folklore/review queries and fail on sequential scans."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--skip-seed", action="store_true")
+
+    def handle(self, *args, **options):
+        results = {}
+        try:
+            with transaction.atomic():
+                if not options["skip_seed"]:
+                    self._seed(total_rows=options["rows"])
+                self._analyze()
+                results = self._explain_all()
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+        failures = []
+        for name, (plan, scans) in results.items():
+            if scans:
+                failures.append(name)
+                self.stdout.write(self.style.WARNING(f"- {name}: sequential scan on {scans}"))
+                self.stdout.write(plan)
+            else:
+                self.stdout.write(f"- {name}: ok")
+
+        if failures:
+            raise CommandError(f"Sequential scans found in: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS(f"Explained queries: {len(results)}, no seq scans."))
+
+    def _explain_all(self):
+        sample = {
+            "entry": Entry.objects.order_by("id").first(),
+            "folklore_entry": FolkloreEntry.objects.order_by("id").first(),
+            "revision": EntryRevision.objects.order_by("id").first(),
+            "folklore_revision": FolkloreRevision.objects.order_by("id").first(),
+            "user": get_user_model().objects.order_by("id").first(),
+        }
+        results = {}
+        for name, queryset in _hot_queries(**sample).items():
+            plan = explain(queryset)
+            results[name] = (plan, find_sequential_scans(plan))
+        return results
+
+    def _analyze(self):
+        with connection.cursor() as cursor:
+            if connection.vendor == "sqlite":
+                cursor.execute("ANALYZE")
+            elif connection.vendor == "postgresql":
+                for model in (
+                    Entry,
+                    PublicEntryView,
+                    EntryRevision,
+                    FolkloreEntry,
+                    FolkloreRevision,
+                ):
+                    cursor.execute(f"ANALYZE {model._meta.db_table}")
+                for model in (Review, FolkloreReview):
+                    cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def _seed(self, *, total_rows):
+        # Split: 25% entries, 50% entry revisions, 25% reviews; folklore gets a quarter of that.
+        User = get_user_model()
+        User.objects.bulk_create([User(username=f"explain_user_{index}") for index in range(200)])
+        users = list(User.objects.filter(username__startswith="explain_user_").order_by("id"))
+
+        entry_count = max(total_rows // 4, 1)
+        entries = Entry.objects.bulk_create(
+            [
+                Entry(
+                    term=f"term{index:07d}",
+                    status=self._entry_status(index),
+                    initial_contributor=users[index % len(users)],
+                )
+                for index in range(entry_count)
+            ],
+            batch_size=2000,
+        )
+        # bulk_create skips post_save, so build the listing read model in one pass.
+        rebuild_public_entry_views()
+        revisions = EntryRevision.objects.bulk_create(
+            [
+                EntryRevision(
+                    entry=entry,
+                    contributor=entry.initial_contributor,
+                    proposed_data={},
+                    status=status,
+                    is_base_snapshot=is_base,
+                )
+                for entry_index, entry in enumerate(entries)
+                for status, is_base in (
+                    (EntryRevision.Status.APPROVED, True),
+                    (self._revision_status(entry_index), False),
+                )
+            ],
+            batch_size=2000,
+        )
+        Review.objects.bulk_create(
+            [
+                Review(
+                    revision=revision,
+                    reviewer=users[(index * 7) % len(users)],
+                    decision=Review.Decision.APPROVE,
+                )
+                for index, revision in enumerate(revisions[: total_rows // 4])
+            ],
+            batch_size=2000,
+        )
+
+        folklore_count = max(entry_count // 4, 1)
+        folklore_entries = FolkloreEntry.objects.bulk_create(
+            [
+                FolkloreEntry(
+                    title=f"Folklore {index:06d}",
+                    content="Sample",
+                    category=FolkloreEntry.Category.ORAL_NARRATIVES,
+                    contributor=users[index % len(users)],
+                    status=self._entry_status(index),
+                )
+                for index in range(folklore_count)
+            ],
+            batch_size=2000,
+        )
+        folklore_revisions = FolkloreRevision.objects.bulk_create(
+            [
+                FolkloreRevision(
+                    entry=entry,
+                    contributor=entry.contributor,
+                    proposed_data={},
+                    status=self._revision_status(index),
+                )
+                for index, entry in enumerate(folklore_entries)
+            ],
+            batch_size=2000,
+        )
+        FolkloreReview.objects.bulk_create(
+            [
+                FolkloreReview(
+                    folklore_revision=revision,
+                    reviewer=users[(index * 7) % len(users)],
+                    decision=FolkloreReview.Decision.APPROVE,
+                )
+                for index, revision in enumerate(folklore_revisions)
+            ],
+            batch_size=2000,
+        )
+
+    @staticmethod
+    def _entry_status(index):
+        if index % 20 == 0:
+            return EntryStatus.APPROVED_UNDER_REVIEW
+        if index % 20 == 1:
+            return EntryStatus.PENDING
+        return EntryStatus.APPROVED
+
+    @staticmethod
+    def _revision_status(index):
+        if index % 10 == 0:
+            return EntryRevision.Status.PENDING
+        if index % 10 == 1:
+            return EntryRevision.Status.REJECTED
+        return EntryRevision.Status.APPROVED
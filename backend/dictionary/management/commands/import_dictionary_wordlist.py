@@ -0,0 +1,65 @@
+"""
+Management command: import_dictionary_wordlist
+
+Publishes a legacy Ivatan wordlist (CSV or JSONL) straight into the live
+dictionary, crediting one contributor. See dictionary/importer.py for the
+record format.
+
+Examples:
+- `manage.py import_dictionary_wordlist words.csv --contributor admin --source-text "Reid 1966"`
+- Re-run the same command after an interruption to resume; add `--restart`
+  to start from the first record again.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from dictionary.importer import import_wordlist
+
+# Errors printed to stdout; the summary line always has the full count.
+PRINTED_ERRORS = 20
+
+
+class Command(BaseCommand):
+    help = "Bulk import a CSV/JSONL wordlist into the live dictionary (resumable)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--contributor", required=True, help="Username credited for entries.")
+        parser.add_argument("--format", choices=["csv", "jsonl"], default=None)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--source-text",
+            default="",
+            help="Headword source used for records without source_text.",
+        )
+        parser.add_argument("--restart", action="store_true", help="Ignore the saved checkpoint.")
+
+    def handle(self, *args, **options):
+        contributor = get_user_model().objects.filter(username=options["contributor"]).first()
+        if contributor is None:
+            raise CommandError(f"Unknown contributor '{options['contributor']}'.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        try:
+            result = import_wordlist(
+                options["path"],
+                contributor=contributor,
+                fmt=options["format"],
+                batch_size=options["batch_size"],
+                source_text=options["source_text"].strip(),
+                restart=options["restart"],
+            )
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        for record_number, message in result["errors"][:PRINTED_ERRORS]:
+            self.stdout.write(f"- record {record_number}: {message}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wordlist import complete: created={result['created']}"
+                f" records={result['records']} resumed_from={result['resumed_from']}"
+                f" errors={result['error_count']}"
+            )
+        )
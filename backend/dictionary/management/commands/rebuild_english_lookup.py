@@ -0,0 +1,21 @@
+"""
+Management command: rebuild_english_lookup
+
+Rebuilds the English → Ivatan reverse index (EnglishLookupTerm) from the
+current live entries. Safe to run at any time; the rebuild is one transaction.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.english_lookup import rebuild_english_lookup
+
+
+class Command(BaseCommand):
+    help = "Rebuild the English → Ivatan lookup index from live dictionary entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_english_lookup(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"English lookup rebuilt: rows={written}"))
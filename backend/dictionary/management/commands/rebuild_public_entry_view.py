@@ -0,0 +1,21 @@
+"""
+Management command: rebuild_public_entry_view
+
+Rebuilds the public listing read model (PublicEntryView) from the current live
+entries. Safe to run at any time; the rebuild is one transaction.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.public_view import rebuild_public_entry_views
+
+
+class Command(BaseCommand):
+    help = "Rebuild the public dictionary listing read model from live entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_public_entry_views(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Public entry view rebuilt: rows={written}"))
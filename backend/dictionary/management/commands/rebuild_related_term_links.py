@@ -0,0 +1,22 @@
+"""
+Management command: rebuild_related_term_links
+
+Rebuilds every RelatedTermLink from the synonym/antonym fields and re-resolves
+them against the public listing. Safe to run at any time; the rebuild is one
+transaction.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.related_terms import rebuild_related_term_links
+
+
+class Command(BaseCommand):
+    help = "Rebuild synonym/antonym links from entry relation fields."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_related_term_links(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Related term links rebuilt: links={written}"))
@@ -0,0 +1,22 @@
+"""
+Management command: rebuild_search_index
+
+Rebuilds the public search documents (EntrySearchDocument) of every live
+entry. Run it after bulk imports or data repairs that bypassed the Entry
+post_save signal. The rebuild is one transaction.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the public dictionary search index from live entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        indexed = rebuild_search_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Search index rebuilt: indexed={indexed}"))
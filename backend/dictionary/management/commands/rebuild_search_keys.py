@@ -0,0 +1,22 @@
+"""
+Management command: rebuild_search_keys
+
+Rebuilds the orthographic search keys (EntrySearchKey) of every live entry.
+Run it after changing DICTIONARY_ORTHOGRAPHY_RULES. The rebuild is one
+transaction.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.orthography import rebuild_search_keys
+
+
+class Command(BaseCommand):
+    help = "Rebuild spelling-tolerant search keys from live dictionary entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_search_keys(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Search keys rebuilt: rows={written}"))
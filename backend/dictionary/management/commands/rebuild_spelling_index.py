@@ -0,0 +1,22 @@
+"""
+Management command: rebuild_spelling_index
+
+Rebuilds the "did you mean" deletion index (SpellingDeletion) from the live
+entries' search keys. Run it after changing DICTIONARY_ORTHOGRAPHY_RULES. The
+rebuild is one transaction.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.spelling import rebuild_spelling_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the spelling suggestion index from live dictionary entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_spelling_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Spelling index rebuilt: rows={written}"))
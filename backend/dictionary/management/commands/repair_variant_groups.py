@@ -0,0 +1,31 @@
+"""
+Management command: repair_variant_groups
+
+Checks every VariantGroup for a missing or misplaced mother term, `is_mother`
+flags that disagree with the group, ungrouped published entries and missing
+`first_approved_at` stamps, then repairs them (see
+`variant_services.repair_variant_groups`). `--dry-run` only reports.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.variant_services import repair_variant_groups
+
+
+class Command(BaseCommand):
+    help = "Regroup and repair dictionary variant groups and their mother terms."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report problems without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        report = repair_variant_groups(dry_run=options["dry_run"])
+        summary = ", ".join(f"{key}={value}" for key, value in report.items())
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Variant group problems: {summary}"))
+            return
+        self.stdout.write(self.style.SUCCESS(f"Variant groups repaired: {summary}"))
@@ -4,6 +4,10 @@ Management command: run_lifecycle_maintenance
 Applies lifecycle automation for dictionary and folklore entries:
 - auto-archive old rejected entries
 - preserve archived entries until an explicitly approved manual deletion workflow exists
+- sweep approved revisions past the retention limit (users/revision_retention.py)
+- store recent revisions' long-text edits as patches (users/revision_storage.py);
+  revision saves on the request path leave them whole
+- prune the public entry change log (dictionary/public_view.py)
 """
 
 from datetime import timedelta
@@ -13,10 +17,17 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from dictionary.models import Entry, EntryRevision, EntryStatus
+from dictionary.public_view import prune_public_entry_changes
 from dictionary.state_machine import validate_transition
 from dictionary.variant_services import handle_mother_removed_or_archived
-from folklore.models import FolkloreEntry
+from folklore.models import FolkloreEntry, FolkloreRevision
 from folklore.state_machine import validate_transition as validate_folklore_transition
+from users.revision_retention import sweep_revision_retention
+from users.revision_storage import compact_revisions
+
+# Revisions created or approved within this window are re-encoded each run;
+# longer than the run interval so a missed day is still covered.
+COMPACTION_WINDOW_DAYS = 3
 
 
 class Command(BaseCommand):
@@ -32,12 +43,24 @@ class Command(BaseCommand):
         archived_folklore = self._archive_rejected_folklore_entries(
             cutoff=archive_cutoff,
         )
+        revisions_swept = sweep_revision_retention(EntryRevision) + sweep_revision_retention(
+            FolkloreRevision
+        )
+        compaction_since = now - timedelta(days=COMPACTION_WINDOW_DAYS)
+        revisions_compacted = sum(
+            compact_revisions(model, since=compaction_since)["revisions"]
+            for model in (EntryRevision, FolkloreRevision)
+        )
+        public_changes_pruned = prune_public_entry_changes()
 
         self.stdout.write(
             self.style.SUCCESS(
                 "Lifecycle maintenance complete: "
                 f"dictionary_archived={archived_dictionary}, "
                 f"folklore_archived={archived_folklore}, "
+                f"revisions_swept={revisions_swept}, "
+                f"revisions_compacted={revisions_compacted}, "
+                f"public_changes_pruned={public_changes_pruned}, "
                 "automatic_deletion=disabled"
             )
         )
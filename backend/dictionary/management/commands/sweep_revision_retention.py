@@ -0,0 +1,33 @@
+"""
+Management command: sweep_revision_retention
+
+Deletes approved dictionary and folklore revisions beyond the newest 20 per
+entry (base snapshots are never touched). See users/revision_retention.py.
+"""
+
+from django.core.management.base import BaseCommand
+
+from dictionary.models import EntryRevision
+from folklore.models import FolkloreRevision
+from users.revision_retention import SWEEP_BATCH_SIZE, sweep_revision_retention
+
+
+class Command(BaseCommand):
+    help = "Apply the approved-revision retention limit to every entry in bulk."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=SWEEP_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        dictionary_deleted = sweep_revision_retention(
+            EntryRevision, batch_size=options["batch_size"]
+        )
+        folklore_deleted = sweep_revision_retention(
+            FolkloreRevision, batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Revision retention sweep complete: "
+                f"dictionary_deleted={dictionary_deleted}, folklore_deleted={folklore_deleted}"
+            )
+        )
@@ -0,0 +1,157 @@
+import django.db.models.deletion
+from django.db import OperationalError, migrations, models
+
+
+SEARCH_DOCUMENT_TABLE = "dictionary_entrysearchdocument"
+SQLITE_FTS_TABLE = "dictionary_entrysearch_fts"
+FTS_COLUMNS = "term, meaning, synonyms, usage_notes, example_sentence"
+
+# Keep in sync with dictionary.search.POSTGRES_SEARCH_VECTOR_SQL.
+POSTGRES_SEARCH_VECTOR_SQL = (
+    "(setweight(to_tsvector('simple', {table}.term), 'A')"
+    " || setweight(to_tsvector('simple', {table}.meaning || ' ' || {table}.synonyms), 'B')"
+    " || setweight(to_tsvector('simple', {table}.usage_notes || ' '"
+    " || {table}.example_sentence), 'C'))"
+)
+
+SQLITE_FTS_STATEMENTS = [
+    f"""
+    CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} USING fts5(
+        {FTS_COLUMNS},
+        content='{SEARCH_DOCUMENT_TABLE}',
+        content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {SQLITE_FTS_TABLE}_ai AFTER INSERT ON {SEARCH_DOCUMENT_TABLE} BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.term, new.meaning, new.synonyms, new.usage_notes,
+                new.example_sentence);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SQLITE_FTS_TABLE}_ad AFTER DELETE ON {SEARCH_DOCUMENT_TABLE} BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.term, old.meaning, old.synonyms, old.usage_notes,
+                old.example_sentence);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {SQLITE_FTS_TABLE}_au AFTER UPDATE ON {SEARCH_DOCUMENT_TABLE} BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, {FTS_COLUMNS})
+        VALUES ('delete', old.id, old.term, old.meaning, old.synonyms, old.usage_notes,
+                old.example_sentence);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, {FTS_COLUMNS})
+        VALUES (new.id, new.term, new.meaning, new.synonyms, new.usage_notes,
+                new.example_sentence);
+    END
+    """,
+]
+
+POSTGRES_STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"""
+    CREATE INDEX dictionary_entrysearch_term_trgm
+    ON {SEARCH_DOCUMENT_TABLE} USING gin (upper(term) gin_trgm_ops)
+    """,
+    f"""
+    CREATE INDEX dictionary_entrysearch_vector
+    ON {SEARCH_DOCUMENT_TABLE}
+    USING gin ({POSTGRES_SEARCH_VECTOR_SQL.format(table=SEARCH_DOCUMENT_TABLE)})
+    """,
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for statement in POSTGRES_STATEMENTS:
+            schema_editor.execute(statement)
+    elif vendor == "sqlite":
+        try:
+            with schema_editor.connection.cursor() as cursor:
+                for statement in SQLITE_FTS_STATEMENTS:
+                    cursor.execute(statement)
+        except OperationalError:
+            # SQLite built without FTS5/trigram support: dictionary.search
+            # detects the missing table and falls back to plain LIKE queries.
+            pass
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS dictionary_entrysearch_vector")
+        schema_editor.execute("DROP INDEX IF EXISTS dictionary_entrysearch_term_trgm")
+    elif vendor == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {SQLITE_FTS_TABLE}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+
+
+def backfill_search_documents(apps, schema_editor):
+    Entry = apps.get_model("dictionary", "Entry")
+    EntrySearchDocument = apps.get_model("dictionary", "EntrySearchDocument")
+
+    documents = []
+    queryset = Entry.objects.filter(
+        status__in=["approved", "approved_under_review"]
+    ).select_related("variant_group__mother_entry")
+    for entry in queryset.iterator():
+        semantic_entry = entry
+        group = entry.variant_group
+        if group and group.mother_entry_id and not entry.is_mother:
+            semantic_entry = group.mother_entry
+        documents.append(
+            EntrySearchDocument(
+                entry_id=entry.id,
+                term=entry.term or "",
+                meaning=semantic_entry.meaning or "",
+                synonyms=" ".join(
+                    value
+                    for value in (semantic_entry.english_synonym, semantic_entry.ivatan_synonym)
+                    if value
+                ),
+                usage_notes=entry.usage_notes or "",
+                example_sentence=entry.example_sentence or "",
+            )
+        )
+    EntrySearchDocument.objects.bulk_create(documents, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dictionary", "0018_entry_audio_photo_license"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntrySearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("term", models.CharField(default="", max_length=255)),
+                ("meaning", models.TextField(default="")),
+                ("synonyms", models.TextField(default="")),
+                ("usage_notes", models.TextField(default="")),
+                ("example_sentence", models.TextField(default="")),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "entry",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_document",
+                        to="dictionary.entry",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
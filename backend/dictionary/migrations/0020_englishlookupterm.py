@@ -0,0 +1,86 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:51
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _english_lookup_key(value):
+    # Frozen copy of dictionary.english_lookup.english_lookup_key.
+    words = re.findall(r"[A-Za-z]+(?:'[A-Za-z]+)?", str(value or "").lower())
+    if not (1 <= len(words) <= 2):
+        return ""
+    return " ".join(words)
+
+
+def create_trigram_index(apps, schema_editor):
+    # Lets `english_key LIKE '%...%'` use an index on PostgreSQL (pg_trgm from 0019).
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            "CREATE INDEX dictionary_englishlookup_key_trgm "
+            "ON dictionary_englishlookupterm USING gin (english_key gin_trgm_ops)"
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS dictionary_englishlookup_key_trgm")
+
+
+def backfill_lookup_terms(apps, schema_editor):
+    Entry = apps.get_model("dictionary", "Entry")
+    EnglishLookupTerm = apps.get_model("dictionary", "EnglishLookupTerm")
+
+    rows = []
+    queryset = Entry.objects.filter(
+        status__in=["approved", "approved_under_review"]
+    ).select_related("variant_group__mother_entry")
+    for entry in queryset.iterator():
+        semantic_entry = entry
+        group = entry.variant_group
+        if group and group.mother_entry_id and not entry.is_mother:
+            semantic_entry = group.mother_entry
+        keys = [
+            _english_lookup_key(semantic_entry.meaning),
+            *[
+                _english_lookup_key(item)
+                for item in re.split(r"[,;\n]", semantic_entry.english_synonym or "")
+            ],
+        ]
+        for key in dict.fromkeys(item for item in keys if item):
+            rows.append(
+                EnglishLookupTerm(
+                    english_key=key,
+                    entry_id=entry.id,
+                    term=entry.term,
+                    part_of_speech=semantic_entry.part_of_speech or "",
+                )
+            )
+    EnglishLookupTerm.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0019_entrysearchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EnglishLookupTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('english_key', models.CharField(max_length=255)),
+                ('term', models.CharField(default='', max_length=255)),
+                ('part_of_speech', models.CharField(blank=True, default='', max_length=100)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='english_lookup_terms', to='dictionary.entry')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['english_key', 'term'], name='dictionary__english_ffe475_idx')],
+                'constraints': [models.UniqueConstraint(fields=('english_key', 'entry'), name='uniq_english_lookup_key_entry')],
+            },
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+        migrations.RunPython(backfill_lookup_terms, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0020_englishlookupterm'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['-last_approved_at', 'id'], name='dict_entry_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['term', 'id'], name='dict_entry_alpha_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0021_public_listing_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(condition=models.Q(('status__in', ['approved', 'approved_under_review'])), fields=['initial_contributor', '-last_approved_at'], name='dict_entry_public_contrib_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['status', '-last_approved_at'], name='dict_entry_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entryrevision',
+            index=models.Index(fields=['entry', 'status', 'is_base_snapshot', 'approved_at', 'created_at'], name='dict_rev_history_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entryrevision',
+            index=models.Index(fields=['status', '-created_at'], name='dict_rev_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entryrevision',
+            index=models.Index(fields=['contributor', '-created_at'], name='dict_rev_contrib_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entryrevision',
+            index=models.Index(condition=models.Q(('status', 'approved')), fields=['-approved_at', '-created_at'], name='dict_rev_approved_recent_idx'),
+        ),
+    ]
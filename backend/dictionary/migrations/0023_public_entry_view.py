@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_public_entry_views(apps, schema_editor):
+    # Frozen copy of dictionary.public_view.rebuild_public_entry_views.
+    Entry = apps.get_model("dictionary", "Entry")
+    PublicEntryView = apps.get_model("dictionary", "PublicEntryView")
+    UserProfile = apps.get_model("users", "UserProfile")
+
+    hidden = set(
+        UserProfile.objects.filter(show_live_contributions=False).values_list("user_id", flat=True)
+    )
+    rows = []
+    queryset = (
+        Entry.objects.filter(status__in=["approved", "approved_under_review"])
+        .exclude(initial_contributor_id__in=hidden)
+        .select_related("variant_group__mother_entry")
+    )
+    for entry in queryset.iterator():
+        semantic_entry = entry
+        group = entry.variant_group
+        if group and group.mother_entry_id and not entry.is_mother:
+            semantic_entry = group.mother_entry
+        rows.append(
+            PublicEntryView(
+                entry_id=entry.id,
+                initial_contributor_id=entry.initial_contributor_id,
+                term=entry.term,
+                is_mother=entry.is_mother,
+                variant_group_id=entry.variant_group_id,
+                status=entry.status,
+                meaning=semantic_entry.meaning or "",
+                part_of_speech=semantic_entry.part_of_speech or "",
+                audio_pronunciation=entry.audio_pronunciation.name or "",
+                photo=semantic_entry.photo.name or "",
+                created_at=entry.created_at,
+                last_approved_at=entry.last_approved_at,
+            )
+        )
+    PublicEntryView.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0022_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('users', '0032_public_content_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublicEntryView',
+            fields=[
+                ('entry', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='public_view', serialize=False, to='dictionary.entry')),
+                ('term', models.CharField(max_length=255)),
+                ('is_mother', models.BooleanField(default=False)),
+                ('variant_group_id', models.UUIDField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('pending', 'Pending'), ('approved', 'Approved'), ('approved_under_review', 'Approved (Under Review)'), ('rejected', 'Rejected'), ('archived', 'Archived'), ('deleted', 'Deleted')], max_length=30)),
+                ('meaning', models.TextField(blank=True, default='')),
+                ('part_of_speech', models.CharField(blank=True, default='', max_length=100)),
+                ('audio_pronunciation', models.CharField(blank=True, default='', max_length=255)),
+                ('photo', models.CharField(blank=True, default='', max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('last_approved_at', models.DateTimeField(blank=True, null=True)),
+                ('initial_contributor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-last_approved_at', 'entry'], name='dict_pubview_recent_idx'), models.Index(fields=['term', 'entry'], name='dict_pubview_alpha_idx'), models.Index(fields=['initial_contributor', '-last_approved_at'], name='dict_pubview_contrib_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_public_entry_views, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0024_wordlistimportcheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DictionaryBundle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(unique=True)),
+                ('change_watermark', models.PositiveBigIntegerField(default=0)),
+                ('entry_count', models.PositiveIntegerField(default=0)),
+                ('bundle_file', models.FileField(blank=True, upload_to='dictionary/bundles/')),
+                ('bundle_sha256', models.CharField(blank=True, default='', max_length=64)),
+                ('patch_file', models.FileField(blank=True, upload_to='dictionary/bundles/')),
+                ('patch_sha256', models.CharField(blank=True, default='', max_length=64)),
+                ('patch_change_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PublicEntryChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('entry_id', models.UUIDField()),
+                ('changed_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
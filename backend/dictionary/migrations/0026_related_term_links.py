@@ -0,0 +1,89 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:42
+
+import re
+
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+RELATED_TERM_FIELDS = ("english_synonym", "ivatan_synonym", "english_antonym", "ivatan_antonym")
+
+
+def backfill_related_term_links(apps, schema_editor):
+    # Frozen copy of dictionary.related_terms.rebuild_related_term_links.
+    Entry = apps.get_model("dictionary", "Entry")
+    PublicEntryView = apps.get_model("dictionary", "PublicEntryView")
+    RelatedTermLink = apps.get_model("dictionary", "RelatedTermLink")
+
+    targets = {}
+    public_rows = PublicEntryView.objects.order_by("-is_mother", "term", "entry_id")
+    for term, entry_id in public_rows.values_list("term", "entry_id"):
+        targets.setdefault(term.strip().lower(), entry_id)
+
+    rows = []
+    for entry in Entry.objects.select_related("variant_group").iterator(chunk_size=1000):
+        if not entry.is_mother and entry.variant_group_id and entry.variant_group.mother_entry_id:
+            continue
+        labels = [
+            (field, label.strip())
+            for field in RELATED_TERM_FIELDS
+            for label in re.split(r"[,;\n]", getattr(entry, field) or "")
+            if label.strip()
+        ]
+        for position, (field, label) in enumerate(labels):
+            rows.append(
+                RelatedTermLink(
+                    source_entry_id=entry.id,
+                    relation=field,
+                    position=position,
+                    label=label,
+                    term_key=label.lower(),
+                    target_entry_id=targets.get(label.lower()),
+                )
+            )
+    RelatedTermLink.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0025_offline_bundles'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedTermLink',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('relation', models.CharField(choices=[('english_synonym', 'English synonym'), ('ivatan_synonym', 'Ivatan synonym'), ('english_antonym', 'English antonym'), ('ivatan_antonym', 'Ivatan antonym')], max_length=20)),
+                ('position', models.PositiveSmallIntegerField()),
+                ('label', models.CharField(max_length=255)),
+                ('term_key', models.CharField(max_length=255)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='publicentryview',
+            index=models.Index(django.db.models.functions.text.Lower('term'), name='dict_pubview_lterm_idx'),
+        ),
+        migrations.AddField(
+            model_name='relatedtermlink',
+            name='source_entry',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_term_links', to='dictionary.entry'),
+        ),
+        migrations.AddField(
+            model_name='relatedtermlink',
+            name='target_entry',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='dictionary.entry'),
+        ),
+        migrations.AddIndex(
+            model_name='relatedtermlink',
+            index=models.Index(fields=['source_entry', 'position'], name='dict_rellink_source_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='relatedtermlink',
+            index=models.Index(fields=['term_key'], name='dict_rellink_key_idx'),
+        ),
+        migrations.RunPython(backfill_related_term_links, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:46
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_first_approved_and_mother_flags(apps, schema_editor):
+    # Frozen copy of the first_approved_at / flag steps of
+    # dictionary.variant_services.repair_variant_groups.
+    Entry = apps.get_model("dictionary", "Entry")
+    EntryRevision = apps.get_model("dictionary", "EntryRevision")
+
+    # dictionary.models.first_revision_approvals, then last approval, then creation.
+    first_revision_approvals = (
+        EntryRevision.objects.filter(
+            entry=OuterRef("pk"), status="approved", approved_at__isnull=False
+        )
+        .order_by("approved_at")
+        .values_list("approved_at", flat=True)
+    )
+    Entry.objects.filter(
+        status__in=["approved", "approved_under_review"], first_approved_at__isnull=True
+    ).update(
+        first_approved_at=Coalesce(
+            Subquery(first_revision_approvals[:1]), "last_approved_at", "created_at"
+        )
+    )
+
+    # The unique constraint below needs exactly the group's mother flagged.
+    Entry.objects.filter(is_mother=True, variant_group__isnull=False).exclude(
+        variant_group__mother_entry=F("id")
+    ).update(is_mother=False)
+    Entry.objects.filter(variant_group__mother_entry=F("id"), is_mother=False).update(
+        is_mother=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0026_related_term_links'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entry',
+            name='first_approved_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_first_approved_and_mother_flags, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['variant_group', 'first_approved_at', 'created_at', 'id'], name='dict_entry_mother_order_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='entry',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_mother', True)), fields=('variant_group',), name='uniq_entry_group_mother'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0027_entry_first_approved_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entryrevision',
+            name='keyframe',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='dictionary.entryrevision'),
+        ),
+    ]
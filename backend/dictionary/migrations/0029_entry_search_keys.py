@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:57
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+SEARCH_KEY_STATUSES = ("approved", "approved_under_review")
+
+ORTHOGRAPHY_RULES = (
+    (r"ch", "c"),
+    (r"v", "b"),
+    (r"([aeiou])\1+", r"\1"),
+)
+
+
+def _orthography_key(value):
+    text = unicodedata.normalize("NFKD", str(value or "")).lower()
+    text = "".join(character for character in text if not unicodedata.combining(character))
+    text = re.sub(r"[\W_]+", "", text)
+    for pattern, replacement in ORTHOGRAPHY_RULES:
+        text = re.sub(pattern, replacement, text)
+    return text[:255]
+
+
+def _inflected_spellings(value):
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _inflected_spellings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _inflected_spellings(item)
+    elif isinstance(value, str):
+        yield from re.split(r"[,;\n]", value)
+
+
+def backfill_search_keys(apps, schema_editor):
+    # Frozen copy of dictionary.orthography.rebuild_search_keys (default rules).
+    Entry = apps.get_model("dictionary", "Entry")
+    EntrySearchKey = apps.get_model("dictionary", "EntrySearchKey")
+
+    rows = []
+    entries = Entry.objects.filter(status__in=SEARCH_KEY_STATUSES).only("id", "term", "inflected_forms")
+    for entry in entries.iterator(chunk_size=1000):
+        spellings = [entry.term, *_inflected_spellings(entry.inflected_forms)]
+        keys = dict.fromkeys(key for key in map(_orthography_key, spellings) if key)
+        rows.extend(EntrySearchKey(entry_id=entry.id, search_key=key) for key in keys)
+    EntrySearchKey.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0028_revision_keyframes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntrySearchKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('search_key', models.CharField(max_length=255)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_keys', to='dictionary.entry')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('search_key', 'entry'), name='uniq_entry_search_key')],
+            },
+        ),
+        migrations.RunPython(backfill_search_keys, migrations.RunPython.noop),
+    ]
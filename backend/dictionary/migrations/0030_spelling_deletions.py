@@ -0,0 +1,95 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:02
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+SEARCH_KEY_STATUSES = ("approved", "approved_under_review")
+
+ORTHOGRAPHY_RULES = (
+    (r"ch", "c"),
+    (r"v", "b"),
+    (r"([aeiou])\1+", r"\1"),
+)
+
+
+def _orthography_key(value):
+    text = unicodedata.normalize("NFKD", str(value or "")).lower()
+    text = "".join(character for character in text if not unicodedata.combining(character))
+    text = re.sub(r"[\W_]+", "", text)
+    for pattern, replacement in ORTHOGRAPHY_RULES:
+        text = re.sub(pattern, replacement, text)
+    return text[:255]
+
+
+def _inflected_spellings(value):
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _inflected_spellings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _inflected_spellings(item)
+    elif isinstance(value, str):
+        yield from re.split(r"[,;\n]", value)
+
+
+def _deletion_variants(key, max_distance=2, prefix_length=7):
+    variants = {key[:prefix_length]}
+    frontier = set(variants)
+    for _ in range(max_distance):
+        frontier = {
+            word[:position] + word[position + 1:]
+            for word in frontier
+            if len(word) > 1
+            for position in range(len(word))
+        }
+        variants |= frontier
+    return variants
+
+
+def backfill_spelling_deletions(apps, schema_editor):
+    # Frozen copy of dictionary.spelling.rebuild_spelling_index (default rules).
+    Entry = apps.get_model("dictionary", "Entry")
+    SpellingDeletion = apps.get_model("dictionary", "SpellingDeletion")
+
+    rows = []
+    entries = Entry.objects.filter(status__in=SEARCH_KEY_STATUSES).only("id", "term", "inflected_forms")
+    for entry in entries.iterator(chunk_size=1000):
+        spellings = [entry.term, *_inflected_spellings(entry.inflected_forms)]
+        keys = dict.fromkeys(key for key in map(_orthography_key, spellings) if key)
+        for key in keys:
+            rows.extend(
+                SpellingDeletion(deletion=deletion, entry_id=entry.id, search_key=key)
+                for deletion in sorted(_deletion_variants(key))
+            )
+        if len(rows) >= 1000:
+            SpellingDeletion.objects.bulk_create(rows)
+            rows = []
+    SpellingDeletion.objects.bulk_create(rows)
+
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0029_entry_search_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpellingDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('deletion', models.CharField(max_length=255)),
+                ('search_key', models.CharField(max_length=255)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='spelling_deletions', to='dictionary.entry')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['deletion'], name='dict_spelling_deletion_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_spelling_deletions, migrations.RunPython.noop),
+    ]
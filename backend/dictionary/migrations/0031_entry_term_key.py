@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_term_keys(apps, schema_editor):
+    # Frozen copy of dictionary.text.headword_key.
+    Entry = apps.get_model("dictionary", "Entry")
+
+    batch = []
+    for entry in Entry.objects.only("id", "term").iterator(chunk_size=1000):
+        entry.term_key = str(entry.term or "").strip().lower()
+        batch.append(entry)
+        if len(batch) >= 1000:
+            Entry.objects.bulk_update(batch, ["term_key"])
+            batch = []
+    Entry.objects.bulk_update(batch, ["term_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0030_spelling_deletions'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entry',
+            name='term_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_term_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['term_key', 'variant_group'], name='dict_entry_term_key_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:41
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0031_entry_term_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publicentryview',
+            name='changed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name='publicentryview',
+            index=models.Index(fields=['changed_at', 'entry'], name='dict_pubview_changed_idx'),
+        ),
+    ]
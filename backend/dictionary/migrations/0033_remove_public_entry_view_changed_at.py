@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:07
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0032_public_entry_view_changed_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='publicentryview',
+            name='dict_pubview_changed_idx',
+        ),
+        migrations.RemoveField(
+            model_name='publicentryview',
+            name='changed_at',
+        ),
+    ]
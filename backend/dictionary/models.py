@@ -9,12 +9,19 @@ Model roles:
 - VariantGroup: mother/variant relationship container.
 """
 
+import copy
 import uuid
 
 from django.conf import settings
 from django.db import models
+from django.db.models.fields.files import FieldFile
+from django.db.models.functions import Lower
 from django.utils import timezone
 
+from dictionary.field_groups import ENTRY_SNAPSHOT_FIELDS
+from dictionary.text import headword_key
+from users.revision_storage import DeltaEncodedRevision
+
 # ============================================
 # ENTRY STATUS ENUM
 # ============================================
@@ -63,6 +70,43 @@ class VariantGroup(models.Model):
 # ============================================
 
 
+def first_revision_approvals(entry):
+    """
+    Approval times of `entry`'s approved revisions, earliest first.
+
+    Head of the one `first_approved_at` fallback chain: earliest approved
+    revision, else `last_approved_at`, else `created_at`. Entry.save,
+    `variant_services.repair_variant_groups` and migration 0027 (frozen copy)
+    all follow it. `entry` may be an id or an OuterRef.
+    """
+
+    return (
+        EntryRevision.objects.filter(
+            entry=entry, status=EntryRevision.Status.APPROVED, approved_at__isnull=False
+        )
+        .order_by("approved_at")
+        .values_list("approved_at", flat=True)
+    )
+
+
+def _tracked_value(value):
+    # Files compare by stored name; copies keep JSON edited in place detectable.
+    if isinstance(value, FieldFile):
+        return value.name
+    return copy.deepcopy(value)
+
+
+def _written_fields(fields, update_fields):
+    # update_fields may name a foreign key by field name or attname.
+    if update_fields is None:
+        return list(fields)
+    return [
+        field
+        for field in fields
+        if field in update_fields or field.removesuffix("_id") in update_fields
+    ]
+
+
 class Entry(models.Model):
     """
     Represents the CURRENT PUBLIC version of a term.
@@ -105,6 +149,8 @@ class Entry(models.Model):
     # these are editable per variant entry.
 
     term = models.CharField(max_length=255)
+    # headword_key(term), kept in step by save(); duplicate checks match on it.
+    term_key = models.CharField(max_length=255, blank=True, default="", editable=False)
 
     pronunciation_text = models.CharField(max_length=255, blank=True)
     phonetic = models.CharField(max_length=255, blank=True)
@@ -177,15 +223,113 @@ class Entry(models.Model):
     )
 
     last_approved_at = models.DateTimeField(null=True, blank=True)
+    # Stamped once, the first time the entry is saved as published (see save()).
+    # Mother fallback picks the earliest one in a group.
+    first_approved_at = models.DateTimeField(null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
 
     archived_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Public listing keyset indexes: they match the (sort value, id) cursor
+            # order exactly. Not partial: SQLite cannot match a partial index
+            # against Django's bound `status IN (%s, %s)` parameters.
+            models.Index(fields=["-last_approved_at", "id"], name="dict_entry_recent_idx"),
+            models.Index(fields=["term", "id"], name="dict_entry_alpha_idx"),
+            # Profile pages: a contributor's live entries. Partial, so only
+            # PostgreSQL uses it; SQLite keeps using the contributor FK index.
+            models.Index(
+                fields=["initial_contributor", "-last_approved_at"],
+                name="dict_entry_public_contrib_idx",
+                condition=models.Q(status__in=["approved", "approved_under_review"]),
+            ),
+            # Single-status lookups (re-review queue joins, lifecycle maintenance).
+            models.Index(fields=["status", "-last_approved_at"], name="dict_entry_status_idx"),
+            # Mother fallback order within a group (recompute_mother_for_group).
+            models.Index(
+                fields=["variant_group", "first_approved_at", "created_at", "id"],
+                name="dict_entry_mother_order_idx",
+            ),
+            # Duplicate headword checks, globally or within one variant group.
+            models.Index(fields=["term_key", "variant_group"], name="dict_entry_term_key_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["variant_group"],
+                condition=models.Q(is_mother=True),
+                name="uniq_entry_group_mother",
+            ),
+        ]
+
     # -------------------------------
     # STATE HELPERS
     # -------------------------------
 
+    # Fields whose changes trigger derived-table refreshes (dictionary/signals.py).
+    TRACKED_FIELDS = (
+        *ENTRY_SNAPSHOT_FIELDS,
+        "status",
+        "is_mother",
+        "variant_group_id",
+        "initial_contributor_id",
+        "last_approved_at",
+    )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_tracked_values()
+        return instance
+
+    def _remember_tracked_values(self, fields=TRACKED_FIELDS):
+        remembered = self.__dict__.setdefault("_tracked_values", {})
+        for field in fields:
+            if field in self.__dict__:
+                remembered[field] = _tracked_value(self.__dict__[field])
+
+    def tracked_fields_changed(self, fields, *, update_fields=None) -> bool:
+        """
+        Whether a save wrote a new value to any of `fields`.
+
+        Compares against the values loaded from (or last saved to) the
+        database. Instances that were never loaded count as changed; fields
+        outside `update_fields` or never loaded (deferred) were not written.
+        """
+
+        remembered = self.__dict__.get("_tracked_values")
+        if remembered is None:
+            return True
+        for field in _written_fields(fields, update_fields):
+            if field not in self.__dict__:
+                continue
+            if field not in remembered or remembered[field] != _tracked_value(self.__dict__[field]):
+                return True
+        return False
+
+    def save(self, *args, **kwargs):
+        self.term_key = headword_key(self.term)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "term" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "term_key"}
+        if self.first_approved_at is None and self.status in (
+            EntryStatus.APPROVED,
+            EntryStatus.APPROVED_UNDER_REVIEW,
+        ):
+            earliest = None if self._state.adding else first_revision_approvals(self.pk).first()
+            # created_at is still unset before the first insert.
+            self.first_approved_at = (
+                earliest or self.last_approved_at or self.created_at or timezone.now()
+            )
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "first_approved_at"}
+        super().save(*args, **kwargs)
+        self._remember_tracked_values(
+            _written_fields(self.TRACKED_FIELDS, kwargs.get("update_fields"))
+        )
+
     def approve(self, approvers):
         # Entry-level helper used by workflows that finalize approval state.
         self.status = EntryStatus.APPROVED
@@ -211,7 +355,7 @@ class Entry(models.Model):
 # ============================================
 
 
-class EntryRevision(models.Model):
+class EntryRevision(DeltaEncodedRevision):
     """
     All submissions (new terms, edits, media changes, variant additions)
     are represented as revisions.
@@ -257,5 +401,344 @@ class EntryRevision(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     approved_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # get_visible_revision_history / retention: one entry's history by state.
+            models.Index(
+                fields=["entry", "status", "is_base_snapshot", "approved_at", "created_at"],
+                name="dict_rev_history_idx",
+            ),
+            # Reviewer queues: newest pending first.
+            models.Index(fields=["status", "-created_at"], name="dict_rev_status_created_idx"),
+            # "My revisions" and gamification counters.
+            models.Index(
+                fields=["contributor", "-created_at"], name="dict_rev_contrib_created_idx"
+            ),
+            # Re-review queue / published list: approved revisions, newest approval first.
+            models.Index(
+                fields=["-approved_at", "-created_at"],
+                name="dict_rev_approved_recent_idx",
+                condition=models.Q(status="approved"),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.id} ({self.status})"
+
+
+# ============================================
+# ENTRY SEARCH DOCUMENT (PUBLIC SEARCH SHADOW)
+# ============================================
+
+
+class EntrySearchDocument(models.Model):
+    """
+    Flattened, search-ready copy of one live Entry.
+
+    Rows exist only for publicly visible entries and carry the effective
+    semantic fields (inherited from the mother term for variants). Database
+    specific full-text indexes are attached in migrations; see
+    `dictionary/search.py` for how each backend queries them.
+    """
+
+    entry = models.OneToOneField(
+        Entry,
+        on_delete=models.CASCADE,
+        related_name="search_document",
+    )
+
+    term = models.CharField(max_length=255, default="")
+    meaning = models.TextField(default="")
+    synonyms = models.TextField(default="")
+    usage_notes = models.TextField(default="")
+    example_sentence = models.TextField(default="")
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"SearchDocument<{self.entry_id}>"
+
+
+# ============================================
+# ENTRY SEARCH KEY (SPELLING-TOLERANT LOOKUP)
+# ============================================
+
+
+class EntrySearchKey(models.Model):
+    """
+    One orthographic search key of a live Entry's term or inflected form.
+
+    Keys fold the spelling differences Ivatan writers disagree on (diacritics,
+    doubled vowels, v/b, ch/c), so "vahay", "bahay" and "vaháay" share a key.
+    `dictionary/orthography.py` builds them and keeps them in sync with the
+    search documents.
+    """
+
+    entry = models.ForeignKey(
+        Entry,
+        on_delete=models.CASCADE,
+        related_name="search_keys",
+    )
+    search_key = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            # Also the index behind exact and prefix key lookups.
+            models.UniqueConstraint(
+                fields=["search_key", "entry"],
+                name="uniq_entry_search_key",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.search_key} -> {self.entry_id}"
+
+
+# ============================================
+# SPELLING DELETION (DID-YOU-MEAN INDEX)
+# ============================================
+
+
+class SpellingDeletion(models.Model):
+    """
+    One deletion-neighbourhood variant of a live Entry's search key.
+
+    Each key contributes itself plus every string made by deleting one or two
+    characters from its first few characters (SymSpell). A misspelled query
+    shares at least one such variant with every key within edit distance 2,
+    so `dictionary/spelling.py` finds candidates with one indexed IN lookup.
+    """
+
+    deletion = models.CharField(max_length=255)
+    entry = models.ForeignKey(
+        Entry,
+        on_delete=models.CASCADE,
+        related_name="spelling_deletions",
+    )
+    search_key = models.CharField(max_length=255)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["deletion"], name="dict_spelling_deletion_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.deletion} -> {self.search_key}"
+
+
+# ============================================
+# PUBLIC ENTRY VIEW (PUBLIC LISTING READ MODEL)
+# ============================================
+
+
+class PublicEntryView(models.Model):
+    """
+    Flat, listing-ready copy of one publicly visible Entry.
+
+    Rows exist only for live entries whose initial contributor shows live
+    contributions, and carry the effective semantic fields and photo (the
+    mother term's, for variants) plus stored media paths. The public listing
+    reads this table alone; `dictionary/public_view.py` keeps it in sync.
+    """
+
+    entry = models.OneToOneField(
+        Entry,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="public_view",
+    )
+    initial_contributor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    term = models.CharField(max_length=255)
+    is_mother = models.BooleanField(default=False)
+    variant_group_id = models.UUIDField(null=True, blank=True)
+    status = models.CharField(max_length=30, choices=EntryStatus.choices)
+
+    meaning = models.TextField(blank=True, default="")
+    part_of_speech = models.CharField(max_length=100, blank=True, default="")
+    audio_pronunciation = models.CharField(max_length=255, blank=True, default="")
+    photo = models.CharField(max_length=255, blank=True, default="")
+
+    created_at = models.DateTimeField()
+    last_approved_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Same keyset orders as the Entry listing indexes.
+            models.Index(fields=["-last_approved_at", "entry"], name="dict_pubview_recent_idx"),
+            models.Index(fields=["term", "entry"], name="dict_pubview_alpha_idx"),
+            models.Index(
+                fields=["initial_contributor", "-last_approved_at"],
+                name="dict_pubview_contrib_idx",
+            ),
+            # Case-insensitive headword match for related term links.
+            models.Index(Lower("term"), name="dict_pubview_lterm_idx"),
+        ]
+
+    def __str__(self):
+        return f"PublicEntryView<{self.entry_id}>"
+
+
+class PublicEntryChange(models.Model):
+    """
+    Append-only log of entry ids whose public listing row was rewritten or
+    removed. Offline bundle patches (`dictionary/bundles.py`), the suggest
+    index and incremental exports read the ids logged past their watermark;
+    lifecycle maintenance prunes old rows.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    # Plain id, not a FK: removals must stay logged after the entry is deleted.
+    entry_id = models.UUIDField()
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"PublicEntryChange<{self.entry_id}>"
+
+
+# ============================================
+# OFFLINE DICTIONARY BUNDLE
+# ============================================
+
+
+class DictionaryBundle(models.Model):
+    """
+    One published version of the offline dictionary.
+
+    `bundle_file` is a gzip JSON snapshot of every public entry (kept for the
+    latest version only); `patch_file` turns the previous version into this
+    one. `change_watermark` is the last PublicEntryChange id the version covers.
+    """
+
+    version = models.PositiveIntegerField(unique=True)
+    change_watermark = models.PositiveBigIntegerField(default=0)
+    entry_count = models.PositiveIntegerField(default=0)
+
+    bundle_file = models.FileField(upload_to="dictionary/bundles/", blank=True)
+    bundle_sha256 = models.CharField(max_length=64, blank=True, default="")
+    patch_file = models.FileField(upload_to="dictionary/bundles/", blank=True)
+    patch_sha256 = models.CharField(max_length=64, blank=True, default="")
+    patch_change_count = models.PositiveIntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"DictionaryBundle v{self.version}"
+
+
+# ============================================
+# RELATED TERM LINK (SYNONYM / ANTONYM LINKS)
+# ============================================
+
+
+class RelatedTermLink(models.Model):
+    """
+    One synonym/antonym label of an entry, resolved to the live entry it names.
+
+    Labels are split from the four free-text relation fields of the entry that
+    owns the semantic core (a mother term or a standalone entry). `target_entry`
+    points at the public entry whose headword matches `term_key`, or is null.
+    `dictionary/related_terms.py` rebuilds links when the source is saved and
+    re-resolves them when a matching headword enters or leaves the listing.
+    """
+
+    class Relation(models.TextChoices):
+        ENGLISH_SYNONYM = "english_synonym", "English synonym"
+        IVATAN_SYNONYM = "ivatan_synonym", "Ivatan synonym"
+        ENGLISH_ANTONYM = "english_antonym", "English antonym"
+        IVATAN_ANTONYM = "ivatan_antonym", "Ivatan antonym"
+
+    source_entry = models.ForeignKey(
+        Entry,
+        on_delete=models.CASCADE,
+        related_name="related_term_links",
+    )
+    relation = models.CharField(max_length=20, choices=Relation.choices)
+    # Order of the label across all four fields, as typed.
+    position = models.PositiveSmallIntegerField()
+    label = models.CharField(max_length=255)
+    # Lowercased normalized headword, matched against public entry terms.
+    term_key = models.CharField(max_length=255)
+    target_entry = models.ForeignKey(
+        Entry,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["source_entry", "position"], name="dict_rellink_source_idx"),
+            models.Index(fields=["term_key"], name="dict_rellink_key_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.relation}: {self.label}"
+
+
+# ============================================
+# ENGLISH LOOKUP TERM (ENGLISH → IVATAN INDEX)
+# ============================================
+
+
+class EnglishLookupTerm(models.Model):
+    """
+    One (English key, live Entry) pair of the reverse lookup index.
+
+    Keys come from the entry's effective meaning and English synonyms, so
+    variants appear under their mother term's English words. Rows are kept in
+    sync by `dictionary/english_lookup.py`; rebuild with the
+    `rebuild_english_lookup` command if they ever drift.
+    """
+
+    english_key = models.CharField(max_length=255)
+    entry = models.ForeignKey(
+        Entry,
+        on_delete=models.CASCADE,
+        related_name="english_lookup_terms",
+    )
+
+    # Denormalized so the lookup endpoint never touches the mother entry.
+    term = models.CharField(max_length=255, default="")
+    part_of_speech = models.CharField(max_length=100, blank=True, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["english_key", "entry"],
+                name="uniq_english_lookup_key_entry",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["english_key", "term"]),
+        ]
+
+    def __str__(self):
+        return f"{self.english_key} -> {self.term}"
+
+
+# ============================================
+# WORDLIST IMPORT CHECKPOINT
+# ============================================
+
+
+class WordlistImportCheckpoint(models.Model):
+    """
+    Resume point of one `import_dictionary_wordlist` source file.
+
+    Updated in the same transaction as each imported batch, so after a crash
+    the next run skips exactly the records that were committed.
+    """
+
+    source = models.CharField(max_length=500, unique=True)
+    records_done = models.PositiveIntegerField(default=0)
+    entries_created = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source} ({self.records_done} records)"
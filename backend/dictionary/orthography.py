@@ -0,0 +1,196 @@
+"""
+dictionary/orthography.py
+
+Spelling-tolerant search keys for Ivatan headwords (EntrySearchKey).
+
+Ivatan spelling varies by municipality and writer, so "vahay", "bahay" and
+"vaháay" are the same word to a reader but three strings to the database. An
+orthographic key folds those differences:
+- lowercase, diacritics stripped ("á" -> "a"), spaces and punctuation dropped;
+- then the ordered rewrite rules: by default "ch" -> "c", "v" -> "b" and
+  doubled vowels collapsed ("aa" -> "a").
+
+Every live entry owns one key row per distinct key of its term and inflected
+forms. Rows are refreshed with the search documents (`dictionary/signals.py`
+on Entry saves, the wordlist importer) and matched by `dictionary/search.py`
+alongside the full-text index: an exact or prefix key match is an index range
+scan on `search_key`, never a substring scan.
+
+Configuration:
+- `DICTIONARY_ORTHOGRAPHY_RULES` in settings replaces the default rules: a
+  list of `(regex, replacement)` pairs applied in order to the folded text.
+
+Troubleshooting:
+- After changing the rules, or if a spelling variant is not found, run
+  `manage.py rebuild_search_keys` (and `rebuild_spelling_index`, which is
+  built from the same keys).
+"""
+
+import functools
+import re
+import unicodedata
+
+from django.conf import settings
+from django.db import transaction
+
+from dictionary.models import Entry, EntrySearchKey, EntryStatus
+
+SEARCH_KEY_STATUSES = (EntryStatus.APPROVED, EntryStatus.APPROVED_UNDER_REVIEW)
+
+DEFAULT_ORTHOGRAPHY_RULES = (
+    (r"ch", "c"),
+    (r"v", "b"),
+    (r"([aeiou])\1+", r"\1"),
+)
+
+SEARCH_KEY_MAX_LENGTH = 255
+
+KEY_ROW_BATCH_SIZE = 1000
+
+# Upper bound of a prefix range: sorts after every character a key can hold.
+_PREFIX_RANGE_END = "\uffff"
+
+
+@functools.lru_cache(maxsize=8)
+def _compiled_rules(rules):
+    return [(re.compile(pattern), replacement) for pattern, replacement in rules]
+
+
+def orthography_key(value) -> str:
+    """
+    Fold one spelling into its search key ("" when nothing searchable is left).
+    """
+
+    text = unicodedata.normalize("NFKD", str(value or "")).lower()
+    text = "".join(character for character in text if not unicodedata.combining(character))
+    text = re.sub(r"[\W_]+", "", text)
+    rules = getattr(settings, "DICTIONARY_ORTHOGRAPHY_RULES", DEFAULT_ORTHOGRAPHY_RULES)
+    for pattern, replacement in _compiled_rules(tuple(map(tuple, rules))):
+        text = pattern.sub(replacement, text)
+    return text[:SEARCH_KEY_MAX_LENGTH]
+
+
+def _inflected_spellings(value):
+    # inflected_forms is free-form JSON: {"plural": "..."}, lists, or "a, b".
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _inflected_spellings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _inflected_spellings(item)
+    elif isinstance(value, str):
+        yield from re.split(r"[,;\n]", value)
+
+
+def entry_search_keys(entry: Entry) -> list[str]:
+    """
+    Ordered, de-duplicated keys of an entry's term and inflected forms.
+    """
+
+    spellings = [entry.term, *_inflected_spellings(entry.inflected_forms)]
+    return list(dict.fromkeys(key for key in map(orthography_key, spellings) if key))
+
+
+def _key_rows(entry: Entry) -> list[EntrySearchKey]:
+    if entry.status not in SEARCH_KEY_STATUSES:
+        return []
+    return [EntrySearchKey(entry_id=entry.id, search_key=key) for key in entry_search_keys(entry)]
+
+
+@transaction.atomic
+def replace_key_rows(model, entries, build_rows) -> None:
+    """
+    Replace the `model` rows of the given entries with `build_rows(entry)`.
+
+    Shared by every table derived from an entry's keys (EntrySearchKey,
+    SpellingDeletion in `dictionary/spelling.py`).
+    """
+
+    entries = list(entries)
+    if not entries:
+        return
+    model.objects.filter(entry_id__in=[entry.id for entry in entries]).delete()
+    rows = []
+    for entry in entries:
+        rows.extend(build_rows(entry))
+    model.objects.bulk_create(rows, batch_size=KEY_ROW_BATCH_SIZE)
+
+
+@transaction.atomic
+def rebuild_key_rows(model, build_rows, *, batch_size=KEY_ROW_BATCH_SIZE) -> int:
+    """
+    Rebuild every `model` row from the live entries, `batch_size` rows per insert.
+    Returns the number of rows written.
+    """
+
+    model.objects.all().delete()
+    written = 0
+    rows = []
+    queryset = Entry.objects.filter(status__in=SEARCH_KEY_STATUSES).order_by("id")
+    for entry in queryset.only("id", "term", "inflected_forms", "status").iterator(
+        chunk_size=batch_size
+    ):
+        rows.extend(build_rows(entry))
+        if len(rows) >= batch_size:
+            model.objects.bulk_create(rows)
+            written += len(rows)
+            rows = []
+    if rows:
+        model.objects.bulk_create(rows)
+        written += len(rows)
+    return written
+
+
+def refresh_entry_search_keys(entries) -> None:
+    """
+    Replace the key rows of the given entries with their current keys.
+    """
+
+    replace_key_rows(EntrySearchKey, entries, _key_rows)
+
+
+def rebuild_search_keys(*, batch_size=KEY_ROW_BATCH_SIZE) -> int:
+    """
+    Rebuild every key row from scratch. Returns the number of rows written.
+    """
+
+    return rebuild_key_rows(EntrySearchKey, _key_rows, batch_size=batch_size)
+
+
+def _keys_with_prefix(key):
+    return EntrySearchKey.objects.filter(
+        search_key__gte=key, search_key__lt=f"{key}{_PREFIX_RANGE_END}"
+    )
+
+
+def matching_key_entry_ids(query):
+    """
+    Entry ids whose term or inflected form key starts with the query's key,
+    as a subquery; None when the query has no searchable characters.
+    """
+
+    key = orthography_key(query)
+    if not key:
+        return None
+    return _keys_with_prefix(key).values("entry_id")
+
+
+def ranked_key_entry_ids(query, *, limit) -> tuple[list, list]:
+    """
+    Return `(exact_ids, prefix_ids)`: entries whose key equals the query's
+    key, then entries whose key only starts with it, in key order.
+    """
+
+    key = orthography_key(query)
+    if not key:
+        return [], []
+    exact = []
+    prefixed = []
+    seen = set()
+    rows = _keys_with_prefix(key).order_by("search_key", "entry_id")
+    for search_key, entry_id in rows.values_list("search_key", "entry_id")[: limit * 2]:
+        if entry_id in seen:
+            continue
+        seen.add(entry_id)
+        (exact if search_key == key else prefixed).append(entry_id)
+    return exact[:limit], prefixed[: max(limit - len(exact), 0)]
@@ -0,0 +1,249 @@
+"""
+dictionary/public_view.py
+
+Public listing read model (PublicEntryView).
+
+The public dictionary listing used to join every row to its variant group and
+mother entry (inherited meaning, part of speech, photo) and to the contributor
+profile (live-contribution opt-out). PublicEntryView stores that result: one
+flat row per publicly visible entry, with effective fields already merged and
+media stored as plain paths.
+
+Rows are refreshed through the same hooks as the search index:
+- `dictionary/signals.py` (Entry saves: publish, archive, overrides)
+- `variant_services._set_group_mother_flags` (mother promotion / fallback)
+- `users/signals.py` (a contributor toggles `show_live_contributions`)
+
+All of these run inside the transaction of the write that triggered them.
+Every refresh also appends the entry ids to PublicEntryChange, which offline
+bundle patches are built from (`dictionary/bundles.py`), and re-resolves the
+related term links naming the old or new headwords (`dictionary/related_terms.py`).
+`manage.py run_lifecycle_maintenance` prunes the log (`prune_public_entry_changes`).
+
+Troubleshooting:
+- Listing shows a stale meaning or misses an entry: run
+  `manage.py rebuild_public_entry_view`.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from dictionary.models import (
+    DictionaryBundle,
+    Entry,
+    EntryStatus,
+    PublicEntryChange,
+    PublicEntryView,
+)
+from dictionary.related_terms import (
+    related_term_key,
+    resolve_all_related_term_links,
+    resolve_related_term_links,
+)
+from dictionary.search import filter_entries
+from dictionary.services import _semantic_source_entry
+from users.models import UserProfile
+
+PUBLIC_VIEW_STATUSES = (EntryStatus.APPROVED, EntryStatus.APPROVED_UNDER_REVIEW)
+
+DEFAULT_CHANGE_SETTLE_SECONDS = 300
+DEFAULT_CHANGE_RETENTION_DAYS = 30
+
+# A PublicEntryView row means "live and contributor visible", so rows keyed by
+# entry (glosses, spelling deletions) filter on it instead of re-checking both.
+HAS_PUBLIC_VIEW = Q(entry__public_view__isnull=False)
+
+
+def _hidden_contributor_ids(entries) -> set:
+    contributor_ids = {entry.initial_contributor_id for entry in entries}
+    return set(
+        UserProfile.objects.filter(
+            user_id__in=contributor_ids,
+            show_live_contributions=False,
+        ).values_list("user_id", flat=True)
+    )
+
+
+def public_view_row(entry: Entry) -> PublicEntryView:
+    """
+    Build the (unsaved) read-model row for one entry.
+    """
+
+    semantic_entry = _semantic_source_entry(entry)
+    return PublicEntryView(
+        entry_id=entry.id,
+        initial_contributor_id=entry.initial_contributor_id,
+        term=entry.term,
+        is_mother=entry.is_mother,
+        variant_group_id=entry.variant_group_id,
+        status=entry.status,
+        meaning=semantic_entry.meaning or "",
+        part_of_speech=semantic_entry.part_of_speech or "",
+        audio_pronunciation=entry.audio_pronunciation.name if entry.audio_pronunciation else "",
+        photo=semantic_entry.photo.name if semantic_entry.photo else "",
+        created_at=entry.created_at,
+        last_approved_at=entry.last_approved_at,
+    )
+
+
+def log_public_entry_changes(entry_ids) -> None:
+    PublicEntryChange.objects.bulk_create(
+        [PublicEntryChange(entry_id=entry_id) for entry_id in entry_ids],
+        batch_size=1000,
+    )
+
+
+def settled_change_watermark() -> int:
+    """
+    Highest PublicEntryChange id that a still-open transaction can no longer undercut.
+
+    A writer's log row gets its id at INSERT and shows up at COMMIT, so a lower
+    id may appear after a higher one. Rows older than the settle window belong
+    to committed writers; consumers advance their watermark only that far and
+    re-read anything newer on their next pass.
+    """
+
+    seconds = getattr(settings, "PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS", DEFAULT_CHANGE_SETTLE_SECONDS)
+    cutoff = timezone.now() - timedelta(seconds=seconds)
+    return (
+        PublicEntryChange.objects.filter(changed_at__lte=cutoff)
+        .order_by("-id")
+        .values_list("id", flat=True)
+        .first()
+        or 0
+    )
+
+
+def prune_public_entry_changes() -> int:
+    """
+    Delete change-log rows every consumer has moved past. Returns the number deleted.
+
+    Rows younger than `PUBLIC_ENTRY_CHANGE_RETENTION_DAYS` stay for export
+    cursors and suggest indexes, and rows past the latest bundle watermark stay
+    until a patch has carried them. The newest prunable row itself is kept, so
+    a consumer whose watermark is that row can tell nothing was lost.
+    """
+
+    days = getattr(settings, "PUBLIC_ENTRY_CHANGE_RETENTION_DAYS", DEFAULT_CHANGE_RETENTION_DAYS)
+    cutoff_id = (
+        PublicEntryChange.objects.filter(changed_at__lte=timezone.now() - timedelta(days=days))
+        .order_by("-id")
+        .values_list("id", flat=True)
+        .first()
+    )
+    if not cutoff_id:
+        return 0
+    bundle_watermark = (
+        DictionaryBundle.objects.order_by("-version")
+        .values_list("change_watermark", flat=True)
+        .first()
+    )
+    if bundle_watermark is not None:
+        cutoff_id = min(cutoff_id, bundle_watermark)
+    deleted, _ = PublicEntryChange.objects.filter(id__lt=cutoff_id).delete()
+    return deleted
+
+
+def _visible_rows(entries):
+    hidden = _hidden_contributor_ids(entries)
+    return [
+        public_view_row(entry)
+        for entry in entries
+        if entry.status in PUBLIC_VIEW_STATUSES and entry.initial_contributor_id not in hidden
+    ]
+
+
+def _insert_rows(entries) -> int:
+    rows = PublicEntryView.objects.bulk_create(_visible_rows(entries))
+    log_public_entry_changes(row.entry_id for row in rows)
+    return len(rows)
+
+
+@transaction.atomic
+def refresh_entry_public_views(entries) -> None:
+    """
+    Replace the read-model rows of the given entries with their current state.
+    """
+
+    entries = list(entries)
+    if not entries:
+        return
+    entry_ids = [entry.id for entry in entries]
+    old_rows = PublicEntryView.objects.filter(entry_id__in=entry_ids)
+    # Both headwords matter: a renamed entry leaves its old links behind.
+    term_keys = {related_term_key(term) for term in old_rows.values_list("term", flat=True)}
+    old_rows.delete()
+    PublicEntryView.objects.bulk_create(_visible_rows(entries))
+    log_public_entry_changes(entry_ids)
+    term_keys.update(related_term_key(entry.term) for entry in entries)
+    resolve_related_term_links(term_keys)
+
+
+def refresh_group_public_views(group) -> None:
+    """
+    Refresh every member of a variant group (variants inherit the mother's fields).
+    """
+
+    if group is None:
+        return
+    refresh_entry_public_views(group.entries.select_related("variant_group__mother_entry"))
+
+
+def refresh_contributor_public_views(user_id) -> None:
+    """
+    Add or drop one contributor's live entries after a visibility toggle.
+    """
+
+    refresh_entry_public_views(
+        Entry.objects.filter(
+            initial_contributor_id=user_id,
+            status__in=PUBLIC_VIEW_STATUSES,
+        ).select_related("variant_group__mother_entry")
+    )
+
+
+@transaction.atomic
+def rebuild_public_entry_views(*, batch_size=1000) -> int:
+    """
+    Rebuild the whole read model. Returns the number of rows written.
+    """
+
+    # Log every old and new row so the next offline bundle patch resyncs them all.
+    log_public_entry_changes(PublicEntryView.objects.values_list("entry_id", flat=True))
+    PublicEntryView.objects.all().delete()
+    written = 0
+    batch = []
+    queryset = (
+        Entry.objects.filter(status__in=PUBLIC_VIEW_STATUSES)
+        .select_related("variant_group__mother_entry")
+        .order_by("id")
+    )
+    for entry in queryset.iterator(chunk_size=batch_size):
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            written += _insert_rows(batch)
+            batch = []
+    if batch:
+        written += _insert_rows(batch)
+    resolve_all_related_term_links()
+    return written
+
+
+def public_listing_queryset(*, search_term="", starts_with="", mother_only=False):
+    """
+    Public listing rows matching the list view filters, unordered (callers page it).
+    """
+
+    queryset = PublicEntryView.objects.all()
+    if search_term:
+        # Indexed search over term, meaning, synonyms, usage notes and example sentence.
+        queryset = filter_entries(queryset, search_term)
+    if starts_with:
+        queryset = queryset.filter(term__istartswith=starts_with[:1])
+    if mother_only:
+        queryset = queryset.filter(Q(is_mother=True) | Q(variant_group_id__isnull=True))
+    return queryset
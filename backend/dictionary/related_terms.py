@@ -0,0 +1,173 @@
+"""
+dictionary/related_terms.py
+
+Persisted synonym/antonym links (RelatedTermLink).
+
+The detail page used to split the four free-text relation fields and match
+every label against `Lower(term)` of all entries on each request. Links are
+now resolved when something changes instead:
+- the semantic source entry is saved (`dictionary/signals.py`) or becomes /
+  stops being a mother (`variant_services._set_group_mother_flags`): its links
+  are rebuilt from the relation fields;
+- a public listing row appears, changes or disappears
+  (`dictionary/public_view.py`): links whose `term_key` matches the old or new
+  headword are re-resolved against PublicEntryView.
+
+Resolution rules match the old per-request lookup: a label links to a public
+entry with the same headword (case-insensitive), mother terms first, then by
+term.
+
+Troubleshooting:
+- Link points at the wrong entry or none: run
+  `manage.py rebuild_related_term_links`.
+"""
+
+import re
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+from dictionary.batching import IN_LOOKUP_BATCH_SIZE, chunked
+from dictionary.models import Entry, PublicEntryView, RelatedTermLink
+from dictionary.text import headword_key
+
+RELATED_TERM_FIELDS = tuple(RelatedTermLink.Relation.values)
+
+
+def split_related_terms(value) -> list[str]:
+    return [item.strip() for item in re.split(r"[,;\n]", value or "") if item and item.strip()]
+
+
+def related_term_key(value) -> str:
+    return headword_key(value)
+
+
+def _owns_semantic_fields(entry: Entry) -> bool:
+    # Mirrors services._semantic_source_entry without loading the mother row.
+    if entry.is_mother or not entry.variant_group_id:
+        return True
+    return entry.variant_group.mother_entry_id is None
+
+
+def _link_rows(entry: Entry) -> list[RelatedTermLink]:
+    rows = []
+    for field in RELATED_TERM_FIELDS:
+        for label in split_related_terms(getattr(entry, field)):
+            rows.append(
+                RelatedTermLink(
+                    source_entry_id=entry.id,
+                    relation=field,
+                    position=len(rows),
+                    label=label,
+                    term_key=related_term_key(label),
+                )
+            )
+    return rows
+
+
+def _resolved_targets(term_keys) -> dict:
+    """
+    Map each term key to the id of the public entry it links to.
+    """
+
+    targets = {}
+    rows = (
+        PublicEntryView.objects.annotate(term_key=Lower("term"))
+        .filter(term_key__in=term_keys)
+        .order_by("-is_mother", "term", "entry_id")
+        .values_list("term_key", "entry_id")
+    )
+    for term_key, entry_id in rows:
+        targets.setdefault(term_key, entry_id)
+    return targets
+
+
+@transaction.atomic
+def refresh_entry_related_links(entries) -> None:
+    """
+    Rebuild the links of the given entries from their relation fields.
+
+    Entries that do not own their semantic fields (variants under a mother)
+    lose any links they had.
+    """
+
+    entries = list(entries)
+    if not entries:
+        return
+    RelatedTermLink.objects.filter(source_entry_id__in=[entry.id for entry in entries]).delete()
+    rows = [row for entry in entries if _owns_semantic_fields(entry) for row in _link_rows(entry)]
+    if not rows:
+        return
+    targets = {}
+    term_keys = sorted({row.term_key for row in rows})
+    for chunk in chunked(term_keys):
+        targets.update(_resolved_targets(chunk))
+    for row in rows:
+        row.target_entry_id = targets.get(row.term_key)
+    RelatedTermLink.objects.bulk_create(rows)
+
+
+def refresh_group_related_links(group) -> None:
+    """
+    Rebuild links for every member of a variant group (after a mother change).
+    """
+
+    if group is None:
+        return
+    refresh_entry_related_links(group.entries.select_related("variant_group"))
+
+
+def resolve_related_term_links(term_keys) -> int:
+    """
+    Re-point existing links whose key is in `term_keys`. Returns links changed.
+    """
+
+    term_keys = sorted({key for key in term_keys if key})
+    changed = []
+    for chunk in chunked(term_keys):
+        links = list(
+            RelatedTermLink.objects.filter(term_key__in=chunk).only("term_key", "target_entry_id")
+        )
+        if not links:
+            continue
+        targets = _resolved_targets({link.term_key for link in links})
+        for link in links:
+            target_id = targets.get(link.term_key)
+            if link.target_entry_id != target_id:
+                link.target_entry_id = target_id
+                changed.append(link)
+    RelatedTermLink.objects.bulk_update(changed, ["target_entry"], batch_size=IN_LOOKUP_BATCH_SIZE)
+    return len(changed)
+
+
+def resolve_all_related_term_links() -> int:
+    """
+    Re-point every link (after a full listing rebuild). Returns links changed.
+    """
+
+    return resolve_related_term_links(
+        RelatedTermLink.objects.values_list("term_key", flat=True).distinct()
+    )
+
+
+@transaction.atomic
+def rebuild_related_term_links(*, batch_size=1000) -> int:
+    """
+    Rebuild every link from scratch. Returns the number of links written.
+    """
+
+    RelatedTermLink.objects.all().delete()
+    has_relations = Q()
+    for field in RELATED_TERM_FIELDS:
+        has_relations |= ~Q(**{field: ""})
+    queryset = Entry.objects.filter(has_relations).select_related("variant_group").order_by("id")
+    batch = []
+    for entry in queryset.iterator(chunk_size=batch_size):
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            refresh_entry_related_links(batch)
+            batch = []
+    if batch:
+        refresh_entry_related_links(batch)
+    return RelatedTermLink.objects.count()
@@ -0,0 +1,320 @@
+"""
+dictionary/search.py
+
+Public dictionary search index.
+
+Every live Entry owns one EntrySearchDocument row holding the text the public
+search box should match (term, effective meaning, synonyms, usage notes and
+example sentence). Each database backend indexes that table its own way:
+
+- PostgreSQL: `pg_trgm` GIN index on the term plus a weighted `tsvector` GIN
+  index over all columns.
+- SQLite: an FTS5 shadow table (trigram tokenizer) kept in sync by triggers.
+- Anything else: plain `icontains` over the document table.
+
+Headwords and inflected forms are also matched by orthographic key
+(`dictionary/orthography.py`), so spelling variants such as "bahay" find
+"vahay" on every backend through an indexed key range. Queries shorter than
+MIN_INDEXED_QUERY_LENGTH use that key range alone.
+
+Callers only use `filter_entries(...)` and `ranked_entry_ids(...)`, so views
+never need to know which backend is active.
+
+Troubleshooting:
+- Entry missing from search: run `refresh_entry_search_documents([entry])`
+  or the `rebuild_search_index` command.
+- Variant matched on the wrong meaning: check `_semantic_source_entry`.
+"""
+
+import uuid
+
+from django.db import OperationalError, ProgrammingError, connection, transaction
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from dictionary.models import Entry, EntrySearchDocument, EntryStatus
+from dictionary.orthography import matching_key_entry_ids, ranked_key_entry_ids
+from dictionary.services import _semantic_source_entry
+
+SEARCHABLE_STATUSES = (EntryStatus.APPROVED, EntryStatus.APPROVED_UNDER_REVIEW)
+
+# Trigram indexes cannot match queries shorter than one trigram.
+MIN_INDEXED_QUERY_LENGTH = 3
+
+SQLITE_FTS_TABLE = "dictionary_entrysearch_fts"
+
+# Relative column weights, most important first. Order matches the FTS5
+# column order (term, meaning, synonyms, usage_notes, example_sentence).
+SQLITE_BM25_WEIGHTS = (10.0, 4.0, 3.0, 1.0, 1.0)
+
+POSTGRES_SEARCH_VECTOR_SQL = (
+    "(setweight(to_tsvector('simple', {table}.term), 'A')"
+    " || setweight(to_tsvector('simple', {table}.meaning || ' ' || {table}.synonyms), 'B')"
+    " || setweight(to_tsvector('simple', {table}.usage_notes || ' '"
+    " || {table}.example_sentence), 'C'))"
+)
+
+
+def search_document_fields(entry: Entry) -> dict:
+    """
+    Build the searchable text columns for one entry.
+    """
+
+    semantic_entry = _semantic_source_entry(entry)
+    synonyms = " ".join(
+        value for value in (semantic_entry.english_synonym, semantic_entry.ivatan_synonym) if value
+    )
+    return {
+        "term": entry.term or "",
+        "meaning": semantic_entry.meaning or "",
+        "synonyms": synonyms,
+        "usage_notes": entry.usage_notes or "",
+        "example_sentence": entry.example_sentence or "",
+    }
+
+
+def refresh_entry_search_documents(entries) -> None:
+    """
+    Upsert or drop search documents so they mirror current entry state.
+    """
+
+    for entry in entries:
+        if entry.status not in SEARCHABLE_STATUSES:
+            EntrySearchDocument.objects.filter(entry_id=entry.id).delete()
+            continue
+        EntrySearchDocument.objects.update_or_create(
+            entry_id=entry.id,
+            defaults=search_document_fields(entry),
+        )
+
+
+def add_entry_search_documents(entries) -> None:
+    """
+    Insert search documents for entries that have none yet (bulk imports).
+    """
+
+    EntrySearchDocument.objects.bulk_create(
+        [
+            EntrySearchDocument(entry_id=entry.id, **search_document_fields(entry))
+            for entry in entries
+            if entry.status in SEARCHABLE_STATUSES
+        ]
+    )
+
+
+def refresh_group_search_documents(group) -> None:
+    """
+    Re-index every member of a variant group.
+
+    Needed after mother changes, because variants inherit semantic fields.
+    """
+
+    if group is None:
+        return
+    refresh_entry_search_documents(
+        group.entries.select_related("variant_group__mother_entry").all()
+    )
+
+
+@transaction.atomic
+def rebuild_search_index(*, batch_size=1000) -> int:
+    """
+    Rebuild every search document from scratch. Returns indexed row count.
+    """
+
+    EntrySearchDocument.objects.all().delete()
+    documents = []
+    indexed = 0
+    queryset = (
+        Entry.objects.filter(status__in=SEARCHABLE_STATUSES)
+        .select_related("variant_group__mother_entry")
+        .order_by("id")
+    )
+    for entry in queryset.iterator(chunk_size=batch_size):
+        documents.append(EntrySearchDocument(entry_id=entry.id, **search_document_fields(entry)))
+        if len(documents) >= batch_size:
+            EntrySearchDocument.objects.bulk_create(documents)
+            indexed += len(documents)
+            documents = []
+    if documents:
+        EntrySearchDocument.objects.bulk_create(documents)
+        indexed += len(documents)
+    return indexed
+
+
+# ============================================
+# BACKENDS
+# ============================================
+
+
+class _LikeSearchBackend:
+    """
+    Portable fallback: substring match over the document table.
+    """
+
+    def matching_document_ids(self, query):
+        return EntrySearchDocument.objects.filter(
+            Q(term__icontains=query)
+            | Q(meaning__icontains=query)
+            | Q(synonyms__icontains=query)
+            | Q(usage_notes__icontains=query)
+            | Q(example_sentence__icontains=query)
+        ).values("entry_id")
+
+    def ranked_entry_ids(self, query, limit):
+        documents = self.matching_document_ids(query)
+        exact = list(
+            documents.filter(term__iexact=query).values_list("entry_id", flat=True)[:limit]
+        )
+        term_hits = list(
+            documents.filter(term__icontains=query)
+            .exclude(entry_id__in=exact)
+            .order_by("term")
+            .values_list("entry_id", flat=True)[: max(limit - len(exact), 0)]
+        )
+        ranked = exact + term_hits
+        if len(ranked) < limit:
+            ranked += list(
+                documents.exclude(entry_id__in=ranked)
+                .order_by("term")
+                .values_list("entry_id", flat=True)[: limit - len(ranked)]
+            )
+        return ranked
+
+
+class _SqliteFtsSearchBackend:
+    """
+    FTS5 trigram shadow table joined back to EntrySearchDocument by rowid.
+    """
+
+    def _match_expression(self, query):
+        # A quoted FTS5 string is a phrase; with the trigram tokenizer that
+        # means "contains this substring" anywhere in the indexed columns.
+        return '"' + query.replace('"', '""') + '"'
+
+    def matching_document_ids(self, query):
+        return EntrySearchDocument.objects.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s",
+                [self._match_expression(query)],
+            )
+        ).values("entry_id")
+
+    def ranked_entry_ids(self, query, limit):
+        weights = ", ".join(str(weight) for weight in SQLITE_BM25_WEIGHTS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT document.entry_id FROM {SQLITE_FTS_TABLE} "
+                f"JOIN {EntrySearchDocument._meta.db_table} AS document "
+                f"ON document.id = {SQLITE_FTS_TABLE}.rowid "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH %s "
+                f"ORDER BY bm25({SQLITE_FTS_TABLE}, {weights}) LIMIT %s",
+                [self._match_expression(query), limit],
+            )
+            return [_as_uuid(row[0]) for row in cursor.fetchall()]
+
+
+class _PostgresSearchBackend:
+    """
+    `pg_trgm` substring match on term plus weighted full-text match on all columns.
+    """
+
+    def _vector_sql(self):
+        return POSTGRES_SEARCH_VECTOR_SQL.format(table=EntrySearchDocument._meta.db_table)
+
+    def _matching_documents(self, query):
+        full_text_match = RawSQL(
+            f"{self._vector_sql()} @@ websearch_to_tsquery('simple', %s)",
+            [query],
+            output_field=BooleanField(),
+        )
+        return EntrySearchDocument.objects.annotate(full_text_match=full_text_match).filter(
+            Q(term__icontains=query) | Q(full_text_match=True)
+        )
+
+    def matching_document_ids(self, query):
+        return self._matching_documents(query).values("entry_id")
+
+    def ranked_entry_ids(self, query, limit):
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        text_rank = RawSQL(
+            f"ts_rank({self._vector_sql()}, websearch_to_tsquery('simple', %s))",
+            [query],
+            output_field=FloatField(),
+        )
+        return list(
+            self._matching_documents(query)
+            .annotate(rank=text_rank + TrigramSimilarity("term", query))
+            .order_by("-rank", "term")
+            .values_list("entry_id", flat=True)[:limit]
+        )
+
+
+_sqlite_fts_available = {}
+
+
+def _sqlite_has_fts_table():
+    # Cached per database name: introspection is cheap but not free.
+    key = connection.settings_dict.get("NAME")
+    if key not in _sqlite_fts_available:
+        try:
+            _sqlite_fts_available[key] = SQLITE_FTS_TABLE in connection.introspection.table_names()
+        except (OperationalError, ProgrammingError):
+            _sqlite_fts_available[key] = False
+    return _sqlite_fts_available[key]
+
+
+def _backend():
+    if connection.vendor == "postgresql":
+        return _PostgresSearchBackend()
+    if connection.vendor == "sqlite" and _sqlite_has_fts_table():
+        return _SqliteFtsSearchBackend()
+    return _LikeSearchBackend()
+
+
+def _as_uuid(value):
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+# ============================================
+# PUBLIC API
+# ============================================
+
+
+def filter_entries(queryset, query):
+    """
+    Restrict an Entry (or PublicEntryView) queryset to rows matching the query.
+    """
+
+    query = str(query or "").strip()
+    if not query:
+        return queryset
+    key_matches = matching_key_entry_ids(query)
+    if len(query) < MIN_INDEXED_QUERY_LENGTH:
+        # Too short for a trigram index: only the indexed key-prefix range, never
+        # a substring scan of the whole table.
+        return queryset.filter(pk__in=key_matches) if key_matches is not None else queryset.none()
+    match = Q(pk__in=_backend().matching_document_ids(query))
+    if key_matches is not None:
+        match |= Q(pk__in=key_matches)
+    return queryset.filter(match)
+
+
+def ranked_entry_ids(query, *, limit):
+    """
+    Return up to `limit` matching entry ids, best match first.
+
+    Entries whose headword or inflected form has the query's spelling key come
+    first, then the backend ranking, then the remaining key prefix matches.
+    """
+
+    query = str(query or "").strip()
+    if not query:
+        return []
+    exact_key_ids, prefix_key_ids = ranked_key_entry_ids(query, limit=limit)
+    if len(query) < MIN_INDEXED_QUERY_LENGTH:
+        return [*exact_key_ids, *prefix_key_ids][:limit]
+    ranked = _backend().ranked_entry_ids(query, limit)
+    merged = list(dict.fromkeys([*exact_key_ids, *ranked, *prefix_key_ids]))
+    return merged[:limit]
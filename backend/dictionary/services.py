@@ -1,6 +1,9 @@
 from django.db import transaction
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 
+from dictionary.batching import chunked
 from dictionary.field_groups import (
     ENTRY_SNAPSHOT_FIELDS,
     MEDIA_FIELDS,
@@ -9,8 +12,9 @@ from dictionary.field_groups import (
 )
 from dictionary.models import Entry, EntryRevision, EntryStatus
 from dictionary.state_machine import validate_transition
-from dictionary.text import capitalize_first, normalize_headword, normalize_sentence
+from dictionary.text import capitalize_first, headword_key, normalize_headword, normalize_sentence
 from dictionary.variant_services import ensure_group_and_mother, maybe_promote_general_ivatan
+from users.revision_retention import enforce_revision_retention_inline
 
 # Dictionary publishing service:
 # - Takes approved revisions and applies them to live entries.
@@ -46,7 +50,7 @@ def _field_snapshot_value(entry: Entry, field: str):
     return value
 
 
-def _snapshot_entry(entry: Entry) -> dict:
+def snapshot_entry(entry: Entry) -> dict:
     """
     Build a JSON-serializable snapshot of editable entry content.
 
@@ -122,6 +126,40 @@ def _build_variant_create_kwargs(*, variant_data: dict, semantic_entry: Entry, r
     return create_kwargs
 
 
+LIVE_HEADWORD_STATUSES = (EntryStatus.APPROVED, EntryStatus.APPROVED_UNDER_REVIEW)
+
+
+def find_live_headwords(terms, *, variant_group_id=None) -> dict:
+    """
+    Map each term's headword_key to the live entries already using it.
+
+    One indexed query on Entry.term_key per `chunked` slice of keys; pass
+    `variant_group_id` to only look inside one variant group. Values are
+    lists of `{"id", "term", "status", "is_mother", "variant_group_id"}`.
+    """
+
+    keys = sorted({headword_key(term) for term in terms} - {""})
+    matches = {}
+    for chunk in chunked(keys):
+        queryset = Entry.objects.filter(term_key__in=chunk, status__in=LIVE_HEADWORD_STATUSES)
+        if variant_group_id is not None:
+            queryset = queryset.filter(variant_group_id=variant_group_id)
+        rows = queryset.order_by("term_key", "-is_mother", "term", "id").values_list(
+            "term_key", "id", "term", "status", "is_mother", "variant_group_id"
+        )
+        for term_key, entry_id, term, status, is_mother, group_id in rows:
+            matches.setdefault(term_key, []).append(
+                {
+                    "id": str(entry_id),
+                    "term": term,
+                    "status": status,
+                    "is_mother": is_mother,
+                    "variant_group_id": str(group_id) if group_id else None,
+                }
+            )
+    return matches
+
+
 def _create_additional_variants(*, entry: Entry, revision, approvers) -> list[Entry]:
     """
     Publish extra variant rows carried in revision.proposed_data["variants"].
@@ -140,19 +178,23 @@ def _create_additional_variants(*, entry: Entry, revision, approvers) -> list[En
 
     created = []
     group = semantic_entry.variant_group
+    variants = [item for item in variants if isinstance(item, dict)]
+    # One lookup for every submitted variant instead of one per variant.
+    taken = set(
+        find_live_headwords(
+            [str(item.get("term") or "") for item in variants],
+            variant_group_id=group.id,
+        )
+    )
     for variant_data in variants:
-        if not isinstance(variant_data, dict):
-            continue
         term = str(variant_data.get("term") or "").strip()
         if not term:
             continue
 
-        duplicate = group.entries.filter(
-            term__iexact=term,
-            status__in=[EntryStatus.APPROVED, EntryStatus.APPROVED_UNDER_REVIEW],
-        ).first()
-        if duplicate:
+        key = headword_key(term)
+        if key in taken:
             continue
+        taken.add(key)
 
         variant_entry = Entry.objects.create(
             **_build_variant_create_kwargs(
@@ -167,7 +209,7 @@ def _create_additional_variants(*, entry: Entry, revision, approvers) -> list[En
         EntryRevision.objects.create(
             entry=variant_entry,
             contributor=revision.contributor,
-            proposed_data=_snapshot_entry(variant_entry),
+            proposed_data=snapshot_entry(variant_entry),
             status=EntryRevision.Status.APPROVED,
             approved_at=revision.approved_at or timezone.now(),
             is_base_snapshot=True,
@@ -222,6 +264,106 @@ def get_visible_revision_history(*, entry: Entry, audience: str = "public") -> d
     }
 
 
+def detail_revision_slices_queryset(*, entry: Entry, audience: str = "public"):
+    """
+    The single EntryRevision query behind `get_detail_revision_slices`.
+
+    Each slice is a ROW_NUMBER() window over the entry's revisions, so the
+    query shape stays the same however long the history grows. Contributors
+    come with `contributor__profile` loaded.
+    """
+
+    if audience not in REVISION_HISTORY_LIMITS:
+        raise ValueError(f"Unknown audience '{audience}'.")
+    limit = REVISION_HISTORY_LIMITS[audience]
+    approved = EntryRevision.Status.APPROVED
+    rejected = EntryRevision.Status.REJECTED
+    newest_approved_first = [F("approved_at").desc(), F("created_at").desc()]
+    by_state = [F("status"), F("is_base_snapshot")]
+
+    return (
+        EntryRevision.objects.filter(entry=entry, status__in=[approved, rejected])
+        .select_related("contributor", "contributor__profile")
+        .annotate(
+            history_rank=Window(RowNumber(), partition_by=by_state, order_by=newest_approved_first),
+            rejected_rank=Window(
+                RowNumber(), partition_by=by_state, order_by=[F("created_at").desc()]
+            ),
+            base_rank=Window(
+                RowNumber(),
+                partition_by=by_state,
+                order_by=[F("approved_at").asc(), F("created_at").asc()],
+            ),
+            latest_rank=Window(
+                RowNumber(), partition_by=[F("status")], order_by=newest_approved_first
+            ),
+            contributor_rank=Window(
+                RowNumber(),
+                partition_by=[*by_state, F("contributor_id")],
+                order_by=newest_approved_first,
+            ),
+        )
+        .filter(
+            Q(status=approved, is_base_snapshot=False, history_rank__lte=limit)
+            | Q(status=approved, is_base_snapshot=False, contributor_rank=1)
+            | Q(status=approved, is_base_snapshot=True, base_rank=1)
+            | Q(status=approved, latest_rank=1)
+            | Q(status=rejected, is_base_snapshot=False, rejected_rank__lte=limit)
+        )
+    )
+
+
+def get_detail_revision_slices(*, entry: Entry, audience: str = "public") -> dict:
+    """
+    Everything the public detail page needs from EntryRevision, in one query.
+
+    Returns the `get_visible_revision_history` keys plus:
+    - `latest_approved_revision`: newest approved revision (base included)
+    - `contributor_revisions`: newest approved non-base revision per contributor,
+      newest first (drives the contributors section)
+    - `has_approved_revisions`: whether any approved non-base revision exists
+    """
+
+    rows = list(detail_revision_slices_queryset(entry=entry, audience=audience))
+    limit = REVISION_HISTORY_LIMITS[audience]
+    approved = EntryRevision.Status.APPROVED
+    rejected = EntryRevision.Status.REJECTED
+    approved_non_base = sorted(
+        (row for row in rows if row.status == approved and not row.is_base_snapshot),
+        key=lambda row: row.history_rank,
+    )
+    return {
+        "base_snapshot": next(
+            (
+                row
+                for row in rows
+                if row.status == approved and row.is_base_snapshot and row.base_rank == 1
+            ),
+            None,
+        ),
+        "recent_approved_revisions": [
+            row for row in approved_non_base if row.history_rank <= limit
+        ],
+        "recent_rejected_revisions": sorted(
+            (row for row in rows if row.status == rejected and not row.is_base_snapshot),
+            key=lambda row: row.rejected_rank,
+        ),
+        "latest_approved_revision": next(
+            (row for row in rows if row.status == approved and row.latest_rank == 1), None
+        ),
+        "contributor_revisions": [row for row in approved_non_base if row.contributor_rank == 1],
+        "has_approved_revisions": bool(approved_non_base),
+    }
+
+
+def contributor_revisions(user):
+    """
+    A contributor's own revisions, newest first ("my revisions" page).
+    """
+
+    return EntryRevision.objects.filter(contributor=user).order_by("-created_at")
+
+
 def _enforce_approved_revision_retention(entry: Entry) -> None:
     """
     Apply approved-revision retention policy.
@@ -229,20 +371,12 @@ def _enforce_approved_revision_retention(entry: Entry) -> None:
     Spec quote:
     "Maximum 20 approved revisions retained.
     Original approved revision excluded from deletion."
-    """
 
-    approved_non_base = EntryRevision.objects.filter(
-        entry=entry,
-        status=EntryRevision.Status.APPROVED,
-        is_base_snapshot=False,
-    ).order_by("approved_at", "created_at")
-
-    overflow = approved_non_base.count() - 20
-    if overflow <= 0:
-        return
+    Only the inline fast path runs here; `sweep_revision_retention` enforces
+    the policy in bulk (users/revision_retention.py).
+    """
 
-    delete_ids = list(approved_non_base.values_list("id", flat=True)[:overflow])
-    EntryRevision.objects.filter(id__in=delete_ids).delete()
+    enforce_revision_retention_inline(EntryRevision, entry.id)
 
 
 @transaction.atomic
@@ -459,7 +593,7 @@ def create_revision_from_entry(*, entry: Entry, contributor) -> EntryRevision:
     # If users complain that revisions start "blank", ensure this function is used.
     revision = EntryRevision.objects.create(
         entry=entry,
-        proposed_data=_snapshot_entry(entry),
+        proposed_data=snapshot_entry(entry),
         contributor=contributor,
         status=EntryRevision.Status.DRAFT,
     )
@@ -0,0 +1,83 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from dictionary.english_lookup import refresh_entry_english_lookup, refresh_group_english_lookup
+from dictionary.field_groups import ENTRY_SNAPSHOT_FIELDS, SEMANTIC_CORE_FIELDS
+from dictionary.models import Entry
+from dictionary.orthography import refresh_entry_search_keys
+from dictionary.public_view import (
+    log_public_entry_changes,
+    refresh_entry_public_views,
+    refresh_group_public_views,
+)
+from dictionary.related_terms import (
+    RELATED_TERM_FIELDS,
+    refresh_entry_related_links,
+    related_term_key,
+    resolve_related_term_links,
+)
+from dictionary.search import refresh_entry_search_documents, refresh_group_search_documents
+from dictionary.spelling import refresh_entry_spelling_index
+
+# Search keys and spelling deletions: the entry's own spellings while it is live.
+SEARCH_KEY_SOURCE_FIELDS = ("term", "inflected_forms", "status")
+
+# Related term links: the relation fields, while the entry owns its semantics.
+RELATED_LINK_SOURCE_FIELDS = (*RELATED_TERM_FIELDS, "is_mother", "variant_group_id")
+
+# Listing rows, search documents, English glosses and exports: every field
+# they read, so bookkeeping saves and no-op saves log no public change.
+LISTING_SOURCE_FIELDS = (
+    *ENTRY_SNAPSHOT_FIELDS,
+    "status",
+    "is_mother",
+    "variant_group_id",
+    "initial_contributor_id",
+    "last_approved_at",
+)
+
+# A mother's variants read these from her, so they are re-indexed with her.
+GROUP_SOURCE_FIELDS = (*SEMANTIC_CORE_FIELDS, "is_mother", "variant_group_id")
+
+
+@receiver(post_save, sender=Entry)
+def on_entry_saved(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    # Fixture loading (`raw=True`) runs before related rows exist; rebuild afterwards instead.
+    if raw:
+        return
+    # Before the listing refresh, which re-resolves links naming this headword.
+    if created or instance.tracked_fields_changed(
+        RELATED_LINK_SOURCE_FIELDS, update_fields=update_fields
+    ):
+        refresh_entry_related_links([instance])
+    if created or instance.tracked_fields_changed(
+        SEARCH_KEY_SOURCE_FIELDS, update_fields=update_fields
+    ):
+        refresh_entry_search_keys([instance])
+        refresh_entry_spelling_index([instance])
+    if (
+        instance.is_mother
+        and instance.variant_group_id
+        and (
+            created
+            or instance.tracked_fields_changed(GROUP_SOURCE_FIELDS, update_fields=update_fields)
+        )
+    ):
+        # Variants inherit the mother's meaning, so the whole group needs re-indexing.
+        refresh_group_search_documents(instance.variant_group)
+        refresh_group_english_lookup(instance.variant_group)
+        refresh_group_public_views(instance.variant_group)
+    elif created or instance.tracked_fields_changed(
+        LISTING_SOURCE_FIELDS, update_fields=update_fields
+    ):
+        refresh_entry_search_documents([instance])
+        refresh_entry_english_lookup([instance])
+        refresh_entry_public_views([instance])
+
+
+@receiver(post_delete, sender=Entry)
+def on_entry_deleted(sender, instance, **kwargs):
+    # The listing row cascades away; offline bundles still need to hear about it.
+    log_public_entry_changes([instance.id])
+    # Links to it were nulled; another entry may carry the same headword.
+    resolve_related_term_links([related_term_key(instance.term)])
@@ -0,0 +1,134 @@
+"""
+dictionary/spelling.py
+
+"Did you mean" suggestions for searches that return no rows.
+
+How it works (SymSpell-style deletion index):
+- Every orthographic key of a live entry (`dictionary/orthography.py`: term
+  and inflected forms) is stored in SpellingDeletion together with each string
+  made by deleting up to MAX_EDIT_DISTANCE characters from its first
+  PREFIX_LENGTH characters.
+- A query key within edit distance 2 of a stored key shares at least one of
+  those variants, so candidates come from one indexed `deletion IN (...)`
+  lookup whose size depends only on PREFIX_LENGTH, not on the dictionary.
+  Candidates are then checked with the real edit distance.
+- Rows are refreshed with the search keys: `dictionary/signals.py` on Entry
+  saves and the wordlist importer.
+
+Troubleshooting:
+- Suggestions are missing or stale, or the orthography rules changed: run
+  `manage.py rebuild_spelling_index`.
+"""
+
+from dictionary.models import Entry, SpellingDeletion
+from dictionary.orthography import (
+    KEY_ROW_BATCH_SIZE,
+    SEARCH_KEY_STATUSES,
+    entry_search_keys,
+    orthography_key,
+    rebuild_key_rows,
+    replace_key_rows,
+)
+from dictionary.public_view import HAS_PUBLIC_VIEW
+
+MAX_EDIT_DISTANCE = 2
+
+# Only the first characters are expanded; this bounds rows per key and the
+# size of the lookup, the usual SymSpell trade-off.
+PREFIX_LENGTH = 7
+
+DEFAULT_SUGGESTION_LIMIT = 5
+
+
+def deletion_variants(key, *, max_distance=MAX_EDIT_DISTANCE, prefix_length=PREFIX_LENGTH) -> set:
+    """
+    `key`'s prefix plus every string made by deleting up to `max_distance` characters.
+    """
+
+    variants = {key[:prefix_length]}
+    frontier = set(variants)
+    for _ in range(max_distance):
+        frontier = {
+            word[:position] + word[position + 1 :]
+            for word in frontier
+            if len(word) > 1
+            for position in range(len(word))
+        }
+        variants |= frontier
+    return variants
+
+
+def edit_distance(left: str, right: str) -> int:
+    """
+    Optimal string alignment distance (insert, delete, substitute, swap).
+    """
+
+    previous_row = None
+    row = list(range(len(right) + 1))
+    for i, left_char in enumerate(left, start=1):
+        older_row, previous_row = previous_row, row
+        row = [i] + [0] * len(right)
+        for j, right_char in enumerate(right, start=1):
+            cost = left_char != right_char
+            row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if (
+                older_row is not None
+                and j > 1
+                and left_char == right[j - 2]
+                and left[i - 2] == right_char
+            ):
+                row[j] = min(row[j], older_row[j - 2] + 1)
+    return row[-1]
+
+
+def _deletion_rows(entry: Entry) -> list[SpellingDeletion]:
+    if entry.status not in SEARCH_KEY_STATUSES:
+        return []
+    return [
+        SpellingDeletion(deletion=deletion, entry_id=entry.id, search_key=key)
+        for key in entry_search_keys(entry)
+        for deletion in sorted(deletion_variants(key))
+    ]
+
+
+def refresh_entry_spelling_index(entries) -> None:
+    """
+    Replace the deletion rows of the given entries with their current keys.
+    """
+
+    replace_key_rows(SpellingDeletion, entries, _deletion_rows)
+
+
+def rebuild_spelling_index(*, batch_size=KEY_ROW_BATCH_SIZE) -> int:
+    """
+    Rebuild every deletion row from scratch. Returns the number of rows written.
+    """
+
+    return rebuild_key_rows(SpellingDeletion, _deletion_rows, batch_size=batch_size)
+
+
+def spelling_suggestions(query, *, limit=DEFAULT_SUGGESTION_LIMIT) -> list[dict]:
+    """
+    Public headwords whose term or inflected form is closest to `query`.
+
+    Returns `[{"id", "label", "distance"}]`, nearest first, at most one per
+    entry and only within MAX_EDIT_DISTANCE.
+    """
+
+    key = orthography_key(query)
+    if not key:
+        return []
+    candidates = SpellingDeletion.objects.filter(
+        HAS_PUBLIC_VIEW, deletion__in=sorted(deletion_variants(key))
+    ).values_list("search_key", "entry_id", "entry__public_view__term")
+
+    best = {}
+    for search_key, entry_id, term in candidates.distinct():
+        distance = edit_distance(key, search_key)
+        if distance <= MAX_EDIT_DISTANCE and distance < best.get(entry_id, (distance + 1,))[0]:
+            best[entry_id] = (distance, term)
+    ranked = sorted(best.items(), key=lambda item: (item[1][0], item[1][1].lower(), str(item[0])))
+    return [
+        {"id": str(entry_id), "label": term, "distance": distance}
+        for entry_id, (distance, term) in ranked[:limit]
+    ]
@@ -0,0 +1,232 @@
+"""
+dictionary/suggest.py
+
+In-process type-ahead index for `api/dictionary/suggest`.
+
+Why:
+- The search box asked `api/dictionary/entries?q=` on every keystroke, which
+  runs the full search and returns whole listing rows.
+
+How it works:
+- Each worker keeps two sorted arrays of `(key, label, entry_id)`: headwords
+  keyed by their orthographic key (`dictionary/orthography.py`, so "bahay"
+  suggests "vahay") and English glosses keyed by EnglishLookupTerm keys. A
+  prefix lookup is one `bisect` plus a short walk; no query runs.
+- The arrays are built on the first suggest request of the worker from
+  PublicEntryView and EnglishLookupTerm (public, contributor-visible rows).
+- At most every `DICTIONARY_SUGGEST_REFRESH_SECONDS` a request reads the
+  dictionary publish sequence (users/public_versions.py). When it moved, the
+  entry ids logged to PublicEntryChange past the index watermark are reloaded
+  and merged into a new copy of the arrays, which replaces the old one.
+- The watermark only advances to `settled_change_watermark()`
+  (dictionary/public_view.py): newer log rows are merged again on the next
+  refresh, so a writer that committed a lower id late is still picked up.
+- The index is rebuilt from scratch instead when the change log was pruned past
+  its watermark (offline bundle builds prune it) or too many entries changed.
+
+Troubleshooting:
+- A new entry never shows up: check that its save logged a PublicEntryChange
+  row and bumped the dictionary PublicContentVersion.
+"""
+
+import bisect
+import threading
+import time
+
+from django.conf import settings
+
+from dictionary.batching import chunked
+from dictionary.english_lookup import english_lookup_key
+from dictionary.models import EnglishLookupTerm, PublicEntryChange, PublicEntryView
+from dictionary.orthography import orthography_key
+from dictionary.public_view import HAS_PUBLIC_VIEW, settled_change_watermark
+from users.models import PublicContentVersion
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 25
+
+DEFAULT_REFRESH_SECONDS = 5
+
+# Past this many changed entries a full rebuild is cheaper than merging.
+MAX_INCREMENTAL_CHANGES = 2000
+
+
+class SuggestIndex:
+    """
+    Immutable snapshot of the sorted headword and gloss arrays.
+    """
+
+    def __init__(self, *, terms, glosses, version, watermark):
+        self.terms = terms
+        self.glosses = glosses
+        self.version = version
+        self.watermark = watermark
+
+    @staticmethod
+    def _prefix_rows(rows, key):
+        start = bisect.bisect_left(rows, (key,))
+        for position in range(start, len(rows)):
+            row = rows[position]
+            if not row[0].startswith(key):
+                return
+            yield row
+
+    def lookup(self, query, *, limit):
+        """
+        Up to `limit` suggestions: headword matches first, then English glosses.
+        """
+
+        suggestions = []
+        seen = set()
+        term_key = orthography_key(query)
+        if term_key:
+            for _, label, entry_id in self._prefix_rows(self.terms, term_key):
+                if len(suggestions) >= limit:
+                    return suggestions
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    suggestions.append({"id": entry_id, "label": label})
+        gloss_key = english_lookup_key(query)
+        if gloss_key:
+            for gloss, label, entry_id in self._prefix_rows(self.glosses, gloss_key):
+                if len(suggestions) >= limit:
+                    return suggestions
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    suggestions.append({"id": entry_id, "label": label, "gloss": gloss})
+        return suggestions
+
+    def merged(self, *, changed_ids, terms, glosses, version, watermark):
+        """
+        New snapshot with the rows of `changed_ids` replaced by the given rows.
+        """
+
+        # Timsort merges the kept (sorted) rows and the few new ones in ~O(n).
+        return SuggestIndex(
+            terms=sorted([row for row in self.terms if row[2] not in changed_ids] + terms),
+            glosses=sorted([row for row in self.glosses if row[2] not in changed_ids] + glosses),
+            version=version,
+            watermark=watermark,
+        )
+
+
+def _term_rows(queryset):
+    rows = []
+    for entry_id, term in queryset.values_list("entry_id", "term"):
+        key = orthography_key(term)
+        if key:
+            rows.append((key, term, str(entry_id)))
+    return rows
+
+
+def _gloss_rows(queryset):
+    return [
+        (english_key, term, str(entry_id))
+        for english_key, term, entry_id in queryset.values_list("english_key", "term", "entry_id")
+    ]
+
+
+def _public_glosses():
+    return EnglishLookupTerm.objects.filter(HAS_PUBLIC_VIEW)
+
+
+def _publish_sequence():
+    return (
+        PublicContentVersion.objects.filter(scope=PublicContentVersion.Scope.DICTIONARY)
+        .values_list("version", flat=True)
+        .first()
+        or 0
+    )
+
+
+def build_suggest_index(*, version=None) -> SuggestIndex:
+    """
+    Build the whole index from the public read models.
+    """
+
+    version = _publish_sequence() if version is None else version
+    # Read before the rows: a change landing in between is merged again later.
+    watermark = settled_change_watermark()
+    return SuggestIndex(
+        terms=sorted(_term_rows(PublicEntryView.objects.all())),
+        glosses=sorted(_gloss_rows(_public_glosses())),
+        version=version,
+        watermark=watermark,
+    )
+
+
+def _refreshed(index: SuggestIndex, version) -> SuggestIndex:
+    # The watermark row survives pruning until a bundle build moves past it.
+    if not index.watermark or not PublicEntryChange.objects.filter(id=index.watermark).exists():
+        return build_suggest_index(version=version)
+    # Read the watermark first; unsettled rows past it are merged again next time.
+    watermark = max(settled_change_watermark(), index.watermark)
+    changed_ids = list(
+        PublicEntryChange.objects.filter(id__gt=index.watermark)
+        .values_list("entry_id", flat=True)
+        .distinct()
+    )
+    if len(changed_ids) > MAX_INCREMENTAL_CHANGES:
+        return build_suggest_index(version=version)
+
+    terms = []
+    glosses = []
+    for chunk in chunked(changed_ids):
+        terms += _term_rows(PublicEntryView.objects.filter(entry_id__in=chunk))
+        glosses += _gloss_rows(_public_glosses().filter(entry_id__in=chunk))
+    return index.merged(
+        changed_ids={str(entry_id) for entry_id in changed_ids},
+        terms=terms,
+        glosses=glosses,
+        version=version,
+        watermark=watermark,
+    )
+
+
+_lock = threading.Lock()
+_index = None
+_checked_until = 0.0
+
+
+def get_suggest_index() -> SuggestIndex:
+    """
+    This worker's index, built on first use and refreshed after publishes.
+    """
+
+    global _index, _checked_until
+
+    index = _index
+    if index is not None and time.monotonic() < _checked_until:
+        return index
+    with _lock:
+        if _index is not None and time.monotonic() < _checked_until:
+            return _index
+        version = _publish_sequence()
+        if _index is None:
+            _index = build_suggest_index(version=version)
+        elif _index.version != version:
+            _index = _refreshed(_index, version)
+        refresh_seconds = getattr(
+            settings, "DICTIONARY_SUGGEST_REFRESH_SECONDS", DEFAULT_REFRESH_SECONDS
+        )
+        _checked_until = time.monotonic() + refresh_seconds
+        return _index
+
+
+def reset_suggest_index() -> None:
+    """
+    Drop this worker's index; the next request rebuilds it.
+    """
+
+    global _index, _checked_until
+
+    with _lock:
+        _index = None
+        _checked_until = 0.0
+
+
+def suggest(query, *, limit=DEFAULT_LIMIT) -> list[dict]:
+    query = str(query or "").strip()
+    if not query:
+        return []
+    return get_suggest_index().lookup(query, limit=limit)
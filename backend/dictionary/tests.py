@@ -1,28 +1,84 @@
+import gzip
+import json
+import tempfile
 from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
-from django.test import TestCase
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from dictionary.models import Entry, EntryRevision, EntryStatus, VariantGroup
+from dictionary.bundles import build_dictionary_bundle
+from dictionary.importer import import_wordlist
+from dictionary.models import (
+    EnglishLookupTerm,
+    Entry,
+    EntryRevision,
+    EntrySearchDocument,
+    EntrySearchKey,
+    EntryStatus,
+    PublicEntryChange,
+    PublicEntryView,
+    RelatedTermLink,
+    VariantGroup,
+    WordlistImportCheckpoint,
+)
+from dictionary.orthography import orthography_key
 from dictionary.services import (
     create_revision_from_entry,
+    detail_revision_slices_queryset,
     finalize_approved_revision,
+    get_detail_revision_slices,
     get_visible_revision_history,
     publish_revision,
 )
+from dictionary.spelling import deletion_variants, edit_distance, rebuild_spelling_index
 from dictionary.state_machine import validate_transition
-from dictionary.variant_services import promote_to_mother
+from dictionary.suggest import reset_suggest_index
+from dictionary.variant_services import ensure_group_and_mother, promote_to_mother
 from folklore.models import FolkloreEntry
-from users.models import Notification, UserProfile
+from reviews.models import Review
+from users.models import (
+    ContributionEvent,
+    Notification,
+    PublicContentVersion,
+    PublicStatusCounter,
+    UserProfile,
+)
+from users.public_versions import bump_public_content_version
+from users.revision_storage import compact_revisions
+from users.site_content import get_site_settings
 
 User = get_user_model()
 
 
+class LiveEntryMixin:
+    """
+    `_entry` factory for tests that need published mother entries owned by `self.user`.
+    """
+
+    def _entry(self, term, **overrides):
+        values = {
+            "term": term,
+            "status": EntryStatus.APPROVED,
+            "is_mother": True,
+            "initial_contributor": self.user,
+            "last_revised_by": self.user,
+            "last_approved_at": timezone.now(),
+        }
+        values.update(overrides)
+        return Entry.objects.create(**values)
+
+
 class DictionaryServicesTests(TestCase):
     def setUp(self):
         self.contributor = User.objects.create_user(
@@ -242,6 +298,46 @@ class DictionaryServicesTests(TestCase):
             ).exists()
         )
 
+    def test_publish_revision_skips_variants_already_live_in_the_group(self):
+        mother = Entry.objects.create(
+            term="Vahay",
+            status=EntryStatus.APPROVED,
+            is_mother=True,
+            initial_contributor=self.contributor,
+            last_revised_by=self.contributor,
+        )
+        ensure_group_and_mother(entry=mother)
+        mother.refresh_from_db()
+        Entry.objects.create(
+            term="Bahay",
+            status=EntryStatus.APPROVED,
+            variant_group=mother.variant_group,
+            initial_contributor=self.contributor,
+            last_revised_by=self.contributor,
+        )
+        revision = EntryRevision.objects.create(
+            entry=mother,
+            contributor=self.contributor,
+            proposed_data={
+                "term": "vahay",
+                "meaning": "house",
+                "term_source_is_self_knowledge": True,
+                "variants": [
+                    {"term": " BAHAY ", "variant_type": "Isamurong"},
+                    {"term": "vahaay", "variant_type": "Itbayaten"},
+                    {"term": "Vahaay", "variant_type": "Ivasay"},
+                ],
+            },
+            status=EntryRevision.Status.APPROVED,
+        )
+
+        publish_revision(revision=revision, approvers=[self.approver])
+
+        self.assertEqual(
+            sorted(mother.variant_group.entries.values_list("term_key", flat=True)),
+            ["bahay", "vahaay", "vahay"],
+        )
+
     def test_publish_revision_normalizes_headword_meaning_and_examples(self):
         revision = EntryRevision.objects.create(
             contributor=self.contributor,
@@ -422,6 +518,61 @@ class DictionaryServicesTests(TestCase):
         self.assertEqual(len(recent_ids), 15)
         self.assertEqual(recent_ids, list(reversed(created_ids[-15:])))
 
+    def test_detail_revision_slices_match_history_in_one_query(self):
+        other = User.objects.create_user(username="other_reviser", password="testpass123")
+        entry = Entry.objects.create(
+            term="vakul",
+            status=EntryStatus.APPROVED,
+            initial_contributor=self.contributor,
+            last_revised_by=self.contributor,
+        )
+        base = EntryRevision.objects.create(
+            entry=entry,
+            contributor=self.contributor,
+            proposed_data={"term": "vakul"},
+            status=EntryRevision.Status.APPROVED,
+            approved_at=timezone.now(),
+            is_base_snapshot=True,
+        )
+        for i in range(8):
+            EntryRevision.objects.create(
+                entry=entry,
+                contributor=other if i % 3 == 0 else self.contributor,
+                proposed_data={"term": f"vakul-{i}"},
+                status=EntryRevision.Status.APPROVED,
+                approved_at=timezone.now() + timedelta(seconds=i + 1),
+            )
+            EntryRevision.objects.create(
+                entry=entry,
+                contributor=self.contributor,
+                proposed_data={"term": f"rejected-{i}"},
+                status=EntryRevision.Status.REJECTED,
+            )
+
+        with self.assertNumQueries(1):
+            slices = get_detail_revision_slices(entry=entry, audience="public")
+            [revision.contributor.username for revision in slices["contributor_revisions"]]
+        visible = get_visible_revision_history(entry=entry, audience="public")
+
+        def ids(revisions):
+            return [revision.id for revision in revisions]
+
+        self.assertEqual(slices["base_snapshot"].id, base.id)
+        self.assertEqual(
+            ids(slices["recent_approved_revisions"]), ids(visible["recent_approved_revisions"])
+        )
+        self.assertEqual(
+            ids(slices["recent_rejected_revisions"]), ids(visible["recent_rejected_revisions"])
+        )
+        self.assertEqual(
+            slices["latest_approved_revision"].id, visible["recent_approved_revisions"][0].id
+        )
+        self.assertEqual(
+            [revision.contributor.username for revision in slices["contributor_revisions"]],
+            [self.contributor.username, "other_reviser"],
+        )
+        self.assertTrue(slices["has_approved_revisions"])
+
 
 class DictionaryEntryDetailApiTests(TestCase):
     def setUp(self):
@@ -474,6 +625,74 @@ class DictionaryEntryDetailApiTests(TestCase):
             finalize_approved_revision(revision=rev)
         return entry
 
+    def _add_history(self, entry, *, start, count):
+        for i in range(start, start + count):
+            contributor = User.objects.create_user(username=f"reviser_{i}", password="x")
+            EntryRevision.objects.create(
+                entry=entry,
+                contributor=contributor,
+                proposed_data={"term": f"{entry.term}-{i}"},
+                status=EntryRevision.Status.APPROVED,
+                approved_at=timezone.now() + timedelta(seconds=i + 1),
+            )
+            EntryRevision.objects.create(
+                entry=entry,
+                contributor=contributor,
+                proposed_data={"term": f"{entry.term}-rejected-{i}"},
+                status=EntryRevision.Status.REJECTED,
+            )
+            Entry.objects.create(
+                term=f"{entry.term}-variant-{i}",
+                status=EntryStatus.APPROVED,
+                is_mother=False,
+                variant_group=entry.variant_group,
+                initial_contributor=contributor,
+                audio_contributor=contributor,
+            )
+            entry.last_approved_by.add(contributor)
+
+    def test_detail_query_count_does_not_grow_with_history_or_variants(self):
+        entry = Entry.objects.create(
+            term="budget",
+            status=EntryStatus.APPROVED,
+            is_mother=True,
+            ivatan_synonym="budget-variant-0",
+            initial_contributor=self.contributor,
+            last_revised_by=self.contributor,
+            audio_contributor=self.contributor,
+            photo_contributor=self.contributor,
+        )
+        group = VariantGroup.objects.create(mother_entry=entry)
+        entry.variant_group = group
+        entry.save(update_fields=["variant_group"])
+        self._add_history(entry, start=0, count=1)
+        get_site_settings()  # maintenance check reads the per-process cache
+
+        # ETag version, entry, approvers, variants, windowed revisions, related terms.
+        with self.assertNumQueries(6):
+            small = self.client.get(f"/api/dictionary/entries/{entry.id}").json()
+
+        self._add_history(entry, start=1, count=12)
+        with self.assertNumQueries(6):
+            large = self.client.get(f"/api/dictionary/entries/{entry.id}").json()
+
+        self.assertEqual(len(small["connected_variants"]), 1)
+        self.assertEqual(len(large["connected_variants"]), 13)
+        self.assertEqual(len(large["revision_history"]["recent_approved_revisions"]), 5)
+        self.assertEqual(len(large["revision_history"]["recent_rejected_revisions"]), 5)
+        self.assertEqual(len(large["contributors"]["unique_revision_contributors"]), 13)
+        self.assertEqual(large["contributors"]["last_revised_by"], "reviser_12")
+        self.assertEqual(
+            len(large["attribution"]["always_visible"]["reviewed_and_approved_by"]), 13
+        )
+        self.assertEqual(
+            large["review_action"]["latest_approved_revision_contributor"], "reviser_12"
+        )
+        self.assertEqual(
+            large["semantic_core"]["related_terms"]["ivatan_synonym"][0]["term"],
+            "budget-variant-0",
+        )
+
     def test_public_entry_detail_limits_to_last_five_revisions(self):
         entry = self._build_entry_with_history()
 
@@ -1491,6 +1710,107 @@ class VariantGovernanceTests(TestCase):
         group.refresh_from_db()
         self.assertEqual(group.mother_entry_id, v1.id)
 
+    def _grouped(self, *terms):
+        entries = [
+            Entry.objects.create(
+                term=term,
+                status=EntryStatus.APPROVED,
+                is_mother=index == 0,
+                initial_contributor=self.contributor,
+                last_revised_by=self.contributor,
+            )
+            for index, term in enumerate(terms)
+        ]
+        group = VariantGroup.objects.create(mother_entry=entries[0])
+        Entry.objects.filter(id__in=[entry.id for entry in entries]).update(variant_group=group)
+        for entry in entries:
+            entry.refresh_from_db()
+        return group, entries
+
+    def test_first_approved_at_is_stamped_once(self):
+        entry = Entry.objects.create(
+            term="pending",
+            status=EntryStatus.PENDING,
+            initial_contributor=self.contributor,
+        )
+        self.assertIsNone(entry.first_approved_at)
+
+        entry.status = EntryStatus.APPROVED
+        entry.save(update_fields=["status"])
+        entry.refresh_from_db()
+        first = entry.first_approved_at
+        self.assertIsNotNone(first)
+
+        entry.last_approved_at = first + timedelta(days=3)
+        entry.save()
+        entry.refresh_from_db()
+        self.assertEqual(entry.first_approved_at, first)
+
+    def test_save_and_repair_share_the_first_approval_fallback(self):
+        approved_at = timezone.now() - timedelta(days=10)
+        stamped = []
+        for term in ("saved", "repaired"):
+            entry = Entry.objects.create(
+                term=term, status=EntryStatus.PENDING, initial_contributor=self.contributor
+            )
+            EntryRevision.objects.create(
+                entry=entry,
+                contributor=self.contributor,
+                proposed_data={"term": term},
+                status=EntryRevision.Status.APPROVED,
+                approved_at=approved_at,
+            )
+            entry.status = EntryStatus.APPROVED
+            entry.last_approved_at = timezone.now()
+            entry.save()
+            stamped.append(entry)
+        Entry.objects.filter(id=stamped[1].id).update(first_approved_at=None)
+
+        call_command("repair_variant_groups", stdout=StringIO())
+
+        for entry in stamped:
+            entry.refresh_from_db()
+            self.assertEqual(entry.first_approved_at, approved_at)
+
+    def test_database_allows_one_mother_per_group(self):
+        group, (_, variant) = self._grouped("mother", "variant")
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Entry.objects.filter(id=variant.id).update(is_mother=True)
+
+    def test_fallback_picks_earliest_first_approval(self):
+        group, (mother, late, early) = self._grouped("mother", "late", "early")
+        Entry.objects.filter(id=early.id).update(
+            first_approved_at=late.first_approved_at - timedelta(days=1)
+        )
+
+        mother.archive()
+
+        group.refresh_from_db()
+        self.assertEqual(group.mother_entry_id, early.id)
+        self.assertEqual(
+            list(group.entries.filter(is_mother=True).values_list("id", flat=True)), [early.id]
+        )
+
+    def test_repair_command_fixes_flags_and_missing_mothers(self):
+        group, (mother, variant) = self._grouped("mother", "variant")
+        Entry.objects.filter(id=mother.id).update(is_mother=False, first_approved_at=None)
+        orphan_group, (orphan,) = self._grouped("orphan")
+        VariantGroup.objects.filter(id=orphan_group.id).update(mother_entry=None)
+
+        output = StringIO()
+        call_command("repair_variant_groups", "--dry-run", stdout=output)
+        self.assertIn("bad_mother=1, bad_flags=2, unstamped=1", output.getvalue())
+        call_command("repair_variant_groups", stdout=output)
+        call_command("repair_variant_groups", "--dry-run", stdout=output)
+
+        mother.refresh_from_db()
+        orphan_group.refresh_from_db()
+        self.assertTrue(mother.is_mother)
+        self.assertIsNotNone(mother.first_approved_at)
+        self.assertEqual(orphan_group.mother_entry_id, orphan.id)
+        self.assertIn("ungrouped=0, bad_mother=0, bad_flags=0, unstamped=0", output.getvalue())
+
 
 class LifecycleMaintenanceCommandTests(TestCase):
     def setUp(self):
@@ -1547,3 +1867,1371 @@ class LifecycleMaintenanceCommandTests(TestCase):
         rejected_folk.refresh_from_db()
         self.assertEqual(rejected_folk.status, FolkloreEntry.Status.ARCHIVED)
         self.assertTrue(FolkloreEntry.objects.filter(id=archived_folk.id).exists())
+
+
+class DictionarySearchTests(LiveEntryMixin, TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="search_user",
+            password="testpass123",
+        )
+
+    def _search(self, query, **params):
+        response = self.client.get("/api/dictionary/entries", {"q": query, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_search_matches_meaning_synonyms_and_example_sentence(self):
+        by_meaning = self._entry("vahay", meaning="house")
+        by_synonym = self._entry("kuvo", meaning="hut", english_synonym="small house")
+        by_example = self._entry("tukon", meaning="hill", example_sentence="Beside the house.")
+        self._entry("payaman", meaning="field")
+
+        payload = self._search("house")
+        entry_ids = {row["entry_id"] for row in payload["rows"]}
+
+        self.assertEqual(
+            entry_ids,
+            {str(by_meaning.id), str(by_synonym.id), str(by_example.id)},
+        )
+        self.assertEqual(payload["counts"]["visible_total"], 3)
+
+    def test_search_ranks_headword_match_before_meaning_match(self):
+        self._entry("among", meaning="a song about the dalan")
+        headword = self._entry("dalan", meaning="road")
+
+        rows = self._search("dalan")["rows"]
+
+        self.assertEqual(rows[0]["entry_id"], str(headword.id))
+        self.assertEqual(len(rows), 2)
+
+    def test_variant_is_searchable_by_inherited_mother_meaning(self):
+        mother = self._entry("vahay", meaning="house")
+        group = VariantGroup.objects.create(mother_entry=mother)
+        mother.variant_group = group
+        mother.save(update_fields=["variant_group"])
+        variant = self._entry("bahay", meaning="", variant_group=group, is_mother=False)
+
+        entry_ids = {row["entry_id"] for row in self._search("house")["rows"]}
+
+        self.assertIn(str(variant.id), entry_ids)
+
+    def test_archived_entry_drops_out_of_search(self):
+        entry = self._entry("vahay", meaning="house")
+        self.assertEqual(len(self._search("house")["rows"]), 1)
+
+        entry.archive()
+
+        self.assertEqual(self._search("house")["rows"], [])
+
+    def test_short_query_uses_only_the_key_prefix_range(self):
+        entry = self._entry("ya", meaning="this")
+        self._entry("vahay", meaning="yard")
+
+        rows = self._search("ya", sort="alpha")["rows"]
+
+        self.assertEqual([row["entry_id"] for row in rows], [str(entry.id)])
+        # "ah" is inside "vahay" but no key starts with it.
+        self.assertEqual(self._search("ah")["rows"], [])
+        with CaptureQueriesContext(connection) as queries:
+            self._search("ya")
+        self.assertFalse(any("LIKE" in query["sql"].upper() for query in queries))
+
+    def test_saves_refresh_spelling_tables_only_when_their_sources_change(self):
+        entry = self._entry("vahay", meaning="house", english_synonym="home")
+        derived_tables = ("entrysearchkey", "spellingdeletion", "relatedtermlink")
+
+        def touched_tables(save):
+            with CaptureQueriesContext(connection) as queries:
+                save()
+            # Rebuilds delete and re-insert; the listing refresh only re-resolves links.
+            sql = " ".join(query["sql"].lower() for query in queries)
+            return {table for table in derived_tables if f'delete from "dictionary_{table}"' in sql}
+
+        entry.usage_notes = "Common."
+        self.assertEqual(touched_tables(lambda: entry.save(update_fields=["usage_notes"])), set())
+        entry.meaning = "dwelling"
+        self.assertEqual(touched_tables(entry.save), set())
+
+        entry.inflected_forms = {"plural": "vavahay"}
+        self.assertEqual(touched_tables(entry.save), {"entrysearchkey", "spellingdeletion"})
+        entry.inflected_forms["plural"] = "vahvahay"
+        self.assertEqual(touched_tables(entry.save), {"entrysearchkey", "spellingdeletion"})
+        entry.english_synonym = "dwelling"
+        self.assertIn("relatedtermlink", touched_tables(entry.save))
+
+        reloaded = Entry.objects.get(id=entry.id)
+        reloaded.term = "rakuh"
+        self.assertEqual(
+            touched_tables(lambda: reloaded.save(update_fields=["usage_notes"])), set()
+        )
+        self.assertGreaterEqual(touched_tables(reloaded.save), {"entrysearchkey"})
+        self.assertEqual(
+            [row["entry_id"] for row in self._search("rakuh")["rows"]], [str(entry.id)]
+        )
+
+    def test_search_matches_spelling_variants_of_term_and_inflected_forms(self):
+        vahay = self._entry("Vahay", meaning="house")
+        chirin = self._entry("chirin", meaning="language", inflected_forms={"plural": "chiriin"})
+        self._entry("payaman", meaning="field")
+
+        self.assertEqual(orthography_key("Vaháay"), orthography_key("bahay"))
+        self.assertEqual(
+            [row["entry_id"] for row in self._search("bahay")["rows"]], [str(vahay.id)]
+        )
+        self.assertEqual(
+            [row["entry_id"] for row in self._search("cirin")["rows"]], [str(chirin.id)]
+        )
+
+        chirin.archive()
+
+        self.assertFalse(chirin.search_keys.exists())
+        self.assertEqual(self._search("cirin")["rows"], [])
+
+    def test_spelling_key_match_ranks_before_text_match(self):
+        self._entry("among", meaning="a song about vahay")
+        headword = self._entry("bahay", meaning="house")
+
+        rows = self._search("vahay")["rows"]
+
+        self.assertEqual([row["entry_id"] for row in rows][:1], [str(headword.id)])
+        self.assertEqual(len(rows), 2)
+
+    def test_empty_search_suggests_closest_headwords(self):
+        vahay = self._entry("vahay", meaning="house")
+        tukon = self._entry("tukon", meaning="hill", inflected_forms={"plural": "tukukon"})
+        self._entry("payaman", meaning="field")
+
+        payload = self._search("vahya")
+        self.assertEqual(payload["rows"], [])
+        self.assertEqual(
+            payload["suggestions"], [{"id": str(vahay.id), "label": "vahay", "distance": 1}]
+        )
+        self.assertEqual(
+            [row["id"] for row in self._search("tukokin")["suggestions"]], [str(tukon.id)]
+        )
+        self.assertEqual(self._search("zzzzzz")["suggestions"], [])
+        self.assertEqual(self._search("vahay")["suggestions"], [])
+
+        tukon.archive()
+
+        self.assertFalse(tukon.spelling_deletions.exists())
+        self.assertEqual(self._search("tukokin")["suggestions"], [])
+
+    def test_spelling_index_matches_edit_distance(self):
+        self.assertEqual(edit_distance("vahay", "vahya"), 1)
+        self.assertEqual(edit_distance("vahay", "vhy"), 2)
+        self.assertEqual(edit_distance("tukon", "tukokin"), 2)
+
+        entry = self._entry("kapayvanuvanua", meaning="story")
+        self.assertTrue(
+            deletion_variants(orthography_key("kapaybanubanua"))
+            & set(entry.spelling_deletions.values_list("deletion", flat=True))
+        )
+        self.assertEqual(rebuild_spelling_index(), entry.spelling_deletions.count())
+        deletions = set(entry.spelling_deletions.values_list("deletion", flat=True))
+        # Batches cut mid-entry still write every row exactly once.
+        self.assertEqual(rebuild_spelling_index(batch_size=7), len(deletions))
+        self.assertEqual(
+            set(entry.spelling_deletions.values_list("deletion", flat=True)), deletions
+        )
+
+    @override_settings(DICTIONARY_ORTHOGRAPHY_RULES=[(r"o", "u")])
+    def test_rebuild_command_applies_configured_rules(self):
+        entry = self._entry("tukon", meaning="hill")
+        EntrySearchKey.objects.all().delete()
+
+        output = StringIO()
+        call_command("rebuild_search_keys", stdout=output)
+
+        self.assertIn("rows=1", output.getvalue())
+        self.assertEqual(list(entry.search_keys.values_list("search_key", flat=True)), ["tukun"])
+
+    def test_benchmark_command_reports_latency_and_rolls_back(self):
+        self._entry("vahay", meaning="house")
+        output = StringIO()
+
+        call_command(
+            "benchmark_dictionary_search",
+            entries=50,
+            queries=5,
+            max_p95_ms=10_000,
+            stdout=output,
+        )
+
+        self.assertIn("Search benchmark passed", output.getvalue())
+        self.assertEqual(Entry.objects.count(), 1)
+        self.assertFalse(User.objects.filter(username="search_benchmark_user").exists())
+
+    def test_rebuild_search_index_command_restores_documents(self):
+        entry = self._entry("vahay", meaning="house")
+        EntrySearchDocument.objects.all().delete()
+
+        output = StringIO()
+        call_command("rebuild_search_index", stdout=output)
+
+        self.assertIn("indexed=1", output.getvalue())
+        self.assertEqual(self._search("house")["rows"][0]["entry_id"], str(entry.id))
+
+
+@override_settings(DICTIONARY_SUGGEST_REFRESH_SECONDS=0, PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS=0)
+class DictionarySuggestTests(LiveEntryMixin, TestCase):
+    def setUp(self):
+        reset_suggest_index()
+        self.addCleanup(reset_suggest_index)
+        self.user = User.objects.create_user(username="suggest_user", password="testpass123")
+
+    def _suggest(self, query, **params):
+        response = self.client.get("/api/dictionary/suggest", {"q": query, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()["suggestions"]
+
+    def test_suggests_headword_prefixes_then_english_glosses(self):
+        vahay = self._entry("vahay", meaning="house")
+        vakul = self._entry("vakul", meaning="headgear")
+        self._entry("payaman", meaning="field")
+        self._entry("draft", status=EntryStatus.PENDING, meaning="house")
+
+        self.assertEqual(
+            self._suggest("ba"),
+            [{"id": str(vahay.id), "label": "vahay"}, {"id": str(vakul.id), "label": "vakul"}],
+        )
+        self.assertEqual(
+            self._suggest("hou"), [{"id": str(vahay.id), "label": "vahay", "gloss": "house"}]
+        )
+        self.assertEqual(len(self._suggest("va", limit="1")), 1)
+        self.assertEqual(self._suggest(""), [])
+        # Glosses are matched on their lookup keys, punctuation and all.
+        self.assertEqual([row["label"] for row in self._suggest("House.")], ["vahay"])
+        self.assertEqual([row["label"] for row in self._suggest("house,")], ["vahay"])
+
+    def test_published_changes_are_merged_without_a_rebuild(self):
+        self._entry("vahay", meaning="house")
+        self.assertEqual(len(self._suggest("vah")), 1)
+
+        with patch("dictionary.suggest.build_suggest_index") as full_build:
+            with self.captureOnCommitCallbacks(execute=True):
+                added = self._entry("vahavahay", meaning="small house")
+            self.assertEqual([row["label"] for row in self._suggest("vah")], ["vahavahay", "vahay"])
+            with self.captureOnCommitCallbacks(execute=True):
+                added.archive()
+            self.assertEqual([row["label"] for row in self._suggest("vah")], ["vahay"])
+
+        full_build.assert_not_called()
+
+    @override_settings(PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS=300)
+    def test_late_committed_changes_below_newer_ones_are_still_merged(self):
+        self._entry("vahay", meaning="house")
+        PublicEntryChange.objects.update(changed_at=timezone.now() - timedelta(minutes=10))
+        self._suggest("vah")
+
+        late = self._entry("vahavahay", meaning="small house")
+        late_change = PublicEntryChange.objects.get(entry_id=late.id)
+        # Its writer has not committed yet when a newer change is published.
+        late_change_id = late_change.id
+        late_change.delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self._entry("vakul", meaning="headgear")
+        self.assertEqual([row["label"] for row in self._suggest("va")], ["vahay", "vakul"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PublicEntryChange.objects.create(id=late_change_id, entry_id=late.id)
+            bump_public_content_version(PublicContentVersion.Scope.DICTIONARY)
+        self.assertEqual(
+            [row["label"] for row in self._suggest("va")], ["vahavahay", "vahay", "vakul"]
+        )
+
+    def test_unchanged_publish_sequence_only_costs_one_query(self):
+        self._entry("vahay", meaning="house")
+        self._suggest("va")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(len(self._suggest("va")), 1)
+
+    def test_invalid_limit_returns_400(self):
+        response = self.client.get("/api/dictionary/suggest", {"q": "va", "limit": "x"})
+        self.assertEqual(response.status_code, 400)
+
+
+class CheckTermApiTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="check_term_user", password="testpass123")
+        self.entry = Entry.objects.create(
+            term="Vahay",
+            status=EntryStatus.APPROVED,
+            is_mother=True,
+            initial_contributor=self.user,
+            last_revised_by=self.user,
+        )
+
+    def test_term_key_follows_term_changes(self):
+        self.assertEqual(self.entry.term_key, "vahay")
+
+        self.entry.term = "Vahay a Vatu"
+        self.entry.save(update_fields=["term"])
+
+        self.entry.refresh_from_db()
+        self.assertEqual(self.entry.term_key, "vahay a vatu")
+
+    def test_checks_headword_and_variants_in_one_query(self):
+        Entry.objects.create(
+            term="Bahay",
+            status=EntryStatus.ARCHIVED,
+            initial_contributor=self.user,
+        )
+        self.client.force_login(self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                "/api/dictionary/check-term", {"term": [" VAHAY", "bahay", "payaman"]}
+            )
+
+        entry_queries = [query for query in queries if "dictionary_entry" in query["sql"]]
+        self.assertEqual(len(entry_queries), 1)
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([row["exists"] for row in results], [True, False, False])
+        self.assertEqual(results[0]["matches"][0]["id"], str(self.entry.id))
+        self.assertEqual(results[0]["term"], "VAHAY")
+
+    def test_requires_authentication_and_a_term(self):
+        response = self.client.get("/api/dictionary/check-term", {"term": "vahay"})
+        self.assertEqual(response.status_code, 401)
+
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get("/api/dictionary/check-term").status_code, 400)
+        response = self.client.get(
+            "/api/dictionary/check-term", {"term": [f"term{index}" for index in range(21)]}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class EnglishLookupIndexTests(LiveEntryMixin, TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="lookup_user",
+            password="testpass123",
+        )
+
+    def _lookup(self, **params):
+        response = self.client.get("/api/dictionary/english-terms", params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_index_tracks_meaning_and_synonyms(self):
+        entry = self._entry("vahay", meaning="house", english_synonym="home, dwelling place")
+
+        self.assertEqual(
+            set(entry.english_lookup_terms.values_list("english_key", flat=True)),
+            {"house", "home", "dwelling place"},
+        )
+
+        entry.english_synonym = ""
+        entry.save()
+
+        self.assertEqual(
+            list(entry.english_lookup_terms.values_list("english_key", flat=True)),
+            ["house"],
+        )
+
+    def test_archive_removes_entry_from_lookup(self):
+        entry = self._entry("vahay", meaning="house")
+
+        entry.archive()
+
+        self.assertFalse(EnglishLookupTerm.objects.filter(entry=entry).exists())
+        self.assertEqual(self._lookup(q="house")["rows"], [])
+
+    def test_promote_to_mother_reindexes_variants(self):
+        mother = self._entry("vahay", meaning="house")
+        group = VariantGroup.objects.create(mother_entry=mother)
+        mother.variant_group = group
+        mother.save(update_fields=["variant_group"])
+        variant = self._entry("bahay", meaning="shelter", is_mother=False, variant_group=group)
+
+        promote_to_mother(entry=variant)
+
+        mother.refresh_from_db()
+        self.assertEqual(
+            set(mother.english_lookup_terms.values_list("english_key", flat=True)),
+            {"shelter"},
+        )
+
+    def test_lookup_paginates_by_english_key(self):
+        for term, meaning in (("a-term", "apple"), ("b-term", "banana"), ("c-term", "cherry")):
+            self._entry(term, meaning=meaning)
+
+        first_page = self._lookup(limit=2)
+        self.assertEqual([row["english_term"] for row in first_page["rows"]], ["apple", "banana"])
+        self.assertEqual(first_page["next_after"], "banana")
+
+        second_page = self._lookup(limit=2, after=first_page["next_after"])
+        self.assertEqual([row["english_term"] for row in second_page["rows"]], ["cherry"])
+        self.assertIsNone(second_page["next_after"])
+
+    def test_prefix_match_mode(self):
+        self._entry("a-term", meaning="rain")
+        self._entry("b-term", meaning="brain")
+
+        contains = self._lookup(q="rain")
+        prefix = self._lookup(q="rain", match="prefix")
+
+        self.assertEqual([row["english_term"] for row in contains["rows"]], ["brain", "rain"])
+        self.assertEqual([row["english_term"] for row in prefix["rows"]], ["rain"])
+
+    def test_audit_command_reports_and_fixes_drift(self):
+        entry = self._entry("vahay", meaning="house")
+        EnglishLookupTerm.objects.filter(entry=entry).delete()
+
+        with self.assertRaises(CommandError):
+            call_command("audit_english_lookup", stdout=StringIO())
+
+        output = StringIO()
+        call_command("audit_english_lookup", fix=True, stdout=output)
+
+        self.assertIn("Refreshed entries: 1", output.getvalue())
+        self.assertTrue(EnglishLookupTerm.objects.filter(entry=entry, english_key="house").exists())
+
+    def test_rebuild_command_restores_index(self):
+        self._entry("vahay", meaning="house")
+        EnglishLookupTerm.objects.all().delete()
+
+        call_command("rebuild_english_lookup", stdout=StringIO())
+
+        self.assertEqual(self._lookup(q="house")["rows"][0]["translations"][0]["term"], "vahay")
+
+
+class PublicEntryViewTests(LiveEntryMixin, TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="view_user", password="testpass123")
+
+    def _group(self, mother, *variants):
+        group = VariantGroup.objects.create(mother_entry=mother)
+        for entry in (mother, *variants):
+            entry.variant_group = group
+            entry.save(update_fields=["variant_group"])
+        return group
+
+    def test_only_saves_that_change_public_fields_log_a_change(self):
+        mother = self._entry("vahay", meaning="house")
+        variant = self._entry("bahay", meaning="", is_mother=False)
+        self._group(mother, variant)
+
+        def logged_ids(save):
+            PublicEntryChange.objects.all().delete()
+            save()
+            return sorted(PublicEntryChange.objects.values_list("entry_id", flat=True))
+
+        self.assertEqual(logged_ids(mother.save), [])
+        mother.first_approved_at = timezone.now()
+        self.assertEqual(logged_ids(mother.save), [])
+        mother.usage_notes = "Common."
+        self.assertEqual(logged_ids(mother.save), [mother.id])
+        mother.meaning = "dwelling"
+        self.assertEqual(logged_ids(mother.save), sorted([mother.id, variant.id]))
+        self.assertEqual(PublicEntryView.objects.get(entry=variant).meaning, "dwelling")
+
+    def test_variant_row_carries_mother_fields(self):
+        mother = self._entry("vahay", meaning="house", part_of_speech="noun")
+        variant = self._entry("bahay", meaning="", is_mother=False)
+        self._group(mother, variant)
+
+        row = PublicEntryView.objects.get(entry=variant)
+        self.assertEqual((row.meaning, row.part_of_speech), ("house", "noun"))
+
+        mother.meaning = "dwelling"
+        mother.save()
+        row.refresh_from_db()
+        self.assertEqual(row.meaning, "dwelling")
+
+    def test_promote_to_mother_refreshes_group_rows(self):
+        mother = self._entry("vahay", meaning="house")
+        variant = self._entry("bahay", meaning="shelter", is_mother=False)
+        self._group(mother, variant)
+
+        promote_to_mother(entry=variant)
+
+        self.assertEqual(PublicEntryView.objects.get(entry=mother).meaning, "shelter")
+        self.assertTrue(PublicEntryView.objects.get(entry=variant).is_mother)
+        self.assertFalse(PublicEntryView.objects.get(entry=mother).is_mother)
+
+    def test_archive_and_contributor_opt_out_drop_rows(self):
+        archived = self._entry("vahay")
+        kept = self._entry("kayvan")
+        archived.archive()
+        self.assertEqual(list(PublicEntryView.objects.values_list("term", flat=True)), ["kayvan"])
+
+        profile = UserProfile.objects.create(user=self.user, show_live_contributions=False)
+        self.assertFalse(PublicEntryView.objects.exists())
+
+        profile.show_live_contributions = True
+        profile.save()
+        self.assertEqual(
+            list(PublicEntryView.objects.values_list("entry_id", flat=True)), [kept.id]
+        )
+
+    def test_listing_reads_only_the_read_model(self):
+        mother = self._entry("vahay", meaning="house")
+        variant = self._entry("bahay", meaning="", is_mother=False)
+        self._group(mother, variant)
+        get_site_settings()
+
+        with self.assertNumQueries(3):
+            # Version lookup, one page read, cached counters.
+            response = self.client.get("/api/dictionary/entries", {"sort": "alpha"})
+
+        rows = response.json()["rows"]
+        self.assertEqual([row["term"] for row in rows], ["bahay", "vahay"])
+        self.assertEqual(rows[0]["meaning"], "house")
+
+    def test_rebuild_command_restores_rows(self):
+        self._entry("vahay", meaning="house")
+        PublicEntryView.objects.all().delete()
+
+        output = StringIO()
+        call_command("rebuild_public_entry_view", stdout=output)
+
+        self.assertIn("rows=1", output.getvalue())
+        self.assertEqual(PublicEntryView.objects.get().meaning, "house")
+
+
+@override_settings(PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS=0)
+class DictionaryExportTests(LiveEntryMixin, TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="export_user", password="testpass123")
+        self.mother = self._entry("vahay", meaning="house", english_synonym="home")
+        self.variant = self._entry("vale", is_mother=False, example_sentence="Vale.")
+        group = VariantGroup.objects.create(mother_entry=self.mother)
+        for entry in (self.mother, self.variant):
+            entry.variant_group = group
+            entry.save(update_fields=["variant_group"])
+
+    def _export(self, **params):
+        response = self.client.get("/api/dictionary/export", params)
+        self.assertEqual(response.status_code, 200)
+        return response, b"".join(response.streaming_content).decode("utf-8")
+
+    def test_ndjson_streams_every_entry_with_resolved_semantics(self):
+        response, body = self._export()
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson; charset=utf-8")
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row["term"] for row in rows], ["vahay", "vale"])
+        self.assertEqual(rows[1]["meaning"], "house")
+        self.assertEqual(rows[1]["english_synonym"], "home")
+        self.assertEqual(rows[1]["example_sentence"], "Vale.")
+        self.assertEqual(rows[1]["mother_entry_id"], str(self.mother.id))
+
+    def test_csv_has_header_and_one_line_per_entry(self):
+        response, body = self._export(format="csv")
+
+        lines = body.splitlines()
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertTrue(lines[0].startswith("entry_id,term,is_mother"))
+        self.assertEqual(len(lines), 3)
+
+    def _rows(self, body):
+        return sorted(
+            (json.loads(line) for line in body.splitlines()), key=lambda row: row["entry_id"]
+        )
+
+    def test_since_returns_changes_and_tombstones_after_the_cursor(self):
+        response, _ = self._export()
+        cursor = response["X-Export-Cursor"]
+        self.assertEqual(
+            int(cursor), PublicEntryChange.objects.order_by("-id").values_list("id", flat=True)[0]
+        )
+
+        self.mother.meaning = "home"
+        self.mother.save()
+        rakuh = self._entry("rakuh", meaning="big")
+        rakuh.archive()
+
+        response, body = self._export(since=cursor)
+        rows = {row["entry_id"]: row for row in self._rows(body)}
+        # A mother edit brings its variants along; they export her meaning.
+        self.assertEqual(rows[str(self.variant.id)]["meaning"], "home")
+        self.assertEqual(rows[str(self.mother.id)]["deleted"], False)
+        self.assertEqual(rows[str(rakuh.id)]["deleted"], True)
+        self.assertIsNone(rows[str(rakuh.id)]["term"])
+        self.assertEqual(len(rows), 3)
+
+        _, body = self._export(since=response["X-Export-Cursor"])
+        self.assertEqual(body, "")
+
+    @override_settings(PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS=300)
+    def test_since_keeps_unsettled_changes_past_the_cursor(self):
+        PublicEntryChange.objects.update(changed_at=timezone.now() - timedelta(minutes=10))
+        cursor = self._export()[0]["X-Export-Cursor"]
+        added = self._entry("among", meaning="fish")
+
+        # Its writer may have committed after a newer row; the cursor stays put.
+        response, body = self._export(since=cursor)
+        self.assertEqual([row["term"] for row in self._rows(body)], ["among"])
+        self.assertEqual(response["X-Export-Cursor"], cursor)
+
+        PublicEntryChange.objects.filter(entry_id=added.id).update(
+            changed_at=timezone.now() - timedelta(minutes=10)
+        )
+        self.assertNotEqual(self._export(since=cursor)[0]["X-Export-Cursor"], cursor)
+
+    def test_pruned_cursor_asks_for_a_full_export(self):
+        cursor = self._export()[0]["X-Export-Cursor"]
+        self._entry("among", meaning="fish")
+        PublicEntryChange.objects.filter(id=cursor).delete()
+
+        response = self.client.get("/api/dictionary/export", {"since": cursor})
+        self.assertEqual(response.status_code, 410)
+
+    def test_query_count_does_not_grow_with_size(self):
+        for index in range(20):
+            self._entry(f"term{index}")
+
+        with self.assertNumQueries(3):
+            # Version lookup, change-log cursor, one streamed SELECT.
+            _, body = self._export()
+
+        self.assertEqual(len(body.splitlines()), 22)
+
+    def test_invalid_parameters_are_rejected(self):
+        self.assertEqual(self.client.get("/api/dictionary/export?format=xml").status_code, 400)
+        self.assertEqual(self.client.get("/api/dictionary/export?since=soon").status_code, 400)
+        self.assertEqual(self.client.get("/api/dictionary/export?since=0").status_code, 400)
+
+
+class DictionaryListPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="page_user",
+            password="testpass123",
+        )
+
+    def _entry(self, term, *, approved_days_ago=None):
+        return Entry.objects.create(
+            term=term,
+            status=EntryStatus.APPROVED,
+            initial_contributor=self.user,
+            last_revised_by=self.user,
+            last_approved_at=(
+                timezone.now() - timedelta(days=approved_days_ago)
+                if approved_days_ago is not None
+                else None
+            ),
+        )
+
+    def _walk(self, **params):
+        seen = []
+        cursor = ""
+        while True:
+            query = {**params, "limit": 2}
+            if cursor:
+                query["cursor"] = cursor
+            payload = self.client.get("/api/dictionary/entries", query).json()
+            seen.extend(row["term"] for row in payload["rows"])
+            cursor = payload["next_cursor"]
+            if not cursor:
+                return seen
+
+    def test_recent_pages_cover_every_row_once_including_unapproved_timestamps(self):
+        for index, term in enumerate(["Anuy", "Vahay", "Rakuh", "Tukon"]):
+            self._entry(term, approved_days_ago=index)
+        self._entry("Payaman")
+        self._entry("Kavavata")
+
+        terms = self._walk(sort="recent")
+
+        self.assertEqual(terms[:4], ["Anuy", "Vahay", "Rakuh", "Tukon"])
+        self.assertEqual(sorted(terms[4:]), ["Kavavata", "Payaman"])
+
+    def test_alpha_cursor_is_stable_when_entries_publish_between_pages(self):
+        for term in ["Anuy", "Kavavata", "Payaman", "Vahay"]:
+            self._entry(term, approved_days_ago=1)
+
+        first_page = self.client.get("/api/dictionary/entries?sort=alpha&limit=2").json()
+        self._entry("Aaron", approved_days_ago=0)
+        second_page = self.client.get(
+            "/api/dictionary/entries",
+            {"sort": "alpha", "limit": 2, "cursor": first_page["next_cursor"]},
+        ).json()
+
+        self.assertEqual([row["term"] for row in first_page["rows"]], ["Anuy", "Kavavata"])
+        self.assertEqual([row["term"] for row in second_page["rows"]], ["Payaman", "Vahay"])
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.client.get("/api/dictionary/entries?cursor=not-a-cursor")
+
+        self.assertEqual(response.status_code, 400)
+
+
+class ExplainHotQueriesCommandTests(TestCase):
+    def test_sqlite_plan_parser_flags_only_full_table_scans(self):
+        from dictionary.management.commands.explain_hot_queries import find_sequential_scans
+
+        plan = "\n".join(
+            [
+                "4 0 0 SCAN dictionary_entry",
+                "7 0 0 SCAN reviews_review USING INDEX review_reviewer_created_idx",
+                "9 0 0 SEARCH dictionary_entryrevision USING INDEX dict_rev_history_idx (entry_id=?)",
+                "11 0 0 SCAN CONSTANT ROW",
+                "13 0 0 CO-ROUTINE qualify",
+                "15 13 0 SCAN qualify",
+            ]
+        )
+
+        self.assertEqual(find_sequential_scans(plan), ["dictionary_entry"])
+
+    def test_hot_queries_cover_the_revision_history_window_query(self):
+        from dictionary.management.commands.explain_hot_queries import _hot_queries
+
+        user = User.objects.create_user(username="explain_reader", password="testpass123")
+        entry = Entry.objects.create(term="vahay", initial_contributor=user)
+        queries = _hot_queries(
+            entry=entry,
+            folklore_entry=None,
+            revision=None,
+            folklore_revision=None,
+            user=user,
+        )
+
+        self.assertEqual(
+            str(queries["revision_history"].query),
+            str(detail_revision_slices_queryset(entry=entry, audience="staff").query),
+        )
+
+    def test_command_explains_seeded_queries_without_seq_scans_and_rolls_back(self):
+        output = StringIO()
+
+        call_command("explain_hot_queries", rows=800, stdout=output)
+
+        self.assertIn("no seq scans", output.getvalue())
+        self.assertEqual(Entry.objects.count(), 0)
+        self.assertFalse(User.objects.filter(username__startswith="explain_user_").exists())
+
+
+class WordlistImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="importer", password="testpass123")
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def _write(self, name, content):
+        path = self.directory / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def _jsonl(self, records):
+        return self._write("words.jsonl", "\n".join(json.dumps(record) for record in records))
+
+    def test_csv_groups_variants_under_general_ivatan_mother(self):
+        path = self._write(
+            "words.csv",
+            "group,term,meaning,variant_type,example_sentence,example_translation\n"
+            "house,VALE,,Itbayat,,\n"
+            "house,vahay,a house,General Ivatan,ipaanmo vahay,go home\n"
+            ",kayvan,friend,,,\n"
+            "child,anak,child,,,\n"
+            "child,ANAK,child,,,\n",
+        )
+
+        result = import_wordlist(path, contributor=self.user, source_text="Old list")
+
+        self.assertEqual((result["created"], result["error_count"]), (3, 1))
+        self.assertIn("repeated in its group", result["errors"][0][1])
+
+        mother = Entry.objects.get(term="Vahay")
+        self.assertTrue(mother.is_mother)
+        self.assertEqual(mother.meaning, "A house")
+        self.assertEqual(mother.example_sentence, "Ipaanmo vahay.")
+        self.assertEqual(mother.variant_group.mother_entry_id, mother.id)
+        self.assertEqual(mother.source_text, "Old list")
+        self.assertTrue(mother.revisions.get().is_base_snapshot)
+        self.assertEqual(PublicEntryView.objects.get(entry=mother).meaning, "A house")
+        self.assertEqual(
+            ContributionEvent.objects.filter(user=self.user).count(),
+            2,  # one per mother term
+        )
+        self.assertEqual(
+            PublicStatusCounter.objects.get(scope="dictionary", status="approved").count, 3
+        )
+        self.assertEqual(self.user.contribution_stats.dictionary_original_total, 2)
+
+    def test_imported_entries_carry_first_approval_time(self):
+        path = self._jsonl(
+            [
+                {"group": "g", "term": "vahay", "meaning": "house", "source_text": "List"},
+                {"group": "g", "term": "vale", "variant_type": "Itbayat"},
+            ]
+        )
+
+        import_wordlist(path, contributor=self.user)
+
+        # Mother fallback orders by it; NULLs would sort differently per database.
+        entries = Entry.objects.filter(term__in=["Vahay", "Vale"])
+        self.assertEqual(entries.filter(first_approved_at__isnull=True).count(), 0)
+        self.assertEqual(
+            {entry.first_approved_at for entry in entries},
+            {entry.last_approved_at for entry in entries},
+        )
+
+    def test_variant_inherits_mother_semantics(self):
+        path = self._jsonl(
+            [
+                {"group": "g", "term": "vahay", "meaning": "house", "source_text": "List"},
+                {"group": "g", "term": "vale", "meaning": "ignored", "variant_type": "Itbayat"},
+            ]
+        )
+
+        import_wordlist(path, contributor=self.user)
+
+        variant = Entry.objects.get(term="Vale")
+        self.assertFalse(variant.is_mother)
+        self.assertEqual(variant.meaning, "House")
+        self.assertEqual(variant.search_document.meaning, "House")
+
+    def test_invalid_and_existing_records_are_skipped(self):
+        Entry.objects.create(
+            term="Vahay",
+            meaning="house",
+            status=EntryStatus.APPROVED,
+            initial_contributor=self.user,
+        )
+        path = self._jsonl(
+            [
+                {"term": "vahay", "meaning": "house", "source_text": "List"},
+                {"term": "", "meaning": "nothing", "source_text": "List"},
+                {"term": "anak", "meaning": "child"},
+                {"term": "among", "meaning": "fish", "example_sentence": "Among."},
+                {"term": "kayvan", "meaning": "friend", "term_source_is_self_knowledge": True},
+            ]
+        )
+
+        result = import_wordlist(path, contributor=self.user)
+
+        self.assertEqual(result["created"], 1)
+        self.assertEqual(
+            [number for number, _ in result["errors"]],
+            [1, 2, 3, 4],
+        )
+        self.assertTrue(Entry.objects.filter(term="Kayvan").exists())
+
+    def test_interrupted_import_resumes_from_checkpoint(self):
+        path = self._jsonl(
+            [
+                {"term": f"term{index}", "meaning": "meaning", "source_text": "List"}
+                for index in range(5)
+            ]
+        )
+        from dictionary import importer
+
+        calls = []
+        real_write_batch = importer._write_batch
+
+        def failing_write_batch(groups, **kwargs):
+            calls.append(len(groups))
+            if len(calls) == 3:
+                raise RuntimeError("disk full")
+            return real_write_batch(groups, **kwargs)
+
+        with patch.object(importer, "_write_batch", side_effect=failing_write_batch):
+            with self.assertRaises(RuntimeError):
+                import_wordlist(path, contributor=self.user, batch_size=2)
+
+        self.assertEqual(Entry.objects.count(), 4)
+        self.assertEqual(WordlistImportCheckpoint.objects.get().records_done, 4)
+
+        result = import_wordlist(path, contributor=self.user, batch_size=2)
+
+        self.assertEqual((result["resumed_from"], result["created"]), (4, 1))
+        self.assertEqual(Entry.objects.count(), 5)
+
+    def test_resumed_run_with_nothing_left_still_rebuilds_counters(self):
+        path = self._jsonl([{"term": "vahay", "meaning": "house", "source_text": "List"}])
+        from dictionary import importer
+
+        with patch.object(
+            importer, "rebuild_public_status_counters", side_effect=RuntimeError("killed")
+        ):
+            with self.assertRaises(RuntimeError):
+                import_wordlist(path, contributor=self.user)
+
+        result = import_wordlist(path, contributor=self.user)
+
+        self.assertEqual(result["created"], 0)
+        self.assertEqual(
+            PublicStatusCounter.objects.get(scope="dictionary", status="approved").count, 1
+        )
+        self.assertEqual(self.user.contribution_stats.dictionary_original_total, 1)
+
+    def test_command_reports_summary(self):
+        path = self._write("words.csv", "term,meaning\nvahay,house\n")
+        output = StringIO()
+
+        call_command(
+            "import_dictionary_wordlist",
+            str(path),
+            contributor="importer",
+            source_text="List",
+            stdout=output,
+        )
+
+        self.assertIn("created=1", output.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("import_dictionary_wordlist", str(path), contributor="nobody")
+
+
+@override_settings(PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS=0)
+class DictionaryBundleTests(LiveEntryMixin, TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.user = User.objects.create_user(username="bundle_user", password="testpass123")
+        self.vahay = self._entry("vahay", meaning="house")
+        self.rakuh = self._entry("rakuh", meaning="big")
+
+    def _read(self, file_field):
+        with file_field.open("rb") as handle:
+            payload = json.loads(gzip.decompress(handle.read()))
+        return payload, [
+            dict(zip(payload["fields"], row, strict=True)) for row in payload["entries"]
+        ]
+
+    def test_first_build_contains_every_public_entry(self):
+        bundle = build_dictionary_bundle()
+
+        payload, rows = self._read(bundle.bundle_file)
+        self.assertEqual(payload["version"], 1)
+        self.assertEqual(bundle.entry_count, 2)
+        self.assertEqual([row["term"] for row in rows], ["rakuh", "vahay"])
+        self.assertEqual(rows[1]["meaning"], "house")
+        self.assertFalse(bundle.patch_file)
+
+    def test_next_build_patches_only_changed_and_removed_entries(self):
+        build_dictionary_bundle()
+        self.vahay.meaning = "home"
+        self.vahay.save()
+        self.rakuh.status = EntryStatus.ARCHIVED
+        self.rakuh.save()
+        added = self._entry("among", meaning="fish")
+
+        bundle = build_dictionary_bundle()
+
+        payload, rows = self._read(bundle.patch_file)
+        self.assertEqual((payload["from_version"], payload["version"]), (1, 2))
+        self.assertEqual(payload["deletes"], [str(self.rakuh.id)])
+        self.assertEqual(
+            {row["entry_id"]: row["meaning"] for row in rows},
+            {str(self.vahay.id): "home", str(added.id): "fish"},
+        )
+        self.assertEqual(bundle.entry_count, 2)
+
+    def test_no_changes_builds_nothing_unless_forced(self):
+        first = build_dictionary_bundle()
+
+        self.assertIsNone(build_dictionary_bundle())
+        forced = build_dictionary_bundle(force=True)
+        self.assertEqual(forced.version, 2)
+        self.assertEqual(self._read(forced.patch_file)[1], [])
+        first.refresh_from_db()
+        self.assertFalse(first.bundle_file)
+
+    @override_settings(PUBLIC_ENTRY_CHANGE_SETTLE_SECONDS=300)
+    def test_unsettled_changes_wait_for_a_later_patch(self):
+        PublicEntryChange.objects.update(changed_at=timezone.now() - timedelta(minutes=10))
+        build_dictionary_bundle()
+        added = self._entry("among", meaning="fish")
+
+        # Its log row may still have a lower-id sibling in an open transaction.
+        self.assertIsNone(build_dictionary_bundle())
+        self.assertTrue(PublicEntryChange.objects.filter(entry_id=added.id).exists())
+
+        PublicEntryChange.objects.filter(entry_id=added.id).update(
+            changed_at=timezone.now() - timedelta(minutes=10)
+        )
+        bundle = build_dictionary_bundle()
+        self.assertEqual([row["term"] for row in self._read(bundle.patch_file)[1]], ["among"])
+
+    def test_lifecycle_maintenance_prunes_the_change_log_behind_the_bundle(self):
+        old = timezone.now() - timedelta(days=40)
+        PublicEntryChange.objects.update(changed_at=old)
+        # Nothing was built yet: only the retention window applies.
+        call_command("run_lifecycle_maintenance", stdout=StringIO())
+        self.assertEqual(PublicEntryChange.objects.count(), 1)
+
+        build_dictionary_bundle()
+        self.vahay.meaning = "home"
+        self.vahay.save()
+        PublicEntryChange.objects.update(changed_at=old)
+        # Older than the window, but no patch has carried the new row yet.
+        call_command("run_lifecycle_maintenance", stdout=StringIO())
+        self.assertEqual(PublicEntryChange.objects.count(), 2)
+
+        build_dictionary_bundle()
+        output = StringIO()
+        call_command("run_lifecycle_maintenance", stdout=output)
+        self.assertIn("public_changes_pruned=1", output.getvalue())
+        self.assertEqual(
+            list(PublicEntryChange.objects.values_list("entry_id", flat=True)), [self.vahay.id]
+        )
+
+    def test_manifest_lists_the_patch_chain(self):
+        self.assertEqual(self.client.get("/api/dictionary/bundle").status_code, 404)
+        build_dictionary_bundle()
+        self.vahay.meaning = "home"
+        self.vahay.save()
+        build_dictionary_bundle()
+
+        manifest = self.client.get("/api/dictionary/bundle", {"since_version": 1}).json()
+        self.assertEqual(manifest["version"], 2)
+        self.assertTrue(manifest["bundle_url"].endswith("dictionary-v2.json.gz"))
+        self.assertEqual(
+            [(patch["from_version"], patch["to_version"]) for patch in manifest["patches"]],
+            [(1, 2)],
+        )
+        # Version 0 predates the first bundle, so only the full download works.
+        full = self.client.get("/api/dictionary/bundle", {"since_version": 0}).json()
+        self.assertIsNone(full["patches"])
+        self.assertEqual(
+            self.client.get("/api/dictionary/bundle", {"since_version": "x"}).status_code, 400
+        )
+
+    def test_command_reports_the_built_version(self):
+        output = StringIO()
+        call_command("build_dictionary_bundle", stdout=output)
+        call_command("build_dictionary_bundle", stdout=output)
+
+        self.assertIn("v1 built: entries=2", output.getvalue())
+        self.assertIn("up to date", output.getvalue())
+
+
+class RelatedTermLinkTests(LiveEntryMixin, TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="link_user", password="testpass123")
+
+    def _targets(self, entry):
+        return list(
+            RelatedTermLink.objects.filter(source_entry=entry)
+            .order_by("position")
+            .values_list("relation", "label", "target_entry_id")
+        )
+
+    def test_links_follow_the_relation_fields(self):
+        vahay = self._entry("Vahay")
+        entry = self._entry("Rahin", ivatan_synonym="vahay; Tukon", english_antonym="small")
+
+        self.assertEqual(
+            self._targets(entry),
+            [
+                ("ivatan_synonym", "vahay", vahay.id),
+                ("ivatan_synonym", "Tukon", None),
+                ("english_antonym", "small", None),
+            ],
+        )
+
+        entry.ivatan_synonym = ""
+        entry.save()
+        self.assertEqual(self._targets(entry), [("english_antonym", "small", None)])
+
+    def test_links_resolve_when_a_headword_is_published_or_archived(self):
+        entry = self._entry("Rahin", ivatan_synonym="tukon")
+        pending = self._entry("Tukon", status=EntryStatus.PENDING)
+        self.assertEqual(self._targets(entry)[0][2], None)
+
+        pending.status = EntryStatus.APPROVED
+        pending.save()
+        self.assertEqual(self._targets(entry)[0][2], pending.id)
+
+        pending.term = "Tukun"
+        pending.save()
+        self.assertEqual(self._targets(entry)[0][2], None)
+
+        fallback = self._entry("Tukon")
+        self.assertEqual(self._targets(entry)[0][2], fallback.id)
+        fallback.status = EntryStatus.ARCHIVED
+        fallback.save()
+        self.assertEqual(self._targets(entry)[0][2], None)
+
+    def test_variant_detail_reads_the_mother_links(self):
+        vahay = self._entry("Vahay")
+        mother = self._entry("Rahin", ivatan_synonym="vahay")
+        variant = self._entry("Rahen", is_mother=False, ivatan_synonym="ignored")
+        group = VariantGroup.objects.create(mother_entry=mother)
+        for entry in (mother, variant):
+            entry.variant_group = group
+            entry.save(update_fields=["variant_group"])
+
+        self.assertFalse(RelatedTermLink.objects.filter(source_entry=variant).exists())
+        response = self.client.get(f"/api/dictionary/entries/{variant.id}")
+        self.assertEqual(
+            response.json()["semantic_core"]["related_terms"]["ivatan_synonym"],
+            [{"label": "vahay", "entry_id": str(vahay.id), "term": "Vahay"}],
+        )
+
+    def test_rebuild_command_restores_links(self):
+        vahay = self._entry("Vahay")
+        entry = self._entry("Rahin", ivatan_synonym="vahay")
+        RelatedTermLink.objects.all().delete()
+
+        output = StringIO()
+        call_command("rebuild_related_term_links", stdout=output)
+
+        self.assertIn("links=1", output.getvalue())
+        self.assertEqual(self._targets(entry), [("ivatan_synonym", "vahay", vahay.id)])
+
+
+class RevisionRetentionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="retention_user", password="testpass123")
+        self.entry = Entry.objects.create(
+            term="vahay",
+            status=EntryStatus.APPROVED,
+            initial_contributor=self.user,
+            last_revised_by=self.user,
+        )
+        self.base_time = timezone.now() - timedelta(days=30)
+        self.base = self._approved(0, is_base_snapshot=True)
+
+    def _approved(self, minutes, **overrides):
+        return EntryRevision.objects.create(
+            entry=self.entry,
+            contributor=self.user,
+            proposed_data={"term": "vahay"},
+            status=EntryRevision.Status.APPROVED,
+            approved_at=self.base_time + timedelta(minutes=minutes),
+            **overrides,
+        )
+
+    def _history(self, count):
+        return [self._approved(minute) for minute in range(1, count + 1)]
+
+    def test_approval_below_the_limit_only_probes(self):
+        latest = self._history(5)[-1]
+
+        # Savepoint pair, base snapshot check and one LIMIT 1 probe past the limit.
+        with self.assertNumQueries(4):
+            finalize_approved_revision(revision=latest)
+
+        self.assertEqual(self.entry.revisions.count(), 6)
+
+    def test_crossing_the_limit_drops_the_oldest_revision(self):
+        history = self._history(21)
+
+        finalize_approved_revision(revision=history[-1])
+
+        remaining = set(self.entry.revisions.values_list("id", flat=True))
+        self.assertEqual(len(remaining), 21)
+        self.assertIn(self.base.id, remaining)
+        self.assertNotIn(history[0].id, remaining)
+
+    @override_settings(REVISION_RETENTION_INLINE=False)
+    def test_sweeper_enforces_the_limit_when_inline_is_off(self):
+        history = self._history(23)
+        other = Entry.objects.create(
+            term="rakuh",
+            status=EntryStatus.APPROVED,
+            initial_contributor=self.user,
+        )
+        EntryRevision.objects.create(
+            entry=other,
+            contributor=self.user,
+            proposed_data={"term": "rakuh"},
+            status=EntryRevision.Status.APPROVED,
+            approved_at=self.base_time,
+        )
+
+        finalize_approved_revision(revision=history[-1])
+        self.assertEqual(self.entry.revisions.count(), 24)
+
+        output = StringIO()
+        call_command("sweep_revision_retention", "--batch-size", "2", stdout=output)
+
+        self.assertIn("dictionary_deleted=3", output.getvalue())
+        remaining = set(self.entry.revisions.values_list("id", flat=True))
+        self.assertEqual(remaining, {self.base.id, *(revision.id for revision in history[3:])})
+        self.assertEqual(other.revisions.count(), 1)
+
+
+class RevisionStorageTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="storage_user", password="testpass123")
+        self.entry = Entry.objects.create(
+            term="vahay",
+            status=EntryStatus.APPROVED,
+            initial_contributor=self.user,
+            last_revised_by=self.user,
+        )
+        self.snapshot = {
+            "term": "vahay",
+            "meaning": "house; dwelling. " * 20,
+            "part_of_speech": "noun",
+            "usage_notes": "",
+        }
+        self.base = EntryRevision.objects.create(
+            entry=self.entry,
+            contributor=self.user,
+            proposed_data=self.snapshot,
+            status=EntryRevision.Status.APPROVED,
+            approved_at=timezone.now() - timedelta(days=1),
+            is_base_snapshot=True,
+        )
+
+    def _stored(self, revision):
+        return EntryRevision._base_manager.filter(id=revision.id).values_list(
+            "keyframe_id", "proposed_data"
+        )[0]
+
+    def _edit(self, **changes):
+        return EntryRevision.objects.create(
+            entry=self.entry,
+            contributor=self.user,
+            proposed_data={**self.snapshot, **changes},
+            status=EntryRevision.Status.PENDING,
+        )
+
+    def test_base_snapshot_is_stored_in_full(self):
+        self.assertEqual(self._stored(self.base), (None, self.snapshot))
+
+    def test_small_edit_is_stored_as_a_delta_and_read_back_in_full(self):
+        revision = self._edit(usage_notes="Common.")
+
+        self.assertEqual(
+            self._stored(revision), (self.base.id, {"set": {"usage_notes": "Common."}})
+        )
+        expected = {**self.snapshot, "usage_notes": "Common."}
+        self.assertEqual(revision.proposed_data, expected)
+        self.assertEqual(EntryRevision.objects.get(id=revision.id).proposed_data, expected)
+
+    def test_long_text_edit_is_patched_by_compaction_not_by_save(self):
+        meaning = self.snapshot["meaning"].replace("dwelling", "home", 1)
+        revision = self._edit(meaning=meaning, usage_notes="Common.")
+        self.assertIsNone(self._stored(revision)[0])
+
+        compact_revisions(EntryRevision, since=timezone.now() - timedelta(days=1))
+
+        keyframe_id, stored = self._stored(revision)
+        self.assertEqual(keyframe_id, self.base.id)
+        self.assertEqual(stored["set"], {"usage_notes": "Common."})
+        self.assertIn("meaning", stored["patch"])
+        self.assertLess(len(json.dumps(stored)), len(json.dumps(self.snapshot)) / 2)
+
+        expected = {**self.snapshot, "meaning": meaning, "usage_notes": "Common."}
+        self.assertEqual(revision.proposed_data, expected)
+        self.assertEqual(EntryRevision.objects.get(id=revision.id).proposed_data, expected)
+
+    def test_listing_rebuilds_deltas_with_one_keyframe_query(self):
+        for index in range(3):
+            self._edit(usage_notes=f"note {index}")
+
+        with self.assertNumQueries(2):
+            revisions = list(self.entry.revisions.order_by("created_at"))
+            self.assertEqual(revisions[0].proposed_data, self.snapshot)
+            self.assertEqual(revisions[-1].proposed_data["meaning"], self.snapshot["meaning"])
+            self.assertEqual(revisions[-1].proposed_data["usage_notes"], "note 2")
+            self.assertEqual(revisions[1].proposed_data["usage_notes"], "note 0")
+
+    def test_select_related_loads_rebuild_only_when_read(self):
+        reviewer = User.objects.create_user(username="storage_reviewer", password="testpass123")
+        for index in range(10):
+            Review.objects.create(
+                revision=self._edit(usage_notes=f"note {index}"),
+                reviewer=reviewer,
+                decision=Review.Decision.APPROVE,
+            )
+
+        with self.assertNumQueries(1):
+            reviews = list(Review.objects.select_related("revision").order_by("created_at"))
+            self.assertTrue(all(review.revision.keyframe_id for review in reviews))
+
+        with self.assertNumQueries(1):
+            notes = [review.revision.proposed_data["usage_notes"] for review in reviews]
+        self.assertEqual(notes, [f"note {index}" for index in range(10)])
+
+    def test_deferred_and_refreshed_loads_return_the_full_snapshot(self):
+        revision = self._edit(usage_notes="Common.")
+        expected = {**self.snapshot, "usage_notes": "Common."}
+
+        deferred = EntryRevision.objects.defer("proposed_data").get(id=revision.id)
+        self.assertEqual(deferred.proposed_data, expected)
+
+        only_data = EntryRevision.objects.only("proposed_data").get(id=revision.id)
+        self.assertEqual(only_data.proposed_data, expected)
+
+        loaded = EntryRevision.objects.get(id=revision.id)
+        loaded.proposed_data = {}
+        loaded.refresh_from_db(fields=["proposed_data"])
+        self.assertEqual(loaded.proposed_data, expected)
+        loaded.refresh_from_db()
+        self.assertEqual(loaded.proposed_data, expected)
+
+    def test_rewrite_that_changes_most_fields_becomes_a_keyframe(self):
+        revision = self._edit(meaning="rewritten " * 40, part_of_speech="verb")
+
+        self.assertEqual(self._stored(revision)[0], None)
+
+    def test_deleting_a_keyframe_keeps_its_deltas_readable(self):
+        keyframe = EntryRevision.objects.create(
+            entry=self.entry,
+            contributor=self.user,
+            proposed_data={**self.snapshot, "meaning": "shelter " * 40},
+            status=EntryRevision.Status.APPROVED,
+            approved_at=timezone.now(),
+        )
+        self.assertIsNone(self._stored(keyframe)[0])
+        revision = self._edit(meaning="shelter " * 40, usage_notes="Draft.")
+        self.assertEqual(self._stored(revision)[0], keyframe.id)
+
+        keyframe.delete()
+
+        keyframe_id, stored = self._stored(revision)
+        self.assertIsNone(keyframe_id)
+        self.assertEqual(stored["usage_notes"], "Draft.")
+        self.assertEqual(
+            EntryRevision.objects.get(id=revision.id).proposed_data["meaning"], "shelter " * 40
+        )
+
+    def test_only_changed_keyframes_rewrite_their_dependents(self):
+        revision = self._edit(usage_notes="Draft.")
+        delta = EntryRevision.objects.get(id=revision.id)
+        delta.status = EntryRevision.Status.APPROVED
+        with CaptureQueriesContext(connection) as queries:
+            delta.save()
+        # A delta has no dependents to look up.
+        # A delta has no dependents to look up.
+        lookups = [query["sql"] for query in queries if query["sql"].startswith("SELECT")]
+        self.assertFalse(any('"keyframe_id" = ' in sql for sql in lookups))
+
+        base = EntryRevision.objects.get(id=self.base.id)
+        base.save()
+        self.assertEqual(self._stored(revision)[0], self.base.id)
+
+        base.proposed_data = {**self.snapshot, "part_of_speech": "verb"}
+        base.save()
+        keyframe_id, stored = self._stored(revision)
+        self.assertIsNone(keyframe_id)
+        self.assertEqual(stored, {**self.snapshot, "usage_notes": "Draft."})
+
+    def test_compact_command_converts_full_rows_and_reports_savings(self):
+        revision = self._edit(usage_notes="Common.")
+        EntryRevision._base_manager.filter(id=revision.id).update(
+            keyframe=None, proposed_data={**self.snapshot, "usage_notes": "Common."}
+        )
+
+        output = StringIO()
+        call_command("compact_revision_storage", "--dry-run", stdout=output)
+        self.assertIn("dictionary: revisions=2, keyframes=1", output.getvalue())
+        self.assertIsNone(self._stored(revision)[0])
+
+        output = StringIO()
+        call_command("compact_revision_storage", stdout=output)
+
+        self.assertIn("bytes_saved=", output.getvalue())
+        self.assertEqual(self._stored(revision)[0], self.base.id)
+        self.assertEqual(
+            EntryRevision.objects.get(id=revision.id).proposed_data,
+            {**self.snapshot, "usage_notes": "Common."},
+        )
@@ -12,6 +12,11 @@ def normalize_headword(value):
     return f"{text[0].upper()}{text[1:].lower()}"
 
 
+def headword_key(value):
+    # Case-insensitive identity of a headword, stored as Entry.term_key.
+    return normalize_headword(value).lower()
+
+
 def _is_all_caps_sentence(text):
     letters = [character for character in text if character.isalpha()]
     return bool(letters) and all(character.isupper() for character in letters)
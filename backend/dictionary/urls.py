@@ -10,9 +10,13 @@ from django.urls import path
 from dictionary.views import (
     create_dictionary_revision_view,
     delete_dictionary_revision_view,
+    dictionary_bundle_view,
+    dictionary_check_term_view,
     dictionary_english_terms_view,
     dictionary_entries_list_view,
     dictionary_entry_detail_view,
+    dictionary_export_view,
+    dictionary_suggest_view,
     my_dictionary_revisions_view,
     start_dictionary_entry_revision_view,
     submit_dictionary_revision_view,
@@ -25,6 +29,26 @@ urlpatterns = [
         dictionary_entries_list_view,
         name="dictionary_entries_list",
     ),
+    path(
+        "api/dictionary/export",
+        dictionary_export_view,
+        name="dictionary_export",
+    ),
+    path(
+        "api/dictionary/bundle",
+        dictionary_bundle_view,
+        name="dictionary_bundle",
+    ),
+    path(
+        "api/dictionary/check-term",
+        dictionary_check_term_view,
+        name="dictionary_check_term",
+    ),
+    path(
+        "api/dictionary/suggest",
+        dictionary_suggest_view,
+        name="dictionary_suggest",
+    ),
     path(
         "api/dictionary/english-terms",
         dictionary_english_terms_view,
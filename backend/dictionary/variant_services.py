@@ -1,8 +1,14 @@
 from django.db import transaction
-from django.db.models import Min, Q
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 
 from dictionary.field_groups import MEDIA_FIELDS, SEMANTIC_CORE_FIELDS
-from dictionary.models import Entry, EntryRevision, EntryStatus, VariantGroup
+from dictionary.models import (
+    Entry,
+    EntryStatus,
+    VariantGroup,
+    first_revision_approvals,
+)
 
 # Variant-group service:
 # - Maintains mother term selection and deterministic fallback.
@@ -32,9 +38,26 @@ def _set_group_mother_flags(*, group: VariantGroup, mother_entry: Entry | None):
     Keep `Entry.is_mother` in sync with `VariantGroup.mother_entry`.
     """
 
-    group.entries.update(is_mother=False)
+    # Local imports: the index modules import dictionary.services, which imports us.
+    from dictionary.english_lookup import refresh_group_english_lookup
+    from dictionary.public_view import refresh_group_public_views
+    from dictionary.related_terms import refresh_group_related_links
+    from dictionary.search import refresh_group_search_documents
+
+    # Two-row swap; clear the old flag first so the one-mother-per-group
+    # constraint holds after each statement.
+    previous_mothers = group.entries.filter(is_mother=True)
+    if mother_entry:
+        previous_mothers = previous_mothers.exclude(id=mother_entry.id)
+    previous_mothers.update(is_mother=False)
     if mother_entry:
-        group.entries.filter(id=mother_entry.id).update(is_mother=True)
+        group.entries.filter(id=mother_entry.id, is_mother=False).update(is_mother=True)
+
+    # Queryset updates skip post_save, so re-index inherited meanings explicitly.
+    refresh_group_search_documents(group)
+    refresh_group_english_lookup(group)
+    refresh_group_related_links(group)
+    refresh_group_public_views(group)
 
 
 @transaction.atomic
@@ -60,7 +83,9 @@ def attach_entry_to_group(*, entry: Entry, group: VariantGroup):
     """
 
     entry.variant_group = group
-    entry.save(update_fields=["variant_group"])
+    if group.mother_entry_id and group.mother_entry_id != entry.id:
+        entry.is_mother = False
+    entry.save(update_fields=["variant_group", "is_mother"])
 
     # If a group currently has no mother, the next approved variant
     # becomes mother automatically once attached/published.
@@ -139,37 +164,26 @@ def maybe_promote_general_ivatan(*, entry: Entry):
 def recompute_mother_for_group(*, group: VariantGroup, exclude_entry_id=None):
     """
     Deterministic fallback:
-    new mother = earliest approved, non-archived variant by submission timestamp.
+    new mother = earliest approved, non-archived variant by first approval.
     """
 
     # Candidate pool follows governance rule:
     # approved + non-archived statuses only.
-    candidates = list(
+    # Deterministic order: first approved timestamp, then created_at, then id
+    # (one lookup on dict_entry_mother_order_idx).
+    chosen = (
         group.entries.filter(status__in=_published_statuses())
         .exclude(id=exclude_entry_id)
-        .annotate(
-            first_approved_at=Min(
-                "revisions__approved_at",
-                filter=Q(revisions__status=EntryRevision.Status.APPROVED),
-            )
-        )
+        .order_by("first_approved_at", "created_at", "id")
+        .first()
     )
 
-    if not candidates:
+    if chosen is None:
         group.mother_entry = None
         group.save(update_fields=["mother_entry"])
         _set_group_mother_flags(group=group, mother_entry=None)
         return None
 
-    # Deterministic order: first approved timestamp, then created_at, then id.
-    candidates.sort(
-        key=lambda item: (
-            item.first_approved_at or item.created_at,
-            item.created_at,
-            str(item.id),
-        )
-    )
-    chosen = candidates[0]
     promote_to_mother(entry=chosen)
     return chosen
 
@@ -189,3 +203,84 @@ def handle_mother_removed_or_archived(*, entry: Entry, removed=False):
 
     exclude_entry_id = entry.id if removed else None
     return recompute_mother_for_group(group=group, exclude_entry_id=exclude_entry_id)
+
+
+def _variant_group_problems() -> dict:
+    published = _published_statuses()
+    member_mother = Q(mother_entry__variant_group=F("id"))
+    return {
+        # Published entries never placed in a group (publish always groups them).
+        "ungrouped": list(
+            Entry.objects.filter(status__in=published, variant_group__isnull=True)
+            .order_by("created_at", "id")
+            .values_list("id", flat=True)
+        ),
+        # Mother missing while published members exist, or not a published member.
+        "bad_mother": list(
+            VariantGroup.objects.filter(
+                Q(mother_entry__isnull=True, entries__status__in=published)
+                | Q(mother_entry__isnull=False)
+                & (~member_mother | ~Q(mother_entry__status__in=published))
+            )
+            .distinct()
+            .values_list("id", flat=True)
+        ),
+        # `is_mother` disagrees with VariantGroup.mother_entry.
+        "bad_flags": list(
+            Entry.objects.filter(variant_group__isnull=False)
+            .filter(
+                Q(is_mother=True) & ~Q(variant_group__mother_entry=F("id"))
+                | Q(is_mother=False, variant_group__mother_entry=F("id"))
+            )
+            .values_list("variant_group_id", flat=True)
+            .distinct()
+        ),
+        "unstamped": Entry.objects.filter(
+            status__in=published, first_approved_at__isnull=True
+        ).count(),
+    }
+
+
+def repair_variant_groups(*, dry_run=False) -> dict:
+    """
+    Bulk regroup / repair pass over every variant group.
+
+    - stamps `first_approved_at` on published entries that lack it (earliest
+      approved revision, else last approval, else creation)
+    - gives ungrouped published entries their own group
+    - recomputes the mother of groups whose mother is missing or not a
+      published member
+    - re-syncs `is_mother` flags with `VariantGroup.mother_entry`
+
+    Returns the problem counts found; nothing is written when `dry_run` is set.
+    """
+
+    problems = _variant_group_problems()
+    report = {
+        key: len(value) if isinstance(value, list) else value for key, value in problems.items()
+    }
+    if dry_run:
+        return report
+
+    Entry.objects.filter(status__in=_published_statuses(), first_approved_at__isnull=True).update(
+        first_approved_at=Coalesce(
+            Subquery(first_revision_approvals(OuterRef("pk"))[:1]),
+            "last_approved_at",
+            "created_at",
+        )
+    )
+
+    for entry in Entry.objects.filter(id__in=problems["ungrouped"]).order_by("created_at", "id"):
+        with transaction.atomic():
+            ensure_group_and_mother(entry=entry)
+
+    for group in VariantGroup.objects.filter(id__in=problems["bad_mother"]):
+        with transaction.atomic():
+            recompute_mother_for_group(group=group)
+
+    flag_group_ids = set(problems["bad_flags"]) - set(problems["bad_mother"])
+    for group in VariantGroup.objects.filter(id__in=flag_group_ids):
+        with transaction.atomic():
+            _set_group_mother_flags(group=group, mother_entry=group.mother_entry)
+
+    return report
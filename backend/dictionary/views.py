@@ -10,22 +10,56 @@ Quick troubleshooting:
 - Semantic mismatch on variant pages: check `_semantic_source_entry`.
 """
 
+import functools
 import json
-import re
 
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.core.files.storage import default_storage
-from django.db.models import Q
-from django.db.models.functions import Lower
-from django.http import JsonResponse
+from django.db.models import Prefetch, Q
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_GET, require_http_methods
 
+from dictionary.bundles import bundle_manifest
+from dictionary.english_lookup import english_lookup_key
+from dictionary.export import (
+    EXPORT_FORMATS,
+    changed_export_rows,
+    export_changes,
+    export_cursor,
+    export_queryset,
+    export_rows,
+)
 from dictionary.field_groups import SEMANTIC_CORE_FIELDS
-from dictionary.models import Entry, EntryRevision, EntryStatus
-from dictionary.services import create_revision_from_entry, get_visible_revision_history
-from dictionary.text import capitalize_first, normalize_headword, normalize_sentence
+from dictionary.models import (
+    EnglishLookupTerm,
+    Entry,
+    EntryRevision,
+    EntryStatus,
+    RelatedTermLink,
+)
+from dictionary.public_view import HAS_PUBLIC_VIEW, public_listing_queryset
+from dictionary.related_terms import RELATED_TERM_FIELDS
+from dictionary.search import ranked_entry_ids
+from dictionary.services import (
+    contributor_revisions,
+    create_revision_from_entry,
+    find_live_headwords,
+    get_detail_revision_slices,
+)
+from dictionary.spelling import spelling_suggestions
+from dictionary.suggest import MAX_LIMIT as SUGGEST_MAX_LIMIT
+from dictionary.suggest import suggest
+from dictionary.text import capitalize_first, headword_key, normalize_headword, normalize_sentence
+from users.models import PublicContentVersion, PublicStatusCounter
 from users.names import display_name as formatted_display_name
 from users.names import normalize_username
+from users.pagination import InvalidCursor, keyset_page
+from users.public_counters import aggregate_status_counts, cached_status_counts
+from users.public_versions import public_content_condition
+from users.roles import in_any_group
+
+User = get_user_model()
 
 EDITABLE_REVISION_FIELDS = (
     "term",
@@ -104,6 +138,10 @@ def public_dictionary(request):
             "key_endpoints": {
                 "reviews_dashboard": "/api/reviews/dashboard",
                 "dictionary_entry_detail": "/api/dictionary/entries/<entry_uuid>",
+                "dictionary_export": "/api/dictionary/export?format=ndjson|csv",
+                "dictionary_bundle": "/api/dictionary/bundle?since_version=<n>",
+                "dictionary_suggest": "/api/dictionary/suggest?q=<prefix>",
+                "dictionary_check_term": "/api/dictionary/check-term?term=<headword>",
                 "folklore_entries": "/api/folklore/entries",
                 "user_profile": "/api/users/<username>",
             },
@@ -117,7 +155,7 @@ def _is_reviewer_or_admin(user):
         return False
     if user.is_superuser:
         return True
-    return user.groups.filter(name__in=["Reviewer", "Admin"]).exists()
+    return in_any_group(user, "Reviewer", "Admin")
 
 
 def _can_flag_live_entry(user):
@@ -125,7 +163,7 @@ def _can_flag_live_entry(user):
         return False
     if user.is_superuser:
         return True
-    return user.groups.filter(name__in=["Contributor", "Reviewer", "Consultant", "Admin"]).exists()
+    return in_any_group(user, "Contributor", "Reviewer", "Consultant", "Admin")
 
 
 def _require_authenticated(request):
@@ -477,39 +515,55 @@ def _serialize_revision(revision):
     }
 
 
-def _serialize_public_entry_row(entry, request=None):
-    semantic_entry = _semantic_source_entry(entry)
+def _serialize_public_entry_row(row, request=None):
+    # `row` is a PublicEntryView: mother fields are already merged in.
     return {
-        "entry_id": str(entry.id),
-        "term": entry.term,
-        "is_mother": entry.is_mother,
-        "variant_group_id": str(entry.variant_group_id) if entry.variant_group_id else None,
-        "meaning": semantic_entry.meaning,
-        "part_of_speech": semantic_entry.part_of_speech,
+        "entry_id": str(row.entry_id),
+        "term": row.term,
+        "is_mother": row.is_mother,
+        "variant_group_id": str(row.variant_group_id) if row.variant_group_id else None,
+        "meaning": row.meaning,
+        "part_of_speech": row.part_of_speech,
         "audio_pronunciation_url": (
-            _media_url(request, entry.audio_pronunciation) if request else ""
+            _stored_media_url(request, row.audio_pronunciation) if request else ""
         ),
-        "photo_url": _media_url(request, semantic_entry.photo) if request else "",
-        "status": entry.status,
-        "created_at": entry.created_at.isoformat(),
-        "approved_at": entry.last_approved_at.isoformat() if entry.last_approved_at else None,
+        "photo_url": _stored_media_url(request, row.photo) if request else "",
+        "status": row.status,
+        "created_at": row.created_at.isoformat(),
+        "approved_at": row.last_approved_at.isoformat() if row.last_approved_at else None,
     }
 
 
-def _english_lookup_key(value):
-    words = re.findall(r"[A-Za-z]+(?:'[A-Za-z]+)?", str(value or "").lower())
-    if not (1 <= len(words) <= 2):
-        return ""
-    return " ".join(words)
+def _relevance_ordered_rows(queryset, *, search_term, limit):
+    """
+    Order search hits best match first.
+
+    The index ranks all live entries, so over-fetch ids and let the queryset
+    drop the ones hidden by the other filters (contributor, starts_with, ...).
+    Anything the ranking missed is appended alphabetically.
+    """
+
+    ranked_ids = ranked_entry_ids(search_term, limit=limit * 3 + 50)
+    positions = {entry_id: position for position, entry_id in enumerate(ranked_ids)}
+    rows = sorted(
+        queryset.filter(pk__in=ranked_ids),
+        key=lambda row: positions[row.pk],
+    )[:limit]
+    if len(rows) < limit:
+        rows += list(queryset.exclude(pk__in=ranked_ids).order_by("term")[: limit - len(rows)])
+    return rows
 
 
 @require_GET
+@public_content_condition(PublicContentVersion.Scope.DICTIONARY)
 def dictionary_entries_list_view(request):
     limit_raw = request.GET.get("limit", "200")
     search_term = request.GET.get("q", "").strip()
     starts_with = request.GET.get("starts_with", "").strip()
-    sort_mode = request.GET.get("sort", "recent").strip().lower()
+    # Searches default to relevance order; plain browsing keeps newest first.
+    sort_mode = request.GET.get("sort", "relevance" if search_term else "recent").strip().lower()
     mother_only = _as_bool(request.GET.get("mother_only"), default=False)
+    cursor = request.GET.get("cursor", "").strip()
 
     try:
         limit = int(limit_raw)
@@ -517,90 +571,248 @@ def dictionary_entries_list_view(request):
         return JsonResponse({"detail": "limit must be an integer."}, status=400)
 
     limit = max(1, min(limit, 500))
-    queryset = (
-        Entry.objects.select_related("variant_group__mother_entry")
-        .filter(status__in=VISIBLE_PUBLIC_STATUSES)
-        .filter(_live_contributor_q("initial_contributor"))
+    # The read model only holds visible entries with mother fields merged in.
+    queryset = public_listing_queryset(
+        search_term=search_term, starts_with=starts_with, mother_only=mother_only
     )
 
-    if search_term:
-        queryset = queryset.filter(term__icontains=search_term)
-
-    if starts_with:
-        queryset = queryset.filter(term__istartswith=starts_with[:1])
-
-    if mother_only:
-        queryset = queryset.filter(Q(is_mother=True) | Q(variant_group__isnull=True))
+    next_cursor = None
+    if sort_mode == "relevance" and search_term:
+        if cursor:
+            return JsonResponse(
+                {"detail": "cursor is not supported for relevance sort."}, status=400
+            )
+        rows = _relevance_ordered_rows(queryset, search_term=search_term, limit=limit)
+    else:
+        # Keyset pages: (term, id) for alpha, (-last_approved_at, id) otherwise.
+        alpha = sort_mode == "alpha"
+        try:
+            rows, next_cursor = keyset_page(
+                queryset,
+                field="term" if alpha else "last_approved_at",
+                descending=not alpha,
+                sort="alpha" if alpha else "recent",
+                cursor=cursor,
+                limit=limit,
+            )
+        except InvalidCursor as exc:
+            return JsonResponse({"detail": str(exc)}, status=400)
 
-    if sort_mode == "alpha":
-        queryset = queryset.order_by("term", "-last_approved_at")
+    if search_term or starts_with or mother_only:
+        counts = aggregate_status_counts(queryset)
     else:
-        queryset = queryset.order_by("-last_approved_at", "-created_at")
+        # Unfiltered header comes from maintained counters instead of COUNT(*).
+        counts = cached_status_counts(PublicStatusCounter.Scope.DICTIONARY)
+
+    suggestions = []
+    if search_term and not rows and not cursor:
+        # Nothing matched: offer the closest headwords ("did you mean").
+        suggestions = spelling_suggestions(search_term)
 
-    rows = queryset[:limit]
     return JsonResponse(
         {
-            "rows": [_serialize_public_entry_row(entry, request=request) for entry in rows],
-            "counts": {
-                "visible_total": queryset.count(),
-                "approved": queryset.filter(status=EntryStatus.APPROVED).count(),
-                "approved_under_review": queryset.filter(
-                    status=EntryStatus.APPROVED_UNDER_REVIEW
-                ).count(),
-            },
+            "rows": [_serialize_public_entry_row(row, request=request) for row in rows],
+            "counts": counts,
+            "next_cursor": next_cursor,
+            "suggestions": suggestions,
         }
     )
 
 
+@require_GET
+@public_content_condition(PublicContentVersion.Scope.DICTIONARY)
+def dictionary_export_view(request):
+    """
+    Stream every publicly visible entry as NDJSON (default) or CSV.
+
+    Query params:
+    - `format`: `ndjson` or `csv`
+    - `since`: `X-Export-Cursor` of an earlier export; only entries changed after
+      it, removed ones as tombstones
+    """
+
+    export_format = request.GET.get("format", "ndjson").strip().lower()
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({"detail": "format must be 'ndjson' or 'csv'."}, status=400)
+    media_url = functools.partial(_stored_media_url, request)
+    since_raw = request.GET.get("since", "").strip()
+    if since_raw:
+        try:
+            since = int(since_raw)
+        except ValueError:
+            since = 0
+        if since < 1:
+            return JsonResponse({"detail": "since must be an X-Export-Cursor value."}, status=400)
+        changes = export_changes(since)
+        if changes is None:
+            return JsonResponse(
+                {"detail": "since is older than the change log; run a full export."},
+                status=410,
+            )
+        cursor, entry_ids = changes
+        rows = changed_export_rows(entry_ids, media_url=media_url)
+    else:
+        # Read before the rows: a change landing in between is sent again next pull.
+        cursor = export_cursor()
+        rows = export_rows(export_queryset(), media_url=media_url)
+
+    line_generator, content_type, extension = EXPORT_FORMATS[export_format]
+    response = StreamingHttpResponse(line_generator(rows), content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="chirin-ivatan-dictionary.{extension}"'
+    if cursor:
+        response["X-Export-Cursor"] = str(cursor)
+    return response
+
+
+@require_GET
+def dictionary_suggest_view(request):
+    """
+    Type-ahead suggestions from the in-process index (dictionary/suggest.py).
+
+    Query params:
+    - `q`: typed prefix of an Ivatan headword (spelling-tolerant) or English gloss
+    - `limit`: suggestions to return (max 25)
+    """
+
+    try:
+        limit = int(request.GET.get("limit", "10"))
+    except ValueError:
+        return JsonResponse({"detail": "limit must be an integer."}, status=400)
+    limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+    return JsonResponse({"suggestions": suggest(request.GET.get("q", ""), limit=limit)})
+
+
+# Draft builders send the headword plus its variants; more is not a draft.
+CHECK_TERM_MAX_TERMS = 20
+
+
+@require_GET
+def dictionary_check_term_view(request):
+    """
+    Tell the draft builder which headwords are already live.
+
+    Query params:
+    - `term`: headword to check; repeat it to check variants in the same call
+      (max 20). Matching ignores case and surrounding whitespace.
+    """
+
+    unauthenticated = _require_authenticated(request)
+    if unauthenticated:
+        return unauthenticated
+
+    terms = [term.strip() for term in request.GET.getlist("term") if term.strip()]
+    if not terms:
+        return JsonResponse({"detail": "term is required."}, status=400)
+    if len(terms) > CHECK_TERM_MAX_TERMS:
+        return JsonResponse(
+            {"detail": f"At most {CHECK_TERM_MAX_TERMS} terms can be checked at once."},
+            status=400,
+        )
+
+    matches = find_live_headwords(terms)
+    results = []
+    for term in terms:
+        existing = matches.get(headword_key(term), [])
+        results.append({"term": term, "exists": bool(existing), "matches": existing})
+    return JsonResponse({"results": results})
+
+
+@require_GET
+def dictionary_bundle_view(request):
+    """
+    Manifest of the latest offline dictionary bundle.
+
+    Query params:
+    - `since_version`: the client's current version; adds the patch chain
+      (`patches` is null when the client must download the full bundle)
+    """
+
+    since_version = None
+    since_raw = request.GET.get("since_version", "").strip()
+    if since_raw:
+        try:
+            since_version = int(since_raw)
+        except ValueError:
+            return JsonResponse({"detail": "since_version must be an integer."}, status=400)
+        if since_version < 0:
+            return JsonResponse({"detail": "since_version must not be negative."}, status=400)
+
+    manifest = bundle_manifest(
+        since_version=since_version,
+        file_url=lambda file_field: _media_url(request, file_field),
+    )
+    if manifest is None:
+        return JsonResponse({"detail": "No dictionary bundle has been built yet."}, status=404)
+    return JsonResponse(manifest)
+
+
 @require_GET
 def dictionary_english_terms_view(request):
+    """
+    English → Ivatan lookup, served from the EnglishLookupTerm index.
+
+    Query params:
+    - `q`: English word(s); matched anywhere in the key, or as a prefix with `match=prefix`
+    - `limit`: English terms per page (max 200)
+    - `after`: `next_after` from the previous page
+    """
+
     limit_raw = request.GET.get("limit", "100")
-    search_term = _english_lookup_key(request.GET.get("q", ""))
+    search_term = english_lookup_key(request.GET.get("q", ""))
+    match_mode = request.GET.get("match", "contains").strip().lower()
+    after = request.GET.get("after", "").strip().lower()
 
     try:
         limit = int(limit_raw)
     except ValueError:
         return JsonResponse({"detail": "limit must be an integer."}, status=400)
+    if match_mode not in {"contains", "prefix"}:
+        return JsonResponse({"detail": "match must be 'contains' or 'prefix'."}, status=400)
 
     limit = max(1, min(limit, 200))
-    queryset = (
-        Entry.objects.select_related("variant_group__mother_entry")
-        .filter(status__in=VISIBLE_PUBLIC_STATUSES)
-        .filter(_live_contributor_q("initial_contributor"))
-        .order_by("term")
-    )
+    queryset = EnglishLookupTerm.objects.filter(HAS_PUBLIC_VIEW)
 
-    lookup_rows = {}
-    for entry in queryset:
-        semantic_entry = _semantic_source_entry(entry)
-        english_terms = [
-            _english_lookup_key(semantic_entry.meaning),
-            *[
-                _english_lookup_key(item)
-                for item in re.split(r"[,;\n]", semantic_entry.english_synonym or "")
-            ],
-        ]
-        for english_term in dict.fromkeys(item for item in english_terms if item):
-            if search_term and search_term not in english_term:
-                continue
-
-            row = lookup_rows.setdefault(
-                english_term,
-                {
-                    "english_term": english_term,
-                    "translations": [],
-                },
-            )
-            row["translations"].append(
-                {
-                    "entry_id": str(entry.id),
-                    "term": entry.term,
-                    "part_of_speech": semantic_entry.part_of_speech,
-                }
-            )
+    if search_term:
+        if match_mode == "prefix":
+            queryset = queryset.filter(english_key__startswith=search_term)
+        else:
+            queryset = queryset.filter(english_key__contains=search_term)
+
+    if after:
+        queryset = queryset.filter(english_key__gt=after)
 
-    rows = sorted(lookup_rows.values(), key=lambda item: item["english_term"])[:limit]
-    return JsonResponse({"rows": rows, "count": len(rows)})
+    # Page over distinct keys first, then load translations for that page only.
+    page_keys = list(
+        queryset.order_by("english_key")
+        .values_list("english_key", flat=True)
+        .distinct()[: limit + 1]
+    )
+    has_more = len(page_keys) > limit
+    page_keys = page_keys[:limit]
+
+    lookup_rows = {key: {"english_term": key, "translations": []} for key in page_keys}
+    translations = (
+        queryset.filter(english_key__in=page_keys)
+        .order_by("english_key", "term", "entry_id")
+        .values_list("english_key", "entry_id", "term", "part_of_speech")
+    )
+    for english_key, entry_id, term, part_of_speech in translations:
+        lookup_rows[english_key]["translations"].append(
+            {
+                "entry_id": str(entry_id),
+                "term": term,
+                "part_of_speech": part_of_speech,
+            }
+        )
+
+    rows = list(lookup_rows.values())
+    return JsonResponse(
+        {
+            "rows": rows,
+            "count": len(rows),
+            "next_after": page_keys[-1] if has_more else None,
+        }
+    )
 
 
 @require_GET
@@ -609,7 +821,7 @@ def my_dictionary_revisions_view(request):
     if auth_error:
         return auth_error
 
-    rows = EntryRevision.objects.filter(contributor=request.user).order_by("-created_at")
+    rows = contributor_revisions(request.user)
     return JsonResponse(
         {"rows": [_serialize_revision_row(revision, request=request) for revision in rows]}
     )
@@ -794,17 +1006,12 @@ def _semantic_source_entry(entry: Entry):
 
 
 def _serialize_connected_variants(entry: Entry, request=None):
-    # Connected variants shown in entry detail page.
+    # Connected variants shown in entry detail page: approved related terms in
+    # the same group, prefetched by `_load_entry_detail`.
     if not entry.variant_group_id:
         return []
 
-    # Public list shows approved related terms in the same group.
-    related = (
-        entry.variant_group.entries.filter(status__in=VISIBLE_PUBLIC_STATUSES)
-        .filter(_live_contributor_q("initial_contributor"))
-        .exclude(id=entry.id)
-        .order_by("term")
-    )
+    related = [item for item in entry.variant_group.visible_entries if item.id != entry.id]
 
     return [
         {
@@ -826,21 +1033,13 @@ def _serialize_connected_variants(entry: Entry, request=None):
     ]
 
 
-def _serialize_contributors(entry: Entry):
-    # Contributor section in public detail page.
-    approved_revision_contributors = list(
-        EntryRevision.objects.filter(
-            entry=entry,
-            status=EntryRevision.Status.APPROVED,
-            is_base_snapshot=False,
-        )
-        .filter(_live_contributor_q("contributor"))
-        .select_related("contributor", "contributor__profile")
-        .order_by("-approved_at", "-created_at")
-    )
+def _serialize_contributors(entry: Entry, contributor_revisions):
+    # Contributor section in public detail page. `contributor_revisions` holds
+    # each contributor's newest approved revision, newest first; hidden
+    # contributors are skipped because `_public_actor` returns None for them.
     revision_actors = []
     seen_usernames = set()
-    for revision in approved_revision_contributors:
+    for revision in contributor_revisions:
         actor = _public_actor(revision.contributor)
         if actor and actor["username"] not in seen_usernames:
             revision_actors.append(actor)
@@ -853,7 +1052,7 @@ def _serialize_contributors(entry: Entry):
         "unique_revision_contributor_actors": revision_actors,
         "last_revised_by": (revision_actors[0]["username"] if revision_actors else None),
         "last_revised_by_actor": revision_actors[0] if revision_actors else None,
-        "approved_by": sorted(list(entry.last_approved_by.values_list("username", flat=True))),
+        "approved_by": sorted(user.username for user in entry.last_approved_by.all()),
         "approved_by_actors": [
             actor
             for actor in (_public_actor(user) for user in entry.last_approved_by.all())
@@ -862,7 +1061,7 @@ def _serialize_contributors(entry: Entry):
     }
 
 
-def _serialize_attribution(entry: Entry):
+def _serialize_attribution(entry: Entry, *, has_approved_revisions):
     """
     Source/attribution visibility rules from SPEC:
     - Term source hidden if self-knowledge.
@@ -918,16 +1117,10 @@ def _serialize_attribution(entry: Entry):
         },
         "always_visible": {
             "last_revised_by": (
-                _public_username(entry.last_revised_by)
-                if EntryRevision.objects.filter(
-                    entry=entry,
-                    status=EntryRevision.Status.APPROVED,
-                    is_base_snapshot=False,
-                ).exists()
-                else None
+                _public_username(entry.last_revised_by) if has_approved_revisions else None
             ),
             "reviewed_and_approved_by": sorted(
-                list(entry.last_approved_by.values_list("username", flat=True))
+                user.username for user in entry.last_approved_by.all()
             ),
             "reviewed_and_approved_by_actors": [
                 actor
@@ -938,73 +1131,62 @@ def _serialize_attribution(entry: Entry):
     }
 
 
-def _latest_approved_revision(entry: Entry):
-    return (
-        EntryRevision.objects.filter(
-            entry=entry,
-            status=EntryRevision.Status.APPROVED,
-        )
-        .select_related("contributor")
-        .order_by("-approved_at", "-created_at")
-        .first()
+def _serialize_related_terms(semantic_entry):
+    # Links are resolved at write time (dictionary/related_terms.py).
+    related_terms = {field: [] for field in RELATED_TERM_FIELDS}
+    links = (
+        RelatedTermLink.objects.filter(source_entry_id=semantic_entry.id)
+        .select_related("target_entry")
+        .order_by("position")
     )
+    for link in links:
+        target = link.target_entry
+        related_terms[link.relation].append(
+            {
+                "label": link.label,
+                "entry_id": str(target.id) if target else None,
+                "term": target.term if target else link.label,
+            }
+        )
+    return related_terms
 
 
-def _split_related_terms(value):
-    return [item.strip() for item in re.split(r"[,;\n]", value or "") if item and item.strip()]
+def _load_entry_detail(entry_id):
+    """
+    Load a visible entry with everything its detail page reads, in two queries:
+    the entry (contributors and profiles joined) plus one prefetch each for
+    approvers and connected variants.
 
+    Serializers below must only read these preloaded relations; the detail
+    query-count test fails if one starts querying per row again.
+    """
 
-def _serialize_related_terms(semantic_entry):
-    fields = {
-        "english_synonym": semantic_entry.english_synonym,
-        "ivatan_synonym": semantic_entry.ivatan_synonym,
-        "english_antonym": semantic_entry.english_antonym,
-        "ivatan_antonym": semantic_entry.ivatan_antonym,
-    }
-    terms_by_field = {field: _split_related_terms(value) for field, value in fields.items()}
-    term_keys = {
-        normalize_headword(term).lower()
-        for terms in terms_by_field.values()
-        for term in terms
-        if normalize_headword(term)
-    }
-    matches = {}
-    if term_keys:
-        matched_entries = (
-            Entry.objects.annotate(term_key=Lower("term"))
-            .select_related("initial_contributor")
-            .filter(
-                _live_contributor_q("initial_contributor"),
-                status__in=VISIBLE_PUBLIC_STATUSES,
-                term_key__in=term_keys,
-            )
-            .order_by("-is_mother", "term")
+    visible_variants = (
+        Entry.objects.filter(status__in=VISIBLE_PUBLIC_STATUSES)
+        .filter(_live_contributor_q("initial_contributor"))
+        .order_by("term")
+    )
+    return (
+        Entry.objects.select_related(
+            "initial_contributor__profile",
+            "last_revised_by__profile",
+            "audio_contributor__profile",
+            "photo_contributor__profile",
+            "variant_group__mother_entry__photo_contributor__profile",
         )
-        for match in matched_entries:
-            matches.setdefault(normalize_headword(match.term).lower(), match)
-
-    return {
-        field: [
-            {
-                "label": term,
-                "entry_id": (
-                    str(matches[normalize_headword(term).lower()].id)
-                    if normalize_headword(term).lower() in matches
-                    else None
-                ),
-                "term": (
-                    matches[normalize_headword(term).lower()].term
-                    if normalize_headword(term).lower() in matches
-                    else term
-                ),
-            }
-            for term in terms
-        ]
-        for field, terms in terms_by_field.items()
-    }
+        .prefetch_related(
+            Prefetch("last_approved_by", queryset=User.objects.select_related("profile")),
+            Prefetch(
+                "variant_group__entries", queryset=visible_variants, to_attr="visible_entries"
+            ),
+        )
+        .filter(_live_contributor_q("initial_contributor"))
+        .get(id=entry_id, status__in=VISIBLE_PUBLIC_STATUSES)
+    )
 
 
 @require_GET
+@public_content_condition(PublicContentVersion.Scope.DICTIONARY)
 def dictionary_entry_detail_view(request, entry_id):
     """
     Main dictionary term detail endpoint.
@@ -1017,21 +1199,13 @@ def dictionary_entry_detail_view(request, entry_id):
     - contributors
     - attribution
     - revision_history
+
+    Query budget is fixed: entry + approvers + variants (`_load_entry_detail`),
+    one windowed revision query, one related-terms lookup and, for signed-in
+    users, one group lookup. It does not grow with history or variant count.
     """
     try:
-        entry = (
-            Entry.objects.select_related(
-                "initial_contributor",
-                "last_revised_by",
-                "variant_group__mother_entry",
-            )
-            .prefetch_related("last_approved_by")
-            .filter(_live_contributor_q("initial_contributor"))
-            .get(
-                id=entry_id,
-                status__in=VISIBLE_PUBLIC_STATUSES,
-            )
-        )
+        entry = _load_entry_detail(entry_id)
     except Entry.DoesNotExist:
         return JsonResponse({"detail": "Dictionary entry not found."}, status=404)
 
@@ -1039,9 +1213,9 @@ def dictionary_entry_detail_view(request, entry_id):
     # Public: base + last 5 approved revisions.
     # Reviewer/Admin: base + last 15 approved revisions.
     audience = "staff" if _is_reviewer_or_admin(request.user) else "public"
-    history = get_visible_revision_history(entry=entry, audience=audience)
+    history = get_detail_revision_slices(entry=entry, audience=audience)
     semantic_entry = _semantic_source_entry(entry)
-    latest_approved_revision = _latest_approved_revision(entry)
+    latest_approved_revision = history["latest_approved_revision"]
 
     return JsonResponse(
         {
@@ -1087,8 +1261,10 @@ def dictionary_entry_detail_view(request, entry_id):
                 "variant_type": entry.variant_type,
             },
             "connected_variants": _serialize_connected_variants(entry, request=request),
-            "contributors": _serialize_contributors(entry),
-            "attribution": _serialize_attribution(entry),
+            "contributors": _serialize_contributors(entry, history["contributor_revisions"]),
+            "attribution": _serialize_attribution(
+                entry, has_approved_revisions=history["has_approved_revisions"]
+            ),
             "review_action": {
                 "can_flag_for_rereview": bool(
                     latest_approved_revision
@@ -1125,7 +1301,7 @@ def dictionary_entry_detail_view(request, entry_id):
                     _serialize_revision(rev) for rev in history["recent_approved_revisions"]
                 ],
                 "recent_rejected_revisions": [
-                    _serialize_revision(rev) for rev in history.get("recent_rejected_revisions", [])
+                    _serialize_revision(rev) for rev in history["recent_rejected_revisions"]
                 ],
             },
         }
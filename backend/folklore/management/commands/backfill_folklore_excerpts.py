@@ -0,0 +1,25 @@
+"""
+Management command: backfill_folklore_excerpts
+
+Recomputes FolkloreEntry.excerpt and word_count (the plain-text preview shown
+on public folklore lists) from each entry's rich-text content.
+
+Use when:
+- entries were imported or edited with raw SQL / queryset.update()
+- the excerpt length or word-count rules change
+"""
+
+from django.core.management.base import BaseCommand
+
+from folklore.services import backfill_folklore_text_summaries
+
+
+class Command(BaseCommand):
+    help = "Recompute stored folklore excerpts and word counts from content."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        updated = backfill_folklore_text_summaries(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Folklore excerpts backfilled: updated={updated}"))
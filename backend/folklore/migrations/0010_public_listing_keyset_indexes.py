@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('folklore', '0009_folkloremediaasset'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='folkloreentry',
+            index=models.Index(fields=['title', 'id'], name='folk_entry_alpha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='folkloreentry',
+            index=models.Index(fields=['-created_at', 'id'], name='folk_entry_recent_idx'),
+        ),
+    ]
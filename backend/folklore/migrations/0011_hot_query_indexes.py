@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('folklore', '0010_public_listing_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='folkloreentry',
+            index=models.Index(condition=models.Q(('status__in', ['approved', 'approved_under_review'])), fields=['contributor', '-created_at'], name='folk_entry_public_contrib_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='folkloreentry',
+            index=models.Index(fields=['status', '-updated_at'], name='folk_entry_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='folklorerevision',
+            index=models.Index(fields=['entry', 'status', 'is_base_snapshot', 'approved_at', 'created_at'], name='folk_rev_history_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='folklorerevision',
+            index=models.Index(fields=['status', '-created_at'], name='folk_rev_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='folklorerevision',
+            index=models.Index(fields=['contributor', '-created_at'], name='folk_rev_contrib_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='folklorerevision',
+            index=models.Index(condition=models.Q(('status', 'approved')), fields=['-approved_at', '-created_at'], name='folk_rev_approved_recent_idx'),
+        ),
+    ]
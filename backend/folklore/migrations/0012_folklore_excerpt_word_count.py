@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:19
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+
+def backfill_excerpts(apps, schema_editor):
+    FolkloreEntry = apps.get_model("folklore", "FolkloreEntry")
+    changed = []
+    for entry in FolkloreEntry.objects.only("id", "content").iterator(chunk_size=500):
+        words = strip_tags(entry.content or "").split()
+        entry.excerpt = " ".join(words)[:180]
+        entry.word_count = len(words)
+        changed.append(entry)
+    FolkloreEntry.objects.bulk_update(changed, ["excerpt", "word_count"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('folklore', '0011_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='folkloreentry',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', max_length=180),
+        ),
+        migrations.AddField(
+            model_name='folkloreentry',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_excerpts, migrations.RunPython.noop),
+    ]
@@ -13,6 +13,9 @@ import uuid
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils.html import strip_tags
+
+from users.revision_storage import DeltaEncodedRevision
 
 FOLKLORE_SUBCATEGORIES_BY_CATEGORY = {
     "oral_narratives": {"myths", "legends", "folktales", "oral_histories"},
@@ -40,6 +43,19 @@ LEGACY_FOLKLORE_CATEGORY_MAP = {
 }
 
 
+# Public list rows show this many characters of plain text.
+FOLKLORE_EXCERPT_LENGTH = 180
+
+
+def folklore_text_summary(content):
+    """
+    Return `(excerpt, word_count)` for rich-text folklore content.
+    """
+
+    words = strip_tags(content or "").split()
+    return " ".join(words)[:FOLKLORE_EXCERPT_LENGTH], len(words)
+
+
 def normalize_folklore_taxonomy(data):
     category, subcategory = LEGACY_FOLKLORE_CATEGORY_MAP.get(
         str(data.get("category", "")).strip(), (None, None)
@@ -59,6 +75,8 @@ class FolkloreEntry(models.Model):
     - conditional media-source validation
     - auto-default license assignment on approval
     - license immutability after approval
+    - plain-text `excerpt`/`word_count` kept in sync with `content`, so public
+      lists can defer the rich-text body
     """
 
     DEFAULT_LICENSE = "CC BY-NC 4.0"
@@ -115,6 +133,8 @@ class FolkloreEntry(models.Model):
 
     title = models.CharField(max_length=255)
     content = models.TextField()
+    excerpt = models.CharField(max_length=FOLKLORE_EXCERPT_LENGTH, blank=True, default="")
+    word_count = models.PositiveIntegerField(default=0)
     category = models.CharField(max_length=40, choices=Category.choices)
     subcategory = models.CharField(
         max_length=40, choices=Subcategory.choices, blank=True, default=""
@@ -144,6 +164,19 @@ class FolkloreEntry(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Public listing keyset indexes (see users/pagination.py).
+            models.Index(fields=["title", "id"], name="folk_entry_alpha_idx"),
+            models.Index(fields=["-created_at", "id"], name="folk_entry_recent_idx"),
+            models.Index(
+                fields=["contributor", "-created_at"],
+                name="folk_entry_public_contrib_idx",
+                condition=models.Q(status__in=["approved", "approved_under_review"]),
+            ),
+            models.Index(fields=["status", "-updated_at"], name="folk_entry_status_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         # Always validate before persisting.
         update_fields = kwargs.get("update_fields")
@@ -161,6 +194,12 @@ class FolkloreEntry(models.Model):
             kwargs["update_fields"] = list(update_fields) + ["subcategory"]
         self.clean()
 
+        # Deferred content was not edited, so the stored summary still matches.
+        if "content" not in self.get_deferred_fields():
+            self.excerpt, self.word_count = folklore_text_summary(self.content)
+            if update_fields is not None and "content" in update_fields:
+                kwargs["update_fields"] = list(kwargs["update_fields"]) + ["excerpt", "word_count"]
+
         if (
             self.status == self.Status.APPROVED
             and self.self_produced_media
@@ -170,7 +209,7 @@ class FolkloreEntry(models.Model):
             # If caller used update_fields, make sure auto-default license
             # is actually persisted with the same save call.
             if update_fields is not None and "copyright_usage" not in update_fields:
-                kwargs["update_fields"] = list(update_fields) + ["copyright_usage"]
+                kwargs["update_fields"] = list(kwargs["update_fields"]) + ["copyright_usage"]
 
         # Lock license once an entry has been approved. A license change
         # should happen through a new revision snapshot lifecycle.
@@ -271,7 +310,7 @@ class FolkloreComment(models.Model):
         return f"{self.author_id} on {self.entry_id}"
 
 
-class FolkloreRevision(models.Model):
+class FolkloreRevision(DeltaEncodedRevision):
     """
     Submission/revision object for folklore content.
 
@@ -343,6 +382,21 @@ class FolkloreRevision(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            models.Index(
+                fields=["entry", "status", "is_base_snapshot", "approved_at", "created_at"],
+                name="folk_rev_history_idx",
+            ),
+            models.Index(fields=["status", "-created_at"], name="folk_rev_status_created_idx"),
+            models.Index(
+                fields=["contributor", "-created_at"], name="folk_rev_contrib_created_idx"
+            ),
+            models.Index(
+                fields=["-approved_at", "-created_at"],
+                name="folk_rev_approved_recent_idx",
+                condition=models.Q(status="approved"),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.id} ({self.status})"
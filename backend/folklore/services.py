@@ -7,14 +7,24 @@ Main responsibilities:
 - validate/publish approved revisions into live entries
 - enforce revision retention policies
 - apply lifecycle-safe state transitions
+- keep the stored plain-text excerpt/word count in sync with content
+- build the public/history/"my submissions" read querysets shared with views
+  and `explain_hot_queries`
 """
 
 from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
-from folklore.models import FolkloreEntry, FolkloreRevision, normalize_folklore_taxonomy
+from folklore.models import (
+    FolkloreEntry,
+    FolkloreRevision,
+    folklore_text_summary,
+    normalize_folklore_taxonomy,
+)
 from folklore.state_machine import validate_transition
 from users.contributions import award_folklore_entry
+from users.revision_retention import enforce_revision_retention_inline
 
 FOLKLORE_SNAPSHOT_FIELDS = (
     "title",
@@ -32,8 +42,49 @@ FOLKLORE_SNAPSHOT_FIELDS = (
     "audio_upload",
 )
 
+VISIBLE_PUBLIC_STATUSES = [
+    FolkloreEntry.Status.APPROVED,
+    FolkloreEntry.Status.APPROVED_UNDER_REVIEW,
+]
+
+
+def live_contributor_q(field_name):
+    return Q(**{f"{field_name}__profile__isnull": True}) | Q(
+        **{f"{field_name}__profile__show_live_contributions": True}
+    )
+
+
+def public_folklore_entries():
+    """
+    Publicly listed entries: visible state and a contributor who shows live work.
+    """
+
+    return FolkloreEntry.objects.filter(status__in=VISIBLE_PUBLIC_STATUSES).filter(
+        live_contributor_q("contributor")
+    )
+
+
+def approved_folklore_revisions(entry: FolkloreEntry):
+    """
+    An entry's approved revisions, newest approval first.
+    """
+
+    return (
+        FolkloreRevision.objects.filter(entry=entry, status=FolkloreRevision.Status.APPROVED)
+        .select_related("contributor", "contributor__profile")
+        .order_by("-approved_at", "-created_at")
+    )
+
+
+def contributor_folklore_revisions(user):
+    """
+    A contributor's own revisions, newest first ("my submissions" page).
+    """
+
+    return FolkloreRevision.objects.filter(contributor=user).order_by("-created_at")
+
 
-def _snapshot_entry(entry: FolkloreEntry) -> dict:
+def snapshot_entry(entry: FolkloreEntry) -> dict:
     # Build JSON snapshot from current live entry for draft revision bootstrap.
     snapshot = {}
     for field in FOLKLORE_SNAPSHOT_FIELDS:
@@ -84,20 +135,9 @@ def transition_folklore_status(*, entry: FolkloreEntry, to_status: str) -> Folkl
 
 
 def _enforce_approved_revision_retention(entry: FolkloreEntry) -> None:
-    # Keep max 20 approved non-base revisions.
-    # Oldest non-base approved revisions are deleted first.
-    approved_non_base = FolkloreRevision.objects.filter(
-        entry=entry,
-        status=FolkloreRevision.Status.APPROVED,
-        is_base_snapshot=False,
-    ).order_by("approved_at", "created_at")
-
-    overflow = approved_non_base.count() - 20
-    if overflow <= 0:
-        return
-
-    delete_ids = list(approved_non_base.values_list("id", flat=True)[:overflow])
-    FolkloreRevision.objects.filter(id__in=delete_ids).delete()
+    # Keep max 20 approved non-base revisions (oldest go first). Only the
+    # inline fast path runs here; the sweeper enforces the policy in bulk.
+    enforce_revision_retention_inline(FolkloreRevision, entry.id)
 
 
 @transaction.atomic
@@ -190,9 +230,37 @@ def publish_revision(*, revision: FolkloreRevision) -> FolkloreEntry:
         entry.archived_at = None
         entry.save()
 
+    # FolkloreEntry.save() refreshed excerpt/word_count from the new content.
     return entry
 
 
+def backfill_folklore_text_summaries(*, batch_size=500) -> int:
+    """
+    Recompute `excerpt`/`word_count` for every entry whose stored values drifted.
+
+    Returns the number of rows updated. Uses bulk_update, so entry save() rules
+    (license lock, taxonomy normalization) are not re-run.
+    """
+
+    changed = []
+    updated = 0
+    rows = FolkloreEntry.objects.only("id", "content", "excerpt", "word_count").order_by("id")
+    for entry in rows.iterator(chunk_size=batch_size):
+        excerpt, word_count = folklore_text_summary(entry.content)
+        if (entry.excerpt, entry.word_count) == (excerpt, word_count):
+            continue
+        entry.excerpt, entry.word_count = excerpt, word_count
+        changed.append(entry)
+        if len(changed) >= batch_size:
+            FolkloreEntry.objects.bulk_update(changed, ["excerpt", "word_count"])
+            updated += len(changed)
+            changed = []
+    if changed:
+        FolkloreEntry.objects.bulk_update(changed, ["excerpt", "word_count"])
+        updated += len(changed)
+    return updated
+
+
 @transaction.atomic
 def create_revision_from_entry(*, entry: FolkloreEntry, contributor) -> FolkloreRevision:
     # Preferred path for starting edits on approved folklore entries.
@@ -203,7 +271,7 @@ def create_revision_from_entry(*, entry: FolkloreEntry, contributor) -> Folklore
     return FolkloreRevision.objects.create(
         entry=entry,
         contributor=contributor,
-        proposed_data=_snapshot_entry(entry),
+        proposed_data=snapshot_entry(entry),
         photo_upload=entry.photo_upload,
         audio_upload=entry.audio_upload,
         revision_type=FolkloreRevision.RevisionType.REVISION,
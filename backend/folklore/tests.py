@@ -1,10 +1,16 @@
+import io
 import json
+from datetime import timedelta
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
 from folklore.models import FolkloreComment, FolkloreEntry, FolkloreRevision
 from folklore.services import (
@@ -13,6 +19,7 @@ from folklore.services import (
     transition_folklore_status,
 )
 from users.models import ContributionEvent, Notification
+from users.revision_storage import compact_revisions
 
 User = get_user_model()
 
@@ -179,6 +186,56 @@ class FolklorePublicApiTests(TestCase):
         self.assertIn(str(under_review.id), entry_ids)
         self.assertEqual(len(entry_ids), 2)
 
+    def test_list_serves_stored_excerpt_without_loading_content(self):
+        entry = self._entry(title="Rich", status=FolkloreEntry.Status.APPROVED)
+        entry.content = "<p>Once   upon a <strong>time</strong></p>\n<p>" + "word " * 100 + "</p>"
+        entry.save(update_fields=["content"])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/folklore/entries")
+
+        row = response.json()["rows"][0]
+        self.assertTrue(row["preview"].startswith("Once upon a time word word"))
+        self.assertEqual(len(row["preview"]), 180)
+        self.assertEqual(row["word_count"], 104)
+        entry_selects = [
+            query["sql"] for query in queries if 'FROM "folklore_folkloreentry"' in query["sql"]
+        ]
+        self.assertTrue(entry_selects)
+        self.assertFalse(any('"content"' in sql for sql in entry_selects))
+
+    def test_backfill_command_repairs_stale_excerpts(self):
+        entry = self._entry(title="Stale", status=FolkloreEntry.Status.APPROVED)
+        FolkloreEntry.objects.filter(pk=entry.pk).update(excerpt="", word_count=0)
+
+        call_command("backfill_folklore_excerpts", stdout=io.StringIO())
+
+        entry.refresh_from_db()
+        self.assertEqual((entry.excerpt, entry.word_count), ("Stale content", 2))
+
+    def test_list_pages_by_title_with_cursor(self):
+        for title in ("Charlie", "Alpha", "Bravo"):
+            self._entry(title=title, status=FolkloreEntry.Status.APPROVED)
+
+        first_page = self.client.get("/api/folklore/entries?limit=2").json()
+        self.assertEqual([row["title"] for row in first_page["rows"]], ["Alpha", "Bravo"])
+        self.assertEqual(first_page["counts"]["visible_total"], 3)
+
+        second_page = self.client.get(
+            "/api/folklore/entries", {"limit": 2, "cursor": first_page["next_cursor"]}
+        ).json()
+        self.assertEqual([row["title"] for row in second_page["rows"]], ["Charlie"])
+        self.assertIsNone(second_page["next_cursor"])
+
+    def test_list_rejects_cursor_from_other_sort(self):
+        self._entry(title="Alpha", status=FolkloreEntry.Status.APPROVED)
+        self._entry(title="Bravo", status=FolkloreEntry.Status.APPROVED)
+        cursor = self.client.get("/api/folklore/entries?limit=1").json()["next_cursor"]
+
+        response = self.client.get("/api/folklore/entries", {"sort": "recent", "cursor": cursor})
+
+        self.assertEqual(response.status_code, 400)
+
     def test_detail_masks_source_fields_when_self_marked(self):
         entry = self._entry(
             title="Masked Entry",
@@ -966,3 +1023,79 @@ class FolkloreCommentTests(TestCase):
         comment = FolkloreComment.objects.create(entry=self.entry, author=self.commenter, body="x")
         response = self.client.delete(self._url_delete(comment.id))
         self.assertEqual(response.status_code, 401)
+
+
+class FolkloreRevisionRetentionTests(TestCase):
+    def test_sweeper_keeps_base_and_newest_twenty_revisions(self):
+        contributor = User.objects.create_user(username="folk_retention", password="testpass123")
+        entry = FolkloreEntry.objects.create(
+            title="Kapayvanuvanua",
+            content="Sample folklore text",
+            category=FolkloreEntry.Category.MYTH,
+            municipality_source="Basco",
+            source="Oral account",
+            contributor=contributor,
+            status=FolkloreEntry.Status.APPROVED,
+        )
+        start = timezone.now() - timedelta(days=1)
+        revisions = [
+            FolkloreRevision.objects.create(
+                entry=entry,
+                contributor=contributor,
+                proposed_data={"title": "Kapayvanuvanua"},
+                status=FolkloreRevision.Status.APPROVED,
+                approved_at=start + timedelta(minutes=index),
+                is_base_snapshot=index == 0,
+            )
+            for index in range(23)
+        ]
+
+        output = io.StringIO()
+        call_command("sweep_revision_retention", stdout=output)
+
+        self.assertIn("folklore_deleted=2", output.getvalue())
+        self.assertEqual(
+            set(entry.revisions.values_list("id", flat=True)),
+            {revisions[0].id, *(revision.id for revision in revisions[3:])},
+        )
+
+
+class FolkloreRevisionStorageTests(TestCase):
+    def test_content_edit_becomes_a_text_patch_after_compaction(self):
+        contributor = User.objects.create_user(username="folk_storage", password="testpass123")
+        content = "<p>The ancestors crossed from Itbayat in a long boat.</p>" * 10
+        entry = FolkloreEntry.objects.create(
+            title="Kapayvanuvanua",
+            content=content,
+            category=FolkloreEntry.Category.MYTH,
+            municipality_source="Basco",
+            source="Oral account",
+            contributor=contributor,
+            status=FolkloreEntry.Status.APPROVED,
+        )
+        snapshot = {"title": entry.title, "content": content}
+        FolkloreRevision.objects.create(
+            entry=entry,
+            contributor=contributor,
+            proposed_data=snapshot,
+            status=FolkloreRevision.Status.APPROVED,
+            approved_at=timezone.now(),
+            is_base_snapshot=True,
+        )
+        edited = {**snapshot, "content": content + "<p>An added ending.</p>"}
+
+        revision = FolkloreRevision.objects.create(
+            entry=entry,
+            contributor=contributor,
+            proposed_data=edited,
+            status=FolkloreRevision.Status.PENDING,
+        )
+
+        stored = FolkloreRevision._base_manager.filter(id=revision.id).values_list(
+            "proposed_data", flat=True
+        )
+        # Saves never diff text; the maintenance pass does.
+        self.assertEqual(stored[0], edited)
+        compact_revisions(FolkloreRevision, since=timezone.now() - timedelta(days=1))
+        self.assertEqual(list(stored[0]), ["patch"])
+        self.assertEqual(FolkloreRevision.objects.get(id=revision.id).proposed_data, edited)
@@ -14,9 +14,7 @@ Troubleshooting:
 import json
 
 from django.core.exceptions import ValidationError
-from django.db.models import Q
 from django.http import Http404, JsonResponse
-from django.utils.html import strip_tags
 from django.views.decorators.http import require_GET, require_http_methods
 
 from folklore.models import (
@@ -27,23 +25,24 @@ from folklore.models import (
     FolkloreRevision,
     normalize_folklore_taxonomy,
 )
-from folklore.services import create_revision_from_entry, create_variant_from_entry
+from folklore.services import (
+    VISIBLE_PUBLIC_STATUSES,
+    approved_folklore_revisions,
+    contributor_folklore_revisions,
+    create_revision_from_entry,
+    create_variant_from_entry,
+    live_contributor_q,
+    public_folklore_entries,
+)
 from reviews.models import FolkloreReview
-from users.models import Notification
+from users.models import Notification, PublicContentVersion, PublicStatusCounter
 from users.names import display_name as formatted_display_name
 from users.names import normalize_username
 from users.notifications import notify
-
-VISIBLE_PUBLIC_STATUSES = [
-    FolkloreEntry.Status.APPROVED,
-    FolkloreEntry.Status.APPROVED_UNDER_REVIEW,
-]
-
-
-def _live_contributor_q(field_name):
-    return Q(**{f"{field_name}__profile__isnull": True}) | Q(
-        **{f"{field_name}__profile__show_live_contributions": True}
-    )
+from users.pagination import InvalidCursor, keyset_page
+from users.public_counters import cached_status_counts
+from users.public_versions import public_content_condition
+from users.roles import in_any_group
 
 
 def _public_username(user):
@@ -69,7 +68,7 @@ def _can_flag_live_entry(user):
         return False
     if user.is_superuser:
         return True
-    return user.groups.filter(name__in=["Contributor", "Reviewer", "Consultant", "Admin"]).exists()
+    return in_any_group(user, "Contributor", "Reviewer", "Consultant", "Admin")
 
 
 def _serialize_public_actor(user):
@@ -89,12 +88,13 @@ def _media_url(request, file_field):
 
 
 def _serialize_folklore_entry(entry: FolkloreEntry, request):
-    # Public-list/detail serializer for live folklore entry rows.
-    content_preview = " ".join(strip_tags(entry.content or "").split())
+    # Public-list serializer for live folklore entry rows. Reads the stored
+    # plain-text excerpt, so the list query can defer the rich-text content.
     return {
         "entry_id": str(entry.id),
         "title": entry.title,
-        "preview": content_preview[:180],
+        "preview": entry.excerpt,
+        "word_count": entry.word_count,
         "category": entry.category,
         "subcategory": entry.subcategory,
         "municipality_source": entry.municipality_source,
@@ -109,7 +109,7 @@ def _serialize_folklore_entry(entry: FolkloreEntry, request):
 def _is_entry_owner_or_admin(user, entry: FolkloreEntry) -> bool:
     if user.is_superuser:
         return True
-    if user.groups.filter(name="Admin").exists():
+    if in_any_group(user, "Admin"):
         return True
     return entry.contributor_id == user.id
 
@@ -171,7 +171,7 @@ def _serialize_folklore_media_asset(asset: FolkloreMediaAsset, request):
 def _is_reviewer_or_admin(user):
     if not user.is_authenticated:
         return False
-    return user.is_superuser or user.groups.filter(name__in=["Admin", "Reviewer"]).exists()
+    return user.is_superuser or in_any_group(user, "Admin", "Reviewer")
 
 
 def _published_variant_entries(entry: FolkloreEntry, request) -> list:
@@ -200,15 +200,7 @@ def _published_variant_entries(entry: FolkloreEntry, request) -> list:
 
 
 def _latest_approved_folklore_revision(entry: FolkloreEntry):
-    return (
-        FolkloreRevision.objects.filter(
-            entry=entry,
-            status=FolkloreRevision.Status.APPROVED,
-        )
-        .select_related("contributor", "contributor__profile")
-        .order_by("-approved_at", "-created_at")
-        .first()
-    )
+    return approved_folklore_revisions(entry).first()
 
 
 def _approval_actors_for_revision(revision):
@@ -338,29 +330,54 @@ def _invalid_choice_errors(data):
 
 
 @require_GET
+@public_content_condition(PublicContentVersion.Scope.FOLKLORE)
 def folklore_entries_list_view(request):
     """
     Public folklore listing.
 
     Rule quote: only publicly visible states are returned.
+
+    Pagination: `limit` (default 200, max 500) plus the `next_cursor` from the
+    previous page. `sort=alpha` (default) orders by title, `sort=recent` by
+    newest first.
     """
 
+    limit_raw = request.GET.get("limit", "200")
+    sort_mode = request.GET.get("sort", "alpha").strip().lower()
+    cursor = request.GET.get("cursor", "").strip()
+
+    try:
+        limit = int(limit_raw)
+    except ValueError:
+        return JsonResponse({"detail": "limit must be an integer."}, status=400)
+
+    limit = max(1, min(limit, 500))
     entries = (
-        FolkloreEntry.objects.filter(status__in=VISIBLE_PUBLIC_STATUSES)
-        .filter(_live_contributor_q("contributor"))
+        public_folklore_entries()
         .select_related("contributor", "contributor__profile")
-        .order_by("title")
+        .defer("content")
     )
+    # Folklore entries have no approval timestamp of their own; creation time
+    # is the stable "recent" key.
+    recent = sort_mode == "recent"
+    try:
+        rows, next_cursor = keyset_page(
+            entries,
+            field="created_at" if recent else "title",
+            descending=recent,
+            sort="recent" if recent else "alpha",
+            cursor=cursor,
+            limit=limit,
+        )
+    except InvalidCursor as exc:
+        return JsonResponse({"detail": str(exc)}, status=400)
+
     return JsonResponse(
         {
-            "rows": [_serialize_folklore_entry(entry, request) for entry in entries],
-            "counts": {
-                "visible_total": entries.count(),
-                "approved": entries.filter(status=FolkloreEntry.Status.APPROVED).count(),
-                "approved_under_review": entries.filter(
-                    status=FolkloreEntry.Status.APPROVED_UNDER_REVIEW
-                ).count(),
-            },
+            "rows": [_serialize_folklore_entry(entry, request) for entry in rows],
+            # Header comes from maintained counters instead of three COUNT(*) queries.
+            "counts": cached_status_counts(PublicStatusCounter.Scope.FOLKLORE),
+            "next_cursor": next_cursor,
         }
     )
 
@@ -371,7 +388,7 @@ def my_folklore_entries_view(request):
     if auth_error:
         return auth_error
 
-    revisions = FolkloreRevision.objects.filter(contributor=request.user).order_by("-created_at")
+    revisions = contributor_folklore_revisions(request.user)
     return JsonResponse(
         {"rows": [_serialize_folklore_revision(revision, request) for revision in revisions]}
     )
@@ -677,11 +694,12 @@ def delete_folklore_revision_view(request, revision_id):
 
 
 @require_GET
+@public_content_condition(PublicContentVersion.Scope.FOLKLORE)
 def folklore_entry_detail_view(request, entry_id):
     try:
         entry = (
             FolkloreEntry.objects.select_related("contributor", "contributor__profile")
-            .filter(_live_contributor_q("contributor"))
+            .filter(live_contributor_q("contributor"))
             .get(
                 id=entry_id,
                 status__in=VISIBLE_PUBLIC_STATUSES,
@@ -825,7 +843,7 @@ def folklore_comment_delete_view(request, comment_id):
     except FolkloreComment.DoesNotExist:
         return JsonResponse({"detail": "Comment not found."}, status=404)
 
-    is_admin = request.user.is_superuser or request.user.groups.filter(name__in=["Admin"]).exists()
+    is_admin = request.user.is_superuser or in_any_group(request.user, "Admin")
     if comment.author_id != request.user.id and not is_admin:
         return JsonResponse({"detail": "You can only delete your own comments."}, status=403)
 
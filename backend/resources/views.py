@@ -6,6 +6,9 @@ from django.http import FileResponse, Http404, JsonResponse
 from django.views.decorators.http import require_GET, require_http_methods
 
 from resources.models import ResourceDocument
+from users.models import PublicContentVersion
+from users.public_versions import public_content_condition
+from users.roles import in_any_group
 
 PRIVILEGED_GROUPS = ["Admin", "Reviewer", "Consultant"]
 
@@ -13,7 +16,7 @@ PRIVILEGED_GROUPS = ["Admin", "Reviewer", "Consultant"]
 def _is_admin(user):
     if not user.is_authenticated:
         return False
-    return user.is_superuser or user.groups.filter(name="Admin").exists()
+    return user.is_superuser or in_any_group(user, "Admin")
 
 
 def _can_view(resource, user):
@@ -26,7 +29,7 @@ def _can_view(resource, user):
         return True
     if user.is_superuser:
         return True
-    return user.groups.filter(name__in=PRIVILEGED_GROUPS).exists()
+    return in_any_group(user, *PRIVILEGED_GROUPS)
 
 
 def _resource_payload(resource):
@@ -45,6 +48,7 @@ def _resource_payload(resource):
 
 
 @require_GET
+@public_content_condition(PublicContentVersion.Scope.RESOURCES)
 def resources_list_view(request):
     rows = []
     for resource in ResourceDocument.objects.filter(is_published=True):
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0022_hot_query_indexes'),
+        ('folklore', '0011_hot_query_indexes'),
+        ('reviews', '0006_alter_folklorereview_decision_alter_review_decision_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='folklorereview',
+            index=models.Index(fields=['folklore_revision', 'decision', 'review_round'], name='folk_review_rev_decision_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='folklorereview',
+            index=models.Index(fields=['reviewer', '-created_at'], name='folk_review_reviewer_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['revision', 'decision', 'review_round'], name='review_rev_decision_round_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['reviewer', '-created_at'], name='review_reviewer_created_idx'),
+        ),
+    ]
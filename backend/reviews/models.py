@@ -66,6 +66,15 @@ class Review(models.Model):
                 name="uniq_review_reviewer_per_round",
             ),
         ]
+        indexes = [
+            # submit_review: approvals / flags for one revision and round.
+            models.Index(
+                fields=["revision", "decision", "review_round"],
+                name="review_rev_decision_round_idx",
+            ),
+            # Reviewer dashboard "my reviews" and gamification counters.
+            models.Index(fields=["reviewer", "-created_at"], name="review_reviewer_created_idx"),
+        ]
         ordering = ["created_at"]
 
     def __str__(self):
@@ -172,6 +181,16 @@ class FolkloreReview(models.Model):
                 name="uniq_folklore_review_reviewer_per_round",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["folklore_revision", "decision", "review_round"],
+                name="folk_review_rev_decision_idx",
+            ),
+            models.Index(
+                fields=["reviewer", "-created_at"],
+                name="folk_review_reviewer_idx",
+            ),
+        ]
         ordering = ["created_at"]
 
     def __str__(self):
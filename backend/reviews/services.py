@@ -33,9 +33,11 @@ from folklore.services import (
 from folklore.services import (
     transition_folklore_status,
 )
+from reviews.queues import flag_reviews, folklore_flag_reviews
 from users.contributions import award_dictionary_term, award_folklore_entry, award_revision
 from users.models import Notification
 from users.notifications import notify
+from users.roles import in_any_group
 
 from .models import CorrectionAssignment, FolkloreReview, Review, ReviewAdminOverride
 
@@ -53,18 +55,16 @@ FLAGGER_GROUPS = ("Contributor", "Reviewer", "Consultant", "Admin")
 
 def is_admin(user):
     """Return True if user is admin (superuser OR Admin group)."""
-    return user.is_superuser or user.groups.filter(name=ADMIN_GROUP).exists()
+    return user.is_superuser or in_any_group(user, ADMIN_GROUP)
 
 
 def is_reviewer(user):
     """Return True for reviewer-level validation roles."""
-    return user.groups.filter(name__in=[REVIEWER_GROUP, "Consultant"]).exists()
+    return in_any_group(user, REVIEWER_GROUP, "Consultant")
 
 
 def can_flag_live_entry(user):
-    return user.is_authenticated and (
-        user.is_superuser or user.groups.filter(name__in=FLAGGER_GROUPS).exists()
-    )
+    return user.is_authenticated and (user.is_superuser or in_any_group(user, *FLAGGER_GROUPS))
 
 
 def _correction_assignee(username):
@@ -219,23 +219,12 @@ def _return_folklore_for_fixing(
 
 def _latest_flag_review(revision: EntryRevision):
     # Re-review decisions are scoped to the latest flag round.
-    return (
-        Review.objects.filter(revision=revision, decision=Review.Decision.FLAG)
-        .order_by("-review_round", "-created_at")
-        .first()
-    )
+    return flag_reviews(revision).first()
 
 
 def _latest_folklore_flag_review(revision: FolkloreRevision):
     # Folklore equivalent of the dictionary flag lookup.
-    return (
-        FolkloreReview.objects.filter(
-            folklore_revision=revision,
-            decision=FolkloreReview.Decision.FLAG,
-        )
-        .order_by("-review_round", "-created_at")
-        .first()
-    )
+    return folklore_flag_reviews(revision).first()
 
 
 def _dictionary_revision_title(revision):
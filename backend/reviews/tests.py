@@ -407,6 +407,24 @@ class ReviewerDashboardApiTests(TestCase):
             status=EntryRevision.Status.PENDING,
         )
 
+    def test_pending_new_term_lists_live_entries_with_the_same_headword(self):
+        live = Entry.objects.create(
+            term="Vahay",
+            status=EntryStatus.APPROVED,
+            initial_contributor=self.contributor,
+        )
+        self._pending_revision(contributor=self.contributor, term="vahay ")
+        self._pending_revision(contributor=self.contributor, term="vakul")
+        self.client.force_login(self.reviewer1)
+
+        response = self.client.get("/api/reviews/dashboard")
+
+        pending = {row["term"]: row for row in response.json()["pending_submissions"]}
+        self.assertEqual(
+            [match["id"] for match in pending["vahay "]["existing_entries"]], [str(live.id)]
+        )
+        self.assertEqual(pending["vakul"]["existing_entries"], [])
+
     def test_dashboard_requires_reviewer_or_admin_role(self):
         self.client.force_login(self.regular_user)
         response = self.client.get("/api/reviews/dashboard")
@@ -1381,3 +1399,93 @@ class FolkloreReviewFlowTests(TestCase):
         )
         self.assertEqual(response.status_code, 400)
         self.assertIn("Invalid revision_id UUID", response.json()["detail"])
+
+
+class RevisionDiffApiTests(TestCase):
+    def setUp(self):
+        reviewer_group, _ = Group.objects.get_or_create(name="Reviewer")
+        self.contributor = User.objects.create_user(
+            username="diff_contributor",
+            password="testpass123",
+        )
+        self.reviewer = User.objects.create_user(username="diff_reviewer", password="testpass123")
+        self.reviewer.groups.add(reviewer_group)
+        self.content = "<p>Long ago the people of Itbayat told this story.</p>" * 8
+        self.entry = FolkloreEntry.objects.create(
+            title="Kapayvanuvanua",
+            content=self.content,
+            category=FolkloreEntry.Category.MYTH,
+            municipality_source="Basco",
+            source="Oral account",
+            contributor=self.contributor,
+            status=FolkloreEntry.Status.APPROVED,
+        )
+        self.revision = FolkloreRevision.objects.create(
+            entry=self.entry,
+            contributor=self.contributor,
+            proposed_data={
+                "title": "Kapayvanuvanua",
+                "content": self.content.replace("Itbayat", "Sabtang", 1),
+            },
+            status=FolkloreRevision.Status.PENDING,
+        )
+
+    def _url(self, revision_id, target="folklore"):
+        return f"/api/reviews/{target}/revisions/{revision_id}/diff"
+
+    def test_diff_requires_reviewer_or_admin_role(self):
+        self.client.force_login(self.contributor)
+        response = self.client.get(self._url(self.revision.id))
+        self.assertEqual(response.status_code, 403)
+
+    def test_diff_against_live_entry_returns_text_ops_for_long_fields(self):
+        self.client.force_login(self.reviewer)
+        response = self.client.get(self._url(self.revision.id))
+
+        self.assertEqual(response.status_code, 200)
+        changes = response.json()["changes"]
+        self.assertNotIn("title", changes)
+        ops = changes["content"]["ops"]
+        self.assertIn(["-", "Itbayat "], ops)
+        self.assertIn(["+", "Sabtang "], ops)
+        self.assertLess(len(json.dumps(ops)), len(self.content))
+
+    def test_diff_against_another_revision_of_the_same_entry(self):
+        later = FolkloreRevision.objects.create(
+            entry=self.entry,
+            contributor=self.contributor,
+            proposed_data={**self.revision.proposed_data, "title": "Kapayvanuvanua II"},
+            status=FolkloreRevision.Status.PENDING,
+        )
+        self.client.force_login(self.reviewer)
+
+        response = self.client.get(self._url(later.id), {"against": str(self.revision.id)})
+
+        self.assertEqual(
+            response.json()["changes"],
+            {"title": {"before": "Kapayvanuvanua", "after": "Kapayvanuvanua II"}},
+        )
+        self.assertEqual(
+            self.client.get(self._url(later.id), {"against": "latest"}).status_code, 400
+        )
+
+    def test_dictionary_diff_of_new_term_lists_every_field(self):
+        revision = EntryRevision.objects.create(
+            contributor=self.contributor,
+            proposed_data={"term": "vahay", "meaning": "house"},
+            status=EntryRevision.Status.PENDING,
+        )
+        self.client.force_login(self.reviewer)
+
+        response = self.client.get(self._url(revision.id, target="dictionary"))
+
+        self.assertEqual(
+            response.json()["changes"],
+            {
+                "meaning": {"before": None, "after": "house"},
+                "term": {"before": None, "after": "vahay"},
+            },
+        )
+        self.assertEqual(
+            self.client.get(self._url(self.revision.id, target="dictionary")).status_code, 404
+        )
@@ -5,6 +5,7 @@ Review governance endpoints:
 - reviewer dashboard
 - decision submission
 - admin override
+- revision diffs
 """
 
 from django.urls import path
@@ -12,6 +13,8 @@ from django.urls import path
 from reviews.views import (
     admin_archive_entries_view,
     admin_override_view,
+    dictionary_revision_diff_view,
+    folklore_revision_diff_view,
     reviewer_dashboard_view,
     submit_dictionary_review_view,
     submit_folklore_review_view,
@@ -31,4 +34,14 @@ urlpatterns = [
         submit_folklore_review_view,
         name="submit_folklore_review",
     ),
+    path(
+        "api/reviews/dictionary/revisions/<uuid:revision_id>/diff",
+        dictionary_revision_diff_view,
+        name="dictionary_revision_diff",
+    ),
+    path(
+        "api/reviews/folklore/revisions/<uuid:revision_id>/diff",
+        folklore_revision_diff_view,
+        name="folklore_revision_diff",
+    ),
 ]
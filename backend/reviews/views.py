@@ -9,6 +9,7 @@ Design intent:
 """
 
 import json
+import uuid
 
 from django.core.exceptions import ValidationError
 from django.core.files.storage import default_storage
@@ -17,8 +18,24 @@ from django.http import JsonResponse
 from django.views.decorators.http import require_GET, require_POST
 
 from dictionary.models import Entry, EntryRevision, EntryStatus
+from dictionary.services import find_live_headwords
+from dictionary.services import snapshot_entry as snapshot_dictionary_entry
+from dictionary.text import headword_key
 from folklore.models import FolkloreEntry, FolkloreRevision
+from folklore.services import snapshot_entry as snapshot_folklore_entry
 from reviews.models import FolkloreReview, Review, ReviewAdminOverride
+from reviews.queues import (
+    flag_reviews,
+    folklore_flag_reviews,
+    folklore_rereview_queue,
+    folklore_reviews_by,
+    folklore_round_approvals,
+    pending_folklore_queue,
+    pending_revision_queue,
+    rereview_queue,
+    reviews_by,
+    round_approvals,
+)
 from reviews.services import (
     admin_override_dictionary_entry,
     admin_override_folklore_entry,
@@ -28,6 +45,7 @@ from reviews.services import (
     submit_review,
 )
 from users.names import normalize_username
+from users.revision_storage import snapshot_diff
 
 
 def _stored_media_url(request, stored_path):
@@ -129,33 +147,18 @@ def _active_rereview_round(revision: EntryRevision):
     Return the currently active re-review round for a revision.
     If no flag exists, there is no active re-review round.
     """
-    latest_flag = (
-        Review.objects.filter(revision=revision, decision=Review.Decision.FLAG)
-        .order_by("-review_round", "-created_at")
-        .first()
-    )
+    latest_flag = flag_reviews(revision).first()
     return latest_flag.review_round if latest_flag else None
 
 
 def _active_folklore_rereview_round(revision: FolkloreRevision):
-    latest_flag = (
-        FolkloreReview.objects.filter(
-            folklore_revision=revision,
-            decision=FolkloreReview.Decision.FLAG,
-        )
-        .order_by("-review_round", "-created_at")
-        .first()
-    )
+    latest_flag = folklore_flag_reviews(revision).first()
     return latest_flag.review_round if latest_flag else None
 
 
 def _approval_sets_for_round(revision: EntryRevision, round_number: int):
     # Quorum depends on reviewer/admin composition, so we split sets by role.
-    approvals = Review.objects.filter(
-        revision=revision,
-        review_round=round_number,
-        decision=Review.Decision.APPROVE,
-    )
+    approvals = round_approvals(revision, round_number)
     reviewer_ids = set()
     admin_ids = set()
     for row in approvals:
@@ -170,11 +173,7 @@ def _folklore_approval_sets_for_round(
     revision: FolkloreRevision,
     round_number: int,
 ):
-    approvals = FolkloreReview.objects.filter(
-        folklore_revision=revision,
-        review_round=round_number,
-        decision=FolkloreReview.Decision.APPROVE,
-    )
+    approvals = folklore_round_approvals(revision, round_number)
     reviewer_ids = set()
     admin_ids = set()
     for row in approvals:
@@ -242,13 +241,7 @@ def _serialize_pending_revision(revision: EntryRevision, request=None):
                 if item.contributor_id
             }
         )
-        latest_flag = (
-            revision.reviews.filter(
-                decision=Review.Decision.FLAG,
-            )
-            .order_by("-review_round", "-created_at")
-            .first()
-        )
+        latest_flag = flag_reviews(revision).first()
         payload["flag_notes"] = latest_flag.notes if latest_flag else ""
     return payload
 
@@ -313,13 +306,7 @@ def _serialize_pending_folklore(revision: FolkloreRevision, request=None):
                 if item.contributor_id
             }
         )
-        latest_flag = (
-            revision.reviews.filter(
-                decision=FolkloreReview.Decision.FLAG,
-            )
-            .order_by("-review_round", "-created_at")
-            .first()
-        )
+        latest_flag = folklore_flag_reviews(revision).first()
         payload["flag_notes"] = latest_flag.notes if latest_flag else ""
     return payload
 
@@ -448,59 +435,29 @@ def reviewer_dashboard_view(request):
 
     # 1) Pending initial submissions (revision.status = pending)
     # Queue view excludes items the current reviewer/admin already reviewed in this round.
-    pending_initial_qs = EntryRevision.objects.filter(
-        status=EntryRevision.Status.PENDING,
-    ).select_related("contributor", "contributor__profile", "entry")
-    pending_initial_qs = pending_initial_qs.exclude(contributor=user)
-    pending_initial_qs = (
-        pending_initial_qs.exclude(
-            reviews__reviewer=user,
-            reviews__review_round=0,
-        )
-        .exclude(
-            reviews__decision=Review.Decision.REJECT,
-            reviews__review_round=0,
-        )
-        .order_by("-created_at")
+    pending_initial_revisions = list(pending_revision_queue(user))
+    # New-term submissions that would duplicate a live headword, in one query.
+    live_headwords = find_live_headwords(
+        (rev.proposed_data or {}).get("term", "")
+        for rev in pending_initial_revisions
+        if not rev.entry_id
     )
+    pending_initial = []
+    for rev in pending_initial_revisions:
+        item = _serialize_pending_revision(rev, request=request)
+        if not rev.entry_id:
+            item["existing_entries"] = live_headwords.get(headword_key(item["term"]), [])
+        pending_initial.append(item)
 
-    pending_initial = [
-        _serialize_pending_revision(rev, request=request) for rev in pending_initial_qs
-    ]
-
-    pending_folklore_qs = FolkloreRevision.objects.filter(
-        status=FolkloreRevision.Status.PENDING
-    ).select_related("contributor", "contributor__profile", "entry")
-    pending_folklore_qs = pending_folklore_qs.exclude(contributor=user)
-    pending_folklore_qs = (
-        pending_folklore_qs.exclude(
-            reviews__reviewer=user,
-            reviews__review_round=0,
-        )
-        .exclude(
-            reviews__decision=FolkloreReview.Decision.REJECT,
-            reviews__review_round=0,
-        )
-        .order_by("-created_at")
-    )
     pending_folklore = [
-        _serialize_pending_folklore(revision, request=request) for revision in pending_folklore_qs
+        _serialize_pending_folklore(revision, request=request)
+        for revision in pending_folklore_queue(user)
     ]
 
     # 2) Pending re-review queue:
     # entry is publicly visible but under review, and revision is approved.
-    pending_rereview_qs = (
-        EntryRevision.objects.filter(
-            status=EntryRevision.Status.APPROVED,
-            entry__status=EntryStatus.APPROVED_UNDER_REVIEW,
-        )
-        .select_related("contributor", "contributor__profile", "entry")
-        .exclude(contributor=user)
-        .order_by("-approved_at", "-created_at")
-        .distinct()
-    )
     pending_rereview = []
-    for rev in pending_rereview_qs:
+    for rev in rereview_queue(user):
         current_round = _active_rereview_round(rev)
         if not current_round:
             continue
@@ -514,20 +471,10 @@ def reviewer_dashboard_view(request):
         item["review_round"] = current_round
         pending_rereview.append(item)
 
-    pending_folklore_rereview_qs = FolkloreRevision.objects.filter(
-        status=FolkloreRevision.Status.APPROVED,
-        entry__status=FolkloreEntry.Status.APPROVED_UNDER_REVIEW,
-    ).select_related("contributor", "contributor__profile", "entry")
-    pending_folklore_rereview_qs = pending_folklore_rereview_qs.exclude(contributor=user).order_by(
-        "-approved_at", "-created_at"
-    )
     pending_folklore_rereview = []
-    for revision in pending_folklore_rereview_qs:
+    for revision in folklore_rereview_queue(user):
         current_round = (
-            revision.reviews.filter(decision=FolkloreReview.Decision.FLAG)
-            .order_by("-review_round", "-created_at")
-            .values_list("review_round", flat=True)
-            .first()
+            folklore_flag_reviews(revision).values_list("review_round", flat=True).first()
         )
         if not current_round:
             continue
@@ -551,14 +498,7 @@ def reviewer_dashboard_view(request):
     )
 
     # 3) My reviews + outcomes
-    my_reviews_qs = (
-        Review.objects.filter(reviewer=user)
-        .select_related(
-            "revision",
-            "revision__entry",
-        )
-        .order_by("-created_at")
-    )
+    my_reviews_qs = reviews_by(user)
     my_reviews = [_serialize_review(r) for r in my_reviews_qs]
 
     # 4) Read-only status rows after this user approved but quorum is still open.
@@ -615,17 +555,7 @@ def reviewer_dashboard_view(request):
         )
         awaiting_dictionary_quorum.append(item)
 
-    my_folklore_reviews_qs = (
-        FolkloreReview.objects.filter(
-            reviewer=user,
-        )
-        .select_related(
-            "folklore_revision",
-            "folklore_revision__entry",
-            "folklore_revision__contributor",
-        )
-        .order_by("-created_at")
-    )
+    my_folklore_reviews_qs = folklore_reviews_by(user)
     awaiting_folklore_quorum = []
     for review in my_folklore_reviews_qs.filter(
         decision=FolkloreReview.Decision.APPROVE,
@@ -783,6 +713,72 @@ def admin_archive_entries_view(request):
     )
 
 
+def _revision_diff_response(request, *, model, revision_id, snapshot_entry):
+    """
+    Field-level diff of one revision against the live entry or another revision.
+
+    `?against=live` (default) compares with the entry as the public sees it
+    (an empty snapshot for new-entry submissions); `?against=<revision_id>`
+    compares with another revision of the same entry.
+    """
+
+    user = request.user
+    if not user.is_authenticated:
+        return JsonResponse({"detail": "Authentication required."}, status=401)
+    if not (is_reviewer(user) or is_admin(user)):
+        return JsonResponse({"detail": "Reviewer or admin access required."}, status=403)
+
+    revision = model.objects.select_related("entry").filter(id=revision_id).first()
+    if revision is None:
+        return JsonResponse({"detail": "Revision not found."}, status=404)
+
+    against = str(request.GET.get("against", "live") or "live").strip()
+    if against == "live":
+        before = snapshot_entry(revision.entry) if revision.entry else {}
+    else:
+        try:
+            against_id = uuid.UUID(against)
+        except ValueError:
+            return JsonResponse(
+                {"detail": "against must be 'live' or a revision UUID."}, status=400
+            )
+        base = model.objects.filter(id=against_id).first()
+        if base is None or base.entry_id is None or base.entry_id != revision.entry_id:
+            return JsonResponse(
+                {"detail": "Comparison revision not found for this entry."}, status=404
+            )
+        before = base.proposed_data
+
+    return JsonResponse(
+        {
+            "revision_id": str(revision.id),
+            "entry_id": str(revision.entry_id) if revision.entry_id else None,
+            "against": against,
+            "changes": snapshot_diff(before, revision.proposed_data),
+        }
+    )
+
+
+@require_GET
+def dictionary_revision_diff_view(request, revision_id):
+    return _revision_diff_response(
+        request,
+        model=EntryRevision,
+        revision_id=revision_id,
+        snapshot_entry=snapshot_dictionary_entry,
+    )
+
+
+@require_GET
+def folklore_revision_diff_view(request, revision_id):
+    return _revision_diff_response(
+        request,
+        model=FolkloreRevision,
+        revision_id=revision_id,
+        snapshot_entry=snapshot_folklore_entry,
+    )
+
+
 @require_POST
 def admin_override_view(request):
     # High-authority endpoint: admin-only state override for disputed entries.
@@ -3,6 +3,7 @@ from django.contrib import admin
 from users.models import (
     ContributionEvent,
     GamificationConfig,
+    GamificationRecomputeJob,
     GamificationRuntimeState,
     MunicipalityMonthlyWinner,
     MunicipalityStats,
@@ -175,6 +176,16 @@ class GamificationRuntimeStateAdmin(admin.ModelAdmin):
     readonly_fields = ("updated_at",)
 
 
+@admin.register(GamificationRecomputeJob)
+class GamificationRecomputeJobAdmin(admin.ModelAdmin):
+    """Queued per-user recomputes; rows with attempts > 0 failed at least once."""
+
+    list_display = ("user", "run_after", "request_count", "attempts", "updated_at")
+    list_filter = ("attempts",)
+    search_fields = ("user__username", "last_error")
+    readonly_fields = ("created_at", "updated_at")
+
+
 @admin.register(MunicipalityMonthlyWinner)
 class MunicipalityMonthlyWinnerAdmin(admin.ModelAdmin):
     """Monthly winners table by metric (dictionary / folklore / combined)."""
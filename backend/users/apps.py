@@ -1,4 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def _bump_public_content_versions(**kwargs):
+    from django.db import DatabaseError
+
+    from users.public_versions import bump_all_public_content_versions
+
+    try:
+        bump_all_public_content_versions()
+    except DatabaseError:
+        # Migrated backwards past the PublicContentVersion table: nothing to bump.
+        pass
 
 
 class UsersConfig(AppConfig):
@@ -18,3 +31,7 @@ class UsersConfig(AppConfig):
         # registers signal receivers (post_save hooks).
         # Without this line, event-driven gamification recompute will not trigger.
         from users import signals  # noqa: F401
+
+        # A deploy can change payload shapes without touching any row, so every
+        # migrate invalidates the public ETags (users/public_versions.py).
+        post_migrate.connect(_bump_public_content_versions, sender=self)
@@ -0,0 +1,59 @@
+"""
+users/cache.py
+
+Per-process caches for small, rarely-changing rows read on hot paths
+(gamification rules, site settings).
+
+How invalidation works across gunicorn workers:
+- Each worker keeps its own copy plus the "version" it was loaded at.
+- After `PROCESS_CACHE_TTL_SECONDS` the worker re-reads only the version
+  (one cheap query) and reloads the value if it changed.
+- The worker that saves the row clears its copy immediately via a model signal,
+  so admins see their own change at once; other workers follow within the TTL.
+
+Troubleshooting:
+- A config change is not picked up: wait for the TTL or restart the workers,
+  then check that the model's save signal still calls `clear()`.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+
+DEFAULT_TTL_SECONDS = 30
+
+
+class VersionedTTLCache:
+    """
+    Cache `loader()` per process, revalidated against `version()` after a TTL.
+    """
+
+    def __init__(self, *, loader, version):
+        self._loader = loader
+        self._version = version
+        self._lock = threading.Lock()
+        self._entry = None  # (value, version, expires_at)
+
+    def _ttl_seconds(self):
+        return getattr(settings, "PROCESS_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+
+    def get(self):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entry
+        if entry is not None and now < entry[2]:
+            return entry[0]
+
+        version = self._version()
+        if entry is not None and entry[1] == version:
+            value = entry[0]
+        else:
+            value = self._loader()
+        with self._lock:
+            self._entry = (value, version, now + self._ttl_seconds())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entry = None
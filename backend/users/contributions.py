@@ -39,6 +39,28 @@ def award_dictionary_term(*, user, entry, revision=None):
     )
 
 
+def bulk_award_dictionary_terms(*, user, entries_with_revisions):
+    """
+    `award_dictionary_term` for freshly imported entries, in one INSERT.
+
+    Only for entries created in the same transaction (no existing credit is
+    possible). bulk_create skips post_save, so no recompute job is queued;
+    the caller recomputes gamification once when it is done.
+    """
+
+    return ContributionEvent.objects.bulk_create(
+        [
+            ContributionEvent(
+                user=user,
+                dictionary_entry=entry,
+                contribution_type=ContributionEvent.Type.DICTIONARY_TERM,
+                entry_revision=revision,
+            )
+            for entry, revision in entries_with_revisions
+        ]
+    )
+
+
 def award_folklore_entry(*, user, entry):
     """
     Award first-time folklore contribution credit.
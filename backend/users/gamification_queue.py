@@ -0,0 +1,146 @@
+"""
+users/gamification_queue.py
+
+Purpose:
+- Move gamification recompute out of the request that triggered it.
+- Coalesce bursts: N saves for one user within the debounce window cost one recompute.
+
+How it works:
+1) Signals call `request_gamification_recompute(user_id)`. That writes (or bumps)
+   one GamificationRecomputeJob row in the same transaction as the save, so a
+   rolled-back request never leaves a job behind and a committed one never loses it.
+   Every bump pushes `run_after` back by the debounce window, capped at
+   GAMIFICATION_RECOMPUTE_MAX_WAIT_SECONDS after the first request so a user
+   who never stops saving is still recomputed.
+2) `manage.py process_gamification_queue` claims due jobs, deletes each row and
+   runs `recompute_user_gamification` in one transaction per user. Each pass
+   first runs the month rollover, so monthly boards reset without a request.
+3) A failed recompute keeps its row, records the error and retries with backoff.
+
+Inline mode (default):
+- `GAMIFICATION_RECOMPUTE_ASYNC=False` recomputes immediately. Turn async on
+  only once `process_gamification_queue` runs on a schedule, or stats never update.
+
+Troubleshooting:
+- Stats lag behind approvals: make sure the worker is running, then check
+  `last_error` on GamificationRecomputeJob rows in admin.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Least
+from django.utils import timezone
+
+from users.leaderboard import refresh_user_leaderboard_ranks
+from users.models import GamificationRecomputeJob
+from users.recognition import recompute_user_gamification, run_month_rollover
+
+MAX_RETRY_DELAY_SECONDS = 3600
+
+
+def request_gamification_recompute(user_id) -> None:
+    """
+    Schedule (or, in inline mode, run) a gamification recompute for one user.
+    """
+
+    if not user_id:
+        return
+    if not getattr(settings, "GAMIFICATION_RECOMPUTE_ASYNC", False):
+        user = get_user_model().objects.filter(pk=user_id).first()
+        if user is not None:
+            recompute_user_gamification(user)
+        return
+
+    now = timezone.now()
+    run_after = now + timedelta(
+        seconds=getattr(settings, "GAMIFICATION_RECOMPUTE_DEBOUNCE_SECONDS", 30)
+    )
+    max_wait = timedelta(seconds=getattr(settings, "GAMIFICATION_RECOMPUTE_MAX_WAIT_SECONDS", 300))
+    bump = {
+        "request_count": F("request_count") + 1,
+        # Jobs that already failed keep their retry backoff.
+        "run_after": Case(
+            When(attempts=0, then=Least(Value(run_after), F("created_at") + max_wait)),
+            default=F("run_after"),
+        ),
+    }
+    if GamificationRecomputeJob.objects.filter(user_id=user_id).update(**bump):
+        return
+
+    try:
+        # Savepoint: a concurrent request may insert the same user's row first.
+        with transaction.atomic():
+            GamificationRecomputeJob.objects.create(user_id=user_id, run_after=run_after)
+    except IntegrityError:
+        GamificationRecomputeJob.objects.filter(user_id=user_id).update(**bump)
+
+
+def request_leaderboard_refresh(user_id) -> None:
+    """
+    Re-rank one user after an eligibility or display change.
+
+    Queued like a recompute when async (the recompute ends by re-ranking), so
+    account and profile saves never wait on the leaderboard lock.
+    """
+
+    if not user_id:
+        return
+    if not getattr(settings, "GAMIFICATION_RECOMPUTE_ASYNC", False):
+        refresh_user_leaderboard_ranks(user_id)
+        return
+    request_gamification_recompute(user_id)
+
+
+def _retry_delay_seconds(attempts) -> int:
+    return min(60 * 2 ** max(attempts - 1, 0), MAX_RETRY_DELAY_SECONDS)
+
+
+def process_gamification_jobs(*, limit=100, now=None) -> dict:
+    """
+    Run due recompute jobs. Returns `{"processed": n, "failed": n}`.
+
+    `now` lets tests (and `--all`) treat every queued job as due.
+    """
+
+    run_month_rollover()
+    now = now or timezone.now()
+    due_ids = list(
+        GamificationRecomputeJob.objects.filter(run_after__lte=now)
+        .order_by("run_after", "id")
+        .values_list("id", flat=True)[:limit]
+    )
+
+    processed = 0
+    failed = 0
+    for job_id in due_ids:
+        try:
+            with transaction.atomic():
+                # skip_locked lets several workers share the queue on PostgreSQL.
+                job = (
+                    GamificationRecomputeJob.objects.select_for_update(skip_locked=True)
+                    .select_related("user")
+                    .filter(id=job_id, run_after__lte=now)
+                    .first()
+                )
+                if job is None:
+                    continue
+                user = job.user
+                # Delete first: saves committed after this point enqueue a fresh job.
+                job.delete()
+                recompute_user_gamification(user)
+            processed += 1
+        except Exception as exc:
+            failed += 1
+            job = GamificationRecomputeJob.objects.filter(id=job_id).first()
+            if job is None:
+                continue
+            job.attempts += 1
+            job.last_error = str(exc)[:2000]
+            job.run_after = timezone.now() + timedelta(seconds=_retry_delay_seconds(job.attempts))
+            job.save(update_fields=["attempts", "last_error", "run_after", "updated_at"])
+
+    return {"processed": processed, "failed": failed}
@@ -0,0 +1,318 @@
+"""
+users/leaderboard.py
+
+Purpose:
+- Keep LeaderboardRank rows (one per user per board) in rank order.
+- Serve top-N and "around me" windows as single range reads on `rank`.
+
+Boards:
+- metric: dictionary / folklore / combined
+- period: all_time / monthly
+- scope: "" (global) or a lower-cased municipality
+
+How rows stay correct:
+- `refresh_user_leaderboard_ranks(user_id)` re-places one user in every board
+  they belong to. Moving a row only shifts the ranks between its old and new
+  position, so the rest of the board is untouched. All boards share one count
+  query and one shift UPDATE; the user's rows are written in bulk.
+- Called after a user's stats are recomputed. Eligibility and display changes
+  (groups, profile, account fields) go through `request_leaderboard_refresh`
+  (users/gamification_queue.py): queued when the worker runs, so request
+  handlers never take the board lock; inline otherwise.
+- Ties are ordered by user id, in the database (`_new_ranks`) and in
+  Python (`rebuild_leaderboard_ranks`) alike; usernames would depend on the
+  database collation.
+- Monthly boards are rebuilt once per month by the month rollover
+  (users/recognition.py), which the queue worker checks on every pass and
+  the first recompute of the month runs inline. Until then reads return no
+  monthly rows rather than last month's ranking.
+- Every change bumps the "leaderboard" PublicContentVersion, which drives the
+  leaderboard views' ETag (users/public_versions.py).
+
+Troubleshooting:
+- Ranks look wrong or have gaps: run `manage.py rebuild_leaderboard`.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Case, Count, F, PositiveIntegerField, Q, When
+from django.utils import timezone
+
+from users.leaderboard_filters import leaderboard_participant_q
+from users.models import GamificationRuntimeState, LeaderboardRank, PublicContentVersion
+from users.names import display_name as formatted_display_name
+from users.public_versions import bump_public_content_version
+
+User = get_user_model()
+
+# (metric, period) -> UserContributionStats field.
+BOARD_FIELDS = {
+    ("dictionary", "all_time"): "dictionary_original_total",
+    ("folklore", "all_time"): "folklore_original_total",
+    ("combined", "all_time"): "combined_total",
+    ("dictionary", "monthly"): "dictionary_month",
+    ("folklore", "monthly"): "folklore_month",
+    ("combined", "monthly"): "combined_month",
+}
+
+# Columns rewritten when a user's existing row moves or changes.
+ROW_FIELDS = (
+    "rank",
+    "value",
+    "month_key",
+    "username",
+    "display_name",
+    "municipality",
+    "profile_photo",
+    "dictionary_total",
+    "folklore_total",
+    "combined_total",
+    "review_completed_total",
+    "updated_at",
+)
+
+
+def municipality_scope(municipality) -> str:
+    # Municipality boards used to filter with iexact; the scope key mirrors that.
+    return str(municipality or "").strip().lower()
+
+
+def _current_month_key():
+    return timezone.now().strftime("%Y-%m")
+
+
+def _lock_boards():
+    # Serializes rank shifting across workers (SQLite already serializes writes).
+    GamificationRuntimeState.objects.get_or_create(key="leaderboard")
+    GamificationRuntimeState.objects.select_for_update().get(key="leaderboard")
+
+
+def _board_rows(user, month_key):
+    """
+    Unsaved LeaderboardRank rows (without rank) for every board `user` belongs to.
+    """
+
+    profile = getattr(user, "profile", None)
+    stats = getattr(user, "contribution_stats", None)
+    monthly_is_current = bool(stats) and stats.last_month_calculated == month_key
+    municipality = profile.municipality if profile else ""
+    scopes = [""]
+    if municipality_scope(municipality):
+        scopes.append(municipality_scope(municipality))
+
+    payload = {
+        "user_id": user.id,
+        "username": user.username,
+        "display_name": formatted_display_name(user, profile),
+        "municipality": municipality,
+        "profile_photo": profile.profile_photo.name if profile and profile.profile_photo else "",
+        "dictionary_total": stats.dictionary_original_total if stats else 0,
+        "folklore_total": stats.folklore_original_total if stats else 0,
+        "combined_total": stats.combined_total if stats else 0,
+        "review_completed_total": stats.review_completed_total if stats else 0,
+        "month_key": month_key,
+    }
+    rows = []
+    for (metric, period), field_name in BOARD_FIELDS.items():
+        value = getattr(stats, field_name, 0) if stats else 0
+        if period == LeaderboardRank.Period.MONTHLY and not monthly_is_current:
+            value = 0
+        for scope in scopes:
+            rows.append(
+                LeaderboardRank(metric=metric, period=period, scope=scope, value=value, **payload)
+            )
+    return rows
+
+
+def _board_q(key):
+    metric, period, scope = key
+    return Q(metric=metric, period=period, scope=scope)
+
+
+def _new_ranks(user_id, desired):
+    """
+    Rank of each `desired` row on its board, counted in one query.
+    """
+
+    ahead = Q()
+    for key, row in desired.items():
+        ahead |= _board_q(key) & (
+            Q(value__gt=row.value) | Q(value=row.value, user_id__lt=row.user_id)
+        )
+    counts = (
+        LeaderboardRank.objects.filter(ahead)
+        .exclude(user_id=user_id)
+        .values("metric", "period", "scope")
+        .annotate(ahead=Count("id"))
+        .order_by()
+        .values_list("metric", "period", "scope", "ahead")
+    )
+    ahead_counts = {(metric, period, scope): count for metric, period, scope, count in counts}
+    return {key: ahead_counts.get(key, 0) + 1 for key in desired}
+
+
+def _shift_ranks(user_id, shifts) -> None:
+    """
+    Apply every `(board key, rank range, delta)` shift in a single UPDATE.
+    """
+
+    if not shifts:
+        return
+    matched = Q()
+    whens = []
+    for key, rank_range, delta in shifts:
+        condition = _board_q(key) & rank_range
+        matched |= condition
+        whens.append(When(condition, then=F("rank") + delta))
+    LeaderboardRank.objects.filter(matched).exclude(user_id=user_id).update(
+        rank=Case(*whens, default=F("rank"), output_field=PositiveIntegerField())
+    )
+
+
+def _replace_user_rows(user_id, existing, desired) -> None:
+    """
+    Move one user's rows from `existing` to `desired` (dicts keyed by board).
+
+    Each row only shifts the ranks between its old and new position; all
+    boards share one count query, one shift UPDATE and bulk writes.
+    """
+
+    new_ranks = _new_ranks(user_id, desired) if desired else {}
+    shifts = []
+    for key, row in existing.items():
+        if key not in desired:
+            shifts.append((key, Q(rank__gt=row.rank), -1))
+    for key, new_rank in new_ranks.items():
+        old = existing.get(key)
+        if old is None:
+            shifts.append((key, Q(rank__gte=new_rank), 1))
+        elif new_rank < old.rank:
+            shifts.append((key, Q(rank__gte=new_rank, rank__lt=old.rank), 1))
+        elif new_rank > old.rank:
+            shifts.append((key, Q(rank__gt=old.rank, rank__lte=new_rank), -1))
+    _shift_ranks(user_id, shifts)
+
+    removed_ids = [row.pk for key, row in existing.items() if key not in desired]
+    if removed_ids:
+        LeaderboardRank.objects.filter(pk__in=removed_ids).delete()
+    created = []
+    updated = []
+    now = timezone.now()
+    for key, row in desired.items():
+        row.rank = new_ranks[key]
+        if key in existing:
+            row.pk = existing[key].pk
+            row.updated_at = now
+            updated.append(row)
+        else:
+            created.append(row)
+    if updated:
+        LeaderboardRank.objects.bulk_update(updated, ROW_FIELDS)
+    if created:
+        LeaderboardRank.objects.bulk_create(created)
+
+
+@transaction.atomic
+def refresh_user_leaderboard_ranks(user_id) -> None:
+    """
+    Re-place one user in every board (adds, moves or removes their rows).
+    """
+
+    if not user_id:
+        return
+    user = (
+        User.objects.filter(leaderboard_participant_q(), id=user_id)
+        .select_related("profile", "contribution_stats")
+        .first()
+    )
+    if user is None and not LeaderboardRank.objects.filter(user_id=user_id).exists():
+        return  # Not a participant and never was: nothing to shift.
+
+    _lock_boards()
+    existing = {
+        (row.metric, row.period, row.scope): row
+        for row in LeaderboardRank.objects.filter(user_id=user_id)
+    }
+    desired = {}
+    if user is not None:
+        desired = {
+            (row.metric, row.period, row.scope): row
+            for row in _board_rows(user, _current_month_key())
+        }
+    _replace_user_rows(user_id, existing, desired)
+    bump_public_content_version(PublicContentVersion.Scope.LEADERBOARD)
+
+
+def remove_user_from_leaderboards(user_id) -> None:
+    with transaction.atomic():
+        _lock_boards()
+        existing = {
+            (row.metric, row.period, row.scope): row
+            for row in LeaderboardRank.objects.filter(user_id=user_id)
+        }
+        _replace_user_rows(user_id, existing, {})
+        bump_public_content_version(PublicContentVersion.Scope.LEADERBOARD)
+
+
+@transaction.atomic
+def rebuild_leaderboard_ranks(*, periods=None) -> int:
+    """
+    Recompute whole boards from UserContributionStats. Returns rows written.
+
+    `periods=["monthly"]` only rebuilds the monthly boards (month rollover).
+    """
+
+    periods = list(periods or LeaderboardRank.Period.values)
+    _lock_boards()
+    month_key = _current_month_key()
+    LeaderboardRank.objects.filter(period__in=periods).delete()
+
+    boards = {}
+    participants = (
+        User.objects.filter(id__in=User.objects.filter(leaderboard_participant_q()).values("id"))
+        .select_related("profile", "contribution_stats")
+        .order_by("id")
+    )
+    for user in participants.iterator(chunk_size=1000):
+        for row in _board_rows(user, month_key):
+            if row.period in periods:
+                boards.setdefault((row.metric, row.period, row.scope), []).append(row)
+
+    rows = []
+    for board_rows in boards.values():
+        board_rows.sort(key=lambda row: (-row.value, row.user_id))
+        for position, row in enumerate(board_rows, start=1):
+            row.rank = position
+            rows.append(row)
+    LeaderboardRank.objects.bulk_create(rows, batch_size=1000)
+    bump_public_content_version(PublicContentVersion.Scope.LEADERBOARD)
+    return len(rows)
+
+
+def leaderboard_window(
+    *, metric, period, municipality=None, limit=100, around_user_id=None, radius=3
+):
+    """
+    Return `(top_rows, around_rows)` as LeaderboardRank rows.
+
+    `around_rows` holds the user's row plus `radius` rows on each side, or is
+    empty when `around_user_id` is not on this board. Monthly boards that the
+    month rollover has not rebuilt yet read as empty.
+    """
+
+    scope = municipality_scope(municipality)
+    board = LeaderboardRank.objects.filter(metric=metric, period=period, scope=scope)
+    if period == LeaderboardRank.Period.MONTHLY:
+        board = board.filter(month_key=_current_month_key())
+    top_rows = list(board.filter(rank__lte=limit).order_by("rank"))
+
+    around_rows = []
+    if around_user_id:
+        own_rank = board.filter(user_id=around_user_id).values("rank")[:1]
+        around_rows = list(
+            board.filter(
+                rank__gte=own_rank.annotate(start=F("rank") - radius).values("start"),
+                rank__lte=own_rank.annotate(end=F("rank") + radius).values("end"),
+            ).order_by("rank")
+        )
+    return top_rows, around_rows
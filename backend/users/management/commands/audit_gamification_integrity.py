@@ -3,12 +3,23 @@ Management command: audit_gamification_integrity
 
 Compares pre-recompute and post-recompute user stats to detect mismatches.
 Useful for integrity checks after migrations or rule updates.
+
+Stats are read and recomputed in bulk (see `recompute_gamification_for_users`),
+so the audit costs a few queries per batch of users, not per user.
 """
 
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
 
-from users.recognition import recompute_user_gamification
+from users.models import UserContributionStats
+from users.recognition import COUNTER_FIELDS, recompute_gamification_for_users
+
+
+def _stats_snapshot():
+    return {
+        row.pop("user__username"): row
+        for row in UserContributionStats.objects.values("user__username", *COUNTER_FIELDS)
+    }
 
 
 class Command(BaseCommand):
@@ -17,51 +28,23 @@ class Command(BaseCommand):
         "for user contribution stats."
     )
 
-    def handle(self, *args, **options):
-        User = get_user_model()
-        mismatches = []
-        checked = 0
-
-        for user in User.objects.select_related("contribution_stats").iterator():
-            checked += 1
-            existing = getattr(user, "contribution_stats", None)
-            if not existing:
-                recompute_user_gamification(user)
-                existing = user.contribution_stats
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
 
-            before = {
-                "combined_total": existing.combined_total,
-                "dictionary_original_total": existing.dictionary_original_total,
-                "folklore_original_total": existing.folklore_original_total,
-                "total_rejections": existing.total_rejections,
-                "review_completed_total": existing.review_completed_total,
-                "dictionary_month": existing.dictionary_month,
-                "folklore_month": existing.folklore_month,
-                "combined_month": existing.combined_month,
-            }
-
-            recompute_user_gamification(user)
-            existing.refresh_from_db()
-
-            after = {
-                "combined_total": existing.combined_total,
-                "dictionary_original_total": existing.dictionary_original_total,
-                "folklore_original_total": existing.folklore_original_total,
-                "total_rejections": existing.total_rejections,
-                "review_completed_total": existing.review_completed_total,
-                "dictionary_month": existing.dictionary_month,
-                "folklore_month": existing.folklore_month,
-                "combined_month": existing.combined_month,
-            }
-
-            if before != after:
-                mismatches.append(
-                    {
-                        "username": user.username,
-                        "before": before,
-                        "after": after,
-                    }
-                )
+    def handle(self, *args, **options):
+        # Users without a stats row yet are created by the recompute, not reported.
+        before_by_username = _stats_snapshot()
+        checked = recompute_gamification_for_users(
+            get_user_model().objects.all(),
+            batch_size=options["batch_size"],
+        )
+        after_by_username = _stats_snapshot()
+
+        mismatches = [
+            {"username": username, "before": before, "after": after_by_username.get(username)}
+            for username, before in sorted(before_by_username.items())
+            if before != after_by_username.get(username)
+        ]
 
         self.stdout.write(f"Checked users: {checked}")
         if mismatches:
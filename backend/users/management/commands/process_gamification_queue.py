@@ -0,0 +1,54 @@
+"""
+Management command: process_gamification_queue
+
+Runs queued gamification recomputes (see users/gamification_queue.py).
+
+Use when:
+- running the background worker: `process_gamification_queue --loop`
+- draining the queue once from cron or after a deploy: `process_gamification_queue`
+- forcing every queued job now, ignoring the debounce window: add `--all`
+"""
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from users.gamification_queue import process_gamification_jobs
+
+
+class Command(BaseCommand):
+    help = "Process queued per-user gamification recompute jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=100)
+        parser.add_argument("--loop", action="store_true")
+        parser.add_argument("--sleep", type=float, default=5.0)
+        parser.add_argument("--all", action="store_true")
+
+    def handle(self, *args, **options):
+        processed = 0
+        failed = 0
+        while True:
+            now = timezone.now()
+            if options["all"]:
+                now += timedelta(days=3650)
+            result = process_gamification_jobs(limit=options["limit"], now=now)
+            processed += result["processed"]
+            failed += result["failed"]
+            # Keep draining while full batches succeed (failed jobs wait for their retry).
+            if result["processed"] >= options["limit"]:
+                continue
+            if not options["loop"]:
+                break
+            if processed or failed:
+                self._report(processed, failed)
+                processed = failed = 0
+            time.sleep(options["sleep"])
+        self._report(processed, failed)
+
+    def _report(self, processed, failed):
+        self.stdout.write(
+            self.style.SUCCESS(f"Gamification queue: processed={processed}, failed={failed}")
+        )
@@ -0,0 +1,21 @@
+"""
+Management command: rebuild_leaderboard
+
+Use when:
+- leaderboard ranks look wrong or have gaps
+- you bulk-edited users/profiles/stats with queryset.update() (bypasses signals)
+
+Rebuilds every LeaderboardRank board from UserContributionStats.
+"""
+
+from django.core.management.base import BaseCommand
+
+from users.leaderboard import rebuild_leaderboard_ranks
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized leaderboard ranks for every board."
+
+    def handle(self, *args, **options):
+        written = rebuild_leaderboard_ranks()
+        self.stdout.write(self.style.SUCCESS(f"Leaderboard rebuilt: rows={written}"))
@@ -0,0 +1,25 @@
+"""
+Management command: rebuild_public_counters
+
+Recomputes PublicStatusCounter rows (public dictionary/folklore listing
+header counts) from the entry tables. Use after bulk imports or manual SQL.
+"""
+
+from django.core.management.base import BaseCommand
+
+from users.models import PublicStatusCounter
+from users.public_counters import rebuild_public_status_counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild cached public listing counters for dictionary and folklore."
+
+    def handle(self, *args, **options):
+        rebuild_public_status_counters()
+        summary = ", ".join(
+            f"{scope}:{status}={count}"
+            for scope, status, count in PublicStatusCounter.objects.order_by(
+                "scope", "status"
+            ).values_list("scope", "status", "count")
+        )
+        self.stdout.write(self.style.SUCCESS(f"Public counters rebuilt: {summary or 'empty'}"))
@@ -4,12 +4,14 @@ Management command: recompute_gamification
 Use when:
 - you changed rules/config and need fresh stats
 - you imported historical data and want consistent levels/badges
+
+Users are processed in batches (grouped counter queries + bulk_update),
+so this stays fast for thousands of users.
 """
 
-from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
 
-from users.recognition import recompute_user_gamification
+from users.recognition import recompute_gamification_for_users
 
 
 class Command(BaseCommand):
@@ -17,11 +19,10 @@ class Command(BaseCommand):
         "Recompute gamification stats, levels, badges, and municipality aggregates for all users."
     )
 
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
     def handle(self, *args, **options):
-        User = get_user_model()
-        count = 0
-        for user in User.objects.all().iterator():
-            recompute_user_gamification(user)
-            count += 1
+        count = recompute_gamification_for_users(batch_size=options["batch_size"])
 
         self.stdout.write(self.style.SUCCESS(f"Gamification recompute complete for {count} users."))
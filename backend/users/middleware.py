@@ -1,7 +1,7 @@
-from django.db import OperationalError, ProgrammingError
 from django.http import JsonResponse
 
-from users.models import SiteContentSettings
+from users.roles import in_any_group
+from users.site_content import get_site_settings
 
 
 class MaintenanceModeMiddleware:
@@ -11,6 +11,10 @@ class MaintenanceModeMiddleware:
     The React app also shows a visitor-facing maintenance page. This backend
     guard prevents old browser tabs from continuing write/read workflows during
     maintenance while keeping login, admin, and the site-content status API open.
+
+    The settings row comes from the per-process cache in users/site_content.py.
+    The Admin check loads the user's group names once; later role checks in the
+    same request reuse them (users/roles.py).
     """
 
     ALLOWED_PREFIXES = (
@@ -32,25 +36,10 @@ class MaintenanceModeMiddleware:
             return self.get_response(request)
 
         user = getattr(request, "user", None)
-        if (
-            user
-            and user.is_authenticated
-            and (user.is_superuser or user.groups.filter(name="Admin").exists())
-        ):
-            return self.get_response(request)
-
-        try:
-            settings = (
-                SiteContentSettings.objects.filter(key="default")
-                .only(
-                    "maintenance_enabled",
-                    "maintenance_message",
-                )
-                .first()
-            )
-        except (OperationalError, ProgrammingError):
+        if user and user.is_authenticated and (user.is_superuser or in_any_group(user, "Admin")):
             return self.get_response(request)
 
+        settings = get_site_settings()
         if not settings or not settings.maintenance_enabled:
             return self.get_response(request)
 
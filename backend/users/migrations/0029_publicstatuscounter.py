@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:53
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+PUBLIC_STATUSES = ["approved", "approved_under_review"]
+
+
+def backfill_public_status_counters(apps, schema_editor):
+    PublicStatusCounter = apps.get_model("users", "PublicStatusCounter")
+    sources = (
+        ("dictionary", apps.get_model("dictionary", "Entry"), "initial_contributor"),
+        ("folklore", apps.get_model("folklore", "FolkloreEntry"), "contributor"),
+    )
+    counters = []
+    for scope, model, contributor_field in sources:
+        live_contributor_q = Q(**{f"{contributor_field}__profile__isnull": True}) | Q(
+            **{f"{contributor_field}__profile__show_live_contributions": True}
+        )
+        rows = (
+            model.objects.filter(status__in=PUBLIC_STATUSES)
+            .filter(live_contributor_q)
+            .values("status")
+            .annotate(total=Count("id"))
+        )
+        counters.extend(
+            PublicStatusCounter(scope=scope, status=row["status"], count=row["total"])
+            for row in rows
+        )
+    PublicStatusCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0028_admin_approval_reminder_action'),
+        ('dictionary', '0020_englishlookupterm'),
+        ('folklore', '0009_folkloremediaasset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublicStatusCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('dictionary', 'Dictionary'), ('folklore', 'Folklore')], max_length=20)),
+                ('status', models.CharField(max_length=32)),
+                ('count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('scope', 'status'), name='uniq_public_status_counter')],
+            },
+        ),
+        migrations.RunPython(backfill_public_status_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,183 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+BOARD_FIELDS = {
+    ("dictionary", "all_time"): "dictionary_original_total",
+    ("folklore", "all_time"): "folklore_original_total",
+    ("combined", "all_time"): "combined_total",
+    ("dictionary", "monthly"): "dictionary_month",
+    ("folklore", "monthly"): "folklore_month",
+    ("combined", "monthly"): "combined_month",
+}
+
+
+# Frozen copies of users.leaderboard_filters.leaderboard_participant_q and
+# users.names.display_name as of this migration.
+
+
+def leaderboard_participant_q():
+    return (
+        models.Q(is_active=True)
+        & ~models.Q(password="")
+        & ~models.Q(password__startswith="!")
+        & models.Q(profile__isnull=False)
+        & models.Q(profile__include_in_leaderboard=True)
+        & (
+            models.Q(is_superuser=True)
+            | models.Q(groups__name="Admin")
+            | models.Q(groups__name__in=("Contributor", "Reviewer", "Consultant"))
+        )
+    )
+
+
+def _is_all_caps_text(text):
+    letters = [character for character in text if character.isalpha()]
+    return bool(letters) and all(character.isupper() for character in letters)
+
+
+def _capitalize_piece(piece):
+    if not piece:
+        return piece
+    return f"{piece[0].upper()}{piece[1:].lower()}"
+
+
+def _title_case_words(value):
+    text = str(value or "").strip()
+    if not text:
+        return ""
+    return " ".join(
+        "-".join(
+            "'".join(_capitalize_piece(part) for part in apostrophe_piece.split("'"))
+            for apostrophe_piece in word.split("-")
+        )
+        for word in text.split()
+    )
+
+
+def _normalize_person_name(value):
+    text = str(value or "").strip()
+    if not text:
+        return ""
+    if _is_all_caps_text(text):
+        return _title_case_words(text)
+    return text
+
+
+def _clean_name_extension(first_name, last_name, extension):
+    suffix = str(extension or "").strip()
+    if not suffix:
+        return ""
+    first = _normalize_person_name(first_name)
+    last = _normalize_person_name(last_name)
+    if first and last and first.casefold() == last.casefold():
+        base_name = first
+    else:
+        base_name = " ".join([part for part in [first, last] if part]).strip()
+    if base_name and suffix.casefold() == base_name.casefold():
+        return ""
+    return suffix
+
+
+def display_name(user, profile=None):
+    first = _normalize_person_name(getattr(user, "first_name", ""))
+    last = _normalize_person_name(getattr(user, "last_name", ""))
+    if first and last and first.casefold() == last.casefold():
+        base_name = first
+    else:
+        base_name = " ".join([part for part in [first, last] if part]).strip() or user.username
+    extension = _clean_name_extension(first, last, getattr(profile, "name_extension", ""))
+    base_name = f"{base_name} {extension}".strip()
+    post_nominals = str(getattr(profile, "post_nominals", "") or "").strip()
+    return f"{base_name}, {post_nominals}" if post_nominals else base_name
+
+
+def backfill_leaderboard_ranks(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    LeaderboardRank = apps.get_model("users", "LeaderboardRank")
+    month_key = timezone.now().strftime("%Y-%m")
+    participants = User.objects.filter(
+        id__in=User.objects.filter(leaderboard_participant_q()).values("id")
+    ).select_related("profile", "contribution_stats")
+
+    boards = {}
+    for user in participants.iterator(chunk_size=1000):
+        profile = getattr(user, "profile", None)
+        stats = getattr(user, "contribution_stats", None)
+        municipality = profile.municipality if profile else ""
+        scopes = {"", municipality.strip().lower()}
+        for (metric, period), field_name in BOARD_FIELDS.items():
+            value = getattr(stats, field_name, 0) if stats else 0
+            if period == "monthly" and (not stats or stats.last_month_calculated != month_key):
+                value = 0
+            for scope in scopes:
+                boards.setdefault((metric, period, scope), []).append(
+                    LeaderboardRank(
+                        user_id=user.id,
+                        metric=metric,
+                        period=period,
+                        scope=scope,
+                        rank=0,
+                        value=value,
+                        month_key=month_key,
+                        username=user.username,
+                        display_name=display_name(user, profile),
+                        municipality=municipality,
+                        profile_photo=profile.profile_photo.name
+                        if profile and profile.profile_photo
+                        else "",
+                        dictionary_total=stats.dictionary_original_total if stats else 0,
+                        folklore_total=stats.folklore_original_total if stats else 0,
+                        combined_total=stats.combined_total if stats else 0,
+                        review_completed_total=stats.review_completed_total if stats else 0,
+                    )
+                )
+
+    rows = []
+    for board_rows in boards.values():
+        board_rows.sort(key=lambda row: (-row.value, row.user_id))
+        for position, row in enumerate(board_rows, start=1):
+            row.rank = position
+            rows.append(row)
+    LeaderboardRank.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0030_gamificationrecomputejob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardRank',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(choices=[('dictionary', 'Dictionary'), ('folklore', 'Folklore'), ('combined', 'Combined')], max_length=20)),
+                ('period', models.CharField(choices=[('all_time', 'All time'), ('monthly', 'Monthly')], max_length=20)),
+                ('scope', models.CharField(blank=True, default='', max_length=255)),
+                ('rank', models.PositiveIntegerField()),
+                ('value', models.PositiveIntegerField(default=0)),
+                ('month_key', models.CharField(blank=True, default='', max_length=7)),
+                ('username', models.CharField(max_length=150)),
+                ('display_name', models.CharField(blank=True, default='', max_length=255)),
+                ('municipality', models.CharField(blank=True, default='', max_length=255)),
+                ('profile_photo', models.CharField(blank=True, default='', max_length=255)),
+                ('dictionary_total', models.PositiveIntegerField(default=0)),
+                ('folklore_total', models.PositiveIntegerField(default=0)),
+                ('combined_total', models.PositiveIntegerField(default=0)),
+                ('review_completed_total', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_ranks', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['metric', 'period', 'scope', 'rank'], name='leaderboard_rank_idx'), models.Index(fields=['metric', 'period', 'scope', '-value', 'user'], name='leaderboard_value_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'metric', 'period', 'scope'), name='uniq_leaderboard_rank_user')],
+            },
+        ),
+        migrations.RunPython(backfill_leaderboard_ranks, migrations.RunPython.noop),
+    ]
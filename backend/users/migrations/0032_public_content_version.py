@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:24
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0031_leaderboardrank'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublicContentVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('dictionary', 'Dictionary'), ('folklore', 'Folklore'), ('leaderboard', 'Leaderboard'), ('resources', 'Resources')], max_length=20, unique=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
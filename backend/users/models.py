@@ -3,6 +3,7 @@ import uuid
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 
 """
 users/models.py
@@ -12,10 +13,10 @@ Beginner map:
 2) ContributionEvent: authoritative credit ledger for achievements.
 3) RoleApplication / RoleApplicationDecision / RoleOnboardingRecord:
    role onboarding and accountability trail.
-4) UserContributionStats / MunicipalityStats:
-   cached counters for fast APIs.
+4) UserContributionStats / MunicipalityStats / PublicStatusCounter / LeaderboardRank:
+   cached counters and rankings for fast APIs.
 5) RecognitionEvent + Gamification* models:
-   level/badge events and configurable thresholds.
+   level/badge events, configurable thresholds and the recompute job queue.
 
 If you are extending this for another indigenous language:
 - keep governance structure intact
@@ -598,6 +599,128 @@ class MunicipalityStats(models.Model):
         return f"MunicipalityStats<{self.municipality}>"
 
 
+class PublicStatusCounter(models.Model):
+    """
+    Cached count of publicly listed entries per (scope, status).
+
+    Backs the "visible_total / approved / approved_under_review" header of the
+    public dictionary and folklore listings so unfiltered pages never COUNT(*).
+    Only entries whose contributor shows live contributions are counted,
+    matching what the listings return. Maintained by `users/public_counters.py`.
+    """
+
+    class Scope(models.TextChoices):
+        DICTIONARY = "dictionary", "Dictionary"
+        FOLKLORE = "folklore", "Folklore"
+
+    scope = models.CharField(max_length=20, choices=Scope.choices)
+    status = models.CharField(max_length=32)
+    count = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=("scope", "status"),
+                name="uniq_public_status_counter",
+            ),
+        ]
+
+    def __str__(self):
+        return f"PublicStatusCounter<{self.scope}:{self.status}={self.count}>"
+
+
+class PublicContentVersion(models.Model):
+    """
+    Publish sequence for one group of public read endpoints.
+
+    Any write that can change what those endpoints return bumps `version`
+    (users/signals.py, users/leaderboard.py). Views derive their ETag and
+    Last-Modified from this row, so a conditional GET is answered with 304
+    after a single lookup. Maintained by `users/public_versions.py`.
+    """
+
+    class Scope(models.TextChoices):
+        DICTIONARY = "dictionary", "Dictionary"
+        FOLKLORE = "folklore", "Folklore"
+        LEADERBOARD = "leaderboard", "Leaderboard"
+        RESOURCES = "resources", "Resources"
+
+    scope = models.CharField(max_length=20, choices=Scope.choices, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"PublicContentVersion<{self.scope}={self.version}>"
+
+
+class LeaderboardRank(models.Model):
+    """
+    Materialized leaderboard position of one user in one board.
+
+    A board is (metric, period, scope): scope "" is the global board, any other
+    value is a lower-cased municipality. Rows are ordered by value desc, then
+    user id (collation-independent), and `rank` is the 1-based position, so
+    top-N and "around me" windows are a single range read on `rank`.
+
+    Maintained incrementally by `users/leaderboard.py`; rebuild with
+    `manage.py rebuild_leaderboard`.
+    """
+
+    class Metric(models.TextChoices):
+        DICTIONARY = "dictionary", "Dictionary"
+        FOLKLORE = "folklore", "Folklore"
+        COMBINED = "combined", "Combined"
+
+    class Period(models.TextChoices):
+        ALL_TIME = "all_time", "All time"
+        MONTHLY = "monthly", "Monthly"
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="leaderboard_ranks",
+    )
+    metric = models.CharField(max_length=20, choices=Metric.choices)
+    period = models.CharField(max_length=20, choices=Period.choices)
+    scope = models.CharField(max_length=255, blank=True, default="")
+    rank = models.PositiveIntegerField()
+    value = models.PositiveIntegerField(default=0)
+    # Month the monthly values belong to; reads skip boards from past months.
+    month_key = models.CharField(max_length=7, blank=True, default="")
+
+    # Denormalized row payload so reads never join users/profiles/stats.
+    username = models.CharField(max_length=150)
+    display_name = models.CharField(max_length=255, blank=True, default="")
+    municipality = models.CharField(max_length=255, blank=True, default="")
+    profile_photo = models.CharField(max_length=255, blank=True, default="")
+    dictionary_total = models.PositiveIntegerField(default=0)
+    folklore_total = models.PositiveIntegerField(default=0)
+    combined_total = models.PositiveIntegerField(default=0)
+    review_completed_total = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=("user", "metric", "period", "scope"),
+                name="uniq_leaderboard_rank_user",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["metric", "period", "scope", "rank"], name="leaderboard_rank_idx"),
+            models.Index(
+                fields=["metric", "period", "scope", "-value", "user"],
+                name="leaderboard_value_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"LeaderboardRank<{self.metric}:{self.period}:{self.scope or 'global'}#{self.rank}>"
+
+
 class RecognitionEvent(models.Model):
     """
     Immutable recognition feed.
@@ -740,6 +863,7 @@ class GamificationRuntimeState(models.Model):
     Internal marker used by monthly winner rollover logic.
 
     Prevents duplicate winner creation when recomputation runs multiple times.
+    The "leaderboard" row is only a lock for LeaderboardRank rank shifting.
     """
 
     key = models.CharField(max_length=32, primary_key=True, default="global")
@@ -750,6 +874,35 @@ class GamificationRuntimeState(models.Model):
         return f"GamificationRuntimeState<{self.key}>"
 
 
+class GamificationRecomputeJob(models.Model):
+    """
+    Pending gamification recompute for one user (durable job queue row).
+
+    Coalescing:
+    - at most one row per user; repeat requests bump `request_count` and push
+      `run_after` back (capped by GAMIFICATION_RECOMPUTE_MAX_WAIT_SECONDS)
+    - the worker runs it once `run_after` has passed, so a burst of saves
+      costs a single recompute
+
+    Processed by `manage.py process_gamification_queue` (see users/gamification_queue.py).
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="gamification_recompute_job",
+    )
+    run_after = models.DateTimeField(db_index=True)
+    request_count = models.PositiveIntegerField(default=1)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"GamificationRecomputeJob<{self.user_id}>"
+
+
 class MunicipalityMonthlyWinner(models.Model):
     """
     Stores one winning municipality per month and metric.
@@ -0,0 +1,101 @@
+"""
+users/pagination.py
+
+Purpose:
+- Keyset (cursor) pagination shared by the public dictionary and folklore listings.
+
+Why keyset instead of OFFSET:
+- OFFSET makes the database walk and discard every earlier row, so deep pages
+  get slower as the archive grows. A keyset filter ("rows after this sort value
+  and id") lets the matching composite index jump straight to the next page.
+- New publishes cannot shift rows between pages: a cursor points at a row,
+  not at a position.
+
+Cursor format:
+- Opaque to clients: urlsafe base64 of a small JSON object holding the sort
+  name, the last row's sort value and id. Clients must pass it back unchanged.
+"""
+
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor we did not issue (or for another sort)."""
+
+
+def encode_cursor(*, sort, value, row_id) -> str:
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    raw = json.dumps({"s": sort, "v": value, "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, *, sort) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursor("cursor is invalid.") from exc
+    if not isinstance(payload, dict) or payload.get("s") != sort or "id" not in payload:
+        raise InvalidCursor("cursor does not match this sort order.")
+    return payload
+
+
+def keyset_queryset(queryset, *, field, descending, sort, cursor=""):
+    """
+    `queryset` ordered by (`field`, primary key) and filtered to rows after `cursor`.
+
+    NULL sort values keep the database's native position (PostgreSQL sorts
+    them as largest, SQLite as smallest) so plain composite indexes such as
+    `("-last_approved_at", "id")` serve the ORDER BY on both.
+    """
+
+    # Column name, not "pk": read models keyed by a one-to-one (PublicEntryView)
+    # must order by the raw key, not by the related model's ordering.
+    pk_name = queryset.model._meta.pk.attname
+    queryset = queryset.order_by(f"-{field}" if descending else field, pk_name)
+    if not cursor:
+        return queryset
+
+    nulls_first = descending == connection.features.nulls_order_largest
+    payload = decode_cursor(cursor, sort=sort)
+    model_field = queryset.model._meta.get_field(field)
+    try:
+        row_id = queryset.model._meta.pk.to_python(payload["id"])
+        value = model_field.to_python(payload.get("v"))
+    except ValidationError as exc:
+        raise InvalidCursor("cursor is invalid.") from exc
+
+    if value is None:
+        after = Q(**{f"{field}__isnull": True, f"{pk_name}__gt": row_id})
+        if nulls_first:
+            after |= Q(**{f"{field}__isnull": False})
+    else:
+        lookup = "lt" if descending else "gt"
+        after = Q(**{f"{field}__{lookup}": value}) | Q(**{field: value, f"{pk_name}__gt": row_id})
+        if model_field.null and not nulls_first:
+            after |= Q(**{f"{field}__isnull": True})
+    return queryset.filter(after)
+
+
+def keyset_page(queryset, *, field, descending, sort, cursor="", limit):
+    """
+    Return `(rows, next_cursor)` for one page ordered by (`field`, primary key).
+    """
+
+    queryset = keyset_queryset(
+        queryset, field=field, descending=descending, sort=sort, cursor=cursor
+    )
+    rows = list(queryset[: limit + 1])
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort=sort, value=getattr(last, field), row_id=last.pk)
+    return rows, next_cursor
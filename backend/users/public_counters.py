@@ -0,0 +1,155 @@
+"""
+users/public_counters.py
+
+Purpose:
+- Keep PublicStatusCounter rows in step with public dictionary/folklore listings.
+- Give list views an O(1) header for unfiltered pages and a single-query
+  aggregate for filtered ones.
+
+How counters stay correct:
+- Entry / FolkloreEntry saves and deletes apply +1/-1 deltas (see users/signals.py),
+  inside the same transaction as the publish/archive/override service that saved them.
+- Toggling `UserProfile.show_live_contributions` moves that user's entries in or out.
+- `rebuild_public_status_counters()` recomputes everything from scratch.
+
+Troubleshooting:
+- Header totals disagree with rows: run `manage.py rebuild_public_counters`.
+"""
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest
+
+from dictionary.models import Entry, EntryStatus
+from folklore.models import FolkloreEntry
+from users.models import PublicStatusCounter, UserProfile
+
+PUBLIC_STATUSES = (EntryStatus.APPROVED, EntryStatus.APPROVED_UNDER_REVIEW)
+
+# scope -> (model, contributor field). Both models share the same status values.
+SCOPE_SOURCES = {
+    PublicStatusCounter.Scope.DICTIONARY: (Entry, "initial_contributor"),
+    PublicStatusCounter.Scope.FOLKLORE: (FolkloreEntry, "contributor"),
+}
+
+
+def contributor_is_live(user_id) -> bool:
+    """
+    Missing profile means "visible", same as `_live_contributor_q` in the views.
+    """
+
+    if not user_id:
+        return True
+    visible = (
+        UserProfile.objects.filter(user_id=user_id)
+        .values_list("show_live_contributions", flat=True)
+        .first()
+    )
+    return visible is None or bool(visible)
+
+
+def _live_rows(scope):
+    """
+    Public rows of one scope whose contributor is live (the counted set).
+    """
+
+    model, contributor_field = SCOPE_SOURCES[scope]
+    live_contributor_q = Q(**{f"{contributor_field}__profile__isnull": True}) | Q(
+        **{f"{contributor_field}__profile__show_live_contributions": True}
+    )
+    return model.objects.filter(status__in=PUBLIC_STATUSES).filter(live_contributor_q)
+
+
+def _add(scope, status, delta):
+    if not delta or status not in PUBLIC_STATUSES:
+        return
+    counter, created = PublicStatusCounter.objects.get_or_create(
+        scope=scope,
+        status=status,
+        # No row yet: count the source rows, which already include this change.
+        defaults={"count": lambda: _live_rows(scope).filter(status=status).count()},
+    )
+    if not created:
+        PublicStatusCounter.objects.filter(id=counter.id).update(
+            count=Greatest(F("count") + delta, 0)
+        )
+
+
+def apply_status_change(scope, *, contributor_id, old_status, new_status) -> None:
+    """
+    Move one entry between status buckets. `None` means "did not exist".
+    """
+
+    if old_status == new_status:
+        return
+    if old_status not in PUBLIC_STATUSES and new_status not in PUBLIC_STATUSES:
+        return
+    if not contributor_is_live(contributor_id):
+        return
+    _add(scope, old_status, -1)
+    _add(scope, new_status, 1)
+
+
+def apply_contributor_visibility_change(user_id, *, visible: bool) -> None:
+    """
+    Add (or remove) every public entry of one contributor after a visibility toggle.
+    """
+
+    sign = 1 if visible else -1
+    for scope, (model, contributor_field) in SCOPE_SOURCES.items():
+        rows = (
+            model.objects.filter(**{contributor_field: user_id}, status__in=PUBLIC_STATUSES)
+            .values("status")
+            .annotate(total=Count("id"))
+        )
+        for row in rows:
+            _add(scope, row["status"], sign * row["total"])
+
+
+@transaction.atomic
+def rebuild_public_status_counters() -> None:
+    """
+    Recompute every counter with one grouped COUNT per scope.
+    """
+
+    PublicStatusCounter.objects.all().delete()
+    counters = []
+    for scope in SCOPE_SOURCES:
+        rows = _live_rows(scope).values("status").annotate(total=Count("id"))
+        counters.extend(
+            PublicStatusCounter(scope=scope, status=row["status"], count=row["total"])
+            for row in rows
+        )
+    PublicStatusCounter.objects.bulk_create(counters)
+
+
+def _counts_payload(approved, approved_under_review):
+    return {
+        "visible_total": approved + approved_under_review,
+        "approved": approved,
+        "approved_under_review": approved_under_review,
+    }
+
+
+def cached_status_counts(scope) -> dict:
+    """
+    Header counts for an unfiltered public listing (one indexed lookup).
+    """
+
+    counts = dict(PublicStatusCounter.objects.filter(scope=scope).values_list("status", "count"))
+    return _counts_payload(
+        max(counts.get(EntryStatus.APPROVED, 0), 0),
+        max(counts.get(EntryStatus.APPROVED_UNDER_REVIEW, 0), 0),
+    )
+
+
+def aggregate_status_counts(queryset) -> dict:
+    """
+    Header counts for a filtered listing in a single conditional aggregate.
+    """
+
+    totals = queryset.order_by().aggregate(
+        approved=Count("pk", filter=Q(status=EntryStatus.APPROVED)),
+        approved_under_review=Count("pk", filter=Q(status=EntryStatus.APPROVED_UNDER_REVIEW)),
+    )
+    return _counts_payload(totals["approved"], totals["approved_under_review"])
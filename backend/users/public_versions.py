@@ -0,0 +1,117 @@
+"""
+users/public_versions.py
+
+Conditional GET (ETag / Last-Modified) for public read endpoints.
+
+How it works:
+- PublicContentVersion keeps one publish sequence per scope (dictionary,
+  folklore, leaderboard, resources).
+- Writes that can change a scope's public payload call
+  `bump_public_content_version(scope)`. Model signals in users/signals.py cover
+  entries, revisions, reviews and profiles; users/leaderboard.py bumps after
+  moving ranks; a `migrate` bumps every scope so payload changes shipped with
+  a deploy are never answered with 304.
+- The bump runs after the writer's transaction commits (`on_commit`), once per
+  scope however many rows changed. Writers never hold the hot scope row lock,
+  and a reader can never cache the old payload under the new version.
+- `@public_content_condition(scope)` reads the scope rows once, builds the
+  validators and lets Django's `condition()` answer If-None-Match /
+  If-Modified-Since with 304 before the view runs.
+
+ETags include the signed-in user id because role checks and "around me"
+windows make some payloads per-user.
+
+Troubleshooting:
+- A page keeps returning 304 after a change: the write path does not bump the
+  scope. Add a bump (or signal) for it, or run `bump_public_content_version`
+  from a shell as a stopgap.
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.views.decorators.http import condition
+
+from users.models import PublicContentVersion
+
+CONDITIONAL_METHODS = {"GET", "HEAD"}
+
+
+def bump_public_content_version(*scopes) -> None:
+    """
+    Advance the publish sequence of each scope when the current transaction commits.
+    """
+
+    connection = transaction.get_connection()
+    connection.__dict__.setdefault("_pending_public_content_scopes", set()).update(scopes)
+    # The first callback to run flushes every queued scope; the rest find the
+    # set empty. Scopes left by a rolled-back transaction only cost a spare bump.
+    transaction.on_commit(lambda: _bump_now(connection))
+
+
+def _bump_now(connection) -> None:
+    scopes = sorted(connection.__dict__.pop("_pending_public_content_scopes", ()))
+    now = timezone.now()
+    for scope in scopes:
+        bumped = PublicContentVersion.objects.filter(scope=scope).update(
+            version=F("version") + 1, updated_at=now
+        )
+        if bumped:
+            continue
+        try:
+            # Savepoint: a concurrent writer may create the same scope row first.
+            with transaction.atomic():
+                PublicContentVersion.objects.create(scope=scope, version=1, updated_at=now)
+        except IntegrityError:
+            PublicContentVersion.objects.filter(scope=scope).update(
+                version=F("version") + 1, updated_at=now
+            )
+
+
+def bump_all_public_content_versions() -> None:
+    bump_public_content_version(*PublicContentVersion.Scope.values)
+
+
+def _validators(request, scopes, extra):
+    # Memoized per request: Django asks for the ETag and Last-Modified separately.
+    cached = getattr(request, "_public_content_validators", None)
+    if cached is not None:
+        return cached
+
+    rows = {
+        scope: (version, updated_at)
+        for scope, version, updated_at in PublicContentVersion.objects.filter(
+            scope__in=scopes
+        ).values_list("scope", "version", "updated_at")
+    }
+    user = getattr(request, "user", None)
+    parts = [f"{scope}.{rows.get(scope, (0, None))[0]}" for scope in scopes]
+    parts.append(f"u{user.pk if user is not None and user.is_authenticated else 0}")
+    if extra:
+        parts.append(extra(request))
+    stamps = [updated_at for _, updated_at in rows.values() if updated_at]
+
+    cached = (f'"{"-".join(parts)}"', max(stamps) if stamps else None)
+    request._public_content_validators = cached
+    return cached
+
+
+def public_content_condition(*scopes, extra=None):
+    """
+    Decorate a public read view with ETag / Last-Modified handling.
+
+    `extra(request)` may add a string to the ETag for state that lives outside
+    the scope rows (for example the current month on monthly leaderboards).
+    """
+
+    def etag_func(request, *args, **kwargs):
+        if request.method not in CONDITIONAL_METHODS:
+            return None
+        return _validators(request, scopes, extra)[0]
+
+    def last_modified_func(request, *args, **kwargs):
+        if request.method not in CONDITIONAL_METHODS:
+            return None
+        return _validators(request, scopes, extra)[1]
+
+    return condition(etag_func=etag_func, last_modified_func=last_modified_func)
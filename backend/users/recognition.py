@@ -15,24 +15,31 @@ from datetime import datetime
 from datetime import timezone as dt_timezone
 
 from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
 from django.db import models, transaction
 from django.utils import timezone
 
 from dictionary.models import EntryRevision
 from folklore.models import FolkloreRevision
 from reviews.models import FolkloreReview, Review
+from users.cache import VersionedTTLCache
+from users.leaderboard import (
+    leaderboard_window,
+    rebuild_leaderboard_ranks,
+    refresh_user_leaderboard_ranks,
+)
 from users.leaderboard_filters import leaderboard_participant_q
 from users.models import (
     ContributionEvent,
     GamificationConfig,
     GamificationRuntimeState,
+    LeaderboardRank,
     MunicipalityMonthlyWinner,
     MunicipalityStats,
     Notification,
     RecognitionEvent,
     UserContributionStats,
 )
-from users.names import display_name as formatted_display_name
 from users.notifications import notify
 
 User = get_user_model()
@@ -150,7 +157,7 @@ def _normalize_quality_badge(raw_row):
         return dict(DEFAULT_QUALITY_BADGE)
 
 
-def _ruleset():
+def _load_ruleset():
     # Central place to resolve active rule values.
     # Extension tip:
     # to reuse this for another language project, update defaults/config only.
@@ -189,6 +196,27 @@ def _ruleset():
     }
 
 
+def _ruleset_version():
+    # Row count catches deletes; latest updated_at catches edits.
+    version = GamificationConfig.objects.aggregate(
+        rows=models.Count("id"),
+        stamp=models.Max("updated_at"),
+    )
+    return version["rows"], version["stamp"]
+
+
+RULESET_CACHE = VersionedTTLCache(loader=_load_ruleset, version=_ruleset_version)
+
+
+def _ruleset():
+    # Normalized rules are cached per process; see users/cache.py for invalidation.
+    return RULESET_CACHE.get()
+
+
+def clear_ruleset_cache():
+    RULESET_CACHE.clear()
+
+
 def _current_month_key(now=None):
     now = now or timezone.now()
     return now.strftime("%Y-%m")
@@ -234,76 +262,87 @@ def _badge_rows_from_rules(*, rules, current_value):
     return rows
 
 
-def _calculate_user_counters(user):
-    # Authoritative counters are DB-derived, never frontend-derived.
-    qs = ContributionEvent.objects.filter(user=user)
-
-    dictionary_original_total = qs.filter(
-        contribution_type=ContributionEvent.Type.DICTIONARY_TERM
-    ).count()
-    folklore_original_total = qs.filter(
-        contribution_type=ContributionEvent.Type.FOLKLORE_ENTRY
-    ).count()
-    revision_total = qs.filter(contribution_type=ContributionEvent.Type.REVISION).count()
-
-    combined_total = dictionary_original_total + folklore_original_total + revision_total
-
-    total_rejections = (
-        EntryRevision.objects.filter(
-            contributor=user,
-            status=EntryRevision.Status.REJECTED,
-        ).count()
-        + FolkloreRevision.objects.filter(
-            contributor=user,
-            status=FolkloreRevision.Status.REJECTED,
-        ).count()
-    )
+# Stored on UserContributionStats; filled by `_calculate_counters_for_users`.
+COUNTER_FIELDS = (
+    "combined_total",
+    "dictionary_original_total",
+    "folklore_original_total",
+    "total_rejections",
+    "review_completed_total",
+    "dictionary_month",
+    "folklore_month",
+    "combined_month",
+)
 
-    review_completed_total = (
-        Review.objects.filter(
-            reviewer=user,
-            decision__in=[Review.Decision.APPROVE, Review.Decision.REJECT],
-        ).count()
-        + FolkloreReview.objects.filter(
-            reviewer=user,
-            decision__in=[FolkloreReview.Decision.APPROVE, FolkloreReview.Decision.REJECT],
-        ).count()
-    )
+# ContributionEvent type -> (all-time field, monthly field). Revisions only feed "combined".
+EVENT_COUNTER_FIELDS = {
+    ContributionEvent.Type.DICTIONARY_TERM: ("dictionary_original_total", "dictionary_month"),
+    ContributionEvent.Type.FOLKLORE_ENTRY: ("folklore_original_total", "folklore_month"),
+    ContributionEvent.Type.REVISION: (None, None),
+}
 
-    return {
-        "combined_total": combined_total,
-        "dictionary_original_total": dictionary_original_total,
-        "folklore_original_total": folklore_original_total,
-        "total_rejections": total_rejections,
-        "review_completed_total": review_completed_total,
-    }
 
+def _grouped_counts(queryset, user_field):
+    rows = queryset.values(user_field).annotate(total=models.Count("id")).order_by()
+    return {row[user_field]: row["total"] for row in rows}
 
-def _calculate_monthly_counters(user, month_key):
-    # Monthly counters are constrained to events on/after month start.
-    start = datetime.strptime(month_key + "-01", "%Y-%m-%d").replace(tzinfo=dt_timezone.utc)
 
-    dictionary_original_month = ContributionEvent.objects.filter(
-        user=user,
-        contribution_type=ContributionEvent.Type.DICTIONARY_TERM,
-        awarded_at__gte=start,
-    ).count()
-    folklore_original_month = ContributionEvent.objects.filter(
-        user=user,
-        contribution_type=ContributionEvent.Type.FOLKLORE_ENTRY,
-        awarded_at__gte=start,
-    ).count()
-    revision_month = ContributionEvent.objects.filter(
-        user=user,
-        contribution_type=ContributionEvent.Type.REVISION,
-        awarded_at__gte=start,
-    ).count()
+def _calculate_counters_for_users(user_ids, month_key):
+    """
+    All-time and monthly counters for many users in five grouped queries.
 
-    return {
-        "dictionary_month": dictionary_original_month,
-        "folklore_month": folklore_original_month,
-        "combined_month": dictionary_original_month + folklore_original_month + revision_month,
-    }
+    Authoritative counters are DB-derived, never frontend-derived. Monthly
+    counters only include events awarded on/after the month start.
+    """
+
+    user_ids = list(user_ids)
+    counters = {user_id: dict.fromkeys(COUNTER_FIELDS, 0) for user_id in user_ids}
+    if not user_ids:
+        return counters
+
+    start = datetime.strptime(month_key + "-01", "%Y-%m-%d").replace(tzinfo=dt_timezone.utc)
+    event_rows = (
+        ContributionEvent.objects.filter(
+            user_id__in=user_ids,
+            contribution_type__in=list(EVENT_COUNTER_FIELDS),
+        )
+        .values("user_id", "contribution_type")
+        .annotate(
+            total=models.Count("id"),
+            month=models.Count("id", filter=models.Q(awarded_at__gte=start)),
+        )
+        .order_by()
+    )
+    for row in event_rows:
+        user_counters = counters[row["user_id"]]
+        user_counters["combined_total"] += row["total"]
+        user_counters["combined_month"] += row["month"]
+        total_field, month_field = EVENT_COUNTER_FIELDS[row["contribution_type"]]
+        if total_field:
+            user_counters[total_field] += row["total"]
+            user_counters[month_field] += row["month"]
+
+    rejection_sources = (
+        EntryRevision.objects.filter(status=EntryRevision.Status.REJECTED),
+        FolkloreRevision.objects.filter(status=FolkloreRevision.Status.REJECTED),
+    )
+    for queryset in rejection_sources:
+        totals = _grouped_counts(queryset.filter(contributor_id__in=user_ids), "contributor_id")
+        for user_id, total in totals.items():
+            counters[user_id]["total_rejections"] += total
+
+    review_sources = (
+        Review.objects.filter(decision__in=[Review.Decision.APPROVE, Review.Decision.REJECT]),
+        FolkloreReview.objects.filter(
+            decision__in=[FolkloreReview.Decision.APPROVE, FolkloreReview.Decision.REJECT]
+        ),
+    )
+    for queryset in review_sources:
+        totals = _grouped_counts(queryset.filter(reviewer_id__in=user_ids), "reviewer_id")
+        for user_id, total in totals.items():
+            counters[user_id]["review_completed_total"] += total
+
+    return counters
 
 
 def _calculate_badges(
@@ -343,8 +382,8 @@ def _unlocked_badge_keys(dictionary_badges, folklore_badges, quality_badges):
 
 
 def _process_monthly_winner_rollover(current_month):
-    # Lazy month rollover:
-    # winner computation runs during recompute so no cron is required.
+    # Lazy month rollover: runs on the first recompute of a month and on every
+    # queue worker pass (`run_month_rollover`), so no extra cron is required.
     state, _ = GamificationRuntimeState.objects.get_or_create(key="global")
     if state.last_winner_processed_month == current_month:
         return
@@ -396,16 +435,36 @@ def _process_monthly_winner_rollover(current_month):
 
     state.last_winner_processed_month = current_month
     state.save(update_fields=["last_winner_processed_month", "updated_at"])
+    # Every monthly value from last month is stale now; re-rank monthly boards once.
+    rebuild_leaderboard_ranks(periods=[LeaderboardRank.Period.MONTHLY])
 
 
-def _update_municipality_stats_for_user(user, stats):
-    # Municipality aggregates are recomputed from user stat rows, not ad-hoc counters.
+def run_month_rollover() -> None:
+    """
+    Close the previous month (municipality winners, monthly boards) if still open.
+    """
+
+    with transaction.atomic():
+        _process_monthly_winner_rollover(_current_month_key())
+
+
+def _user_municipality(user):
     profile = getattr(user, "profile", None)
-    municipality = (profile.municipality if profile else "").strip()
+    return (profile.municipality if profile else "").strip()
+
+
+def _update_municipality_stats_for_user(user, stats):
+    municipality = _user_municipality(user)
     if not municipality:
         return None
+    return _refresh_municipality_stats(
+        municipality,
+        stats.last_month_calculated or _current_month_key(),
+    )
+
 
-    month_key = stats.last_month_calculated or _current_month_key()
+def _refresh_municipality_stats(municipality, month_key):
+    # Municipality aggregates are recomputed from user stat rows, not ad-hoc counters.
     row, _ = MunicipalityStats.objects.get_or_create(municipality=municipality)
 
     if row.last_month_calculated != month_key:
@@ -497,35 +556,16 @@ def _emit_recognition_events_if_needed(
             )
 
 
-@transaction.atomic
-def recompute_user_gamification(user):
+def _apply_counters(user, stats, *, previous_stats, counters, rules, month_key):
     """
-    Main recalculation entry point for one user.
+    Copy fresh counters onto `stats`, derive levels/badges and emit new achievements.
 
-    Troubleshooting:
-    - If totals look wrong, inspect ContributionEvent rows first.
-    - If reviewer track is wrong, inspect Review/FolkloreReview rows.
-    - If thresholds feel off, inspect GamificationConfig JSON values.
+    `previous_stats` must still hold the old levels/badges (None for new rows).
+    The caller saves `stats`.
     """
-    month_key = _current_month_key()
-    _process_monthly_winner_rollover(month_key)
 
-    rules = _ruleset()
-    counters = _calculate_user_counters(user)
-    monthly = _calculate_monthly_counters(user, month_key)
-
-    previous_stats = UserContributionStats.objects.filter(user=user).first()
-    stats, _ = UserContributionStats.objects.get_or_create(user=user)
-
-    stats.combined_total = counters["combined_total"]
-    stats.dictionary_original_total = counters["dictionary_original_total"]
-    stats.folklore_original_total = counters["folklore_original_total"]
-    stats.total_rejections = counters["total_rejections"]
-    stats.review_completed_total = counters["review_completed_total"]
-
-    stats.dictionary_month = monthly["dictionary_month"]
-    stats.folklore_month = monthly["folklore_month"]
-    stats.combined_month = monthly["combined_month"]
+    for field_name in COUNTER_FIELDS:
+        setattr(stats, field_name, counters[field_name])
     stats.last_month_calculated = month_key
 
     contributor_level, _ = _compute_level(rules["contributor_levels"], stats.combined_total)
@@ -556,12 +596,100 @@ def recompute_user_gamification(user):
     stats.contributor_level = contributor_level.number
     stats.reviewer_level = reviewer_level.number
     stats.unlocked_badges = unlocked_badges
+
+
+@transaction.atomic
+def recompute_user_gamification(user):
+    """
+    Main recalculation entry point for one user.
+
+    Troubleshooting:
+    - If totals look wrong, inspect ContributionEvent rows first.
+    - If reviewer track is wrong, inspect Review/FolkloreReview rows.
+    - If thresholds feel off, inspect GamificationConfig JSON values.
+    """
+    month_key = _current_month_key()
+    _process_monthly_winner_rollover(month_key)
+
+    rules = _ruleset()
+    counters = _calculate_counters_for_users([user.id], month_key)[user.id]
+
+    stats, created = UserContributionStats.objects.get_or_create(user=user)
+    _apply_counters(
+        user,
+        stats,
+        previous_stats=None if created else stats,
+        counters=counters,
+        rules=rules,
+        month_key=month_key,
+    )
     stats.save()
 
     _update_municipality_stats_for_user(user, stats)
+    refresh_user_leaderboard_ranks(user.id)
     return stats
 
 
+def recompute_gamification_for_users(users=None, *, batch_size=500) -> int:
+    """
+    Bulk version of `recompute_user_gamification` for maintenance commands.
+
+    Per batch of users: five grouped counter queries, one stats read and one
+    bulk_create/bulk_update, instead of a dozen queries per user. Municipality
+    aggregates are refreshed once per municipality at the end.
+    Returns the number of users processed.
+    """
+
+    month_key = _current_month_key()
+    _process_monthly_winner_rollover(month_key)
+    rules = _ruleset()
+
+    users = User.objects.all() if users is None else users
+    user_ids = list(users.order_by("id").values_list("id", flat=True))
+    municipalities = set()
+    stat_fields = [
+        *COUNTER_FIELDS,
+        "last_month_calculated",
+        "contributor_level",
+        "reviewer_level",
+        "unlocked_badges",
+        "updated_at",
+    ]
+
+    for offset in range(0, len(user_ids), batch_size):
+        chunk = user_ids[offset : offset + batch_size]
+        with transaction.atomic():
+            existing = {
+                stats.user_id: stats
+                for stats in UserContributionStats.objects.filter(user_id__in=chunk)
+            }
+            counters = _calculate_counters_for_users(chunk, month_key)
+            now = timezone.now()
+            to_create = []
+            to_update = []
+            for user in User.objects.filter(id__in=chunk).select_related("profile"):
+                previous_stats = existing.get(user.id)
+                stats = previous_stats or UserContributionStats(user=user)
+                _apply_counters(
+                    user,
+                    stats,
+                    previous_stats=previous_stats,
+                    counters=counters[user.id],
+                    rules=rules,
+                    month_key=month_key,
+                )
+                stats.updated_at = now
+                (to_update if previous_stats else to_create).append(stats)
+                municipalities.add(_user_municipality(user))
+            UserContributionStats.objects.bulk_create(to_create)
+            UserContributionStats.objects.bulk_update(to_update, stat_fields)
+
+    for municipality in sorted(municipalities - {""}):
+        _refresh_municipality_stats(municipality, month_key)
+    rebuild_leaderboard_ranks()
+    return len(user_ids)
+
+
 def _serialize_level(track, rules, current_value):
     current, next_rule = _compute_level(rules, current_value)
     return {
@@ -669,69 +797,62 @@ def cultural_stewardship_summary_for_user(user):
     return build_gamification_profile_payload(user)
 
 
-def leaderboard_rows(*, municipality=None, metric="combined", period="all_time", request=None):
-    # Fast leaderboard source:
-    # reads from UserContributionStats rather than scanning all raw events.
-    metric = metric if metric in {"dictionary", "folklore", "combined"} else "combined"
-    period = period if period in {"all_time", "monthly"} else "all_time"
-
-    field_name = {
-        ("dictionary", "all_time"): "dictionary_original_total",
-        ("folklore", "all_time"): "folklore_original_total",
-        ("combined", "all_time"): "combined_total",
-        ("dictionary", "monthly"): "dictionary_month",
-        ("folklore", "monthly"): "folklore_month",
-        ("combined", "monthly"): "combined_month",
-    }[(metric, period)]
-
-    rules = _ruleset()
-    current_month = _current_month_key()
-    queryset = (
-        User.objects.filter(leaderboard_participant_q())
-        .distinct()
-        .select_related("profile", "contribution_stats")
-    )
-
-    if municipality:
-        queryset = queryset.filter(profile__municipality__iexact=municipality)
+def _serialize_leaderboard_row(row, *, rules, request=None):
+    photo_url = ""
+    if request and row.profile_photo:
+        photo_url = request.build_absolute_uri(default_storage.url(row.profile_photo))
+    return {
+        "rank": row.rank,
+        "username": row.username,
+        "display_name": row.display_name,
+        "profile_photo": photo_url,
+        "municipality": row.municipality,
+        "metric": row.metric,
+        "period": row.period,
+        "value": row.value,
+        "dictionary_total": row.dictionary_total,
+        "folklore_total": row.folklore_total,
+        "combined_total": row.combined_total,
+        "total_contributions": row.combined_total,
+        "current_contributor_title": _compute_level(
+            rules["contributor_levels"],
+            row.combined_total,
+        )[0].title,
+        "current_reviewer_title": _compute_level(
+            rules["reviewer_levels"],
+            row.review_completed_total,
+        )[0].title,
+    }
 
-    rows = []
-    for user in queryset:
-        stats = getattr(user, "contribution_stats", None)
-        if not stats:
-            stats = recompute_user_gamification(user)
-        elif period == "monthly" and stats.last_month_calculated != current_month:
-            stats = recompute_user_gamification(user)
 
-        value = getattr(stats, field_name, 0)
+def leaderboard_rows(
+    *,
+    municipality=None,
+    metric="combined",
+    period="all_time",
+    request=None,
+    limit=100,
+    around_user=None,
+):
+    """
+    Ranked leaderboard rows from the LeaderboardRank snapshot.
 
-        profile = getattr(user, "profile", None)
-        photo_url = ""
-        if request and profile and profile.profile_photo:
-            photo_url = request.build_absolute_uri(profile.profile_photo.url)
+    Returns `(rows, around_me)`: the top `limit` rows and, when `around_user`
+    is on the board, their row with a few neighbours on each side.
+    """
 
-        rows.append(
-            {
-                "username": user.username,
-                "display_name": formatted_display_name(user, profile),
-                "profile_photo": photo_url,
-                "municipality": profile.municipality if profile else "",
-                "metric": metric,
-                "period": period,
-                "value": value,
-                "dictionary_total": stats.dictionary_original_total,
-                "folklore_total": stats.folklore_original_total,
-                "combined_total": stats.combined_total,
-                "total_contributions": stats.combined_total,
-                "current_contributor_title": _compute_level(
-                    rules["contributor_levels"],
-                    stats.combined_total,
-                )[0].title,
-                "current_reviewer_title": _compute_level(
-                    rules["reviewer_levels"],
-                    stats.review_completed_total,
-                )[0].title,
-            }
-        )
+    metric = metric if metric in {"dictionary", "folklore", "combined"} else "combined"
+    period = period if period in {"all_time", "monthly"} else "all_time"
 
-    return sorted(rows, key=lambda row: (-row["value"], row["username"]))
+    top_rows, around_rows = leaderboard_window(
+        metric=metric,
+        period=period,
+        municipality=municipality,
+        limit=limit,
+        around_user_id=getattr(around_user, "id", None),
+    )
+    rules = _ruleset()
+    return (
+        [_serialize_leaderboard_row(row, rules=rules, request=request) for row in top_rows],
+        [_serialize_leaderboard_row(row, rules=rules, request=request) for row in around_rows],
+    )
@@ -0,0 +1,85 @@
+"""
+users/revision_retention.py
+
+Approved-revision retention for dictionary and folklore entries.
+
+Spec quote:
+"Maximum 20 approved revisions retained.
+Original approved revision excluded from deletion."
+
+How it works:
+- `sweep_revision_retention(model)` ranks every approved, non-base revision
+  per entry with `ROW_NUMBER() OVER (PARTITION BY entry_id ORDER BY
+  approved_at DESC, ...)` and deletes the rows ranked past the limit, one
+  batch per statement. `manage.py sweep_revision_retention` runs it for both
+  apps; `run_lifecycle_maintenance` runs it too.
+- Approval no longer counts and lists revisions. With
+  `REVISION_RETENTION_INLINE` on (the default) it runs one LIMIT 1 probe for
+  a revision past the limit and sweeps that entry only when one exists.
+
+Troubleshooting:
+- An entry shows more than 20 approved revisions: the inline path is off and
+  the sweeper has not run yet; run `manage.py sweep_revision_retention`.
+"""
+
+from django.conf import settings
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+MAX_APPROVED_REVISIONS = 20
+
+# Revisions deleted per statement; keeps each DELETE (and its cascade) small.
+SWEEP_BATCH_SIZE = 1000
+
+
+def _approved_history(model):
+    return model.objects.filter(status=model.Status.APPROVED, is_base_snapshot=False)
+
+
+def _overflow_ids(queryset, *, keep):
+    # Newest first, so the rows ranked past `keep` are the oldest ones.
+    ranked = queryset.annotate(
+        retention_rank=Window(
+            RowNumber(),
+            partition_by=[F("entry_id")],
+            order_by=[F("approved_at").desc(), F("created_at").desc(), F("id").desc()],
+        )
+    )
+    return ranked.filter(retention_rank__gt=keep).values_list("id", flat=True)
+
+
+def sweep_revision_retention(
+    model, *, entry_id=None, keep=MAX_APPROVED_REVISIONS, batch_size=SWEEP_BATCH_SIZE
+) -> int:
+    """
+    Delete approved non-base revisions beyond the newest `keep` per entry.
+
+    `model` is EntryRevision or FolkloreRevision; `entry_id` limits the sweep
+    to one entry. Returns the number of revisions deleted.
+    """
+
+    queryset = _approved_history(model)
+    if entry_id is not None:
+        queryset = queryset.filter(entry_id=entry_id)
+
+    deleted = 0
+    while True:
+        overflow = list(_overflow_ids(queryset, keep=keep)[:batch_size])
+        if not overflow:
+            return deleted
+        model.objects.filter(id__in=overflow).delete()
+        deleted += len(overflow)
+
+
+def enforce_revision_retention_inline(model, entry_id, *, keep=MAX_APPROVED_REVISIONS) -> int:
+    """
+    Approval-time fast path: sweep one entry only once it crosses the limit.
+    """
+
+    if not getattr(settings, "REVISION_RETENTION_INLINE", True):
+        return 0
+    # Any row past `keep` means the limit was crossed; order does not matter.
+    crossed = _approved_history(model).filter(entry_id=entry_id)[keep : keep + 1].exists()
+    if not crossed:
+        return 0
+    return sweep_revision_retention(model, entry_id=entry_id, keep=keep)
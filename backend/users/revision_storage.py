@@ -0,0 +1,503 @@
+"""
+users/revision_storage.py
+
+Delta-encoded `proposed_data` for dictionary and folklore revisions.
+
+Why:
+- Every revision stored a full snapshot, so a folklore entry kept its whole
+  rich-text `content` once per draft, correction and approved revision.
+
+Storage:
+- A keyframe revision stores the full snapshot and has `keyframe` null. Base
+  snapshots, new-entry submissions and revisions whose delta would not save
+  at least half the bytes are keyframes.
+- Every other revision stores a delta against the latest approved keyframe of
+  its entry: `{"set": {...}, "unset": [...], "patch": {field: ops}}`. Long
+  strings changed in place are stored as `patch` ops: a positive int copies
+  that many characters from the keyframe, a negative int skips them and a
+  string is inserted text.
+- Deltas never chain, so reading one needs at most its keyframe.
+- `save()` runs on the request path, so it only stores whole changed values
+  (`set`). Text `patch` ops are computed by `compact_revision_storage`, which
+  `run_lifecycle_maintenance` runs for recently revised entries.
+- Text diffs match words after trimming the common prefix and suffix; a
+  changed middle longer than TEXT_DIFF_MAX_TOKENS is one replacement, so the
+  cost stays bounded however long the text is.
+
+Access stays transparent:
+- Loading a revision keeps the stored form. The first read of
+  `proposed_data` rebuilds it, together with every other unread delta of the
+  model loaded in this thread, with one keyframe query; rows loaded but never
+  read cost nothing. Deferred loads and `refresh_from_db` fetch `keyframe`
+  along with `proposed_data`. Code keeps reading and assigning
+  `revision.proposed_data` as a full snapshot; `save()` re-encodes.
+- Deleting a keyframe (retention sweep, cascade) first stores its dependents
+  as full snapshots (`pre_delete` in users/signals.py). So does re-saving a
+  keyframe that other revisions depend on when it becomes a delta or its
+  snapshot changes; other saves never touch dependents.
+
+Limits:
+- JSON lookups in queries (`proposed_data__term=...`) and `values()` see the
+  stored form, so they only match keyframes.
+
+Troubleshooting:
+- Convert or re-pack existing rows: `manage.py compact_revision_storage`
+  (`--dry-run` reports the bytes it would save).
+"""
+
+import difflib
+import json
+import re
+import threading
+import weakref
+
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+from django.db.models.signals import class_prepared
+from django.dispatch import receiver
+
+# A delta is kept only when it is at most this share of the full snapshot.
+MAX_DELTA_RATIO = 0.5
+
+# Strings at least this long are stored / shown as text ops instead of whole values.
+TEXT_PATCH_MIN_LENGTH = 200
+
+# Past this many differing tokens (both sides) the changed middle of a text is
+# stored / shown as one replacement instead of being matched word by word.
+TEXT_DIFF_MAX_TOKENS = 2000
+
+# Words with their trailing whitespace; leading whitespace is its own token.
+_TEXT_TOKENS = re.compile(r"\s+|\S+\s*")
+
+# Set in an instance's __dict__ while `proposed_data` holds the stored form.
+_STORED = "_proposed_data_stored"
+
+# Per thread: model -> {id(instance): instance} whose stored delta was not read
+# yet. Keyed by identity: two loads of one row are equal but both need rebuilding.
+_unread = threading.local()
+
+
+def _size(value) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+
+
+def _text_opcodes(before: str, after: str):
+    # Tokens join back to the exact strings. Most edits touch a small middle,
+    # so only that part reaches SequenceMatcher (quadratic in the worst case).
+    before_tokens = _TEXT_TOKENS.findall(before)
+    after_tokens = _TEXT_TOKENS.findall(after)
+    limit = min(len(before_tokens), len(after_tokens))
+    head = 0
+    while head < limit and before_tokens[head] == after_tokens[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and before_tokens[-1 - tail] == after_tokens[-1 - tail]:
+        tail += 1
+    before_middle = before_tokens[head : len(before_tokens) - tail]
+    after_middle = after_tokens[head : len(after_tokens) - tail]
+
+    if head:
+        yield "equal", "".join(before_tokens[:head]), "".join(after_tokens[:head])
+    if len(before_middle) + len(after_middle) > TEXT_DIFF_MAX_TOKENS:
+        yield "replace", "".join(before_middle), "".join(after_middle)
+    elif before_middle or after_middle:
+        matcher = difflib.SequenceMatcher(None, before_middle, after_middle, autojunk=False)
+        for tag, b_start, b_end, a_start, a_end in matcher.get_opcodes():
+            yield (
+                tag,
+                "".join(before_middle[b_start:b_end]),
+                "".join(after_middle[a_start:a_end]),
+            )
+    if tail:
+        yield "equal", "".join(before_tokens[-tail:]), "".join(after_tokens[-tail:])
+
+
+def text_patch(before: str, after: str) -> list:
+    """
+    Compact ops that turn `before` into `after` (see module docstring).
+    """
+
+    ops = []
+    for tag, removed, inserted in _text_opcodes(before, after):
+        if tag == "equal":
+            ops.append(len(removed))
+            continue
+        if removed:
+            ops.append(-len(removed))
+        if inserted:
+            ops.append(inserted)
+    return ops
+
+
+def apply_text_patch(before: str, ops) -> str:
+    parts = []
+    cursor = 0
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        elif op > 0:
+            parts.append(before[cursor : cursor + op])
+            cursor += op
+        else:
+            cursor -= op
+    return "".join(parts)
+
+
+def _is_long_text(before, after) -> bool:
+    return (
+        isinstance(before, str)
+        and isinstance(after, str)
+        and max(len(before), len(after)) >= TEXT_PATCH_MIN_LENGTH
+    )
+
+
+def make_delta(keyframe: dict, data: dict, *, text_patches=True) -> dict:
+    """
+    Delta that rebuilds `data` from `keyframe` via `apply_delta`.
+
+    With `text_patches` off, changed long strings are stored whole.
+    """
+
+    delta = {}
+    changed = {}
+    patches = {}
+    for field, value in data.items():
+        if field in keyframe and keyframe[field] == value:
+            continue
+        if text_patches and field in keyframe and _is_long_text(keyframe[field], value):
+            patches[field] = text_patch(keyframe[field], value)
+        else:
+            changed[field] = value
+    removed = sorted(field for field in keyframe if field not in data)
+    if changed:
+        delta["set"] = changed
+    if removed:
+        delta["unset"] = removed
+    if patches:
+        delta["patch"] = patches
+    return delta
+
+
+def apply_delta(keyframe: dict, delta: dict) -> dict:
+    data = {
+        field: value for field, value in keyframe.items() if field not in delta.get("unset", ())
+    }
+    for field, ops in delta.get("patch", {}).items():
+        data[field] = apply_text_patch(keyframe[field], ops)
+    data.update(delta.get("set", {}))
+    return data
+
+
+def snapshot_diff(before, after) -> dict:
+    """
+    Reviewer-facing diff between two snapshots.
+
+    Short fields come back as `{"before", "after"}`; long text as `{"ops"}`
+    where `["=", n]` keeps n characters and `["-", text]` / `["+", text]`
+    remove or insert text, so unchanged paragraphs are not shipped.
+    """
+
+    before = before if isinstance(before, dict) else {}
+    after = after if isinstance(after, dict) else {}
+    changes = {}
+    for field in sorted(set(before) | set(after)):
+        old, new = before.get(field), after.get(field)
+        if old == new:
+            continue
+        if _is_long_text(old, new):
+            ops = []
+            for tag, removed, inserted in _text_opcodes(old, new):
+                if tag == "equal":
+                    ops.append(["=", len(removed)])
+                    continue
+                if removed:
+                    ops.append(["-", removed])
+                if inserted:
+                    ops.append(["+", inserted])
+            changes[field] = {"ops": ops}
+        else:
+            changes[field] = {"before": old, "after": new}
+    return changes
+
+
+def _unread_instances(model) -> weakref.WeakValueDictionary:
+    if not hasattr(_unread, "by_model"):
+        _unread.by_model = {}
+    return _unread.by_model.setdefault(model, weakref.WeakValueDictionary())
+
+
+def _mark_unread(instance) -> None:
+    instance.__dict__[_STORED] = True
+    _unread_instances(type(instance))[id(instance)] = instance
+
+
+def _rebuild_unread(model) -> None:
+    unread = _unread_instances(model)
+    pending = []
+    for key, instance in list(unread.items()):
+        if _STORED not in instance.__dict__:
+            del unread[key]
+        elif "keyframe_id" in instance.__dict__:
+            # Loads that deferred `keyframe` wait for their own first read.
+            pending.append(instance)
+            del unread[key]
+    by_db = {}
+    for instance in pending:
+        by_db.setdefault(instance._state.db, []).append(instance)
+    for using, instances in by_db.items():
+        keyframe_ids = {instance.keyframe_id for instance in instances} - {None}
+        keyframes = dict(
+            model._base_manager.using(using)
+            .filter(id__in=keyframe_ids)
+            .values_list("id", "proposed_data")
+        )
+        for instance in instances:
+            del instance.__dict__[_STORED]
+            stored = instance.__dict__["proposed_data"]
+            keyframe = keyframes.get(instance.keyframe_id)
+            if isinstance(keyframe, dict) and isinstance(stored, dict):
+                instance.__dict__["proposed_data"] = apply_delta(keyframe, stored)
+
+
+class StoredProposedData(DeferredAttribute):
+    """
+    `proposed_data` descriptor: a loaded delta is rebuilt on its first read.
+
+    Assigning a value stores it as the full snapshot.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if _STORED not in instance.__dict__:
+            return value
+        if instance.__dict__.get("keyframe_id", 0) is None:
+            instance.__dict__.pop(_STORED)
+            return value
+        if "keyframe_id" not in instance.__dict__:
+            instance.refresh_from_db(fields=["keyframe_id"])
+        _mark_unread(instance)
+        _rebuild_unread(type(instance))
+        return instance.__dict__[self.field.attname]
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+        instance.__dict__.pop(_STORED, None)
+
+
+class DeltaEncodedRevision(models.Model):
+    """
+    Abstract base for revision models whose `proposed_data` is delta-encoded.
+
+    Subclasses define `entry`, `status` (with `Status.APPROVED`),
+    `is_base_snapshot`, `approved_at`, `created_at` and `proposed_data`.
+    """
+
+    # Null on keyframes; otherwise the revision whose full snapshot
+    # `proposed_data` is a delta against.
+    keyframe = models.ForeignKey(
+        "self",
+        on_delete=models.DO_NOTHING,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = instance.__dict__
+        # Keyframes (`keyframe_id` None) already hold the full snapshot.
+        if "proposed_data" in loaded and loaded.get("keyframe_id", 0) is not None:
+            _mark_unread(instance)
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # A delta is only readable together with the keyframe it was stored against.
+        if fields is not None and "proposed_data" in fields:
+            fields = {*fields, "keyframe_id"}
+        return super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
+    def _latest_keyframe(self):
+        if not self.entry_id or self.is_base_snapshot:
+            return None
+        return (
+            type(self)
+            ._base_manager.filter(
+                entry_id=self.entry_id,
+                status=self.Status.APPROVED,
+                keyframe__isnull=True,
+            )
+            .exclude(id=self.id)
+            .order_by("-approved_at", "-created_at")
+            .values_list("id", "proposed_data")
+            .first()
+        )
+
+    def encode_proposed_data(self, keyframe=None, *, text_patches=True):
+        """
+        Return `(keyframe_id, stored_value)` for the current `proposed_data`.
+
+        `keyframe` is an `(id, full_snapshot)` pair; looked up when omitted.
+        """
+
+        data = self.proposed_data
+        if not isinstance(data, dict):
+            return None, data
+        keyframe = keyframe if keyframe is not None else self._latest_keyframe()
+        if not keyframe or not isinstance(keyframe[1], dict):
+            return None, data
+        delta = make_delta(keyframe[1], data, text_patches=text_patches)
+        if _size(delta) > _size(data) * MAX_DELTA_RATIO:
+            return None, data
+        return keyframe[0], delta
+
+    def _release_changed_keyframe(self, keyframe_id, stored) -> None:
+        # Dependents decode against the stored snapshot: rewrite them only when
+        # this row stops being a keyframe or its snapshot changes.
+        model = type(self)
+        if not model._base_manager.filter(keyframe_id=self.id).exists():
+            return
+        if keyframe_id is None:
+            current = (
+                model._base_manager.filter(id=self.id)
+                .values_list("proposed_data", flat=True)
+                .first()
+            )
+            if current == stored:
+                return
+        store_dependents_in_full(model, self.id)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "proposed_data" not in update_fields:
+            if not (self.is_base_snapshot and self.keyframe_id):
+                return super().save(*args, **kwargs)
+            # Base snapshots are always full keyframes.
+            update_fields = {*update_fields, "proposed_data"}
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "keyframe"}
+
+        # Only a row stored as a keyframe can have dependents (deferred: assume it is).
+        was_keyframe = not self._state.adding and self.__dict__.get("keyframe_id") is None
+        data = self.proposed_data
+        keyframe_id, stored = self.encode_proposed_data(text_patches=False)
+        if was_keyframe and self.status == self.Status.APPROVED:
+            self._release_changed_keyframe(keyframe_id, stored)
+        self.keyframe_id, self.proposed_data = keyframe_id, stored
+        try:
+            return super().save(*args, **kwargs)
+        finally:
+            self.proposed_data = data
+
+
+@receiver(class_prepared)
+def install_proposed_data_descriptor(sender, **kwargs):
+    # Model fields get a plain DeferredAttribute; concrete revision models swap in
+    # the rebuilding one once their fields exist.
+    if issubclass(sender, DeltaEncodedRevision) and not sender._meta.abstract:
+        field = sender._meta.get_field("proposed_data")
+        setattr(sender, field.attname, StoredProposedData(field))
+
+
+def store_dependents_in_full(model, keyframe_id) -> int:
+    """
+    Rewrite revisions encoded against `keyframe_id` as full keyframes.
+    """
+
+    dependents = list(
+        model._base_manager.filter(keyframe_id=keyframe_id).only("keyframe", "proposed_data")
+    )
+    for dependent in dependents:
+        model._base_manager.filter(id=dependent.id).update(
+            keyframe=None, proposed_data=dependent.proposed_data
+        )
+    return len(dependents)
+
+
+def release_keyframe(model, instance) -> int:
+    """
+    `pre_delete` hook (users/signals.py): keep dependents readable.
+    """
+
+    if instance.keyframe_id is not None:
+        return 0
+    return store_dependents_in_full(model, instance.id)
+
+
+def compact_revisions(model, *, dry_run=False, batch_size=200, since=None) -> dict:
+    """
+    Re-encode every revision of `model`, entry by entry.
+
+    Approved revisions are visited by approval time, so each one can use the
+    latest keyframe before it; drafts and other states use the final one.
+    `since` limits the pass to entries with a revision created or approved
+    after it. Returns `{"revisions", "keyframes", "bytes_before", "bytes_after"}`.
+    """
+
+    report = {"revisions": 0, "keyframes": 0, "bytes_before": 0, "bytes_after": 0}
+    revisions_with_entry = model._base_manager.filter(entry__isnull=False)
+    if since is not None:
+        revisions_with_entry = revisions_with_entry.filter(
+            models.Q(created_at__gte=since) | models.Q(approved_at__gte=since)
+        )
+    entry_ids = list(
+        revisions_with_entry.order_by("entry_id").values_list("entry_id", flat=True).distinct()
+    )
+    for start in range(0, len(entry_ids), batch_size):
+        chunk = entry_ids[start : start + batch_size]
+        stored = dict(
+            model._base_manager.filter(entry_id__in=chunk).values_list("id", "proposed_data")
+        )
+        revisions = list(model.objects.filter(entry_id__in=chunk))
+        by_entry = {}
+        for revision in revisions:
+            by_entry.setdefault(revision.entry_id, []).append(revision)
+
+        changed = []
+        for entry_revisions in by_entry.values():
+            approved_first = sorted(
+                entry_revisions,
+                key=lambda item: (
+                    item.status != model.Status.APPROVED,
+                    not item.is_base_snapshot,
+                    item.approved_at or item.created_at,
+                    item.created_at,
+                ),
+            )
+            keyframe = None
+            for revision in approved_first:
+                data = revision.proposed_data
+                if revision.is_base_snapshot:
+                    keyframe_id, value = None, data
+                else:
+                    keyframe_id, value = revision.encode_proposed_data(keyframe=keyframe or ())
+                if keyframe_id is None and revision.status == model.Status.APPROVED:
+                    keyframe = (revision.id, data)
+                report["revisions"] += 1
+                report["keyframes"] += keyframe_id is None
+                report["bytes_before"] += _size(stored[revision.id])
+                report["bytes_after"] += _size(value)
+                if keyframe_id != revision.keyframe_id or value != stored[revision.id]:
+                    revision.keyframe_id, revision.proposed_data = keyframe_id, value
+                    changed.append(revision)
+
+        if not dry_run and changed:
+            model._base_manager.bulk_update(changed, ["keyframe", "proposed_data"], batch_size=500)
+
+    if since is not None:
+        return report
+    unattached = model._base_manager.filter(entry__isnull=True).values_list(
+        "proposed_data", flat=True
+    )
+    for data in unattached.iterator(chunk_size=1000):
+        size = _size(data)
+        report["revisions"] += 1
+        report["keyframes"] += 1
+        report["bytes_before"] += size
+        report["bytes_after"] += size
+    return report
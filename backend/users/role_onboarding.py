@@ -35,6 +35,7 @@ from users.names import (
 from users.names import (
     display_name as formatted_display_name,
 )
+from users.roles import in_any_group
 
 User = get_user_model()
 CONTRIBUTOR_GROUP = "Contributor"
@@ -60,11 +61,11 @@ def _clean_email(value, *, required=True):
 # - Handles applications, screening decisions, and direct invites.
 # - Keeps approval quorum rules in backend so frontend cannot bypass them.
 def is_admin(user):
-    return user.is_superuser or user.groups.filter(name=ADMIN_GROUP).exists()
+    return user.is_superuser or in_any_group(user, ADMIN_GROUP)
 
 
 def is_reviewer(user):
-    return user.groups.filter(name=REVIEWER_GROUP).exists()
+    return in_any_group(user, REVIEWER_GROUP)
 
 
 def can_screen_roles(user):
@@ -114,23 +115,15 @@ def activate_role_for_approved_application(application):
 
 def _user_already_has_role(*, user, target_role):
     if target_role == RoleApplication.TargetRole.CONTRIBUTOR:
-        return (
-            user.is_superuser
-            or user.groups.filter(
-                name__in=[CONTRIBUTOR_GROUP, REVIEWER_GROUP, CONSULTANT_GROUP, ADMIN_GROUP]
-            ).exists()
+        return user.is_superuser or in_any_group(
+            user, CONTRIBUTOR_GROUP, REVIEWER_GROUP, CONSULTANT_GROUP, ADMIN_GROUP
         )
     if target_role == RoleApplication.TargetRole.REVIEWER:
-        return (
-            user.is_superuser or user.groups.filter(name__in=[REVIEWER_GROUP, ADMIN_GROUP]).exists()
-        )
+        return user.is_superuser or in_any_group(user, REVIEWER_GROUP, ADMIN_GROUP)
     if target_role == RoleOnboardingRecord.Role.CONSULTANT:
-        return (
-            user.is_superuser
-            or user.groups.filter(name__in=[CONSULTANT_GROUP, ADMIN_GROUP]).exists()
-        )
+        return user.is_superuser or in_any_group(user, CONSULTANT_GROUP, ADMIN_GROUP)
     if target_role == RoleOnboardingRecord.Role.ADMIN:
-        return user.is_superuser or user.groups.filter(name=ADMIN_GROUP).exists()
+        return user.is_superuser or in_any_group(user, ADMIN_GROUP)
     return False
 
 
@@ -186,9 +179,8 @@ def create_role_application(*, applicant, target_role, reviewer_reason="", publi
     if target_role not in set(RoleApplication.TargetRole.values):
         raise ValidationError("Invalid target role.")
     reviewer_reason = str(reviewer_reason or "").strip()
-    is_contributor_upgrade = (
-        target_role == RoleApplication.TargetRole.REVIEWER
-        and applicant.groups.filter(name=CONTRIBUTOR_GROUP).exists()
+    is_contributor_upgrade = target_role == RoleApplication.TargetRole.REVIEWER and in_any_group(
+        applicant, CONTRIBUTOR_GROUP
     )
     if is_contributor_upgrade and not reviewer_reason:
         raise ValidationError("Reason for applying as reviewer is required.")
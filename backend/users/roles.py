@@ -0,0 +1,41 @@
+"""
+users/roles.py
+
+Group-membership checks shared by middleware, views and services.
+
+Why:
+- One request used to ask "is this user an Admin / Reviewer / ..." several
+  times (middleware, view guard, serializer), each an EXISTS query.
+- `user_group_names(user)` loads the names once and remembers them on the user
+  object. `request.user` is rebuilt for every request, so the memo lives for one
+  request only.
+
+Troubleshooting:
+- A role change is not visible on an object you already hold: changes through
+  `user.groups` drop the memo (users/signals.py); changes made from the Group
+  side (`group.user_set.add(...)`) do not, so call `forget_group_names(user)`.
+"""
+
+_MEMO_ATTR = "_group_names_memo"
+
+
+def user_group_names(user) -> frozenset:
+    """
+    Return the names of `user`'s groups, memoized on the user object.
+    """
+
+    if user is None or not user.is_authenticated:
+        return frozenset()
+    names = getattr(user, _MEMO_ATTR, None)
+    if names is None:
+        names = frozenset(user.groups.values_list("name", flat=True))
+        setattr(user, _MEMO_ATTR, names)
+    return names
+
+
+def in_any_group(user, *group_names) -> bool:
+    return not user_group_names(user).isdisjoint(group_names)
+
+
+def forget_group_names(user) -> None:
+    user.__dict__.pop(_MEMO_ATTR, None)
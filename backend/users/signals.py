@@ -1,43 +1,295 @@
-from django.db.models.signals import post_save
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
-from dictionary.models import EntryRevision
-from folklore.models import FolkloreRevision
+from dictionary.models import Entry, EntryRevision, VariantGroup
+from dictionary.public_view import refresh_contributor_public_views
+from folklore.models import FolkloreEntry, FolkloreRevision
+from resources.models import ResourceDocument
 from reviews.models import FolkloreReview, Review
-from users.models import ContributionEvent
-from users.recognition import recompute_user_gamification
+from users.gamification_queue import (
+    request_gamification_recompute,
+    request_leaderboard_refresh,
+)
+from users.leaderboard import (
+    rebuild_leaderboard_ranks,
+    remove_user_from_leaderboards,
+)
+from users.models import (
+    ContributionEvent,
+    GamificationConfig,
+    PublicContentVersion,
+    PublicStatusCounter,
+    SiteContentSettings,
+    UserProfile,
+)
+from users.public_counters import (
+    apply_contributor_visibility_change,
+    apply_status_change,
+)
+from users.public_versions import bump_public_content_version
+from users.recognition import clear_ruleset_cache
+from users.revision_storage import release_keyframe
+from users.roles import forget_group_names
+from users.site_content import clear_site_settings_cache
+
+User = get_user_model()
+
+ROLE_DEPENDENT_SCOPES = (
+    PublicContentVersion.Scope.DICTIONARY,
+    PublicContentVersion.Scope.FOLKLORE,
+    PublicContentVersion.Scope.RESOURCES,
+)
+PUBLIC_CONTENT_MODELS = {
+    Entry: PublicContentVersion.Scope.DICTIONARY,
+    VariantGroup: PublicContentVersion.Scope.DICTIONARY,
+    FolkloreEntry: PublicContentVersion.Scope.FOLKLORE,
+    FolkloreReview: PublicContentVersion.Scope.FOLKLORE,
+    ResourceDocument: PublicContentVersion.Scope.RESOURCES,
+}
+PUBLIC_REVISION_MODELS = {
+    EntryRevision: PublicContentVersion.Scope.DICTIONARY,
+    FolkloreRevision: PublicContentVersion.Scope.FOLKLORE,
+}
+
+COUNTED_ENTRY_MODELS = {
+    Entry: (PublicStatusCounter.Scope.DICTIONARY, "initial_contributor_id"),
+    FolkloreEntry: (PublicStatusCounter.Scope.FOLKLORE, "contributor_id"),
+}
+
+
+# Gamification recompute is queued, not run inline: the request only writes one
+# coalesced job row per user (see users/gamification_queue.py).
 
 
 @receiver(post_save, sender=ContributionEvent)
 def on_contribution_event_saved(sender, instance, created, **kwargs):
     # Event-driven recalculation: approvals create contribution events.
     if created:
-        recompute_user_gamification(instance.user)
+        request_gamification_recompute(instance.user_id)
 
 
 @receiver(post_save, sender=Review)
 def on_dictionary_review_saved(sender, instance, created, **kwargs):
     # Reviewer progression should update whenever a review decision is recorded.
     if created:
-        recompute_user_gamification(instance.reviewer)
+        request_gamification_recompute(instance.reviewer_id)
 
 
 @receiver(post_save, sender=FolkloreReview)
 def on_folklore_review_saved(sender, instance, created, **kwargs):
     # Keeps reviewer level progression in sync for folklore workflows too.
     if created:
-        recompute_user_gamification(instance.reviewer)
+        request_gamification_recompute(instance.reviewer_id)
+
+
+@receiver(pre_save, sender=EntryRevision)
+@receiver(pre_save, sender=FolkloreRevision)
+def on_revision_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    _remember_previous_value(instance, "status", update_fields)
 
 
 @receiver(post_save, sender=EntryRevision)
-def on_dictionary_revision_saved(sender, instance, created, **kwargs):
-    # Rejection counters come from revision state; recompute when revision updates.
-    if instance.contributor_id:
-        recompute_user_gamification(instance.contributor)
+@receiver(post_save, sender=FolkloreRevision)
+def on_revision_saved(sender, instance, raw=False, **kwargs):
+    # Only moves into/out of "rejected" change revision-based counters,
+    # so draft autosaves never touch the queue.
+    if raw or not hasattr(instance, "_previous_counted_value"):
+        return
+    previous = instance.__dict__.pop("_previous_counted_value")
+    if previous == instance.status:
+        return
+    if sender.Status.REJECTED in {previous, instance.status}:
+        request_gamification_recompute(instance.contributor_id)
+
+
+def _remember_previous_value(instance, field_name, update_fields):
+    # Read the stored value (not the in-memory one) so stale instances cannot double count.
+    if update_fields is not None and field_name not in update_fields:
+        return
+    previous = None
+    if instance.pk and not instance._state.adding:
+        previous = (
+            type(instance).objects.filter(pk=instance.pk).values_list(field_name, flat=True).first()
+        )
+    instance._previous_counted_value = previous
+
+
+@receiver(pre_save, sender=Entry)
+@receiver(pre_save, sender=FolkloreEntry)
+def on_public_entry_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    _remember_previous_value(instance, "status", update_fields)
+
+
+@receiver(post_save, sender=Entry)
+@receiver(post_save, sender=FolkloreEntry)
+def on_public_entry_saved(sender, instance, raw=False, **kwargs):
+    # Keeps public listing header counters in step with status changes.
+    if raw or not hasattr(instance, "_previous_counted_value"):
+        return
+    scope, contributor_field = COUNTED_ENTRY_MODELS[sender]
+    apply_status_change(
+        scope,
+        contributor_id=getattr(instance, contributor_field),
+        old_status=instance.__dict__.pop("_previous_counted_value"),
+        new_status=instance.status,
+    )
+
+
+@receiver(post_delete, sender=Entry)
+@receiver(post_delete, sender=FolkloreEntry)
+def on_public_entry_deleted(sender, instance, **kwargs):
+    scope, contributor_field = COUNTED_ENTRY_MODELS[sender]
+    apply_status_change(
+        scope,
+        contributor_id=getattr(instance, contributor_field),
+        old_status=instance.status,
+        new_status=None,
+    )
+
+
+@receiver(pre_save, sender=UserProfile)
+def on_profile_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    _remember_previous_value(instance, "show_live_contributions", update_fields)
+
+
+@receiver(post_save, sender=UserProfile)
+def on_profile_saved(sender, instance, raw=False, **kwargs):
+    # Hiding live contributions removes that user's entries from public listings.
+    if raw or not hasattr(instance, "_previous_counted_value"):
+        return
+    previous = instance.__dict__.pop("_previous_counted_value")
+    was_visible = True if previous is None else bool(previous)
+    if was_visible != bool(instance.show_live_contributions):
+        apply_contributor_visibility_change(
+            instance.user_id,
+            visible=bool(instance.show_live_contributions),
+        )
+        refresh_contributor_public_views(instance.user_id)
+
+
+# Leaderboard snapshot: eligibility (role groups, active/password, profile opt-in)
+# and row display data (names, municipality, photo) live outside the stats table.
+# Re-ranking takes the board lock, so with a queue worker these saves only
+# enqueue it (`request_leaderboard_refresh`).
+
 
+@receiver(post_save, sender=UserProfile)
+def on_profile_saved_refresh_leaderboard(sender, instance, raw=False, **kwargs):
+    if not raw:
+        request_leaderboard_refresh(instance.user_id)
 
+
+@receiver(post_save, sender=User)
+def on_user_saved_refresh_leaderboard(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    # New accounts have no profile yet; logins only touch last_login.
+    if raw or created or (update_fields is not None and set(update_fields) <= {"last_login"}):
+        return
+    request_leaderboard_refresh(instance.id)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def on_user_groups_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    # Roles decide staff history depth, flag buttons and resource visibility.
+    bump_public_content_version(*ROLE_DEPENDENT_SCOPES)
+    if not reverse:
+        forget_group_names(instance)
+        request_leaderboard_refresh(instance.pk)
+        return
+    # Changed from the Group side: `pk_set` holds user ids, but is None after a clear.
+    if pk_set is None:
+        rebuild_leaderboard_ranks()
+        return
+    for user_id in pk_set:
+        request_leaderboard_refresh(user_id)
+
+
+@receiver(pre_delete, sender=User)
+def on_user_deleting(sender, instance, **kwargs):
+    # Close the rank gaps before CASCADE removes the rows.
+    remove_user_from_leaderboards(instance.pk)
+
+
+@receiver(pre_delete, sender=EntryRevision)
+@receiver(pre_delete, sender=FolkloreRevision)
+def on_revision_deleting(sender, instance, **kwargs):
+    # Deltas stored against this keyframe become full snapshots first.
+    release_keyframe(sender, instance)
+
+
+@receiver(post_save, sender=GamificationConfig)
+@receiver(post_delete, sender=GamificationConfig)
+def on_gamification_config_changed(sender, **kwargs):
+    # Drop this worker's cached rules now and again after commit, so a value
+    # cached mid-transaction is not kept; other workers revalidate after the TTL.
+    clear_ruleset_cache()
+    transaction.on_commit(clear_ruleset_cache)
+    # Level titles on leaderboard rows come from the rules.
+    bump_public_content_version(PublicContentVersion.Scope.LEADERBOARD)
+
+
+@receiver(post_save, sender=SiteContentSettings)
+@receiver(post_delete, sender=SiteContentSettings)
+def on_site_content_settings_changed(sender, **kwargs):
+    # Same pattern as GamificationConfig: clear now and again after commit.
+    clear_site_settings_cache()
+    transaction.on_commit(clear_site_settings_cache)
+
+
+# Conditional GET: bump the publish sequence of every public scope a write can
+# change (see users/public_versions.py). Bumps run once the writer's
+# transaction commits, so clients never cache the old payload under the new version.
+
+
+@receiver(post_save, sender=Entry)
+@receiver(post_delete, sender=Entry)
+@receiver(post_save, sender=VariantGroup)
+@receiver(post_delete, sender=VariantGroup)
+@receiver(post_save, sender=FolkloreEntry)
+@receiver(post_delete, sender=FolkloreEntry)
+@receiver(post_save, sender=FolkloreReview)
+@receiver(post_save, sender=ResourceDocument)
+@receiver(post_delete, sender=ResourceDocument)
+def on_public_content_changed(sender, raw=False, **kwargs):
+    if not raw:
+        bump_public_content_version(PUBLIC_CONTENT_MODELS[sender])
+
+
+@receiver(post_save, sender=EntryRevision)
+@receiver(post_delete, sender=EntryRevision)
 @receiver(post_save, sender=FolkloreRevision)
-def on_folklore_revision_saved(sender, instance, created, **kwargs):
-    # Recompute on revision save so rejection counters stay accurate.
-    if instance.contributor_id:
-        recompute_user_gamification(instance.contributor)
+@receiver(post_delete, sender=FolkloreRevision)
+def on_public_revision_changed(sender, instance, raw=False, **kwargs):
+    # Drafts and pending revisions never appear on public pages.
+    if not raw and instance.status in {sender.Status.APPROVED, sender.Status.REJECTED}:
+        bump_public_content_version(PUBLIC_REVISION_MODELS[sender])
+
+
+@receiver(m2m_changed, sender=Entry.last_approved_by.through)
+def on_entry_approvers_changed(sender, action, **kwargs):
+    if action in {"post_add", "post_remove", "post_clear"}:
+        bump_public_content_version(PublicContentVersion.Scope.DICTIONARY)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_save, sender=User)
+def on_public_actor_changed(sender, created=False, raw=False, update_fields=None, **kwargs):
+    # Names and live-contribution visibility show up on entry pages.
+    if raw or (sender is User and created):
+        return
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    bump_public_content_version(
+        PublicContentVersion.Scope.DICTIONARY, PublicContentVersion.Scope.FOLKLORE
+    )
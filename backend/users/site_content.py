@@ -0,0 +1,65 @@
+"""
+users/site_content.py
+
+Shared, per-process cached read of the single SiteContentSettings row.
+
+Why:
+- MaintenanceModeMiddleware, the beta gate and the public site-content API all
+  read the same "default" row on every request.
+- The row changes a few times a year, so each worker keeps it in a
+  VersionedTTLCache (users/cache.py). The version is the row's `updated_at`,
+  which `save()` bumps on every admin edit.
+
+Rules:
+- The cached row is shared by every request in the worker: read it, never
+  modify or save it. Write paths load their own row with `get_or_create`.
+
+Troubleshooting:
+- Maintenance mode toggled but another worker still serves the old state: it
+  catches up within `PROCESS_CACHE_TTL_SECONDS`.
+"""
+
+from django.db import OperationalError, ProgrammingError
+
+from users.cache import VersionedTTLCache
+from users.models import SiteContentSettings
+
+SITE_SETTINGS_KEY = "default"
+
+
+def _load_site_settings():
+    try:
+        return (
+            SiteContentSettings.objects.filter(key=SITE_SETTINGS_KEY)
+            .select_related("updated_by")
+            .first()
+        )
+    except (OperationalError, ProgrammingError):
+        # Table missing (fresh checkout before migrate): behave as "no row".
+        return None
+
+
+def _site_settings_version():
+    try:
+        return (
+            SiteContentSettings.objects.filter(key=SITE_SETTINGS_KEY)
+            .values_list("id", "updated_at")
+            .first()
+        )
+    except (OperationalError, ProgrammingError):
+        return None
+
+
+SITE_SETTINGS_CACHE = VersionedTTLCache(loader=_load_site_settings, version=_site_settings_version)
+
+
+def get_site_settings():
+    """
+    Return the cached "default" SiteContentSettings row, or None if none exists.
+    """
+
+    return SITE_SETTINGS_CACHE.get()
+
+
+def clear_site_settings_cache() -> None:
+    SITE_SETTINGS_CACHE.clear()
@@ -1,5 +1,7 @@
 import json
 import tempfile
+from datetime import timedelta
+from io import StringIO
 from unittest.mock import patch
 from urllib.parse import urlparse
 
@@ -8,20 +10,30 @@ from django.contrib.auth.models import Group
 from django.core import mail
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
 from dictionary.models import Entry, EntryRevision, EntryStatus
 from folklore.models import FolkloreEntry
 from reviews.models import Review
 from reviews.services import submit_review
 from users.contributions import contribution_summary_for_user, global_leaderboard
+from users.leaderboard import rebuild_leaderboard_ranks, refresh_user_leaderboard_ranks
 from users.models import (
     AdminAccountAction,
     ContributionEvent,
     GamificationConfig,
+    GamificationRecomputeJob,
+    GamificationRuntimeState,
+    LeaderboardRank,
     MunicipalityMonthlyWinner,
     MunicipalityStats,
     Notification,
+    PublicContentVersion,
+    PublicStatusCounter,
     RecognitionEvent,
     RoleApplication,
     RoleApplicationDecision,
@@ -33,10 +45,16 @@ from users.models import (
     UserSessionEvent,
 )
 from users.recognition import (
+    COUNTER_FIELDS,
+    _ruleset,
     build_gamification_profile_payload,
+    clear_ruleset_cache,
     contributor_level_for_user,
+    recompute_gamification_for_users,
     recompute_user_gamification,
 )
+from users.roles import in_any_group, user_group_names
+from users.site_content import clear_site_settings_cache, get_site_settings
 
 User = get_user_model()
 
@@ -604,6 +622,8 @@ class PublicUserProfileApiTests(TestCase):
 
 class SiteContentApiTests(TestCase):
     def setUp(self):
+        clear_site_settings_cache()
+        self.addCleanup(clear_site_settings_cache)
         self.admin_group, _ = Group.objects.get_or_create(name="Admin")
         self.admin_user = User.objects.create_user(username="site_admin", password="testpass123")
         self.admin_user.groups.add(self.admin_group)
@@ -2281,6 +2301,7 @@ class CulturalStewardshipTests(TestCase):
     def test_level_uses_preserved_entries_language(self):
         for i in range(5):
             self._approve_dictionary_submission(term=f"term_{i}")
+        call_command("process_gamification_queue", all=True, stdout=StringIO())
 
         level = contributor_level_for_user(self.user)
         self.assertEqual(level["current_level"]["title"], "Language Contributor")
@@ -2600,6 +2621,8 @@ class GamificationAdvancedFeaturesTests(TestCase):
         self.user = User.objects.create_user(username="advanced_user", password="testpass123")
 
     def test_admin_config_can_override_level_titles_and_thresholds(self):
+        # The rollback at test end does not fire save signals; drop cached rules too.
+        self.addCleanup(clear_ruleset_cache)
         GamificationConfig.objects.create(
             name="default",
             contributor_levels=[
@@ -2672,6 +2695,211 @@ class GamificationAdvancedFeaturesTests(TestCase):
             config.full_clean()
 
 
+class GamificationRulesCacheTests(TestCase):
+    def setUp(self):
+        clear_ruleset_cache()
+        self.addCleanup(clear_ruleset_cache)
+
+    def _config(self, title):
+        return GamificationConfig.objects.create(
+            name="default",
+            contributor_levels=[{"number": 0, "title": title, "threshold": 0}],
+            reviewer_levels=[{"number": 0, "title": "Reviewer", "threshold": 0}],
+            dictionary_badges=[{"key": "word", "name": "Word", "threshold": 1}],
+            folklore_badges=[{"key": "story", "name": "Story", "threshold": 1}],
+            quality_badge={"key": "q", "name": "Q", "threshold": 1, "max_rejections": 0},
+        )
+
+    def test_rules_are_served_from_cache_within_ttl(self):
+        _ruleset()
+
+        with self.assertNumQueries(0):
+            rules = _ruleset()
+
+        self.assertEqual(rules["contributor_levels"][0].title, "Community Learner")
+
+    def test_saving_config_invalidates_this_process_immediately(self):
+        _ruleset()
+        config = self._config("Starter")
+
+        self.assertEqual(_ruleset()["contributor_levels"][0].title, "Starter")
+
+        config.contributor_levels = [{"number": 0, "title": "Renamed", "threshold": 0}]
+        config.save()
+        self.assertEqual(_ruleset()["contributor_levels"][0].title, "Renamed")
+
+    @override_settings(PROCESS_CACHE_TTL_SECONDS=0)
+    def test_expired_entry_only_rechecks_version_when_unchanged(self):
+        _ruleset()
+
+        with self.assertNumQueries(1):
+            _ruleset()
+
+    @override_settings(PROCESS_CACHE_TTL_SECONDS=0)
+    def test_edits_from_other_workers_are_picked_up_by_version_stamp(self):
+        config = self._config("Starter")
+        self.assertEqual(_ruleset()["contributor_levels"][0].title, "Starter")
+
+        # queryset.update() sends no signal, like a save made in another worker.
+        GamificationConfig.objects.filter(pk=config.pk).update(
+            contributor_levels=[{"number": 0, "title": "Remote", "threshold": 0}],
+            updated_at=config.updated_at + timedelta(seconds=1),
+        )
+
+        self.assertEqual(_ruleset()["contributor_levels"][0].title, "Remote")
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        clear_site_settings_cache()
+        self.addCleanup(clear_site_settings_cache)
+        self.user = User.objects.create_user(username="etag_user", password="testpass123")
+
+    def _entry(self, term):
+        return Entry.objects.create(
+            term=term,
+            status=EntryStatus.APPROVED,
+            initial_contributor=self.user,
+            last_revised_by=self.user,
+        )
+
+    def test_unchanged_dictionary_list_returns_304_after_one_lookup(self):
+        self._entry("vahay")
+        first = self.client.get("/api/dictionary/entries")
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first.has_header("Last-Modified"))
+        get_site_settings()
+
+        with self.assertNumQueries(1):
+            repeat = self.client.get("/api/dictionary/entries", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.content, b"")
+
+    def test_publishing_changes_the_etag(self):
+        entry = self._entry("vahay")
+        etag = self.client.get(f"/api/dictionary/entries/{entry.id}")["ETag"]
+
+        entry.meaning = "house"
+        with self.captureOnCommitCallbacks(execute=True):
+            entry.save()
+        response = self.client.get(f"/api/dictionary/entries/{entry.id}", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["semantic_core"]["meaning"], "house")
+
+    def test_version_bump_waits_for_commit_and_coalesces(self):
+        versions = PublicContentVersion.objects.filter(scope=PublicContentVersion.Scope.DICTIONARY)
+        before = versions.values_list("version", flat=True).first() or 0
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self._entry("vahay")
+            self._entry("vakul")
+            self.assertEqual(versions.values_list("version", flat=True).first() or 0, before)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(versions.get().version, before + 1)
+
+    def test_etag_is_per_user(self):
+        etag = self.client.get("/api/folklore/entries")["ETag"]
+
+        self.client.force_login(self.user)
+        response = self.client.get("/api/folklore/entries", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since_is_honoured(self):
+        first = self.client.get("/api/resources")
+
+        response = self.client.get("/api/resources", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_leaderboard_etag_follows_rank_changes(self):
+        etag = self.client.get("/api/leaderboard/global")["ETag"]
+        self.assertEqual(
+            self.client.get("/api/leaderboard/global", HTTP_IF_NONE_MATCH=etag).status_code, 304
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            rebuild_leaderboard_ranks()
+
+        self.assertEqual(
+            self.client.get("/api/leaderboard/global", HTTP_IF_NONE_MATCH=etag).status_code, 200
+        )
+
+    def test_site_content_304_uses_cached_row_only(self):
+        SiteContentSettings.objects.create(key="default", about_heading="Cached")
+        etag = self.client.get("/api/site-content")["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/site-content", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        row = SiteContentSettings.objects.get(key="default")
+        row.about_heading = "Changed"
+        row.save()
+        response = self.client.get("/api/site-content", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["about_heading"], "Changed")
+
+
+class RequestCacheTests(TestCase):
+    def setUp(self):
+        clear_site_settings_cache()
+        self.addCleanup(clear_site_settings_cache)
+        self.admin_group, _ = Group.objects.get_or_create(name="Admin")
+        self.admin_user = User.objects.create_user(username="cache_admin", password="testpass123")
+        self.admin_user.groups.add(self.admin_group)
+
+    def test_warm_site_content_get_runs_no_queries(self):
+        SiteContentSettings.objects.create(key="default", about_heading="Cached heading")
+        self.client.get("/api/site-content")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/site-content")
+
+        self.assertEqual(response.json()["about_heading"], "Cached heading")
+
+    def test_maintenance_toggle_applies_immediately_in_this_process(self):
+        self.assertEqual(self.client.get("/api/leaderboard/global").status_code, 200)
+
+        admin_client = self.client_class()
+        admin_client.force_login(self.admin_user)
+        response = admin_client.post(
+            "/api/admin/maintenance-toggle",
+            data=json.dumps({"mode": "maintenance"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.client.get("/api/leaderboard/global").status_code, 503)
+
+    @override_settings(PROCESS_CACHE_TTL_SECONDS=0)
+    def test_edits_from_other_workers_are_picked_up_by_version_stamp(self):
+        row = SiteContentSettings.objects.create(key="default")
+        self.assertFalse(get_site_settings().maintenance_enabled)
+
+        # queryset.update() sends no signal, like a save made in another worker.
+        SiteContentSettings.objects.filter(pk=row.pk).update(
+            maintenance_enabled=True, updated_at=row.updated_at + timedelta(seconds=1)
+        )
+
+        self.assertTrue(get_site_settings().maintenance_enabled)
+
+    def test_group_names_are_loaded_once_per_user_object(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(in_any_group(self.admin_user, "Admin"))
+            self.assertFalse(in_any_group(self.admin_user, "Reviewer", "Consultant"))
+
+        reviewer_group, _ = Group.objects.get_or_create(name="Reviewer")
+        self.admin_user.groups.add(reviewer_group)
+
+        self.assertEqual(user_group_names(self.admin_user), {"Admin", "Reviewer"})
+
+
 class ProfileOnboardingTests(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
@@ -2864,3 +3092,479 @@ class NotificationTests(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"unread_count": 0, "notifications": []})
+
+
+class PublicStatusCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="counter_user", password="testpass123")
+
+    def _entry(self, term, status=EntryStatus.APPROVED):
+        return Entry.objects.create(
+            term=term,
+            status=status,
+            initial_contributor=self.user,
+            last_revised_by=self.user,
+        )
+
+    def _counter(self, scope, status):
+        counter = PublicStatusCounter.objects.filter(scope=scope, status=status).first()
+        return counter.count if counter else 0
+
+    def test_status_changes_move_dictionary_counters(self):
+        entry = self._entry("vahay")
+        self._entry("pending-term", status=EntryStatus.PENDING)
+        scope = PublicStatusCounter.Scope.DICTIONARY
+
+        self.assertEqual(self._counter(scope, EntryStatus.APPROVED), 1)
+
+        entry.status = EntryStatus.APPROVED_UNDER_REVIEW
+        entry.save(update_fields=["status"])
+        self.assertEqual(self._counter(scope, EntryStatus.APPROVED), 0)
+        self.assertEqual(self._counter(scope, EntryStatus.APPROVED_UNDER_REVIEW), 1)
+
+        entry.archive()
+        self.assertEqual(self._counter(scope, EntryStatus.APPROVED_UNDER_REVIEW), 0)
+
+    def test_stale_instance_does_not_double_count(self):
+        entry = self._entry("vahay", status=EntryStatus.PENDING)
+        stale_copy = Entry.objects.get(id=entry.id)
+
+        entry.status = EntryStatus.APPROVED
+        entry.save()
+        stale_copy.status = EntryStatus.APPROVED
+        stale_copy.save()
+
+        self.assertEqual(
+            self._counter(PublicStatusCounter.Scope.DICTIONARY, EntryStatus.APPROVED),
+            1,
+        )
+
+    def test_hiding_live_contributions_removes_entries_from_counters(self):
+        self._entry("vahay")
+        FolkloreEntry.objects.create(
+            title="Ariw",
+            content="Sample",
+            category=FolkloreEntry.Category.PROVERB,
+            source="Oral account",
+            contributor=self.user,
+            status=FolkloreEntry.Status.APPROVED,
+        )
+
+        profile = UserProfile.objects.create(user=self.user, show_live_contributions=False)
+        self.assertEqual(
+            self._counter(PublicStatusCounter.Scope.DICTIONARY, EntryStatus.APPROVED), 0
+        )
+        self.assertEqual(self._counter(PublicStatusCounter.Scope.FOLKLORE, "approved"), 0)
+
+        profile.show_live_contributions = True
+        profile.save()
+        self.assertEqual(
+            self._counter(PublicStatusCounter.Scope.DICTIONARY, EntryStatus.APPROVED), 1
+        )
+        self.assertEqual(self._counter(PublicStatusCounter.Scope.FOLKLORE, "approved"), 1)
+
+    def test_unfiltered_list_reads_counters_and_filtered_list_aggregates(self):
+        self._entry("vahay")
+        self._entry("valugan", status=EntryStatus.APPROVED_UNDER_REVIEW)
+        self._entry("rakuh")
+
+        # ETag version, counters and rows: no COUNT(*) over entries, and the
+        # maintenance check reads the per-process settings cache.
+        get_site_settings()
+        with self.assertNumQueries(3):
+            unfiltered = self.client.get("/api/dictionary/entries?limit=1").json()
+        filtered = self.client.get("/api/dictionary/entries?starts_with=v").json()
+
+        self.assertEqual(
+            unfiltered["counts"],
+            {"visible_total": 3, "approved": 2, "approved_under_review": 1},
+        )
+        self.assertEqual(
+            filtered["counts"],
+            {"visible_total": 2, "approved": 1, "approved_under_review": 1},
+        )
+
+    def test_missing_counter_is_rebuilt_from_source_rows_not_the_delta(self):
+        entry = self._entry("vahay")
+        self._entry("rakuh")
+        scope = PublicStatusCounter.Scope.DICTIONARY
+        PublicStatusCounter.objects.all().delete()
+
+        # The first event recorded is a decrement.
+        entry.archive()
+        self.assertEqual(self._counter(scope, EntryStatus.APPROVED), 1)
+
+        PublicStatusCounter.objects.update(count=0)
+        Entry.objects.get(term="rakuh").archive()
+        self.assertEqual(self._counter(scope, EntryStatus.APPROVED), 0)
+
+    def test_rebuild_command_repairs_drift(self):
+        self._entry("vahay")
+        PublicStatusCounter.objects.update(count=42)
+
+        call_command("rebuild_public_counters", stdout=StringIO())
+
+        self.assertEqual(
+            self._counter(PublicStatusCounter.Scope.DICTIONARY, EntryStatus.APPROVED), 1
+        )
+
+
+@override_settings(GAMIFICATION_RECOMPUTE_ASYNC=True)
+class GamificationRecomputeQueueTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="queue_user", password="testpass123")
+
+    def _rejected_revision(self):
+        return EntryRevision.objects.create(
+            contributor=self.user,
+            proposed_data={"term": "vahay"},
+            status=EntryRevision.Status.REJECTED,
+        )
+
+    def _drain(self):
+        output = StringIO()
+        call_command("process_gamification_queue", all=True, stdout=output)
+        return output.getvalue()
+
+    def test_burst_of_saves_coalesces_into_one_job_and_one_recompute(self):
+        for _ in range(3):
+            self._rejected_revision()
+
+        job = GamificationRecomputeJob.objects.get(user=self.user)
+        self.assertEqual(job.request_count, 3)
+        self.assertFalse(UserContributionStats.objects.filter(user=self.user).exists())
+
+        with patch(
+            "users.gamification_queue.recompute_user_gamification",
+            wraps=recompute_user_gamification,
+        ) as recompute:
+            output = self._drain()
+
+        self.assertEqual(recompute.call_count, 1)
+        self.assertIn("processed=1, failed=0", output)
+        self.assertFalse(GamificationRecomputeJob.objects.exists())
+        self.assertEqual(UserContributionStats.objects.get(user=self.user).total_rejections, 3)
+
+    def test_jobs_wait_for_the_debounce_window(self):
+        self._rejected_revision()
+
+        output = StringIO()
+        call_command("process_gamification_queue", stdout=output)
+
+        self.assertIn("processed=0", output.getvalue())
+        self.assertTrue(GamificationRecomputeJob.objects.filter(user=self.user).exists())
+
+    @override_settings(
+        GAMIFICATION_RECOMPUTE_DEBOUNCE_SECONDS=30,
+        GAMIFICATION_RECOMPUTE_MAX_WAIT_SECONDS=45,
+    )
+    def test_each_request_pushes_the_run_back_up_to_the_max_wait(self):
+        started = timezone.now()
+        with patch("users.gamification_queue.timezone.now", return_value=started):
+            self._rejected_revision()
+        job = GamificationRecomputeJob.objects.get(user=self.user)
+        first_run = job.run_after
+
+        with patch(
+            "users.gamification_queue.timezone.now",
+            return_value=started + timedelta(seconds=10),
+        ):
+            self._rejected_revision()
+        job.refresh_from_db()
+        self.assertEqual(job.run_after - first_run, timedelta(seconds=10))
+
+        with patch(
+            "users.gamification_queue.timezone.now",
+            return_value=started + timedelta(seconds=40),
+        ):
+            self._rejected_revision()
+        job.refresh_from_db()
+        self.assertEqual(job.run_after, job.created_at + timedelta(seconds=45))
+        self.assertEqual(job.request_count, 3)
+
+    def test_draft_autosaves_do_not_enqueue(self):
+        revision = EntryRevision.objects.create(
+            contributor=self.user,
+            proposed_data={"term": "vahay"},
+            status=EntryRevision.Status.DRAFT,
+        )
+        revision.proposed_data = {"term": "vahay", "meaning": "house"}
+        revision.save()
+
+        self.assertFalse(GamificationRecomputeJob.objects.exists())
+
+        revision.status = EntryRevision.Status.REJECTED
+        revision.save()
+        self.assertTrue(GamificationRecomputeJob.objects.filter(user=self.user).exists())
+
+    def test_failed_recompute_keeps_job_for_retry(self):
+        self._rejected_revision()
+
+        with patch(
+            "users.gamification_queue.recompute_user_gamification",
+            side_effect=RuntimeError("boom"),
+        ):
+            output = self._drain()
+
+        job = GamificationRecomputeJob.objects.get(user=self.user)
+        self.assertIn("failed=1", output)
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(job.last_error, "boom")
+
+    @override_settings(GAMIFICATION_RECOMPUTE_ASYNC=False)
+    def test_inline_mode_recomputes_immediately(self):
+        self._rejected_revision()
+
+        self.assertFalse(GamificationRecomputeJob.objects.exists())
+        self.assertEqual(UserContributionStats.objects.get(user=self.user).total_rejections, 1)
+
+
+class GamificationBulkRecomputeTests(TestCase):
+    def setUp(self):
+        self.wordsmith = User.objects.create_user(username="bulk_wordsmith", password="x")
+        self.storyteller = User.objects.create_user(username="bulk_storyteller", password="x")
+        self.quiet = User.objects.create_user(username="bulk_quiet", password="x")
+        UserProfile.objects.create(user=self.wordsmith, municipality="Basco")
+        contributor_group, _ = Group.objects.get_or_create(name="Contributor")
+        self.wordsmith.groups.add(contributor_group)
+        ContributionEvent.objects.bulk_create(
+            [
+                ContributionEvent(
+                    user=self.wordsmith,
+                    contribution_type=ContributionEvent.Type.DICTIONARY_TERM,
+                )
+                for _ in range(6)
+            ]
+            + [
+                ContributionEvent(
+                    user=self.storyteller,
+                    contribution_type=ContributionEvent.Type.FOLKLORE_ENTRY,
+                ),
+                ContributionEvent(
+                    user=self.storyteller,
+                    contribution_type=ContributionEvent.Type.REVISION,
+                ),
+            ]
+        )
+        EntryRevision.objects.bulk_create(
+            [
+                EntryRevision(
+                    contributor=self.storyteller,
+                    proposed_data={"term": "vahay"},
+                    status=EntryRevision.Status.REJECTED,
+                )
+            ]
+        )
+
+    def _stats_rows(self):
+        return {
+            row["user_id"]: row
+            for row in UserContributionStats.objects.values(
+                "user_id",
+                *COUNTER_FIELDS,
+                "contributor_level",
+                "reviewer_level",
+                "unlocked_badges",
+            )
+        }
+
+    def test_bulk_recompute_matches_single_user_recompute(self):
+        processed = recompute_gamification_for_users()
+        bulk_rows = self._stats_rows()
+
+        for user in (self.wordsmith, self.storyteller, self.quiet):
+            recompute_user_gamification(user)
+
+        self.assertEqual(processed, 3)
+        self.assertEqual(bulk_rows, self._stats_rows())
+        wordsmith = bulk_rows[self.wordsmith.id]
+        self.assertEqual(wordsmith["dictionary_original_total"], 6)
+        self.assertEqual(wordsmith["dictionary_month"], 6)
+        self.assertEqual(wordsmith["contributor_level"], 1)
+        self.assertIn("word_contributor", wordsmith["unlocked_badges"])
+        storyteller = bulk_rows[self.storyteller.id]
+        self.assertEqual(storyteller["combined_total"], 2)
+        self.assertEqual(storyteller["total_rejections"], 1)
+        self.assertEqual(MunicipalityStats.objects.get(municipality="Basco").combined_all_time, 6)
+        self.assertEqual(
+            RecognitionEvent.objects.filter(
+                user=self.wordsmith,
+                event_type=RecognitionEvent.EventType.LEVEL_UP,
+            ).count(),
+            1,
+        )
+
+    def test_bulk_recompute_query_count_does_not_grow_with_users(self):
+        recompute_gamification_for_users()
+        with CaptureQueriesContext(connection) as few_users:
+            recompute_gamification_for_users()
+
+        User.objects.bulk_create([User(username=f"bulk_extra_{index}") for index in range(25)])
+        recompute_gamification_for_users()
+        with CaptureQueriesContext(connection) as many_users:
+            recompute_gamification_for_users()
+
+        self.assertEqual(len(many_users.captured_queries), len(few_users.captured_queries))
+
+    def test_audit_reports_tampered_stats(self):
+        call_command("recompute_gamification", stdout=StringIO())
+        UserContributionStats.objects.filter(user=self.wordsmith).update(combined_total=99)
+
+        output = StringIO()
+        call_command("audit_gamification_integrity", stdout=output)
+
+        self.assertIn("Checked users: 3", output.getvalue())
+        self.assertIn("Mismatches found: 1", output.getvalue())
+        self.assertIn("bulk_wordsmith", output.getvalue())
+        self.assertEqual(
+            UserContributionStats.objects.get(user=self.wordsmith).combined_total,
+            6,
+        )
+
+
+class LeaderboardRankTests(TestCase):
+    def setUp(self):
+        self.contributor_group, _ = Group.objects.get_or_create(name="Contributor")
+
+    def _participant(self, username, *, combined=0, municipality="Basco"):
+        user = User.objects.create_user(username=username, password="testpass123")
+        user.groups.add(self.contributor_group)
+        UserProfile.objects.create(user=user, municipality=municipality)
+        self._set_combined(user, combined)
+        return user
+
+    def _set_combined(self, user, combined):
+        UserContributionStats.objects.update_or_create(
+            user=user,
+            defaults={"combined_total": combined, "combined_month": combined},
+        )
+        refresh_user_leaderboard_ranks(user.id)
+
+    def _board(self, scope=""):
+        return list(
+            LeaderboardRank.objects.filter(metric="combined", period="all_time", scope=scope)
+            .order_by("rank")
+            .values_list("username", "rank", "value")
+        )
+
+    def test_incremental_moves_match_a_full_rebuild(self):
+        anuy = self._participant("anuy", combined=5)
+        vahay = self._participant("vahay", combined=3, municipality="Mahatao")
+        self._participant("rakuh", combined=3)
+
+        # Ties go to the earlier account (user id), whatever the collation.
+        self.assertEqual(self._board(), [("anuy", 1, 5), ("vahay", 2, 3), ("rakuh", 3, 3)])
+
+        self._set_combined(vahay, 9)
+        self._set_combined(anuy, 1)
+        incremental = self._board()
+        basco = self._board(scope="basco")
+
+        rebuild_leaderboard_ranks()
+
+        self.assertEqual(incremental, [("vahay", 1, 9), ("rakuh", 2, 3), ("anuy", 3, 1)])
+        self.assertEqual(incremental, self._board())
+        self.assertEqual(basco, [("rakuh", 1, 3), ("anuy", 2, 1)])
+
+    def test_moving_a_user_batches_every_board(self):
+        self._participant("anuy", combined=5)
+        vahay = self._participant("vahay", combined=3)
+        UserContributionStats.objects.filter(user=vahay).update(combined_total=9, combined_month=9)
+
+        with CaptureQueriesContext(connection) as queries:
+            refresh_user_leaderboard_ranks(vahay.id)
+
+        # Own rows, one rank count, one shift UPDATE and one bulk write for all
+        # twelve boards (global and municipality, all-time and monthly).
+        rank_queries = [query for query in queries if "users_leaderboardrank" in query["sql"]]
+        self.assertEqual(len(rank_queries), 4)
+        self.assertEqual(self._board(), [("vahay", 1, 9), ("anuy", 2, 5)])
+        self.assertEqual(self._board(scope="basco"), [("vahay", 1, 9), ("anuy", 2, 5)])
+
+    def test_opting_out_and_deleting_close_rank_gaps(self):
+        self._participant("anuy", combined=5)
+        vahay = self._participant("vahay", combined=4)
+        rakuh = self._participant("rakuh", combined=3)
+
+        vahay.profile.include_in_leaderboard = False
+        vahay.profile.save()
+        self.assertEqual(self._board(), [("anuy", 1, 5), ("rakuh", 2, 3)])
+
+        rakuh.delete()
+        self.assertEqual(self._board(), [("anuy", 1, 5)])
+
+    def test_global_view_serves_top_n_and_around_me_from_snapshot(self):
+        users = [self._participant(f"user{index}", combined=10 - index) for index in range(8)]
+        self.client.force_login(users[5])
+
+        response = self.client.get("/api/leaderboard/global?limit=2")
+
+        payload = response.json()
+        self.assertEqual([row["username"] for row in payload["rows"]], ["user0", "user1"])
+        self.assertEqual(
+            [row["username"] for row in payload["around_me"]],
+            ["user2", "user3", "user4", "user5", "user6", "user7"],
+        )
+        self.assertEqual(payload["around_me"][3]["rank"], 6)
+
+    def test_municipality_view_reads_case_insensitive_scope(self):
+        self._participant("anuy", combined=2, municipality="Basco")
+        self._participant("vahay", combined=1, municipality="Itbayat")
+
+        # Warm the per-process caches (rules, site settings): the ETag version
+        # lookup and one rank read remain.
+        _ruleset()
+        get_site_settings()
+
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/leaderboard/municipality?municipality=BASCO")
+
+        self.assertEqual([row["username"] for row in response.json()["rows"]], ["anuy"])
+
+    def test_ties_with_mixed_case_usernames_keep_ranks_dense(self):
+        self._participant("Zed", combined=2)
+        self._participant("amy", combined=2)
+        self._participant("Bob", combined=2)
+        incremental = self._board()
+
+        rebuild_leaderboard_ranks()
+
+        self.assertEqual(incremental, [("Zed", 1, 2), ("amy", 2, 2), ("Bob", 3, 2)])
+        self.assertEqual(incremental, self._board())
+
+    def test_stale_monthly_board_is_hidden_until_the_rollover_rebuilds_it(self):
+        self._participant("anuy", combined=4)
+        LeaderboardRank.objects.filter(period="monthly").update(month_key="2000-01")
+        UserContributionStats.objects.update(last_month_calculated="2000-01")
+        GamificationRuntimeState.objects.update_or_create(
+            key="global", defaults={"last_winner_processed_month": "2000-01"}
+        )
+
+        response = self.client.get("/api/leaderboard/global?period=monthly")
+
+        self.assertEqual(response.json()["rows"], [])
+        self.assertTrue(LeaderboardRank.objects.filter(month_key="2000-01").exists())
+
+        call_command("process_gamification_queue", stdout=StringIO())
+
+        row = self.client.get("/api/leaderboard/global?period=monthly").json()["rows"][0]
+        self.assertEqual((row["username"], row["value"]), ("anuy", 0))
+        self.assertFalse(LeaderboardRank.objects.filter(month_key="2000-01").exists())
+
+    @override_settings(GAMIFICATION_RECOMPUTE_ASYNC=True)
+    def test_profile_saves_queue_the_rank_refresh(self):
+        anuy = self._participant("anuy", combined=5)
+        anuy.profile.include_in_leaderboard = False
+
+        with CaptureQueriesContext(connection) as queries:
+            anuy.profile.save()
+
+        self.assertFalse(
+            any("gamificationruntimestate" in query["sql"] for query in queries.captured_queries)
+        )
+        self.assertTrue(GamificationRecomputeJob.objects.filter(user=anuy).exists())
+        self.assertEqual(self._board(), [("anuy", 1, 5)])
+
+        call_command("process_gamification_queue", all=True, stdout=StringIO())
+
+        self.assertEqual(self._board(), [])
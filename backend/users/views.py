@@ -35,7 +35,7 @@ from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.text import slugify
 from django.views.decorators.csrf import csrf_exempt, ensure_csrf_cookie
-from django.views.decorators.http import require_GET, require_http_methods
+from django.views.decorators.http import condition, require_GET, require_http_methods
 
 from dictionary.models import Entry, EntryRevision, EntryStatus
 from folklore.models import FolkloreEntry, FolkloreRevision
@@ -46,6 +46,7 @@ from users.models import (
     ContributionEvent,
     MunicipalityMonthlyWinner,
     Notification,
+    PublicContentVersion,
     RecognitionEvent,
     RoleApplication,
     RoleApplicationDecision,
@@ -66,6 +67,7 @@ from users.names import (
     display_name as formatted_display_name,
 )
 from users.notifications import notify
+from users.public_versions import CONDITIONAL_METHODS, public_content_condition
 from users.recognition import (
     build_gamification_profile_payload,
     leaderboard_rows,
@@ -86,10 +88,14 @@ from users.role_onboarding import (
     role_application_duplicate_message,
     update_managed_consultant_profile,
 )
+from users.roles import in_any_group
+from users.site_content import get_site_settings
 
 User = get_user_model()
 ADMIN_ACTIVITY_LIMIT = 500
 ADMIN_OVERVIEW_RECENT_LIMIT = 5
+LEADERBOARD_DEFAULT_LIMIT = 100
+LEADERBOARD_MAX_LIMIT = 500
 TURNSTILE_TEST_TOKEN = "test-turnstile-token"
 
 
@@ -588,11 +594,11 @@ def _profile_occupation_summary(profile):
 def _public_role_label(user):
     if is_admin(user):
         return "Admin"
-    if user.groups.filter(name="Consultant").exists():
+    if in_any_group(user, "Consultant"):
         return "Consultant"
-    if user.groups.filter(name="Reviewer").exists():
+    if in_any_group(user, "Reviewer"):
         return "Reviewer"
-    if user.groups.filter(name="Contributor").exists():
+    if in_any_group(user, "Contributor"):
         return "Contributor"
     return "Community Member"
 
@@ -1635,12 +1641,41 @@ def user_public_visibility_view(request, username):
     )
 
 
+def _public_site_content_payload():
+    # The payload is memoized on the cached row, so it is rebuilt only when the
+    # row itself is reloaded (see users/site_content.py).
+    row = get_site_settings()
+    if row is None:
+        return _site_content_payload(None)
+    payload = getattr(row, "_public_payload", None)
+    if payload is None:
+        payload = _site_content_payload(row)
+        row._public_payload = payload
+    return payload
+
+
+def _site_content_etag(request):
+    # Validators come from the cached settings row, so a 304 costs no query.
+    if request.method not in CONDITIONAL_METHODS:
+        return None
+    row = get_site_settings()
+    if row is None:
+        return '"site-content-default"'
+    return f'"site-content-{row.updated_at.timestamp():.6f}"'
+
+
+def _site_content_last_modified(request):
+    if request.method not in CONDITIONAL_METHODS:
+        return None
+    row = get_site_settings()
+    return row.updated_at if row else None
+
+
 @require_http_methods(["GET", "POST", "PATCH"])
+@condition(etag_func=_site_content_etag, last_modified_func=_site_content_last_modified)
 def site_content_view(request):
-    row = SiteContentSettings.objects.filter(key="default").select_related("updated_by").first()
-
     if request.method == "GET":
-        return JsonResponse(_site_content_payload(row))
+        return JsonResponse(_public_site_content_payload())
 
     auth_error = _require_authenticated(request)
     if auth_error:
@@ -1829,7 +1864,7 @@ def beta_check_view(request):
     ua = request.META.get("HTTP_USER_AGENT", "").lower()
     if any(f in ua for f in _CRAWLER_UA_FRAGMENTS):
         return JsonResponse({}, status=200)
-    row = SiteContentSettings.objects.filter(key="default").first()
+    row = get_site_settings()
     if row and not row.beta_locked:
         return JsonResponse({}, status=200)
     token = request.COOKIES.get(_BETA_COOKIE, "")
@@ -1979,17 +2014,49 @@ def yaru_members_view(request):
     return JsonResponse({"rows": payload})
 
 
+def _leaderboard_limit(request):
+    try:
+        limit = int(request.GET.get("limit") or LEADERBOARD_DEFAULT_LIMIT)
+    except (TypeError, ValueError):
+        limit = LEADERBOARD_DEFAULT_LIMIT
+    return max(1, min(limit, LEADERBOARD_MAX_LIMIT))
+
+
+def _leaderboard_around_user(request):
+    return request.user if request.user.is_authenticated else None
+
+
+def _leaderboard_month(request):
+    # Monthly boards roll over without a write; keep last month's ETag from matching.
+    return timezone.now().strftime("%Y-%m")
+
+
 @require_GET
+@public_content_condition(PublicContentVersion.Scope.LEADERBOARD, extra=_leaderboard_month)
 def global_leaderboard_view(request):
+    # Top-N plus the signed-in user's neighbourhood, both from the rank snapshot.
     metric = (request.GET.get("metric") or "combined").strip().lower()
     period = (request.GET.get("period") or "all_time").strip().lower()
-    rows = leaderboard_rows(metric=metric, period=period, request=request)
+    rows, around_me = leaderboard_rows(
+        metric=metric,
+        period=period,
+        request=request,
+        limit=_leaderboard_limit(request),
+        around_user=_leaderboard_around_user(request),
+    )
     return JsonResponse(
-        {"leaderboard_type": "global", "metric": metric, "period": period, "rows": rows}
+        {
+            "leaderboard_type": "global",
+            "metric": metric,
+            "period": period,
+            "rows": rows,
+            "around_me": around_me,
+        }
     )
 
 
 @require_GET
+@public_content_condition(PublicContentVersion.Scope.LEADERBOARD, extra=_leaderboard_month)
 def municipality_leaderboard_view(request):
     municipality = (request.GET.get("municipality") or "").strip()
     if not municipality:
@@ -2000,11 +2067,13 @@ def municipality_leaderboard_view(request):
 
     metric = (request.GET.get("metric") or "combined").strip().lower()
     period = (request.GET.get("period") or "all_time").strip().lower()
-    rows = leaderboard_rows(
+    rows, around_me = leaderboard_rows(
         municipality=municipality,
         metric=metric,
         period=period,
         request=request,
+        limit=_leaderboard_limit(request),
+        around_user=_leaderboard_around_user(request),
     )
 
     return JsonResponse(
@@ -2014,6 +2083,7 @@ def municipality_leaderboard_view(request):
             "metric": metric,
             "period": period,
             "rows": rows,
+            "around_me": around_me,
         }
     )
 
@@ -631,7 +631,7 @@ export default function DictionaryViewerPage({ currentUser }) {
     try {
       const params = new URLSearchParams()
       params.set('limit', '500')
-      params.set('sort', 'alpha')
+      params.set('sort', q.trim() ? 'relevance' : 'alpha')
       if (q.trim()) {
         params.set('q', q.trim())
       }
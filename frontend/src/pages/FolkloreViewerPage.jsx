@@ -166,9 +166,22 @@ export default function FolkloreViewerPage({ currentUser }) {
     setListError('')
     try {
       // Beginner note: this endpoint only returns public-visible folklore entries.
-      const payload = await apiRequest('/api/folklore/entries')
-      setListRows(payload.rows || [])
-      setLiveEntryTotal(payload.counts?.visible_total || 0)
+      // It is paginated, so follow `next_cursor` until every page is loaded.
+      const rows = []
+      let counts = null
+      let cursor = ''
+      do {
+        const params = new URLSearchParams({ limit: '500' })
+        if (cursor) {
+          params.set('cursor', cursor)
+        }
+        const payload = await apiRequest(`/api/folklore/entries?${params.toString()}`)
+        rows.push(...(payload.rows || []))
+        counts = counts || payload.counts
+        cursor = payload.next_cursor || ''
+      } while (cursor)
+      setListRows(rows)
+      setLiveEntryTotal(counts?.visible_total || 0)
       setListLoaded(true)
     } catch (requestError) {
       setListError(requestError.message)
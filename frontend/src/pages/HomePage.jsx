@@ -146,7 +146,7 @@ export default function HomePage({ currentUser = {} }) {
       }
 
       try {
-        const folklorePayload = await apiRequest('/api/folklore/entries')
+        const folklorePayload = await apiRequest(`/api/folklore/entries?limit=${HOME_LATEST_FOLKLORE_LIMIT}`)
         setFolkloreRows((folklorePayload.rows || []).slice(0, HOME_LATEST_FOLKLORE_LIMIT))
         setArchiveCounts((current) => ({
           ...current,
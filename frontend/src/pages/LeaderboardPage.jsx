@@ -1061,7 +1061,7 @@ Honoring the heritage entrusted to us by those who came before. Join us in this
     try {
       const [dictionaryPayload, folklorePayload] = await Promise.all([
         apiRequest('/api/dictionary/entries?limit=1'),
-        apiRequest('/api/folklore/entries'),
+        apiRequest('/api/folklore/entries?limit=1'),
       ])
       setArchiveCounts({
         dictionaryLive: dictionaryPayload.counts?.visible_total ?? dictionaryPayload.counts?.approved ?? 0,